@@ -0,0 +1,57 @@
+"""Benchmark ``load_config`` with and without the compiled snapshot."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from sele_saisie_auto import app_config, config_snapshot, logger_utils  # noqa: E402
+from sele_saisie_auto.enums import LogLevel  # noqa: E402
+from sele_saisie_auto.read_or_write_file_config_ini_utils import (  # noqa: E402
+    clear_cache,
+)
+
+LOADS = 500
+
+
+def main() -> int:
+    """Print the cost of a cold and of a warm ``load_config``."""
+    logger_utils.LOG_LEVEL_FILTER = LogLevel.OFF
+    for env_var in app_config.ENV_VAR_MAP.values():
+        os.environ.pop(env_var, None)
+    with tempfile.TemporaryDirectory() as tmp:
+        config_path = str(Path(tmp) / "config.ini")
+        shutil.copy(ROOT / "config.ini", config_path)
+        os.environ["SAA_RES_DIR"] = tmp
+        log_file = str(Path(tmp) / "bench.html")
+
+        def cold() -> None:
+            clear_cache()
+            config_snapshot.remove_snapshot(config_path)
+            app_config.load_config(log_file)
+
+        def warm() -> None:
+            clear_cache()
+            app_config.load_config(log_file)
+
+        for label, func in (
+            ("froid (analyse INI)", cold),
+            ("chaud (instantané)", warm),
+        ):
+            func()
+            elapsed = min(timeit.repeat(func, number=LOADS, repeat=3))
+            print(f"{label:<22} : {elapsed / LOADS * 1e6:8.1f} µs/chargement")
+        size = os.path.getsize(config_snapshot.snapshot_path(config_path))
+        print(f"instantané             : {size} octets")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
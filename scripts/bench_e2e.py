@@ -0,0 +1,419 @@
+"""End-to-end benchmark of the ``PageNavigator`` flow on local PSA Time pages.
+
+Starts :class:`MockPsaTimeServer`, drives a headless Edge through the real
+login, date entry, grid filling, additional information and save steps, then
+reports the wall time of each phase, the WebDriver commands sent and the bytes
+exchanged. The JSON result can be compared with the one of another commit::
+
+    poetry run python scripts/bench_e2e.py --runs 3 --output bench.json
+    poetry run python scripts/bench_e2e.py --runs 3 --compare bench.json
+
+``--lean`` runs the flow with the lean browser profile and ``--page-loads``
+also times each mock page with and without it::
+
+    poetry run python scripts/bench_e2e.py --runs 1 --page-loads
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import json
+import platform
+import statistics
+import subprocess  # nosec B404
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import selenium  # noqa: E402
+from psatime_mock import MockPsaTimeServer, build_app_config  # noqa: E402
+from selenium import webdriver  # noqa: E402
+from selenium.webdriver.remote.remote_connection import RemoteConnection  # noqa: E402
+from selenium.webdriver.support.ui import WebDriverWait  # noqa: E402
+
+from sele_saisie_auto.encryption_utils import EncryptionService  # noqa: E402
+from sele_saisie_auto.saisie_automatiser_psatime import PSATimeAutomation  # noqa: E402
+from sele_saisie_auto.selenium_utils.lean_profile import LeanProfile  # noqa: E402
+from sele_saisie_auto.selenium_utils.navigation import (  # noqa: E402
+    _build_edge_options,
+)
+from sele_saisie_auto.selenium_utils.wrapper import is_document_ready  # noqa: E402
+from sele_saisie_auto.timeouts import DEFAULT_TIMEOUT  # noqa: E402
+
+SCHEMA_VERSION = 1
+
+# PageNavigator method ➜ phase name, in execution order.
+NAVIGATOR_PHASES = {
+    "login": "login",
+    "navigate_to_date_entry": "date_entry",
+    "fill_timesheet": "fill",
+    "finalize_timesheet": "save",
+}
+PHASES = ("startup", *NAVIGATOR_PHASES.values())
+METRICS = ("wall_s", "commands", "webdriver_bytes")
+# Mock pages timed by ``--page-loads``.
+PAGE_LOAD_PATHS = ("", "home", "timesheet", "grid")
+PAGE_LOAD_MODES = ("standard", "lean")
+
+
+@dataclass
+class BenchCredentials:
+    """Credentials encrypted with a throw-away key."""
+
+    aes_key: bytes
+    login: bytes
+    password: bytes
+
+    def get_auth_tuple(self) -> tuple[bytes, bytes, bytes]:
+        return self.aes_key, self.login, self.password
+
+    @classmethod
+    def create(cls, service: EncryptionService) -> BenchCredentials:
+        key = service.generer_cle_aes()
+        return cls(
+            key,
+            service.chiffrer_donnees("bench.user", key),
+            service.chiffrer_donnees("bench-password", key),
+        )
+
+
+def _json_size(payload: Any) -> int:
+    return len(json.dumps(payload, default=str).encode("utf-8"))
+
+
+class CommandRecorder:
+    """Count the WebDriver commands sent while a phase is active."""
+
+    def __init__(self) -> None:
+        self.phase: str | None = None
+        self.commands: dict[str, Counter[str]] = defaultdict(Counter)
+        self.seconds: dict[str, float] = defaultdict(float)
+        self.bytes: dict[str, int] = defaultdict(int)
+
+    def record(self, command: str, params: Any, response: Any, elapsed: float) -> None:
+        if self.phase is None:
+            return
+        self.commands[self.phase][command] += 1
+        self.seconds[self.phase] += elapsed
+        self.bytes[self.phase] += _json_size(params) + _json_size(response)
+
+    @contextmanager
+    def installed(self) -> Iterator[CommandRecorder]:
+        """Route every ``RemoteConnection.execute`` call through :meth:`record`."""
+        original = RemoteConnection.execute
+        recorder = self
+
+        @functools.wraps(original)
+        def execute(self: RemoteConnection, command: str, params: Any) -> Any:
+            start = time.perf_counter()
+            response = original(self, command, params)
+            recorder.record(command, params, response, time.perf_counter() - start)
+            return response
+
+        RemoteConnection.execute = execute  # type: ignore[method-assign]
+        try:
+            yield self
+        finally:
+            RemoteConnection.execute = original  # type: ignore[method-assign]
+
+
+def _timed(
+    func: Callable[..., Any],
+    phase: str,
+    recorder: CommandRecorder,
+    timings: dict[str, float],
+) -> Callable[..., Any]:
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        recorder.phase = phase
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            timings[phase] = timings.get(phase, 0.0) + time.perf_counter() - start
+
+    return wrapper
+
+
+def run_once(
+    server: MockPsaTimeServer, options: argparse.Namespace, workdir: Path, index: int
+) -> dict[str, Any]:
+    """Run the full flow once and return its measurements."""
+    app_config = build_app_config(
+        server.url,
+        default_timeout=options.timeout,
+        long_timeout=options.timeout * 2,
+        debug_mode=options.log_level,
+        lean_browser=options.lean,
+    )
+    automation = PSATimeAutomation(str(workdir / f"bench_{index}.html"), app_config)
+    navigator = automation.page_navigator
+    recorder = CommandRecorder()
+    timings: dict[str, float] = {}
+    for method, phase in NAVIGATOR_PHASES.items():
+        setattr(
+            navigator,
+            method,
+            _timed(getattr(navigator, method), phase, recorder, timings),
+        )
+    server.reset_counters()
+
+    start = time.perf_counter()
+    with recorder.installed():
+        recorder.phase = "startup"
+        driver = automation.setup_browser(headless=True, no_sandbox=options.no_sandbox)
+        timings["startup"] = time.perf_counter() - start
+        if driver is None:
+            raise RuntimeError("Le navigateur n'a pas pu être démarré.")
+        try:
+            navigator.prepare(
+                BenchCredentials.create(automation.encryption_service),
+                app_config.date_cible or "",
+            )
+            navigator.run(driver)
+            total = time.perf_counter() - start
+            recorder.phase = None
+            driver.switch_to.default_content()
+            completed = driver.execute_script("return window.__psaSaved === true;")
+        finally:
+            recorder.phase = None
+            automation.browser_session.close()
+
+    return {
+        "total_s": total,
+        "completed": bool(completed),
+        "phases": {
+            phase: {
+                "wall_s": timings.get(phase, 0.0),
+                "commands": sum(recorder.commands[phase].values()),
+                "command_s": recorder.seconds[phase],
+                "webdriver_bytes": recorder.bytes[phase],
+                "by_command": dict(recorder.commands[phase].most_common()),
+            }
+            for phase in PHASES
+        },
+        "http": {"bytes": server.bytes_sent, "requests": server.requests},
+    }
+
+
+def measure_page_loads(
+    server: MockPsaTimeServer, options: argparse.Namespace, lean: bool
+) -> dict[str, float]:
+    """Return the median time (s) to load each of :data:`PAGE_LOAD_PATHS`.
+
+    A load lasts from ``driver.get`` until :func:`is_document_ready`, the
+    readiness check the automation waits for.
+    """
+    profile = LeanProfile() if lean else None
+    driver = webdriver.Edge(
+        options=_build_edge_options(
+            headless=True, no_sandbox=options.no_sandbox, lean=profile
+        )
+    )
+    try:
+        if profile is not None:
+            profile.apply_to_driver(driver)
+        timings: dict[str, list[float]] = defaultdict(list)
+        for _ in range(options.page_load_repeat):
+            for path in PAGE_LOAD_PATHS:
+                start = time.perf_counter()
+                driver.get(server.url + path)
+                WebDriverWait(driver, options.timeout).until(is_document_ready)
+                timings[path].append(time.perf_counter() - start)
+    finally:
+        driver.quit()
+    return {path: statistics.median(values) for path, values in timings.items()}
+
+
+def _print_page_loads(page_loads: dict[str, dict[str, float]]) -> None:
+    print(f"{'page':<12}" + "".join(f"{mode + ' (ms)':>16}" for mode in page_loads))
+    for path in PAGE_LOAD_PATHS:
+        print(
+            f"{'/' + path:<12}"
+            + "".join(f"{loads[path] * 1000:>16.1f}" for loads in page_loads.values())
+        )
+
+
+def summarize(runs: list[dict[str, Any]]) -> dict[str, Any]:
+    """Return the median of every metric across ``runs``."""
+    return {
+        "total_s": statistics.median(run["total_s"] for run in runs),
+        "http_bytes": statistics.median(run["http"]["bytes"] for run in runs),
+        "phases": {
+            phase: {
+                metric: statistics.median(run["phases"][phase][metric] for run in runs)
+                for metric in METRICS
+            }
+            for phase in PHASES
+        },
+    }
+
+
+def compare(
+    summary: dict[str, Any], baseline: dict[str, Any], threshold: float
+) -> list[str]:
+    """Return a description of every metric slower than ``baseline``.
+
+    A metric regresses when it exceeds the baseline by more than
+    ``threshold`` (``0.2`` means 20 %).
+    """
+    pairs: list[tuple[str, float, float]] = [
+        ("total_s", summary["total_s"], baseline["total_s"])
+    ]
+    for phase in PHASES:
+        current = summary["phases"].get(phase, {})
+        previous = baseline["phases"].get(phase, {})
+        for metric in METRICS:
+            if metric in current and metric in previous:
+                pairs.append((f"{phase}.{metric}", current[metric], previous[metric]))
+    regressions = []
+    for name, current_value, previous_value in pairs:
+        if previous_value and current_value > previous_value * (1 + threshold):
+            ratio = (current_value - previous_value) / previous_value * 100
+            regressions.append(
+                f"{name} : {previous_value:g} → {current_value:g} (+{ratio:.0f} %)"
+            )
+    return regressions
+
+
+def _git_commit() -> str | None:
+    try:
+        result = subprocess.run(  # nosec B603 B607
+            ["git", "rev-parse", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def _print_summary(summary: dict[str, Any]) -> None:
+    print(f"{'phase':<12}{'temps (s)':>12}{'commandes':>12}{'octets WD':>12}")
+    for phase in PHASES:
+        values = summary["phases"][phase]
+        print(
+            f"{phase:<12}{values['wall_s']:>12.3f}"
+            f"{values['commands']:>12g}{values['webdriver_bytes']:>12g}"
+        )
+    print(f"{'total':<12}{summary['total_s']:>12.3f}")
+    print(f"Octets HTTP servis : {summary['http_bytes']:g}")
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=3, help="nombre d'exécutions")
+    parser.add_argument("--output", type=Path, help="fichier JSON de résultat")
+    parser.add_argument("--compare", type=Path, help="résultat JSON de référence")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="régression tolérée par rapport à la référence (0.2 = 20 %%)",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=int,
+        default=DEFAULT_TIMEOUT,
+        help="default_timeout appliqué à la configuration",
+    )
+    parser.add_argument(
+        "--latency-ms",
+        type=int,
+        default=0,
+        help="délai ajouté à chaque réponse du serveur simulé",
+    )
+    parser.add_argument(
+        "--lean", action="store_true", help="profil de navigateur allégé"
+    )
+    parser.add_argument(
+        "--page-loads",
+        action="store_true",
+        help="mesure aussi le chargement des pages avec et sans profil allégé",
+    )
+    parser.add_argument(
+        "--page-load-repeat",
+        type=int,
+        default=5,
+        help="chargements de chaque page pour --page-loads",
+    )
+    parser.add_argument("--no-sandbox", action="store_true")
+    parser.add_argument("--log-level", default="INFO")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark, print it and optionally compare it to a baseline."""
+    options = parse_args(argv)
+    with (
+        tempfile.TemporaryDirectory() as tmp,
+        MockPsaTimeServer(latency_ms=options.latency_ms) as server,
+    ):
+        runs = [
+            run_once(server, options, Path(tmp), index) for index in range(options.runs)
+        ]
+        page_loads = (
+            {
+                mode: measure_page_loads(server, options, lean=mode == "lean")
+                for mode in PAGE_LOAD_MODES
+            }
+            if options.page_loads
+            else None
+        )
+
+    summary = summarize(runs)
+    result = {
+        "schema": SCHEMA_VERSION,
+        "commit": _git_commit(),
+        "created": datetime.now(UTC).isoformat(timespec="seconds"),
+        "environment": {
+            "python": platform.python_version(),
+            "selenium": selenium.__version__,
+            "platform": platform.platform(),
+        },
+        "settings": {
+            "runs": options.runs,
+            "timeout": options.timeout,
+            "latency_ms": options.latency_ms,
+            "lean": options.lean,
+        },
+        "summary": summary,
+        "runs": runs,
+    }
+    _print_summary(summary)
+    if page_loads is not None:
+        result["page_loads"] = page_loads
+        _print_page_loads(page_loads)
+    if options.output:
+        options.output.write_text(json.dumps(result, indent=2), encoding="utf-8")
+
+    status = 0
+    if not all(run["completed"] for run in runs):
+        print("⚠️ Au moins une exécution n'a pas atteint l'enregistrement.")
+        status = 2
+    if options.compare:
+        baseline = json.loads(options.compare.read_text(encoding="utf-8"))
+        regressions = compare(summary, baseline["summary"], options.threshold)
+        for line in regressions:
+            print(f"Régression {line}")
+        if regressions:
+            status = status or 1
+    return status
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
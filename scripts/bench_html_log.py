@@ -0,0 +1,41 @@
+"""Benchmark the HTML log writer to check that each row costs O(1)."""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from sele_saisie_auto import logger_utils  # noqa: E402
+from sele_saisie_auto.enums import LogLevel  # noqa: E402
+
+SIZES = (10_000, 25_000, 50_000)
+
+
+def run(rows: int, directory: Path) -> float:
+    """Write ``rows`` DEBUG rows and return the elapsed time in seconds."""
+    log_file = str(directory / f"bench_{rows}.html")
+    start = time.perf_counter()
+    for i in range(rows):
+        logger_utils.write_log(f"ligne {i}", log_file, LogLevel.DEBUG)
+    logger_utils.close_logs(log_file)
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    """Print the total and per-row duration for each size."""
+    logger_utils.LOG_LEVEL_FILTER = LogLevel.DEBUG
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in SIZES:
+            elapsed = run(rows, Path(tmp))
+            per_row = elapsed / rows * 1_000_000
+            print(f"{rows:>7} lignes : {elapsed:6.2f} s ({per_row:5.1f} µs/ligne)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,72 @@
+"""Benchmark the cost of a DEBUG call suppressed by the INFO level filter."""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from sele_saisie_auto import logger_utils  # noqa: E402
+from sele_saisie_auto.enums import LogLevel  # noqa: E402
+from sele_saisie_auto.logging_service import Logger  # noqa: E402
+
+CALLS = 200_000
+
+
+class FakeField:
+    """Stand-in for a ``WebElement`` whose attribute read is not free."""
+
+    def get_attribute(self, name: str) -> str:
+        return f"{name}-{sum(range(50))}"
+
+
+MESSAGE = "f\"Jour '{day}' contient : {field.get_attribute('value')}\""
+# Each statement logs the same suppressed DEBUG message.
+CASES: dict[str, str] = {
+    "f-string (avant)": f"logger.debug({MESSAGE})",
+    "write_log f-string (avant)": (
+        f"logger_utils.write_log({MESSAGE}, log_file, 'DEBUG')"
+    ),
+    "arguments %": (
+        "logger.debug(\"Jour '%s' contient : %s\", day, field.get_attribute('value'))"
+    ),
+    "write_log arguments %": (
+        "logger_utils.write_log(\"Jour '%s' contient : %s\", log_file, 'DEBUG',"
+        " day, field.get_attribute('value'))"
+    ),
+    "callable": f"logger.debug(lambda: {MESSAGE})",
+    "write_log callable": (
+        f"logger_utils.write_log(lambda: {MESSAGE}, log_file, 'DEBUG')"
+    ),
+    "is_enabled": f"logger.is_enabled('DEBUG') and logger.debug({MESSAGE})",
+}
+
+
+def main() -> int:
+    """Print the cost per suppressed call of each variant."""
+    logger_utils.LOG_LEVEL_FILTER = LogLevel.INFO
+    with tempfile.TemporaryDirectory() as tmp:
+        log_file = str(Path(tmp) / "bench.html")
+        logger = Logger(log_file)
+        namespace = {
+            "logger": logger,
+            "logger_utils": logger_utils,
+            "log_file": log_file,
+            "field": FakeField(),
+            "day": "lundi",
+        }
+        for label, stmt in CASES.items():
+            elapsed = min(
+                timeit.repeat(stmt, number=CALLS, repeat=3, globals=namespace)
+            )
+            print(f"{label:<28} : {elapsed / CALLS * 1e9:7.0f} ns/appel")
+        assert not Path(log_file).exists()  # nosec B101
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
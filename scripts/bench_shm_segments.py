@@ -0,0 +1,80 @@
+"""Benchmark shared memory segment reads and secure wipes, bytes to megabytes."""
+
+from __future__ import annotations
+
+import sys
+import timeit
+from multiprocessing import shared_memory
+from pathlib import Path
+from uuid import uuid4
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from sele_saisie_auto.shared_memory_service import (  # noqa: E402
+    framed_size,
+    read_framed,
+    wipe_segment,
+    write_framed,
+)
+
+SIZES = (64, 4 * 1024, 256 * 1024, 4 * 1024 * 1024)
+
+
+def read_rstrip(buf: memoryview) -> bytes:
+    """Former read: copy the whole segment then guess the payload length."""
+    raw = bytes(buf)
+    return raw[: len(raw.rstrip(b"\x00"))]
+
+
+def wipe_loop(buf: memoryview) -> None:
+    """Former wipe: one Python assignment per byte."""
+    for i in range(len(buf)):
+        buf[i] = 0
+
+
+def _per_call(func, buf: memoryview, size: int) -> float:
+    # Fewer repetitions for the byte loop on large segments.
+    number = max(1, 1_000_000 // size) if func is wipe_loop else 200
+    return min(timeit.repeat(lambda: func(buf), number=number, repeat=3)) / number
+
+
+def _label(size: int) -> str:
+    for unit, factor in (("Mo", 1024 * 1024), ("Ko", 1024)):
+        if size >= factor:
+            return f"{size // factor} {unit}"
+    return f"{size} o"
+
+
+def main() -> int:
+    """Print the cost per call of the former and framed read and wipe."""
+    print(
+        f"{'taille':>8} {'lecture avant':>14} {'lecture':>10} "
+        f"{'effacement avant':>17} {'effacement':>11}  (µs)"
+    )
+    for size in SIZES:
+        payload = bytes(range(1, 256)) * (size // 255) + b"\x01" * (size % 255)
+        mem = shared_memory.SharedMemory(
+            name=f"bench_{uuid4().hex}", create=True, size=framed_size(size)
+        )
+        try:
+            raw = mem.buf[:size]
+            raw[:] = payload
+            old_read = _per_call(read_rstrip, raw, size)
+            raw.release()
+            write_framed(mem.buf, payload)
+            new_read = _per_call(read_framed, mem.buf, size)
+            old_wipe = _per_call(wipe_loop, mem.buf, size)
+            new_wipe = _per_call(wipe_segment, mem.buf, size)
+        finally:
+            mem.close()
+            mem.unlink()
+        print(
+            f"{_label(size):>8} {old_read * 1e6:14.1f} {new_read * 1e6:10.1f} "
+            f"{old_wipe * 1e6:17.1f} {new_wipe * 1e6:11.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,122 @@
+"""Report the modules imported by a command, from ``python -X importtime``.
+
+Usage::
+
+    python scripts/import_time_report.py
+    python scripts/import_time_report.py --top 30 --sort self
+    python scripts/import_time_report.py --code "import sele_saisie_auto.launcher"
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess  # nosec B404
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# What ``psatime-auto --help`` pays before argparse runs.
+DEFAULT_CODE = "from sele_saisie_auto.cli import parse_args; parse_args([])"
+
+# Imports that must stay out of the CLI start-up path.
+HEAVY_MODULES = ("tkinter", "selenium", "requests", "cryptography")
+
+
+@dataclass(frozen=True)
+class ImportTiming:
+    """One line of the ``-X importtime`` output (times in microseconds)."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(stderr: str) -> list[ImportTiming]:
+    """Return the timings found in the ``-X importtime`` output ``stderr``."""
+
+    timings = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # column header
+        name = fields[2].rstrip()
+        module = name.lstrip()
+        timings.append(
+            ImportTiming(
+                module=module,
+                self_us=int(fields[0]),
+                cumulative_us=int(fields[1]),
+                depth=(len(name) - len(module) - 1) // 2,
+            )
+        )
+    return timings
+
+
+def measure(code: str = DEFAULT_CODE) -> list[ImportTiming]:
+    """Run ``code`` in a fresh interpreter and return its import timings."""
+
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [str(ROOT / "src"), env.get("PYTHONPATH")])
+    )
+    result = subprocess.run(  # nosec B603
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    return parse_importtime(result.stderr)
+
+
+def total_us(timings: list[ImportTiming]) -> int:
+    """Return the cumulative time of the top-level imports."""
+
+    return sum(t.cumulative_us for t in timings if t.depth == 0)
+
+
+def heavy_imports(timings: list[ImportTiming]) -> list[str]:
+    """Return the modules of :data:`HEAVY_MODULES` (or their children) imported."""
+
+    return sorted(
+        {t.module for t in timings if t.module.split(".")[0] in HEAVY_MODULES}
+    )
+
+
+def format_report(timings: list[ImportTiming], top: int, sort: str) -> str:
+    """Return a table of the ``top`` slowest imports sorted by ``sort``."""
+
+    key = "self_us" if sort == "self" else "cumulative_us"
+    rows = sorted(timings, key=lambda t: getattr(t, key), reverse=True)[:top]
+    lines = [f"{'propre (ms)':>12} {'cumulé (ms)':>12}  module"]
+    lines += [
+        f"{t.self_us / 1000:12.1f} {t.cumulative_us / 1000:12.1f}  {t.module}"
+        for t in rows
+    ]
+    lines.append(f"total : {total_us(timings) / 1000:.1f} ms, {len(timings)} modules")
+    heavy = heavy_imports(timings)
+    if heavy:
+        lines.append("modules lourds importés : " + ", ".join(heavy))
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Print the import time report of ``--code``."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--code", default=DEFAULT_CODE)
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--sort", choices=("cumulative", "self"), default="cumulative")
+    args = parser.parse_args(argv)
+    print(format_report(measure(args.code), args.top, args.sort))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,462 @@
+"""Local PeopleSoft-like PSA Time pages used by ``bench_e2e.py``.
+
+The pages only reproduce what the automation touches: login form, landing
+tile, side menu, date entry iframe, ``POL_TIME`` grid, additional information
+modal and save alert. Like PeopleSoft, every page also loads a logo, a web font
+and an analytics script that the automation never reads (:data:`ASSETS`), so
+the lean browser profile can be measured. Every id comes from :class:`Locators`,
+:class:`MissionField` and ``ensure_descriptions`` (which reads
+``ADDITIONAL_INFO_LOCATORS``) so the fixture follows the automation when a
+locator changes.
+"""
+
+from __future__ import annotations
+
+import html
+import sys
+import threading
+import time
+from collections import defaultdict
+from configparser import ConfigParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from urllib.parse import urlsplit
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from sele_saisie_auto.app_config import AppConfig  # noqa: E402
+from sele_saisie_auto.automation.additional_info_page import (  # noqa: E402
+    ensure_descriptions,
+)
+from sele_saisie_auto.constants import JOURS_SEMAINE  # noqa: E402
+from sele_saisie_auto.elements.element_id_builder import (  # noqa: E402
+    ElementIdBuilder,
+)
+from sele_saisie_auto.enums import MissionField  # noqa: E402
+from sele_saisie_auto.locators import Locators  # noqa: E402
+from sele_saisie_auto.selenium_utils.grid_snapshot import (  # noqa: E402
+    DAY_VALUE_PREFIX,
+    DESCRIPTION_PREFIX,
+)
+
+MISSION_ROW = 0
+GRID_ROWS = ("Formation", "Jour férié", "RTT Q1")
+INITIAL_DATE = "30/06/2025"
+
+BENCH_CONFIG = """
+[settings]
+url = {url}
+date_cible = 05/07/2025
+debug_mode = {debug_mode}
+default_timeout = {default_timeout}
+long_timeout = {long_timeout}
+lean_browser = {lean_browser}
+liste_items_planning = "Formation", "Jour férié", "RTT Q1"
+
+[work_schedule]
+dimanche = ,
+lundi = En mission,7
+mardi = En mission,7
+mercredi = En mission,7
+jeudi = En mission,7
+vendredi = Formation,7
+samedi = ,
+
+[project_information]
+project_code = 300000000105047
+activity_code = PROJET
+category_code = 10100
+sub_category_code =
+billing_action = Facturable
+
+[additional_information_rest_period_respected]
+dimanche = N/A
+lundi = Oui
+mardi = Oui
+mercredi = Oui
+jeudi = Oui
+vendredi = Oui
+samedi = N/A
+
+[additional_information_work_time_range]
+dimanche = N/A
+lundi = Oui
+mardi = Oui
+mercredi = Oui
+jeudi = Oui
+vendredi = Oui
+samedi = N/A
+
+[additional_information_half_day_worked]
+dimanche = N/A
+lundi = Oui
+mardi = Oui
+mercredi = Oui
+jeudi = Oui
+vendredi = Oui
+samedi = N/A
+
+[additional_information_lunch_break_duration]
+dimanche =
+lundi = 1
+mardi = 1
+mercredi = 1
+jeudi = 1
+vendredi = 1
+samedi =
+
+[work_location_am]
+dimanche = N/A
+lundi = Site client
+mardi = Regulier TLT
+mercredi = Regulier TLT
+jeudi = Site client
+vendredi = Regulier TLT
+samedi = N/A
+
+[work_location_pm]
+dimanche = N/A
+lundi = Site client
+mardi = Regulier TLT
+mercredi = Regulier TLT
+jeudi = Site client
+vendredi = Regulier TLT
+samedi = N/A
+
+[cgi_options_billing_action]
+Facturable = B
+Facture int. = I
+Non facturable = U
+"""
+
+
+def build_app_config(
+    url: str = "http://127.0.0.1/",
+    *,
+    default_timeout: int = 10,
+    long_timeout: int = 20,
+    debug_mode: str = "INFO",
+    lean_browser: bool = False,
+) -> AppConfig:
+    """Return the :class:`AppConfig` matching the mock pages."""
+    parser = ConfigParser(interpolation=None)
+    parser.read_string(
+        BENCH_CONFIG.format(
+            url=url,
+            debug_mode=debug_mode,
+            default_timeout=default_timeout,
+            long_timeout=long_timeout,
+            lean_browser=str(lean_browser).lower(),
+        )
+    )
+    return AppConfig.from_parser(parser)
+
+
+# ---------------------------------------------------------------------------
+# Assets
+# ---------------------------------------------------------------------------
+# Path ➜ (body, content type). Sizes are those of typical PeopleSoft assets.
+ASSETS: dict[str, tuple[bytes, str]] = {
+    "/static/psa-logo.png": (
+        b"\x89PNG\r\n\x1a\n" + bytes(48 * 1024),
+        "image/png",
+    ),
+    "/static/psa-font.woff2": (b"wOF2" + bytes(96 * 1024), "font/woff2"),
+    "/static/analytics.js": (
+        b"window.__psaAnalytics = true;" + b" " * (32 * 1024),
+        "text/javascript",
+    ),
+}
+ASSET_HEAD = (
+    "<style>@font-face{font-family:psa;src:url('/static/psa-font.woff2')}"
+    "body{font-family:psa,sans-serif}</style>"
+    "<script async src='/static/analytics.js'></script>"
+)
+ASSET_BODY = "<img src='/static/psa-logo.png' width='120' height='40' alt='PSA'>"
+
+
+# ---------------------------------------------------------------------------
+# Pages
+# ---------------------------------------------------------------------------
+def _page(title: str, body: str, script: str = "") -> str:
+    return (
+        "<!DOCTYPE html><html lang='fr'><head><meta charset='utf-8'>"
+        f"<title>{html.escape(title)}</title>{ASSET_HEAD}</head>"
+        f"<body>{ASSET_BODY}{body}"
+        f"<script>{script}</script></body></html>"
+    )
+
+
+def _attr(value: str) -> str:
+    return html.escape(value, quote=True)
+
+
+def _input(element_id: str, value: str = "") -> str:
+    return f"<input type='text' id='{_attr(element_id)}' value='{_attr(value)}'>"
+
+
+def _select(element_id: str, options: list[str]) -> str:
+    items = "".join(
+        f"<option value='{_attr(option)}'>{html.escape(option)}</option>"
+        for option in options
+    )
+    return f"<select id='{_attr(element_id)}'>{items}</select>"
+
+
+def render_login() -> str:
+    """Login form submitting to the landing page."""
+    return _page(
+        "Connexion",
+        "<form method='get' action='/home'>"
+        f"{_input(Locators.USERNAME.value)}"
+        f"<input type='password' id='{_attr(Locators.PASSWORD.value)}'>"
+        "<input type='submit' value='Connexion'></form>",
+    )
+
+
+def render_home() -> str:
+    """Landing page holding the time sheet tile."""
+    return _page(
+        "Accueil",
+        f"<a id='{_attr(Locators.NAV_TO_DATE_ENTRY.value)}' href='/timesheet'>"
+        "Feuille de temps</a>",
+    )
+
+
+def render_timesheet() -> str:
+    """Frame page with the side menu and the ``main_target_win0`` iframe."""
+    frame = Locators.MAIN_FRAME.value
+    return _page(
+        "Feuille de temps",
+        f"<a id='{_attr(Locators.SIDE_MENU_BUTTON.value)}' href='#' "
+        "onclick=\"document.body.classList.toggle('menu');return false;\">Menu</a>"
+        f"<iframe id='{_attr(frame)}' name='{_attr(frame)}' src='/date-entry' "
+        "width='1200' height='600'></iframe>",
+    )
+
+
+def render_date_entry() -> str:
+    """Date selection form; submitting it opens the grid in the top window."""
+    return _page(
+        "Ajouter une feuille",
+        "<form method='get' action='/grid' target='_top'>"
+        f"<input type='text' name='date' id='{_attr(Locators.DATE_INPUT.value)}' "
+        f"value='{INITIAL_DATE}'>"
+        f"<input type='submit' id='{_attr(Locators.ADD_BUTTON.value)}' "
+        "value='Ajouter'></form>",
+    )
+
+
+GRID_SCRIPT = """
+window.__psaSaved = false;
+function openModal() {
+    var box = document.getElementById('ptModBox');
+    box.innerHTML = '<iframe id="%(modal)s" name="%(modal)s" src="/additional-info"'
+        + ' width="1000" height="500"></iframe>';
+    box.style.display = 'block';
+}
+function closeModal() {
+    var box = document.getElementById('ptModBox');
+    box.innerHTML = '';
+    box.style.display = 'none';
+}
+function showSaveAlert() {
+    window.__psaSaved = true;
+    document.getElementById('ptAlertBox').innerHTML =
+        '<div id="%(alert)s">Attention : feuille enregistrée en brouillon.</div>'
+        + '<a id="%(ok)s" href="#" onclick="closeAlert();return false;">OK</a>';
+}
+function closeAlert() {
+    document.getElementById('ptAlertBox').innerHTML = '';
+}
+"""
+
+
+def render_grid() -> str:
+    """``POL_DESCR``/``POL_TIME`` grid with the mission row and action links."""
+    mission = "".join(
+        _input(f"TIME{day}${MISSION_ROW}") for day in JOURS_SEMAINE
+    ) + "".join(_input(field.value) for field in MissionField)
+    rows = "".join(
+        f"<tr><td><span id='{_attr(f'{DESCRIPTION_PREFIX}{index}')}'>"
+        f"{html.escape(label)}</span></td>"
+        + "".join(
+            f"<td>{_input(f'{DAY_VALUE_PREFIX}{day}${index}')}</td>"
+            for day in JOURS_SEMAINE
+        )
+        + "</tr>"
+        for index, label in enumerate(GRID_ROWS)
+    )
+    body = (
+        f"<div>{mission}</div><table>{rows}</table>"
+        f"<a id='{_attr(Locators.ADDITIONAL_INFO_LINK.value)}' href='#' "
+        "onclick='openModal();return false;'>Informations complémentaires</a>"
+        f"<a id='{_attr(Locators.SAVE_DRAFT_BUTTON.value)}' href='#' "
+        "onclick='showSaveAlert();return false;'>Enregistrer brouillon</a>"
+        "<div id='ptModBox' style='display:none'></div><div id='ptAlertBox'></div>"
+    )
+    script = GRID_SCRIPT % {
+        "modal": Locators.MODAL_FRAME.value,
+        "alert": Locators.ALERT_CONTENT_1.value,
+        "ok": Locators.CONFIRM_OK.value,
+    }
+    return _page("Feuille de temps - saisie", body, script)
+
+
+def render_additional_info(app_config: AppConfig) -> str:
+    """Additional information modal built from ``ensure_descriptions``."""
+    context = SimpleNamespace(config=app_config, descriptions=[])
+    ensure_descriptions(context)  # type: ignore[arg-type]
+    options = [""] + sorted(
+        {option.label for option in app_config.cgi_options}
+        | {option.label for option in app_config.work_location_options}
+        | {option.label for option in app_config.cgi_options_dejeuner} - {""}
+    )
+    rows_per_prefix: dict[str, int] = defaultdict(int)
+    lines: list[str] = []
+    for description in context.descriptions:
+        row_prefix = description["id_value_ligne"]
+        row = rows_per_prefix[row_prefix]
+        rows_per_prefix[row_prefix] += 1
+        cells = []
+        for day in JOURS_SEMAINE:
+            cell_id = ElementIdBuilder.build_day_input_id(
+                description["id_value_jours"], day, row
+            )
+            if description["type_element"] == "select":
+                cells.append(_select(cell_id, options))
+            else:
+                cells.append(_input(cell_id))
+        lines.append(
+            f"<tr><td><span id='{_attr(f'{row_prefix}{row}')}'>"
+            f"{html.escape(description['description_cible'])}</span></td>"
+            + "".join(f"<td>{cell}</td>" for cell in cells)
+            + "</tr>"
+        )
+    body = (
+        f"<table>{''.join(lines)}</table>"
+        f"<a id='{_attr(Locators.SAVE_ICON.value)}' href='#' "
+        "onclick='parent.closeModal();return false;'>OK</a>"
+    )
+    return _page("Informations complémentaires", body)
+
+
+# ---------------------------------------------------------------------------
+# Server
+# ---------------------------------------------------------------------------
+class _Handler(BaseHTTPRequestHandler):
+    server: _Server
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server API
+        path = urlsplit(self.path).path
+        render = self.server.routes.get(path)
+        if render is None and path not in ASSETS:
+            self.send_error(404)
+            return
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        if render is None:
+            body, content_type = ASSETS[path]
+        else:
+            body, content_type = render().encode("utf-8"), "text/html; charset=utf-8"
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        # Counted before writing so a client never sees the body first.
+        self.server.record(path, len(body))
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        return
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, routes: dict[str, Any], latency: float) -> None:
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.routes = routes
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.requests: dict[str, int] = defaultdict(int)
+        self.bytes_sent = 0
+
+    def record(self, path: str, size: int) -> None:
+        with self.lock:
+            self.requests[path] += 1
+            self.bytes_sent += size
+
+
+class MockPsaTimeServer:
+    """Serve the mock pages on ``127.0.0.1`` from a background thread.
+
+    ``latency_ms`` delays every response, assets included, to mimic the
+    PeopleSoft server.
+    """
+
+    def __init__(
+        self, app_config: AppConfig | None = None, *, latency_ms: int = 0
+    ) -> None:
+        app_config = app_config or build_app_config()
+        routes = {
+            "/": render_login,
+            "/home": render_home,
+            "/timesheet": render_timesheet,
+            "/date-entry": render_date_entry,
+            "/grid": render_grid,
+            "/additional-info": lambda: render_additional_info(app_config),
+        }
+        self._server = _Server(routes, latency_ms / 1000)
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    @property
+    def bytes_sent(self) -> int:
+        return self._server.bytes_sent
+
+    @property
+    def requests(self) -> dict[str, int]:
+        return dict(self._server.requests)
+
+    def reset_counters(self) -> None:
+        """Forget the traffic recorded so far."""
+        with self._server.lock:
+            self._server.requests.clear()
+            self._server.bytes_sent = 0
+
+    def start(self) -> MockPsaTimeServer:
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="psatime-mock", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> MockPsaTimeServer:
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+
+if __name__ == "__main__":
+    with MockPsaTimeServer() as server:
+        print(f"Pages PSA Time simulées sur {server.url} (Ctrl+C pour arrêter)")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
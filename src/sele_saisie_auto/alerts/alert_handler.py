@@ -1,14 +1,14 @@
 # src\sele_saisie_auto\alerts\alert_handler.py
 from __future__ import annotations
 
-from configparser import ConfigParser
 from types import SimpleNamespace
 from typing import TYPE_CHECKING, Any, cast
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 
-from sele_saisie_auto.app_config import AppConfig, AppConfigRaw, get_default_timeout
+from sele_saisie_auto.app_config import AppConfig, get_default_timeout
+from sele_saisie_auto.compiled_config import resolve_compiled
 from sele_saisie_auto.enums import AlertMessage, AlertType, LogLevel
 from sele_saisie_auto.exceptions import AutomationExitError
 from sele_saisie_auto.locators import Locators
@@ -16,7 +16,8 @@ from sele_saisie_auto.logger_utils import format_message, write_log
 from sele_saisie_auto.logging_service import log_info
 from sele_saisie_auto.selenium_utils import click_element_without_wait
 from sele_saisie_auto.selenium_utils.waiter_factory import create_waiter
-from sele_saisie_auto.timeouts import DEFAULT_TIMEOUT, LONG_TIMEOUT
+from sele_saisie_auto.selenium_utils.wrapper import Outcome
+from sele_saisie_auto.timeouts import DEFAULT_TIMEOUT, LONG_TIMEOUT, SETTLE_TIMEOUT
 
 if TYPE_CHECKING:
     from sele_saisie_auto.interfaces import WaiterProtocol
@@ -36,6 +37,11 @@ class AlertHandler:
         "date_alerts": [Locators.ALERT_CONTENT_0.value],
     }
 
+    #: Sign that the date was accepted: the timesheet grid is displayed
+    grid_outcome = Outcome(
+        "grid", Locators.SAVE_DRAFT_BUTTON.value, frame=Locators.MAIN_FRAME.value
+    )
+
     def __init__(
         self, automation: PSATimeAutomation, waiter: WaiterProtocol | None = None
     ) -> None:
@@ -45,16 +51,14 @@ class AlertHandler:
         self._log_file = automation.log_file
         self.waiter: WaiterProtocol
         if waiter is None:
-            cfg = getattr(self.context, "config", None)
-            app_cfg = (
-                AppConfig.from_raw(AppConfigRaw(cfg))
-                if isinstance(cfg, ConfigParser)
-                else None
+            compiled = getattr(automation, "compiled_config", None) or resolve_compiled(
+                getattr(self.context, "config", None)
+            )
+            self.waiter = create_waiter(
+                compiled.default_timeout if compiled else DEFAULT_TIMEOUT
             )
-            timeout = get_default_timeout(app_cfg)
-            self.waiter = create_waiter(timeout)
-            if app_cfg is not None and hasattr(app_cfg, "long_timeout"):
-                self.waiter.wrapper.long_timeout = app_cfg.long_timeout
+            if compiled is not None:
+                self.waiter.wrapper.long_timeout = compiled.long_timeout
         else:
             self.waiter = waiter
 
@@ -88,24 +92,25 @@ class AlertHandler:
         """
         if self.browser_session is not None:
             self.browser_session.go_to_default_content()
-        for alerte in self.alert_configs.get("date_alerts", []):
-            if self.waiter.wait_for_element(
-                driver, By.ID, alerte, timeout=get_default_timeout(self.config)
-            ):
-                click_element_without_wait(
-                    driver, cast(By, By.ID), Locators.CONFIRM_OK.value
-                )
-                log_info(
-                    format_message(AlertMessage.TIME_SHEET_EXISTS_ERROR),
-                    self.log_file,
-                )
-                log_info(
-                    format_message(AlertMessage.MODIFY_DATE_MESSAGE),
-                    self.log_file,
-                )
-                raise AutomationExitError(
-                    format_message(AlertMessage.TIME_SHEET_EXISTS_ERROR)
-                )
+        outcomes = self._alert_outcomes("date_alerts") + [self.grid_outcome]
+        result = self.waiter.wait_for_any(
+            driver, outcomes, timeout=get_default_timeout(self.config)
+        )
+        if result is not None and result.outcome != self.grid_outcome:
+            click_element_without_wait(
+                driver, cast(By, By.ID), Locators.CONFIRM_OK.value
+            )
+            log_info(
+                format_message(AlertMessage.TIME_SHEET_EXISTS_ERROR),
+                self.log_file,
+            )
+            log_info(
+                format_message(AlertMessage.MODIFY_DATE_MESSAGE),
+                self.log_file,
+            )
+            raise AutomationExitError(
+                format_message(AlertMessage.TIME_SHEET_EXISTS_ERROR)
+            )
 
         write_log(
             format_message(AlertMessage.DATE_VALIDATED),
@@ -114,22 +119,27 @@ class AlertHandler:
         )
 
     def handle_save_alerts(self, driver: WebDriver) -> None:
-        """Dismiss any alert shown after saving."""
-        alerts = self.alert_configs.get("save_alerts", [])
+        """Dismiss any alert shown after saving.
+
+        Nothing on the page signals a save without alert, so the alerts are
+        only awaited for :data:`SETTLE_TIMEOUT`.
+        """
         if self.browser_session is not None:
             self.browser_session.go_to_default_content()
-        for alerte in alerts:
-            if self.waiter.wait_for_element(
-                driver, By.ID, alerte, timeout=get_default_timeout(self.config)
-            ):
-                click_element_without_wait(
-                    driver, cast(By, By.ID), Locators.CONFIRM_OK.value
-                )
-                log_info(
-                    format_message(AlertMessage.SAVE_ALERT_WARNING),
-                    self.log_file,
-                )
-                break
+        result = self.waiter.wait_for_any(
+            driver, self._alert_outcomes("save_alerts"), timeout=SETTLE_TIMEOUT
+        )
+        if result is not None:
+            click_element_without_wait(
+                driver, cast(By, By.ID), Locators.CONFIRM_OK.value
+            )
+            log_info(
+                format_message(AlertMessage.SAVE_ALERT_WARNING),
+                self.log_file,
+            )
+
+    def _alert_outcomes(self, group: str) -> list[Outcome]:
+        return [Outcome(alerte, alerte) for alerte in self.alert_configs.get(group, [])]
 
     def handle_alerts(
         self, driver: WebDriver, alert_type: AlertType | str = AlertType.SAVE_ALERTS
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import hashlib
+import marshal
 import os
 from collections.abc import Callable
-from configparser import ConfigParser
-from dataclasses import dataclass
-from typing import Any, NotRequired, TypedDict, TypeVar, cast
+from configparser import DEFAULTSECT, ConfigParser, SectionProxy
+from dataclasses import dataclass, fields
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, NotRequired, TypedDict, TypeVar, cast
 
+from sele_saisie_auto import __version__, config_snapshot
 from sele_saisie_auto.dropdown_options import (
     BillingActionOption,
     CGILunchOption,
@@ -28,9 +32,16 @@ from sele_saisie_auto.dropdown_options import (
 from sele_saisie_auto.dropdown_options import (
     work_schedule_options as default_work_schedule_options,
 )
-from sele_saisie_auto.read_or_write_file_config_ini_utils import read_config_ini
+from sele_saisie_auto.logging_service import log_info
+from sele_saisie_auto.read_or_write_file_config_ini_utils import (
+    get_runtime_config_path,
+    read_config_ini,
+)
 from sele_saisie_auto.timeouts import DEFAULT_TIMEOUT
 
+if TYPE_CHECKING:
+    from sele_saisie_auto.compiled_config import CompiledConfig
+
 T = TypeVar("T")
 
 
@@ -367,6 +378,119 @@ class AppConfig:
 
         return cls.from_parser(raw.parser)
 
+    # ------------------------------------------------------------------ #
+    # Instantané compilé
+    # ------------------------------------------------------------------ #
+    @cached_property
+    def lookup_maps(self) -> dict[str, dict[str, str]]:
+        """Return the lower-cased label -> value map of each dropdown family.
+
+        ``billing_action`` maps a label to its code, the other families map
+        a label to its canonical spelling.
+        """
+
+        return {
+            "work_location": {
+                o.label.lower(): o.label for o in self.work_location_options
+            },
+            "cgi": {o.label.lower(): o.label for o in self.cgi_options},
+            "cgi_dejeuner": {
+                o.label.lower(): o.label for o in self.cgi_options_dejeuner
+            },
+            "billing_action": {
+                o.label.lower(): o.code for o in self.cgi_options_billing_action
+            },
+            "work_schedule": {
+                o.label.lower(): o.label for o in self.work_schedule_options
+            },
+        }
+
+    @cached_property
+    def compiled(self) -> CompiledConfig:
+        """Return the shared :class:`CompiledConfig` of this configuration."""
+
+        from sele_saisie_auto.compiled_config import CompiledConfig
+
+        return CompiledConfig.build(self)
+
+    def to_snapshot(self) -> dict[str, Any]:
+        """Return the configuration as builtins only, ready for :mod:`marshal`."""
+
+        record: dict[str, Any] = {name: getattr(self, name) for name in _PLAIN_FIELDS}
+        record["work_location_options"] = [o.label for o in self.work_location_options]
+        record["cgi_options"] = [o.label for o in self.cgi_options]
+        record["cgi_options_dejeuner"] = [o.label for o in self.cgi_options_dejeuner]
+        record["cgi_options_billing_action"] = [
+            (o.label, o.code) for o in self.cgi_options_billing_action
+        ]
+        record["work_schedule_options"] = [o.label for o in self.work_schedule_options]
+        record["raw"] = {
+            "defaults": dict(self.raw.defaults()),
+            # Own options only: ``items()`` would copy DEFAULT into every section.
+            "sections": {
+                name: dict(options)
+                for name, options in self.raw._sections.items()  # type: ignore[attr-defined]
+            },
+        }
+        record["lookup_maps"] = self.lookup_maps
+        return record
+
+    @classmethod
+    def from_snapshot(cls, record: dict[str, Any]) -> AppConfig:
+        """Rebuild an ``AppConfig`` from :meth:`to_snapshot` output."""
+
+        cfg = cls(
+            **{name: record[name] for name in _PLAIN_FIELDS},
+            work_location_options=[
+                WorkLocationOption(label) for label in record["work_location_options"]
+            ],
+            cgi_options=[CGIOption(label) for label in record["cgi_options"]],
+            cgi_options_dejeuner=[
+                CGILunchOption(label) for label in record["cgi_options_dejeuner"]
+            ],
+            cgi_options_billing_action=[
+                BillingActionOption(label=label, code=code)
+                for label, code in record["cgi_options_billing_action"]
+            ],
+            work_schedule_options=[
+                WorkScheduleOption(label) for label in record["work_schedule_options"]
+            ],
+            raw=_restore_parser(record["raw"]),
+        )
+        cfg.__dict__["lookup_maps"] = record["lookup_maps"]
+        return cfg
+
+
+_OPTION_FIELDS = frozenset(
+    {
+        "work_location_options",
+        "cgi_options",
+        "cgi_options_dejeuner",
+        "cgi_options_billing_action",
+        "work_schedule_options",
+        "raw",
+    }
+)
+_PLAIN_FIELDS: tuple[str, ...] = tuple(
+    f.name for f in fields(AppConfig) if f.name not in _OPTION_FIELDS
+)
+
+
+def _restore_parser(raw: dict[str, Any]) -> ConfigParser:
+    """Rebuild the ``ConfigParser`` stored by :meth:`AppConfig.to_snapshot`."""
+
+    parser = ConfigParser(interpolation=None)
+    if raw["defaults"]:
+        parser.read_dict({DEFAULTSECT: raw["defaults"]})
+    # Option names were already normalised by ``optionxform`` when the file
+    # was parsed: install the sections directly, ``read_dict`` would cost as
+    # much as parsing the file again.
+    sections: dict[str, dict[str, str]] = raw["sections"]
+    parser._sections.update(sections)  # type: ignore[attr-defined]
+    for name in sections:
+        parser._proxies[name] = SectionProxy(parser, name)  # type: ignore[attr-defined]
+    return parser
+
 
 ENV_VAR_MAP: dict[tuple[str, str], str] = {
     ("credentials", "login"): "PSATIME_LOGIN",
@@ -386,23 +510,96 @@ def get_default_timeout(cfg: Any | None) -> int:
     return getattr(cfg, "default_timeout", DEFAULT_TIMEOUT)
 
 
+SNAPSHOT_FORMAT = 1
+"""Version of the snapshot content; bump it when the parsing of ``config.ini``
+changes in a way the source hash below cannot see."""
+
+_SNAPSHOT_SALT: tuple[Any, ...] | None = None
+
+
+def _parser_source_hash() -> str:
+    """Return the SHA-256 of this module, empty when its source is unavailable."""
+
+    try:
+        with open(__file__, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:  # pragma: no cover - frozen build without sources
+        return ""
+
+
+def _snapshot_salt() -> tuple[Any, ...]:
+    """Return what, besides ``config.ini``, the compiled snapshot depends on.
+
+    Besides the dropdown defaults and the :class:`AppConfig` fields, the
+    package version, :data:`SNAPSHOT_FORMAT` and the source of this module
+    are included, so a change of the parsing code invalidates the snapshot.
+    """
+
+    global _SNAPSHOT_SALT
+    if _SNAPSHOT_SALT is None:
+        defaults = marshal.dumps(
+            (
+                [o.label for o in default_work_location_options],
+                [o.label for o in default_cgi_options],
+                [o.label for o in default_cgi_options_dejeuner],
+                [(o.label, o.code) for o in default_cgi_options_billing_action],
+                [o.label for o in default_work_schedule_options],
+            )
+        )
+        _SNAPSHOT_SALT = (
+            SNAPSHOT_FORMAT,
+            __version__,
+            _parser_source_hash(),
+            hashlib.sha256(defaults).hexdigest(),
+            tuple(f.name for f in fields(AppConfig)),
+        )
+    return _SNAPSHOT_SALT
+
+
+def _snapshot_key(config_path: str) -> config_snapshot.SnapshotKey | None:
+    try:
+        return config_snapshot.snapshot_key(config_path, _snapshot_salt())
+    except OSError:
+        return None
+
+
 def load_config(log_file: str | None) -> AppConfig:
     """Load ``config.ini`` and return an :class:`AppConfig`.
 
     Environment variables take precedence over values found in the
-    configuration file.
+    configuration file. Without such variables the resolved configuration is
+    served from the compiled snapshot (:mod:`sele_saisie_auto.config_snapshot`)
+    when it matches the file, and the snapshot is refreshed otherwise;
+    values coming from the environment are never written to it.
     """
-    parser = read_config_ini(log_file=log_file)
-
-    for (section, option), env_var in ENV_VAR_MAP.items():
-        value = os.getenv(env_var)
-        if value is not None:
+    overrides = {
+        key: value
+        for key, env_var in ENV_VAR_MAP.items()
+        if (value := os.getenv(env_var)) is not None
+    }
+    config_path = None if overrides else get_runtime_config_path(log_file=log_file)
+    key = _snapshot_key(config_path) if config_path else None
+    record = (
+        config_snapshot.read_snapshot(config_path, key) if config_path and key else None
+    )
+
+    if record is not None:
+        cfg = AppConfig.from_snapshot(record)
+        log_info("🔹 Configuration chargée depuis l'instantané compilé.", log_file)
+    else:
+        parser = read_config_ini(log_file=log_file)
+        for (section, option), value in overrides.items():
             if not parser.has_section(section):
                 parser.add_section(section)
             parser.set(section, option, value)
 
-    raw_cfg = AppConfigRaw(parser=parser)
-    cfg = AppConfig.from_raw(raw_cfg)
+        raw_cfg = AppConfigRaw(parser=parser)
+        cfg = AppConfig.from_raw(raw_cfg)
+        # The file may have changed while it was parsed: only store the
+        # snapshot if the key still describes what was read.
+        if config_path and key is not None and _snapshot_key(config_path) == key:
+            config_snapshot.write_snapshot(config_path, key, cfg.to_snapshot())
+
     if not cfg.url.strip():
         raise ValueError("L'URL de connexion ne peut pas être vide.")
 
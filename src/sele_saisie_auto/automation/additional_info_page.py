@@ -8,9 +8,12 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support import expected_conditions as ec
 
-from sele_saisie_auto.additional_info_locators import ADDITIONAL_INFO_LOCATORS
 from sele_saisie_auto.alerts import AlertHandler
 from sele_saisie_auto.app_config import AppConfig, get_default_timeout
+from sele_saisie_auto.compiled_config import (
+    build_additional_descriptions,
+    resolve_compiled,
+)
 from sele_saisie_auto.decorators import handle_selenium_errors
 from sele_saisie_auto.interfaces import WaiterProtocol
 from sele_saisie_auto.locators import Locators
@@ -35,65 +38,12 @@ def ensure_descriptions(context: SaisieContext) -> None:
     if getattr(context, "descriptions", None):
         return
 
-    cfg = context.config
-    context.descriptions = [
-        {
-            "description_cible": "Temps de repos de 11h entre 2 jours travaillés respecté",
-            "id_value_ligne": ADDITIONAL_INFO_LOCATORS["ROW_DESCR100"],
-            "id_value_jours": ADDITIONAL_INFO_LOCATORS["DAY_UC_DAILYREST"],
-            "type_element": "select",
-            "valeurs_a_remplir": cfg.additional_information.get(
-                "periode_repos_respectee",
-                {},
-            ),
-        },
-        {
-            "description_cible": (
-                "Mon temps de travail effectif a débuté entre 8h00 et 10h00 et Mon temps de travail effectif a pris fin entre 16h30 et 19h00"
-            ),
-            "id_value_ligne": ADDITIONAL_INFO_LOCATORS["ROW_DESCR100"],
-            "id_value_jours": ADDITIONAL_INFO_LOCATORS["DAY_UC_DAILYREST"],
-            "type_element": "select",
-            "valeurs_a_remplir": cfg.additional_information.get(
-                "horaire_travail_effectif",
-                {},
-            ),
-        },
-        {
-            "description_cible": "J\u2019ai travaillé plus d\u2019une demi-journée",
-            "id_value_ligne": ADDITIONAL_INFO_LOCATORS["ROW_DESCR100"],
-            "id_value_jours": ADDITIONAL_INFO_LOCATORS["DAY_UC_DAILYREST"],
-            "type_element": "select",
-            "valeurs_a_remplir": cfg.additional_information.get(
-                "plus_demi_journee_travaillee",
-                {},
-            ),
-        },
-        {
-            "description_cible": "Durée de la pause déjeuner",
-            "id_value_ligne": ADDITIONAL_INFO_LOCATORS["ROW_DESCR200"],
-            "id_value_jours": ADDITIONAL_INFO_LOCATORS["DAY_UC_DAILYREST_SPECIAL"],
-            "type_element": "input",
-            "valeurs_a_remplir": cfg.additional_information.get(
-                "duree_pause_dejeuner",
-                {},
-            ),
-        },
-        {
-            "description_cible": "Matin",
-            "id_value_ligne": ADDITIONAL_INFO_LOCATORS["ROW_DESCR"],
-            "id_value_jours": ADDITIONAL_INFO_LOCATORS["DAY_UC_LOCATION_A"],
-            "type_element": "select",
-            "valeurs_a_remplir": cfg.work_location_am,
-        },
-        {
-            "description_cible": "Après-midi",
-            "id_value_ligne": ADDITIONAL_INFO_LOCATORS["ROW_DESCR"],
-            "id_value_jours": ADDITIONAL_INFO_LOCATORS["DAY_UC_LOCATION_A"],
-            "type_element": "select",
-            "valeurs_a_remplir": cfg.work_location_pm,
-        },
-    ]
+    compiled = resolve_compiled(context.config)
+    context.descriptions = (
+        compiled.descriptions()
+        if compiled is not None
+        else build_additional_descriptions(context.config)
+    )
 
 
 class AdditionalInfoPage:
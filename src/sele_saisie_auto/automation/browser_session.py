@@ -1,6 +1,8 @@
 # src\sele_saisie_auto\automation\browser_session.py
 from __future__ import annotations
 
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from typing import cast
 
 from selenium.webdriver.common.by import By
@@ -20,7 +22,14 @@ from sele_saisie_auto.selenium_utils import (
     send_keys_to_element,
     wait_for_dom_ready,
 )
-from sele_saisie_auto.selenium_utils.waiter_factory import create_waiter, get_waiter
+from sele_saisie_auto.selenium_utils.batch_fill import fill_and_verify
+from sele_saisie_auto.selenium_utils.command_metrics import CommandMetrics
+from sele_saisie_auto.selenium_utils.lean_profile import LeanProfile
+from sele_saisie_auto.selenium_utils.waiter_factory import (
+    create_waiter,
+    get_waiter,
+    readiness_mode,
+)
 from sele_saisie_auto.shared_utils import get_log_file
 from sele_saisie_auto.timeouts import LONG_TIMEOUT
 
@@ -60,6 +69,8 @@ class SeleniumDriverManager:
             url=url,
             headless=headless,
             no_sandbox=no_sandbox,
+            lean=LeanProfile.from_config(getattr(self.app_config, "raw", None)),
+            track_network=readiness_mode(self.app_config) == "network_idle",
         )
         if self.driver is not None:
             self.driver = definir_taille_navigateur(self.driver, 1260, 800)
@@ -76,6 +87,30 @@ class SeleniumDriverManager:
             self.driver = None
 
 
+@dataclass
+class FrameTracker:
+    """Frame the driver is in and how each frame was found.
+
+    ``path`` lists the frames entered from the top-level document, ``None``
+    when unknown (after an action that may have navigated). ``strategies``
+    remembers whether a frame was found by id or by name.
+    """
+
+    path: tuple[str, ...] | None = ()
+    strategies: dict[str, str] = field(default_factory=dict)
+    switches: int = 0
+    avoided: int = 0
+
+    def reset(self) -> None:
+        """Forget everything after a navigation: the driver is at the top level."""
+        self.path = ()
+        self.strategies.clear()
+
+    def counters(self) -> dict[str, int]:
+        """Return the switch counters for the run metrics."""
+        return {"frame_switches": self.switches, "frame_switches_avoided": self.avoided}
+
+
 class BrowserSession:
     """Encapsulate :class:`SeleniumDriverManager` for higher-level automation."""
 
@@ -90,7 +125,9 @@ class BrowserSession:
         self.waiter: WaiterProtocol
         if waiter is None:
             timeout = get_default_timeout(app_config)
-            internal_waiter: Waiter = create_waiter(timeout)
+            internal_waiter: Waiter = create_waiter(
+                timeout, readiness=readiness_mode(app_config)
+            )
             if app_config is not None and hasattr(app_config, "long_timeout"):
                 internal_waiter.wrapper.long_timeout = app_config.long_timeout
             self.waiter = internal_waiter
@@ -101,6 +138,9 @@ class BrowserSession:
         else:
             self._manager = SeleniumDriverManager(log_file)
         self.driver: WebDriver | None = None
+        # Set by the orchestrator when command instrumentation is enabled.
+        self.command_metrics: CommandMetrics | None = None
+        self.frames = FrameTracker()
 
     def __enter__(self) -> BrowserSession:
         return self
@@ -137,6 +177,7 @@ class BrowserSession:
                 "ERROR",
             )
             raise DriverError(f"Failed to start WebDriver: {exc}") from exc
+        self.frames.reset()
         if self.driver is not None and hasattr(self.driver, "execute_script"):
             self.waiter.wait_for_dom_ready(
                 self.driver,
@@ -151,6 +192,7 @@ class BrowserSession:
             write_log(format_message("BROWSER_CLOSE", {}), self.log_file, "DEBUG")
         self._manager.close()
         self.driver = None
+        self.frames.reset()
 
     # ------------------------------------------------------------------
     # DOM helpers
@@ -158,6 +200,10 @@ class BrowserSession:
     def wait_for_dom(self, driver: WebDriver, max_attempts: int | None = None) -> None:
         """Wait until the DOM is stable and fully loaded.
 
+        With ``network_idle`` readiness the stability check is kept: a
+        PeopleSoft save can end its last request before the grid is redrawn,
+        so network idleness alone does not prove the DOM settled.
+
         Args:
             driver: Selenium WebDriver.
             max_attempts: Number of tries before raising ``RuntimeError`` if the
@@ -192,6 +238,8 @@ class BrowserSession:
         if self.driver is None:
             return False
 
+        # A click may load a page or close the frame the driver is in.
+        self.frames.path = None
         click_element_without_wait(self.driver, cast(By, By.ID), element_id)
         return True
 
@@ -202,38 +250,74 @@ class BrowserSession:
         if self.driver is None:
             return False
 
+        # Keys such as RETURN may submit the page.
+        self.frames.path = None
         send_keys_to_element(self.driver, cast(By, By.ID), element_id, value)
         return True
 
+    def fill_inputs(self, values: Mapping[str, str]) -> list[str] | None:
+        """Fill every ``{element_id: value}`` pair with one script.
+
+        Returns the ids whose value could not be verified, or ``None`` when
+        the browser does not support batch filling.
+        """
+
+        if self.driver is None:
+            return None
+        driver = self.driver
+        return fill_and_verify(
+            driver,
+            values,
+            settle=lambda: self.wait_for_dom(driver),
+        )
+
     # ------------------------------------------------------------------
     # Iframe helpers
     # ------------------------------------------------------------------
     @handle_selenium_errors(default_return=False)
     def go_to_iframe(self, id_or_name: str) -> bool:
-        """Switch to the iframe identified by ``id_or_name``."""
+        """Switch to the iframe identified by ``id_or_name``.
+
+        Does nothing when the driver is already in that iframe. The lookup
+        starts with the strategy (id or name) that found it last time.
+        """
 
         if self.driver is None:
             return False
 
-        try:
-            self.driver.switch_to.frame(self.driver.find_element(By.ID, id_or_name))
+        frames = self.frames
+        if frames.path is not None and frames.path[-1:] == (id_or_name,):
+            frames.avoided += 1
             return True
-        except Exception:  # noqa: BLE001
+        parent, frames.path = frames.path, None
+        cached = frames.strategies.get(id_or_name, By.ID)
+        for by in (cached, By.NAME if cached == By.ID else By.ID):
             try:
-                self.driver.switch_to.frame(
-                    self.driver.find_element(By.NAME, id_or_name)
-                )
-                return True
+                self.driver.switch_to.frame(self.driver.find_element(by, id_or_name))
             except Exception:  # noqa: BLE001
-                return False
+                continue
+            frames.switches += 1
+            frames.strategies[id_or_name] = by
+            if parent is not None:
+                frames.path = (*parent, id_or_name)
+            return True
+        frames.path = parent
+        return False
 
     @handle_selenium_errors(default_return=None)
     def go_to_default_content(self) -> None:
-        """Return to the default document context."""
+        """Return to the default document context, unless already there."""
 
         if self.driver is None:
             return
+        frames = self.frames
+        if frames.path == ():
+            frames.avoided += 1
+            return
+        frames.path = None
         self.driver.switch_to.default_content()
+        frames.switches += 1
+        frames.path = ()
 
 
 def create_session(app_config: AppConfig) -> BrowserSession:
@@ -4,12 +4,12 @@ from __future__ import annotations
 from types import SimpleNamespace
 from typing import TYPE_CHECKING, Any
 
+from selenium.common.exceptions import StaleElementReferenceException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support import expected_conditions as ec
 
-from sele_saisie_auto import messages
 from sele_saisie_auto.alerts import AlertHandler
 from sele_saisie_auto.app_config import AppConfig, get_default_timeout
 from sele_saisie_auto.decorators import handle_selenium_errors
@@ -17,10 +17,9 @@ from sele_saisie_auto.exceptions import AutomationExitError
 from sele_saisie_auto.interfaces import WaiterProtocol
 from sele_saisie_auto.locators import Locators
 from sele_saisie_auto.logger_utils import format_message, write_log
-from sele_saisie_auto.selenium_utils import wait_for_dom_after
+from sele_saisie_auto.selenium_utils import is_document_ready, wait_for_dom_after
 from sele_saisie_auto.selenium_utils.waiter_factory import create_waiter
-from sele_saisie_auto.timeouts import DEFAULT_TIMEOUT, LONG_TIMEOUT
-from sele_saisie_auto.utils.misc import program_break_time
+from sele_saisie_auto.timeouts import DEFAULT_TIMEOUT, LONG_TIMEOUT, SETTLE_TIMEOUT
 
 if TYPE_CHECKING:
     from sele_saisie_auto.navigation import PageNavigator
@@ -173,11 +172,7 @@ class DateEntryPage:
         """
 
         self.handle_date_input(driver, date_cible)
-        program_break_time(
-            1,
-            messages.WAIT_STABILISATION,
-        )
-        write_log(format_message("DOM_STABLE", {}), self.log_file, "DEBUG")
+        self.wait_for_date_accepted(driver)
         if self.submit_date_cible(driver):
             try:
                 self._handle_date_alert(driver)
@@ -186,6 +181,29 @@ class DateEntryPage:
             return True
         return None
 
+    def wait_for_date_accepted(self, driver: WebDriver) -> bool:
+        """Wait for the date round trip to settle, then check the field kept it.
+
+        PeopleSoft validates the typed date on the server and rewrites the
+        page when the response arrives: the DOM going quiet is the signal,
+        the field value alone is already there right after ``send_keys``.
+        """
+        settled = self.waiter.wait_until_dom_is_stable(driver, timeout=SETTLE_TIMEOUT)
+        accepted = self._date_field_accepted(driver)
+        if not (settled and accepted):
+            write_log("Champ date non confirmé après saisie.", self.log_file, "DEBUG")
+        return bool(settled) and accepted
+
+    @staticmethod
+    def _date_field_accepted(driver: WebDriver) -> bool:
+        try:
+            fields = driver.find_elements(By.ID, Locators.DATE_INPUT.value)
+            if not fields or not (fields[0].get_attribute("value") or "").strip():
+                return False
+        except StaleElementReferenceException:
+            return False
+        return is_document_ready(driver)
+
     def _handle_date_alert(self, driver: WebDriver) -> None:
         """Delegate alert handling to :class:`AlertHandler`."""
 
@@ -42,6 +42,13 @@ class LoginHandler:
         """Fill username and password fields using decrypted credentials."""
         if self.log_file is None:
             raise ValueError("log_file is required")
+        if self.is_reused_session(driver):
+            write_log(
+                "Session déjà authentifiée, connexion ignorée.",
+                self.log_file,
+                "DEBUG",
+            )
+            return
         write_log(
             format_message("DECRYPT_CREDENTIALS", {}),
             self.log_file,
@@ -50,7 +57,7 @@ class LoginHandler:
         aes_key, enc_login, enc_pwd = credentials.get_auth_tuple()
         username = self.encryption_service.dechiffrer_donnees(enc_login, aes_key)
         password = self.encryption_service.dechiffrer_donnees(enc_pwd, aes_key)
-        
+
         write_log(format_message("SEND_CREDENTIALS", {}), self.log_file, "DEBUG")
         send_keys_to_element(
             driver,
@@ -71,6 +78,32 @@ class LoginHandler:
             Keys.RETURN,
         )
 
+    @classmethod
+    def is_reused_session(cls, driver: WebDriver) -> bool:
+        """Return ``True`` when a pooled browser is still authenticated.
+
+        Browsers started for this run always show the login form, so the
+        probe only runs for drivers lent by a :class:`DriverPool`.
+        """
+        # Imported here: ``driver_pool`` imports this package.
+        from sele_saisie_auto.resources.driver_pool import is_pooled_driver
+
+        return is_pooled_driver(driver) and cls.is_already_logged_in(driver)
+
+    @staticmethod
+    def is_already_logged_in(driver: WebDriver) -> bool:
+        """Return ``True`` when the home page is shown instead of the login form.
+
+        Happens when the browser is reused from a :class:`DriverPool`.
+        """
+        find_elements = getattr(driver, "find_elements", None)
+        if not callable(find_elements):
+            return False
+        login_form = find_elements(By.ID, Locators.USERNAME.value)
+        if not isinstance(login_form, list) or login_form:
+            return False
+        return bool(find_elements(By.ID, Locators.NAV_TO_DATE_ENTRY.value))
+
     @wait_for_dom_after
     def connect_to_psatime(
         self,
@@ -0,0 +1,415 @@
+"""Run several weeks or consultants in parallel browser sessions.
+
+Each job is executed in its own worker process with its own
+:class:`BrowserSession`, log file and :class:`MemoryConfig` namespace. The
+credentials are encrypted in shared memory by the parent process, which also
+wipes every namespace once the pool has stopped, so a crashed worker cannot
+leave segments behind::
+
+    psatime-auto batch --config alice.ini --config bob.ini \\
+        --from-date 06/07/2024 --weeks 4 --jobs 3 --headless
+"""
+
+from __future__ import annotations
+
+import argparse
+import atexit
+import getpass
+import multiprocessing
+import os
+import time
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
+from configparser import ConfigParser
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import cast
+
+import sele_saisie_auto.shared_utils as shared_utils
+from sele_saisie_auto.app_config import AppConfig
+from sele_saisie_auto.configuration import service_configurator_factory
+from sele_saisie_auto.encryption_utils import EncryptionService
+from sele_saisie_auto.interfaces import LoggerProtocol
+from sele_saisie_auto.logger_utils import LOG_LEVEL_CHOICES
+from sele_saisie_auto.logging_service import Logger, LoggingConfigurator, get_logger
+from sele_saisie_auto.memory_config import MemoryConfig
+from sele_saisie_auto.orchestration import AutomationOrchestrator
+from sele_saisie_auto.read_or_write_file_config_ini_utils import (
+    get_runtime_config_path,
+)
+from sele_saisie_auto.resources.driver_pool import DriverPool, edge_driver_factory
+from sele_saisie_auto.saisie_automatiser_psatime import PSATimeAutomation
+from sele_saisie_auto.shared_memory_service import (
+    cleanup_memory_segments,
+    collect_leaked_segments,
+)
+from sele_saisie_auto.shared_utils import DEFAULT_LOG_DIR
+from sele_saisie_auto.utils.date_utils import get_next_saturday_if_not_saturday
+
+DATE_FORMAT = "%d/%m/%Y"
+DEFAULT_CONCURRENCY = 2
+SUMMARY_LOG_NAME = "batch.html"
+
+CredentialsPrompt = Callable[[str | None], tuple[str, str]]
+ExecutorFactory = Callable[["BatchOptions"], Executor]
+
+# Browsers kept by a worker process between its jobs, per configuration file.
+_DRIVER_POOLS: dict[str | None, DriverPool] = {}
+
+
+@dataclass(frozen=True)
+class BatchJob:
+    """One timesheet to fill: a configuration file and a target week."""
+
+    config_path: str | None = None
+    date_cible: str | None = None
+
+    @property
+    def name(self) -> str:
+        stem = Path(self.config_path).stem if self.config_path else "config"
+        date = self.date_cible.replace("/", "-") if self.date_cible else "auto"
+        return f"{stem}_{date}"
+
+
+@dataclass(frozen=True)
+class BatchOptions:
+    """Settings shared by every job of a batch."""
+
+    log_dir: str
+    concurrency: int = DEFAULT_CONCURRENCY
+    headless: bool = False
+    no_sandbox: bool = False
+    log_level: str | None = None
+    reuse_browsers: bool = False
+
+
+@dataclass(frozen=True)
+class JobResult:
+    """Outcome of one job."""
+
+    job: BatchJob
+    log_file: str
+    duration: float
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class BatchSummary:
+    """Results of every job, in submission order."""
+
+    results: list[JobResult] = field(default_factory=list)
+
+    @property
+    def failed(self) -> list[JobResult]:
+        return [result for result in self.results if not result.ok]
+
+    def format(self) -> str:
+        """Return a human readable report."""
+        succeeded = len(self.results) - len(self.failed)
+        lines = [f"Lot terminé : {succeeded}/{len(self.results)} réussi(s)"]
+        for result in self.results:
+            status = "✅" if result.ok else "❌"
+            line = f"{status} {result.job.name} ({result.duration:.1f} s)"
+            if result.error:
+                line += f" : {result.error}"
+            lines.append(f"{line} — {result.log_file}")
+        return "\n".join(lines)
+
+
+# ----------------------------------------------------------------------------- #
+# ------------------------------- JOB PLANNING -------------------------------- #
+# ----------------------------------------------------------------------------- #
+
+
+def weekly_dates(start: str, weeks: int) -> list[str]:
+    """Return ``weeks`` consecutive Saturdays starting at ``start``."""
+    first = datetime.strptime(get_next_saturday_if_not_saturday(start), DATE_FORMAT)
+    return [(first + timedelta(weeks=i)).strftime(DATE_FORMAT) for i in range(weeks)]
+
+
+def expand_jobs(
+    configs: Sequence[str | None], dates: Sequence[str | None]
+) -> list[BatchJob]:
+    """Return one job per configuration and date."""
+    return [
+        BatchJob(config, date)
+        for config in (configs or [None])
+        for date in (dates or [None])
+    ]
+
+
+def load_job_config(job: BatchJob, log_file: str) -> AppConfig:
+    """Read the configuration of ``job`` and apply its target date."""
+    path = job.config_path or get_runtime_config_path(log_file=log_file)
+    parser = ConfigParser(interpolation=None)
+    with open(path, encoding="utf-8") as f:
+        parser.read_file(f)
+    if job.date_cible:
+        if not parser.has_section("settings"):
+            parser.add_section("settings")
+        parser.set("settings", "date_cible", job.date_cible)
+    return AppConfig.from_parser(parser)
+
+
+# ----------------------------------------------------------------------------- #
+# --------------------------------- WORKER ------------------------------------ #
+# ----------------------------------------------------------------------------- #
+
+
+def run_job(
+    job: BatchJob, memory_config: MemoryConfig, log_file: str, options: BatchOptions
+) -> JobResult:
+    """Fill the timesheet of ``job`` in the current process."""
+    start = time.perf_counter()
+    shared_utils._log_file = log_file
+    try:
+        with get_logger(log_file) as logger:
+            cfg = load_job_config(job, log_file)
+            LoggingConfigurator.setup(log_file, options.log_level, cfg.raw)
+            service_configurator = service_configurator_factory(
+                cfg, memory_config=memory_config
+            )
+            services = service_configurator.build_services(log_file)
+            services.encryption_service.attach()
+            automation = PSATimeAutomation(
+                log_file, cfg, logger=logger, services=services
+            )
+            automation.resource_manager.driver_pool = _driver_pool(
+                job, cfg, log_file, options
+            )
+            orchestrator = AutomationOrchestrator.from_components(
+                automation.resource_manager,
+                automation.page_navigator,
+                service_configurator,
+                automation.context,
+                cast(LoggerProtocol, automation.logger),
+            )
+            orchestrator.execute(
+                headless=options.headless, no_sandbox=options.no_sandbox
+            )
+    except Exception as exc:  # noqa: BLE001
+        return JobResult(
+            job, log_file, time.perf_counter() - start, f"{type(exc).__name__}: {exc}"
+        )
+    return JobResult(job, log_file, time.perf_counter() - start)
+
+
+def _driver_pool(
+    job: BatchJob, cfg: AppConfig, log_file: str, options: BatchOptions
+) -> DriverPool | None:
+    """Return the pool of this worker for the configuration of ``job``."""
+    if not options.reuse_browsers:
+        return None
+    pool = _DRIVER_POOLS.get(job.config_path)
+    if pool is None:
+        factory = edge_driver_factory(
+            cfg, log_file, headless=options.headless, no_sandbox=options.no_sandbox
+        )
+        pool = _DRIVER_POOLS[job.config_path] = DriverPool(factory)
+    return pool
+
+
+@atexit.register
+def _close_driver_pools() -> None:
+    while _DRIVER_POOLS:
+        _, pool = _DRIVER_POOLS.popitem()
+        pool.close()
+
+
+# ----------------------------------------------------------------------------- #
+# --------------------------------- PARENT ------------------------------------ #
+# ----------------------------------------------------------------------------- #
+
+
+def prompt_credentials(config_path: str | None) -> tuple[str, str]:
+    """Ask the login and password used for ``config_path``."""
+    label = config_path or "config.ini"
+    login = input(f"Login ({label}) : ")
+    password = getpass.getpass(f"Password ({label}) : ")
+    return login, password
+
+
+@contextmanager
+def provision_credentials(
+    memory_config: MemoryConfig, login: str, password: str, log_file: str
+) -> Iterator[None]:
+    """Store encrypted credentials under ``memory_config`` until exit."""
+    try:
+        with EncryptionService(log_file, memory_config=memory_config) as service:
+            key = cast(bytes, service.cle_aes)
+            service.store_credentials(
+                service.chiffrer_donnees(login, key),
+                service.chiffrer_donnees(password, key),
+            )
+            yield
+    finally:
+        cleanup_memory_segments(memory_config)
+
+
+def process_pool(options: BatchOptions) -> Executor:
+    """Return the worker pool of a batch.
+
+    Without ``reuse_browsers`` every job starts in a fresh process.
+    """
+    return ProcessPoolExecutor(
+        max_workers=max(1, options.concurrency),
+        mp_context=multiprocessing.get_context("spawn"),
+        max_tasks_per_child=None if options.reuse_browsers else 1,
+    )
+
+
+def run_batch(
+    jobs: Sequence[BatchJob],
+    options: BatchOptions,
+    *,
+    prompt: CredentialsPrompt = prompt_credentials,
+    worker: Callable[..., JobResult] = run_job,
+    executor_factory: ExecutorFactory = process_pool,
+) -> BatchSummary:
+    """Run ``jobs`` with at most ``options.concurrency`` workers."""
+    os.makedirs(options.log_dir, exist_ok=True)
+    summary_log = os.path.join(options.log_dir, SUMMARY_LOG_NAME)
+    credentials: dict[str | None, tuple[str, str]] = {}
+    planned: list[tuple[BatchJob, MemoryConfig, str]] = []
+    results: dict[int, JobResult] = {}
+    with ExitStack() as stack:
+        for index, job in enumerate(jobs):
+            if job.config_path not in credentials:
+                credentials[job.config_path] = prompt(job.config_path)
+            memory_config = MemoryConfig.with_uuid()
+            stack.enter_context(
+                provision_credentials(
+                    memory_config, *credentials[job.config_path], summary_log
+                )
+            )
+            log_file = os.path.join(options.log_dir, f"{index:02d}_{job.name}.html")
+            planned.append((job, memory_config, log_file))
+        credentials.clear()
+
+        executor = stack.enter_context(executor_factory(options))
+        futures = {
+            executor.submit(worker, job, memory_config, log_file, options): index
+            for index, (job, memory_config, log_file) in enumerate(planned)
+        }
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                results[index] = future.result()
+            except Exception as exc:  # noqa: BLE001 - crashed worker
+                job, _, log_file = planned[index]
+                results[index] = JobResult(
+                    job, log_file, 0.0, f"Processus interrompu : {exc!r}"
+                )
+    return BatchSummary([results[index] for index in sorted(results)])
+
+
+# ----------------------------------------------------------------------------- #
+# ---------------------------------- CLI -------------------------------------- #
+# ----------------------------------------------------------------------------- #
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse the arguments of ``psatime-auto batch``."""
+    parser = argparse.ArgumentParser(
+        prog="psatime-auto batch",
+        description="Fill several weeks or consultants in parallel",
+    )
+    parser.add_argument(
+        "--config",
+        action="append",
+        default=[],
+        help="Configuration file of a consultant (repeatable)",
+    )
+    parser.add_argument(
+        "--date",
+        action="append",
+        default=[],
+        help="Target date dd/mm/yyyy (repeatable)",
+    )
+    parser.add_argument("--from-date", help="First week to backfill (dd/mm/yyyy)")
+    parser.add_argument(
+        "--weeks",
+        type=int,
+        default=1,
+        help="Number of weeks filled from --from-date",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help="Maximum number of browsers running at the same time",
+    )
+    parser.add_argument("--log-dir", help="Directory receiving one log file per job")
+    parser.add_argument(
+        "-l",
+        "--log-level",
+        choices=LOG_LEVEL_CHOICES,
+        help="Override log level",
+    )
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="Run the browsers in headless mode",
+    )
+    parser.add_argument(
+        "--reuse-browsers",
+        action="store_true",
+        help="Keep each worker's authenticated browser for its next job",
+    )
+    parser.add_argument(
+        "--no-sandbox",
+        action="store_true",
+        help="Disable the browser sandbox",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run a batch and return ``1`` when at least one job failed."""
+    args = parse_args(argv)
+    dates: list[str | None] = list(args.date)
+    if args.from_date:
+        dates.extend(weekly_dates(args.from_date, args.weeks))
+    log_dir = args.log_dir or os.path.join(
+        DEFAULT_LOG_DIR, f"batch_{datetime.now():%Y-%m-%d_%H%M%S}"
+    )
+    options = BatchOptions(
+        log_dir=log_dir,
+        concurrency=args.jobs,
+        headless=args.headless,
+        no_sandbox=args.no_sandbox,
+        log_level=args.log_level,
+        reuse_browsers=args.reuse_browsers,
+    )
+    reclaimed = collect_leaked_segments()
+    if reclaimed:
+        print(f"{len(reclaimed)} segment(s) orphelin(s) d'un lot précédent supprimé(s)")
+    summary = run_batch(expand_jobs(args.config, dates), options)
+    report = summary.format()
+    print(report)
+    with Logger(os.path.join(log_dir, SUMMARY_LOG_NAME)) as logger:
+        for line in report.splitlines():
+            logger.info(line)
+    return 1 if summary.failed else 0
+
+
+__all__ = [
+    "BatchJob",
+    "BatchOptions",
+    "BatchSummary",
+    "JobResult",
+    "expand_jobs",
+    "load_job_config",
+    "main",
+    "parse_args",
+    "run_batch",
+    "run_job",
+    "weekly_dates",
+]
@@ -4,18 +4,42 @@ from __future__ import annotations
 
 import argparse
 import getpass
-from typing import cast
+import sys
+from typing import TYPE_CHECKING, cast
 
 import sele_saisie_auto.shared_utils as shared_utils
 from sele_saisie_auto import __version__
-from sele_saisie_auto.config_manager import ConfigManager
-from sele_saisie_auto.configuration import service_configurator_factory
-from sele_saisie_auto.interfaces import LoggerProtocol
-from sele_saisie_auto.logger_utils import LOG_LEVEL_CHOICES
+from sele_saisie_auto.logger_utils import LOG_FORMAT_CHOICES, LOG_LEVEL_CHOICES
 from sele_saisie_auto.logging_service import LoggingConfigurator, get_logger
-from sele_saisie_auto.orchestration import AutomationOrchestrator
-from sele_saisie_auto.saisie_automatiser_psatime import PSATimeAutomation
 from sele_saisie_auto.shared_utils import get_log_file
+from sele_saisie_auto.utils.lazy import lazy_attributes, resolve_lazy
+
+# Selenium, cryptography and the automation classes are only needed once
+# ``main`` actually runs the automation: ``--help``, ``--version``,
+# ``--cleanup-mem`` and the subcommands never import them.
+_LAZY_IMPORTS: dict[str, str] = {
+    "AutomationOrchestrator": "sele_saisie_auto.orchestration:AutomationOrchestrator",
+    "CommandMetrics": "sele_saisie_auto.selenium_utils.command_metrics:CommandMetrics",
+    "ConfigManager": "sele_saisie_auto.config_manager:ConfigManager",
+    "LoggerProtocol": "sele_saisie_auto.interfaces:LoggerProtocol",
+    "PSATimeAutomation": "sele_saisie_auto.saisie_automatiser_psatime:PSATimeAutomation",
+    "collect_leaked_segments": (
+        "sele_saisie_auto.shared_memory_service:collect_leaked_segments"
+    ),
+    "service_configurator_factory": (
+        "sele_saisie_auto.configuration:service_configurator_factory"
+    ),
+}
+__getattr__, __dir__ = lazy_attributes(globals(), _LAZY_IMPORTS)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from sele_saisie_auto.config_manager import ConfigManager
+    from sele_saisie_auto.configuration import service_configurator_factory
+    from sele_saisie_auto.interfaces import LoggerProtocol
+    from sele_saisie_auto.orchestration import AutomationOrchestrator
+    from sele_saisie_auto.saisie_automatiser_psatime import PSATimeAutomation
+    from sele_saisie_auto.selenium_utils.command_metrics import CommandMetrics
+    from sele_saisie_auto.shared_memory_service import collect_leaked_segments
 
 
 def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
@@ -29,6 +53,11 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         choices=LOG_LEVEL_CHOICES,
         help="Override log level",
     )
+    parser.add_argument(
+        "--log-format",
+        choices=LOG_FORMAT_CHOICES,
+        help="Format of the daily log file (html by default)",
+    )
     parser.add_argument(
         "--headless",
         action="store_true",
@@ -39,6 +68,11 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         action="store_true",
         help="Disable the browser sandbox",
     )
+    parser.add_argument(
+        "--command-metrics",
+        action="store_true",
+        help="Record WebDriver command timings and append them to the log",
+    )
     parser.add_argument(
         "--cleanup-mem",
         action="store_true",
@@ -54,18 +88,41 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
 
 
 def main(argv: list[str] | None = None) -> None:
-    """Run the automation from the command line."""
+    """Run the automation from the command line.
+
+    ``psatime-auto batch ...`` is delegated to :mod:`sele_saisie_auto.batch`
+    and ``psatime-auto logs ...`` to :mod:`sele_saisie_auto.jsonl_log`.
+    """
+
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv[:1] == ["batch"]:
+        from sele_saisie_auto.batch import main as batch_main
+
+        raise SystemExit(batch_main(argv[1:]))
+    if argv[:1] == ["logs"]:
+        from sele_saisie_auto.jsonl_log import main as logs_main
 
+        raise SystemExit(logs_main(argv[1:]))
     args = parse_args(argv)
     if args.cleanup_mem:
-        from sele_saisie_auto.launcher import cleanup_memory_segments
+        from sele_saisie_auto import shared_memory_service
 
-        cleanup_memory_segments()
+        shared_memory_service.cleanup_memory_segments()
+        reclaimed = shared_memory_service.collect_leaked_segments()
+        print(f"{len(reclaimed)} segment(s) orphelin(s) supprimé(s)")
+        for name in reclaimed:
+            print(f"  {name}")
         return
+    resolve_lazy(globals(), _LAZY_IMPORTS)
+    log_format = getattr(args, "log_format", None)
+    if log_format and shared_utils._log_file is None:
+        shared_utils._log_file = shared_utils.setup_logs(log_format=log_format)
     log_file = get_log_file()
     with get_logger(log_file) as logger:
         cfg = ConfigManager(log_file=log_file).load()
         LoggingConfigurator.setup(log_file, args.log_level, cfg.raw)
+        collect_leaked_segments(logger)
 
         service_configurator = service_configurator_factory(cfg)
         services = service_configurator.build_services(log_file)
@@ -98,6 +155,9 @@ def main(argv: list[str] | None = None) -> None:
             service_configurator,
             automation.context,
             cast(LoggerProtocol, automation.logger),
+            command_metrics=(
+                CommandMetrics() if getattr(args, "command_metrics", False) else None
+            ),
         )
         orchestrator.run(headless=args.headless, no_sandbox=args.no_sandbox)
 
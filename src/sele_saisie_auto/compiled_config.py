@@ -0,0 +1,169 @@
+# src\sele_saisie_auto\compiled_config.py
+"""Read-only lookups derived once from an :class:`AppConfig`.
+
+:class:`CompiledConfig` gathers what the pages and helpers used to rebuild
+from the configuration on every run: the label -> code map of each dropdown
+family, the project information translated to codes, the timesheet context,
+the timeouts and the additional information descriptions. It is built on
+first access of :attr:`AppConfig.compiled` and shared by every consumer of
+that configuration.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from configparser import ConfigParser
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, cast
+
+from sele_saisie_auto.additional_info_locators import ADDITIONAL_INFO_LOCATORS
+from sele_saisie_auto.app_config import AppConfig
+from sele_saisie_auto.saisie_context import TimeSheetContext
+
+
+def build_additional_descriptions(cfg: Any) -> list[dict[str, object]]:
+    """Return the rows of the additional information modal filled from ``cfg``."""
+
+    return [
+        {
+            "description_cible": "Temps de repos de 11h entre 2 jours travaillés respecté",
+            "id_value_ligne": ADDITIONAL_INFO_LOCATORS["ROW_DESCR100"],
+            "id_value_jours": ADDITIONAL_INFO_LOCATORS["DAY_UC_DAILYREST"],
+            "type_element": "select",
+            "valeurs_a_remplir": cfg.additional_information.get(
+                "periode_repos_respectee",
+                {},
+            ),
+        },
+        {
+            "description_cible": (
+                "Mon temps de travail effectif a débuté entre 8h00 et 10h00 et Mon temps de travail effectif a pris fin entre 16h30 et 19h00"
+            ),
+            "id_value_ligne": ADDITIONAL_INFO_LOCATORS["ROW_DESCR100"],
+            "id_value_jours": ADDITIONAL_INFO_LOCATORS["DAY_UC_DAILYREST"],
+            "type_element": "select",
+            "valeurs_a_remplir": cfg.additional_information.get(
+                "horaire_travail_effectif",
+                {},
+            ),
+        },
+        {
+            "description_cible": "J’ai travaillé plus d’une demi-journée",
+            "id_value_ligne": ADDITIONAL_INFO_LOCATORS["ROW_DESCR100"],
+            "id_value_jours": ADDITIONAL_INFO_LOCATORS["DAY_UC_DAILYREST"],
+            "type_element": "select",
+            "valeurs_a_remplir": cfg.additional_information.get(
+                "plus_demi_journee_travaillee",
+                {},
+            ),
+        },
+        {
+            "description_cible": "Durée de la pause déjeuner",
+            "id_value_ligne": ADDITIONAL_INFO_LOCATORS["ROW_DESCR200"],
+            "id_value_jours": ADDITIONAL_INFO_LOCATORS["DAY_UC_DAILYREST_SPECIAL"],
+            "type_element": "input",
+            "valeurs_a_remplir": cfg.additional_information.get(
+                "duree_pause_dejeuner",
+                {},
+            ),
+        },
+        {
+            "description_cible": "Matin",
+            "id_value_ligne": ADDITIONAL_INFO_LOCATORS["ROW_DESCR"],
+            "id_value_jours": ADDITIONAL_INFO_LOCATORS["DAY_UC_LOCATION_A"],
+            "type_element": "select",
+            "valeurs_a_remplir": cfg.work_location_am,
+        },
+        {
+            "description_cible": "Après-midi",
+            "id_value_ligne": ADDITIONAL_INFO_LOCATORS["ROW_DESCR"],
+            "id_value_jours": ADDITIONAL_INFO_LOCATORS["DAY_UC_LOCATION_A"],
+            "type_element": "select",
+            "valeurs_a_remplir": cfg.work_location_pm,
+        },
+    ]
+
+
+@dataclass(frozen=True)
+class CompiledConfig:
+    """Immutable view of an :class:`AppConfig` with its derived lookups."""
+
+    app_config: AppConfig
+    lookups: Mapping[str, Mapping[str, str]]
+    project_mission_info: Mapping[str, str]
+    item_descriptions: tuple[str, ...]
+    work_days: Mapping[str, tuple[str, str]]
+    default_timeout: int
+    long_timeout: int
+    additional_descriptions: tuple[Mapping[str, object], ...]
+
+    @classmethod
+    def build(cls, app_config: AppConfig) -> CompiledConfig:
+        """Derive every lookup of ``app_config``; prefer :attr:`AppConfig.compiled`."""
+
+        lookups = {
+            family: MappingProxyType(dict(values))
+            for family, values in app_config.lookup_maps.items()
+        }
+        billing = lookups["billing_action"]
+        project_mission_info = {
+            str(item): billing.get(str(value).lower(), str(value))
+            for item, value in app_config.project_information.items()
+        }
+        return cls(
+            app_config=app_config,
+            lookups=MappingProxyType(lookups),
+            project_mission_info=MappingProxyType(project_mission_info),
+            item_descriptions=tuple(app_config.liste_items_planning),
+            work_days=MappingProxyType(
+                dict(cast(dict[str, tuple[str, str]], app_config.work_schedule))
+            ),
+            default_timeout=app_config.default_timeout,
+            long_timeout=app_config.long_timeout,
+            additional_descriptions=tuple(
+                MappingProxyType(row)
+                for row in build_additional_descriptions(app_config)
+            ),
+        )
+
+    def code_for(self, family: str, label: str) -> str:
+        """Return the value of ``label`` in ``family`` (any case), else ``label``."""
+
+        return self.lookups.get(family, {}).get(label.lower(), label)
+
+    def descriptions(self) -> list[dict[str, object]]:
+        """Return a mutable copy of the additional information descriptions."""
+
+        return [dict(row) for row in self.additional_descriptions]
+
+    def timesheet_context(self, log_file: str) -> TimeSheetContext:
+        """Return a new :class:`TimeSheetContext` for ``log_file``."""
+
+        return TimeSheetContext(
+            log_file=log_file,
+            item_descriptions=list(self.item_descriptions),
+            work_days=dict(self.work_days),
+            project_mission_info=dict(self.project_mission_info),
+            config=self.app_config.raw,
+            compiled=self,
+        )
+
+
+def resolve_compiled(source: object) -> CompiledConfig | None:
+    """Return the :class:`CompiledConfig` behind ``source`` when it has one.
+
+    ``source`` may already be compiled, be an :class:`AppConfig` (memoized) or
+    a bare ``ConfigParser`` (compiled on the spot). Anything else gives ``None``.
+    """
+
+    if isinstance(source, CompiledConfig):
+        return source
+    if isinstance(source, AppConfig):
+        return source.compiled
+    if isinstance(source, ConfigParser):
+        return AppConfig.from_parser(source).compiled
+    return None
+
+
+__all__ = ["CompiledConfig", "build_additional_descriptions", "resolve_compiled"]
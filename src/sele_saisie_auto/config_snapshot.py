@@ -0,0 +1,100 @@
+# src\sele_saisie_auto\config_snapshot.py
+"""Compiled snapshot of the resolved configuration kept next to ``config.ini``.
+
+:func:`sele_saisie_auto.app_config.load_config` stores the fully resolved
+:class:`~sele_saisie_auto.app_config.AppConfig` in ``.config.ini.snapshot``
+as a single :mod:`marshal` blob. A warm start reads that blob once instead of
+parsing the INI file and rebuilding every option list.
+
+The snapshot is only used when its key matches exactly: modification time,
+size and SHA-256 of ``config.ini`` plus a caller supplied salt (format
+version, dropdown defaults, ``AppConfig`` fields). Any mismatch, unreadable
+or truncated blob counts as a miss.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import marshal
+import os
+import sys
+from typing import Any
+
+SNAPSHOT_VERSION = 1
+SNAPSHOT_PREFIX = "."
+SNAPSHOT_SUFFIX = ".snapshot"
+
+SnapshotKey = tuple[Any, ...]
+
+
+def snapshot_path(config_path: str) -> str:
+    """Return the snapshot path of ``config_path`` (hidden file, same folder)."""
+    folder, name = os.path.split(config_path)
+    return os.path.join(folder, f"{SNAPSHOT_PREFIX}{name}{SNAPSHOT_SUFFIX}")
+
+
+def snapshot_key(config_path: str, salt: tuple[Any, ...] = ()) -> SnapshotKey:
+    """Return the key of the current content of ``config_path``.
+
+    Raises :class:`OSError` when the file cannot be read.
+    """
+    with open(config_path, "rb") as f:
+        stat = os.fstat(f.fileno())
+        digest = hashlib.sha256(f.read()).hexdigest()
+    return (
+        SNAPSHOT_VERSION,
+        sys.version_info[:2],
+        os.path.abspath(config_path),
+        stat.st_mtime_ns,
+        stat.st_size,
+        digest,
+        salt,
+    )
+
+
+def read_snapshot(config_path: str, key: SnapshotKey) -> dict[str, Any] | None:
+    """Return the record stored for ``key``; ``None`` on any miss."""
+    try:
+        with open(snapshot_path(config_path), "rb") as f:
+            # Written by write_snapshot() only and checked against the key.
+            stored_key, record = marshal.loads(f.read())  # nosec B302
+    except (OSError, ValueError, EOFError, TypeError):
+        return None
+    if stored_key != key or not isinstance(record, dict):
+        return None
+    return record
+
+
+def write_snapshot(config_path: str, key: SnapshotKey, record: dict[str, Any]) -> bool:
+    """Store ``record`` under ``key`` atomically; ``False`` when it cannot be written."""
+    path = snapshot_path(config_path)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(marshal.dumps((key, record)))
+        os.replace(tmp, path)
+    except (OSError, ValueError):
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        return False
+    return True
+
+
+def remove_snapshot(config_path: str) -> None:
+    """Delete the snapshot of ``config_path`` if present."""
+    try:
+        os.remove(snapshot_path(config_path))
+    except FileNotFoundError:
+        pass
+
+
+__all__ = [
+    "SNAPSHOT_VERSION",
+    "read_snapshot",
+    "remove_snapshot",
+    "snapshot_key",
+    "snapshot_path",
+    "write_snapshot",
+]
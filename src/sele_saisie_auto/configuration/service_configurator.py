@@ -7,6 +7,7 @@ from typing import cast
 from sele_saisie_auto.app_config import AppConfig, get_default_timeout
 from sele_saisie_auto.automation import LoginHandler
 from sele_saisie_auto.automation.browser_session import BrowserSession
+from sele_saisie_auto.compiled_config import CompiledConfig, resolve_compiled
 from sele_saisie_auto.encryption_utils import (
     DefaultEncryptionBackend,
     EncryptionBackend,
@@ -20,6 +21,7 @@ from sele_saisie_auto.interfaces import (
 from sele_saisie_auto.logging_service import get_logger
 from sele_saisie_auto.memory_config import MemoryConfig
 from sele_saisie_auto.selenium_utils import Waiter
+from sele_saisie_auto.selenium_utils.waiter_factory import readiness_mode
 
 
 @dataclass
@@ -30,6 +32,7 @@ class Services:
     browser_session: BrowserSessionProtocol
     waiter: WaiterProtocol
     login_handler: LoginHandlerProtocol
+    config: CompiledConfig | None = None
 
 
 class ServiceConfigurator:
@@ -97,6 +100,7 @@ class ServiceConfigurator:
         return Waiter(
             default_timeout=get_default_timeout(self.app_config),
             long_timeout=self.app_config.long_timeout,
+            readiness=readiness_mode(self.app_config),
         )
 
     def create_browser_session(self, log_file: str) -> BrowserSessionProtocol:
@@ -134,6 +138,7 @@ class ServiceConfigurator:
             cast(BrowserSessionProtocol, browser_session),
             waiter,
             login_handler,
+            resolve_compiled(self.app_config),
         )
 
 
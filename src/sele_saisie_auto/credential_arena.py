@@ -0,0 +1,86 @@
+"""Directory of typed credential slots stored in a single shared memory segment.
+
+The arena payload (framed by :mod:`sele_saisie_auto.shared_memory_service`)
+is a slot count followed by one record per slot::
+
+    kind (1) | name length (1) | reserved (2) | data length (4) | name | data
+
+``key``, ``login`` and ``password`` have their own kind; any other name is an
+extra slot. Decoding walks ``memoryview`` slices of the mapping and only
+copies the data of each slot.
+"""
+
+from __future__ import annotations
+
+import struct
+from collections.abc import Mapping
+from enum import IntEnum
+
+from sele_saisie_auto.exceptions import SegmentFormatError
+
+KEY_SLOT = "key"
+LOGIN_SLOT = "login"
+PASSWORD_SLOT = "password"
+
+
+class SlotKind(IntEnum):
+    """Type of an arena slot."""
+
+    KEY = 1
+    LOGIN = 2
+    PASSWORD = 3
+    EXTRA = 4
+
+
+_TYPED_SLOTS = {
+    KEY_SLOT: SlotKind.KEY,
+    LOGIN_SLOT: SlotKind.LOGIN,
+    PASSWORD_SLOT: SlotKind.PASSWORD,
+}
+_KINDS = frozenset(SlotKind)
+_COUNT = struct.Struct("<H")
+_RECORD = struct.Struct("<BB2xI")
+
+
+def encode_slots(slots: Mapping[str, bytes]) -> bytes:
+    """Return the arena payload holding ``slots`` in insertion order."""
+
+    parts = [_COUNT.pack(len(slots))]
+    for name, data in slots.items():
+        raw_name = name.encode()
+        if len(raw_name) > 255:
+            raise ValueError(f"nom d'emplacement trop long : {name!r}")
+        kind = _TYPED_SLOTS.get(name, SlotKind.EXTRA)
+        parts += [_RECORD.pack(kind, len(raw_name), len(data)), raw_name, data]
+    return b"".join(parts)
+
+
+def decode_slots(payload: memoryview) -> dict[str, bytes]:
+    """Return the slots of an arena ``payload`` by name."""
+
+    try:
+        (count,) = _COUNT.unpack_from(payload)
+        offset = _COUNT.size
+        slots = {}
+        for _ in range(count):
+            kind, name_len, data_len = _RECORD.unpack_from(payload, offset)
+            offset += _RECORD.size
+            name = bytes(payload[offset : offset + name_len]).decode()
+            offset += name_len
+            if kind not in _KINDS or offset + data_len > len(payload):
+                raise SegmentFormatError("répertoire de l'arène incohérent")
+            slots[name] = bytes(payload[offset : offset + data_len])
+            offset += data_len
+    except (struct.error, UnicodeDecodeError) as exc:
+        raise SegmentFormatError("répertoire de l'arène illisible") from exc
+    return slots
+
+
+__all__ = [
+    "KEY_SLOT",
+    "LOGIN_SLOT",
+    "PASSWORD_SLOT",
+    "SlotKind",
+    "decode_slots",
+    "encode_slots",
+]
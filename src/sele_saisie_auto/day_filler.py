@@ -29,7 +29,13 @@ from sele_saisie_auto import messages
 from sele_saisie_auto.constants import JOURS_SEMAINE
 from sele_saisie_auto.enums import MissionField
 from sele_saisie_auto.interfaces import LoggerProtocol, WaiterProtocol
-from sele_saisie_auto.timeouts import DEFAULT_TIMEOUT
+from sele_saisie_auto.selenium_utils.batch_fill import (
+    fill_and_verify,
+    supports_batch_fill,
+)
+from sele_saisie_auto.selenium_utils.grid_snapshot import GridSnapshot
+from sele_saisie_auto.selenium_utils.row_index import RowIndex
+from sele_saisie_auto.timeouts import DEFAULT_TIMEOUT, SETTLE_TIMEOUT
 from sele_saisie_auto.utils.mission import est_en_mission
 
 if TYPE_CHECKING:
@@ -144,12 +150,16 @@ class DayFiller:
         context: TimeSheetContext,
         logger: LoggerProtocol | None,
         waiter: WaiterProtocol | None = None,
+        *,
+        batch_fill: bool = True,
     ) -> None:
         self.context = context
         self.waiter = waiter
         self.logger = logger
         log_file = context.log_file if logger is None else logger.log_file
         self.log_file: str = log_file or ""
+        self.row_index = RowIndex()
+        self.batch_fill = batch_fill
 
     def wait_for_dom(
         self, driver: WebDriver, waiter: WaiterProtocol | None = None
@@ -193,6 +203,16 @@ class DayFiller:
                     collected.append(jour_rempli)
         return collected
 
+    def _find_row_index(self, driver: WebDriver, description_cible: str) -> int | None:
+        """Cherche la ligne via :class:`RowIndex`, ou en parcourant le DOM."""
+        if self.row_index.ensure(driver):
+            return self.row_index.find(description_cible)
+        rjf = _rjf()
+        return cast(
+            int | None,
+            rjf.trouver_ligne_par_description(driver, description_cible, "POL_DESCR$"),
+        )
+
     def remplir_jours(
         self,
         driver: WebDriver,
@@ -202,13 +222,18 @@ class DayFiller:
     ) -> list[str]:
         if not item_descriptions:
             return filled_days
-        rjf = _rjf()
+        # Une seule lecture de la grille remplace un aller-retour par cellule.
+        snapshot = GridSnapshot.capture(driver)
+        if snapshot is not None:
+            self.row_index.load(driver, snapshot)
 
         for description_cible in item_descriptions:
-            row_index = rjf.trouver_ligne_par_description(
-                driver, description_cible, "POL_DESCR$"
-            )
-            if row_index is not None:
+            row_index = self._find_row_index(driver, description_cible)
+            if row_index is None:
+                continue
+            if snapshot is not None:
+                filled_days.extend(snapshot.filled_days(row_index, week_days))
+            else:
                 filled_days.extend(
                     self._collect_filled_days_for_row(driver, row_index, week_days)
                 )
@@ -219,9 +244,7 @@ class DayFiller:
     ) -> tuple[str, Any | None]:
         rjf = _rjf()
 
-        row_index = rjf.trouver_ligne_par_description(
-            driver, description_cible, "POL_DESCR$"
-        )
+        row_index = self._find_row_index(driver, description_cible)
         if row_index is None:
             return "", None
         input_id = f"POL_TIME{JOUR_TO_INDEX[jour]}${row_index}"
@@ -276,12 +299,72 @@ class DayFiller:
                 jour, value_to_fill, 0, "après insertion", self.log_file
             )
 
+    def _batch_targets(
+        self,
+        driver: WebDriver,
+        work_days: dict[str, tuple[str, str]],
+        filled_days: list[str],
+    ) -> dict[str, tuple[str, str]]:
+        """Retourne ``{field_id: (jour, valeur)}`` pour les jours à saisir."""
+        targets: dict[str, tuple[str, str]] = {}
+        for jour, (description_cible, value_to_fill) in work_days.items():
+            if jour in filled_days or not description_cible:
+                continue
+            if est_en_mission(description_cible):
+                field_id = f"TIME{JOUR_TO_INDEX[jour]}$0"
+            else:
+                row_index = self._find_row_index(driver, description_cible)
+                if row_index is None:
+                    continue
+                field_id = f"POL_TIME{JOUR_TO_INDEX[jour]}${row_index}"
+            targets[field_id] = (jour, value_to_fill)
+        return targets
+
+    def remplir_mission_en_lot(
+        self,
+        driver: WebDriver,
+        work_days: dict[str, tuple[str, str]],
+        filled_days: list[str],
+    ) -> list[str] | None:
+        """Saisit toute la grille en un script puis vérifie en une lecture.
+
+        Seules les cellules non confirmées repassent par
+        :meth:`insert_with_retries`. Retourne ``None`` si le driver ne permet
+        pas la saisie groupée.
+        """
+        if not supports_batch_fill(driver):
+            return None
+        targets = self._batch_targets(driver, work_days, filled_days)
+        failed = fill_and_verify(
+            driver,
+            {field_id: value for field_id, (_, value) in targets.items()},
+            settle=lambda: self.wait_for_dom(driver, self.waiter),
+        )
+        if failed is None:
+            return None
+        rjf = _rjf()
+        for field_id, (jour, value_to_fill) in targets.items():
+            if field_id in failed and not self.insert_with_retries(
+                driver, field_id, value_to_fill, self.waiter
+            ):
+                continue
+            ajouter_jour_a_jours_remplis(jour, filled_days)
+            rjf.afficher_message_insertion(
+                jour, value_to_fill, 0, "après insertion", self.log_file
+            )
+        return filled_days
+
     def remplir_mission(
         self,
         driver: WebDriver,
         work_days: dict[str, tuple[str, str]],
         filled_days: list[str],
     ) -> list[str]:
+        self.row_index.begin_pass()
+        if self.batch_fill:
+            result = self.remplir_mission_en_lot(driver, work_days, filled_days)
+            if result is not None:
+                return result
         for jour, (description_cible, value_to_fill) in work_days.items():
             if jour in filled_days or not description_cible:
                 continue
@@ -306,7 +389,22 @@ class DayFiller:
         )
         return getter(driver, By.ID, field_id, timeout=DEFAULT_TIMEOUT) is not None
 
-    def _try_fill_once(self, driver: WebDriver, field_id: str, value: str) -> bool:
+    def _wait_for_field_settled(
+        self, driver: WebDriver, waiter: WaiterProtocol | None
+    ) -> None:
+        """Attend que le DOM se calme après la saisie (aller-retour PeopleSoft)."""
+        if waiter is None:
+            _rjf().wait_until_dom_is_stable(driver, timeout=SETTLE_TIMEOUT)
+        else:
+            waiter.wait_until_dom_is_stable(driver, timeout=SETTLE_TIMEOUT)
+
+    def _try_fill_once(
+        self,
+        driver: WebDriver,
+        field_id: str,
+        value: str,
+        waiter: WaiterProtocol | None = None,
+    ) -> bool:
         rjf = _rjf()
 
         input_field, is_correct_value = rjf.detecter_et_verifier_contenu(
@@ -316,19 +414,21 @@ class DayFiller:
             raise RuntimeError("detecter_et_verifier_contenu returned None")
         if is_correct_value:
             rjf.write_log(
-                f"Valeur correcte déjà présente pour '{field_id}'.",
+                "Valeur correcte déjà présente pour '%s'.",
                 self.log_file,
                 "DEBUG",
+                field_id,
             )
             return True
         rjf.effacer_et_entrer_valeur(input_field, value)
-        rjf.program_break_time(1, "Stabilisation du DOM après insertion.")
-        rjf.write_log(messages.DOM_STABLE, self.log_file, "DEBUG")
+        self._wait_for_field_settled(driver, waiter)
         if cast(Callable[[Any, str], bool], rjf.controle_insertion)(input_field, value):
             rjf.write_log(
-                f"Valeur '{value}' insérée avec succès pour '{field_id}'.",
+                "Valeur '%s' insérée avec succès pour '%s'.",
                 self.log_file,
                 "DEBUG",
+                value,
+                field_id,
             )
             return True
         return False
@@ -342,10 +442,15 @@ class DayFiller:
         )
 
     def _attempt_insert(
-        self, driver: WebDriver, field_id: str, value: str, attempt_index: int
+        self,
+        driver: WebDriver,
+        field_id: str,
+        value: str,
+        attempt_index: int,
+        waiter: WaiterProtocol | None = None,
     ) -> bool:
         try:
-            return self._try_fill_once(driver, field_id, value)
+            return self._try_fill_once(driver, field_id, value, waiter)
         except StaleElementReferenceException:
             self._log_stale(field_id, attempt_index)
             return False
@@ -370,7 +475,7 @@ class DayFiller:
         if not self._ensure_element_ready(driver, field_id, waiter):
             return False
         for attempt in range(max_attempts):
-            if self._attempt_insert(driver, field_id, value, attempt):
+            if self._attempt_insert(driver, field_id, value, attempt, waiter):
                 return True
         self._log_insert_failure(field_id, max_attempts)
         return False
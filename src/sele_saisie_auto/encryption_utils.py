@@ -2,17 +2,24 @@
 
 import os
 from contextlib import suppress
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from multiprocessing import shared_memory
 from typing import Protocol, TypeAlias, runtime_checkable
 
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from cryptography.hazmat.primitives.padding import PKCS7
 
-from sele_saisie_auto.exceptions import AutomationExitError
+from sele_saisie_auto.credential_arena import (
+    KEY_SLOT,
+    LOGIN_SLOT,
+    PASSWORD_SLOT,
+    decode_slots,
+    encode_slots,
+)
+from sele_saisie_auto.exceptions import AutomationExitError, SegmentFormatError
 from sele_saisie_auto.logging_service import Logger, get_logger
 from sele_saisie_auto.memory_config import MemoryConfig
-from sele_saisie_auto.shared_memory_service import SharedMemoryService
+from sele_saisie_auto.shared_memory_service import SharedMemoryService, payload_view
 from sele_saisie_auto.shared_utils import get_log_file
 
 AuthTuple: TypeAlias = tuple[bytes, bytes, bytes]
@@ -83,7 +90,11 @@ class DefaultEncryptionBackend:
 
 @dataclass
 class Credentials:
-    """Encrypted credentials and their shared memory handles."""
+    """Encrypted credentials and their shared memory handles.
+
+    Credentials read from the arena share a single handle, exposed through
+    ``mem_key``, ``mem_login`` and ``mem_password`` alike.
+    """
 
     aes_key: bytes
     mem_key: shared_memory.SharedMemory
@@ -91,6 +102,17 @@ class Credentials:
     mem_login: shared_memory.SharedMemory
     password: bytes
     mem_password: shared_memory.SharedMemory
+    extras: dict[str, bytes] = field(default_factory=dict)
+
+    def memories(self) -> list[shared_memory.SharedMemory]:
+        """Return the distinct shared memory handles of these credentials."""
+        return list(
+            dict.fromkeys(
+                mem
+                for mem in (self.mem_key, self.mem_login, self.mem_password)
+                if mem is not None
+            )
+        )
 
     def get_auth_tuple(self) -> AuthTuple:
         """Return credentials as a tuple in the **exact** order:
@@ -104,7 +126,13 @@ class Credentials:
 
 
 class EncryptionService:
-    """Service chargé de chiffrer et déchiffrer les données sensibles."""
+    """Service chargé de chiffrer et déchiffrer les données sensibles.
+
+    La clé AES, les identifiants chiffrés et d'éventuelles données
+    supplémentaires partagent un seul segment (l'arène ``arena_name`` de
+    :class:`MemoryConfig`), créé à l'entrée du contexte et supprimé à sa
+    sortie.
+    """
 
     def __init__(
         self,
@@ -123,6 +151,7 @@ class EncryptionService:
         )
         self.cle_aes: bytes | None = None
         self._memoires: list[shared_memory.SharedMemory] = []
+        self._slots: dict[str, bytes] = {}
 
     def _resolve_shared_memory_service(
         self, service: SharedMemoryService | None
@@ -139,27 +168,36 @@ class EncryptionService:
     ) -> shared_memory.SharedMemory:
         """Create a shared memory segment, retrying once if it already exists."""
 
+        taille = self.memory_config.arena_size
         try:
-            return self.shared_memory_service.stocker_en_memoire_partagee(nom, donnees)
+            return self.shared_memory_service.stocker_en_memoire_partagee(
+                nom, donnees, taille
+            )
         except FileExistsError:
             self.logger.info(
                 "⚠️ Segment déjà présent, nettoyage puis nouvelle tentative"
             )
             self.shared_memory_service.ensure_clean_segment(nom, len(donnees))
-            return self.shared_memory_service.stocker_en_memoire_partagee(nom, donnees)
+            return self.shared_memory_service.stocker_en_memoire_partagee(
+                nom, donnees, taille
+            )
         except Exception as exc:
             self.logger.error(f"❌ Impossible de créer le segment '{nom}' : {exc}")
             raise
 
-    def _lire_segment(self, nom: str) -> tuple[shared_memory.SharedMemory, bytes]:
-        """Read a segment and return the useful bytes without trailing nulls."""
+    def _lire_arene(self) -> tuple[shared_memory.SharedMemory, dict[str, bytes]]:
+        """Attach to the arena once and return its slots by name."""
 
+        nom = self.memory_config.arena_name
         mem = shared_memory.SharedMemory(name=nom)
-        raw = bytes(mem.buf)
-        taille = len(raw.rstrip(b"\x00"))
-        data = raw[:taille]
-        self.logger.info(f"Segment '{nom}' lu ({taille} octets)")
-        return mem, data
+        try:
+            with payload_view(mem.buf) as view:
+                slots = decode_slots(view)
+        except SegmentFormatError:
+            mem.close()
+            raise
+        self.logger.info(f"Arène '{nom}' lue ({len(slots)} emplacements)")
+        return mem, slots
 
     def generer_cle_aes(self, taille_cle: int = 32) -> bytes:
         """Génère aléatoirement une clé AES."""
@@ -185,10 +223,13 @@ class EncryptionService:
     # ------------------------------------------------------------------
 
     def __enter__(self) -> "EncryptionService":
-        """Generate and store the AES key in shared memory."""
+        """Generate the AES key and create the arena holding it."""
 
         key = self.generer_cle_aes(self.memory_config.key_size)
-        mem = self._creer_segment_si_besoin(self.memory_config.cle_name, key)
+        slots = {KEY_SLOT: key}
+        mem = self._creer_segment_si_besoin(
+            self.memory_config.arena_name, encode_slots(slots)
+        )
         try:
             self._memoires.append(mem)
         except Exception:
@@ -196,25 +237,53 @@ class EncryptionService:
                 self.remove_shared_memory(mem)
             raise
         self.cle_aes = key
+        self._slots = slots
         self.logger.info("✅ Mémoire partagée initialisée")
         return self
 
-    def store_credentials(self, login_data: bytes, password_data: bytes) -> None:
-        """Save encrypted credentials in shared memory atomically."""
+    def attach(self) -> "EncryptionService":
+        """Reuse the AES key already stored in shared memory.
 
-        mem_login = self._creer_segment_si_besoin(
-            self.memory_config.login_name, login_data
-        )
-        try:
-            mem_pwd = self._creer_segment_si_besoin(
-                self.memory_config.password_name, password_data
-            )
-        except Exception:
-            with suppress(Exception):
-                self.remove_shared_memory(mem_login)
-            raise
+        Used by a process reading credentials provisioned by another one, so
+        that entering the service does not replace the existing key.
+        """
+        mem, slots = self._lire_arene()
+        mem.close()
+        self.cle_aes = slots.get(KEY_SLOT)
+        return self
+
+    def store_credentials(
+        self,
+        login_data: bytes,
+        password_data: bytes,
+        extras: dict[str, bytes] | None = None,
+    ) -> None:
+        """Save encrypted credentials (and ``extras``) in the arena atomically.
+
+        The arena is rewritten in place; it is only recreated when the new
+        content exceeds ``arena_size``.
+        """
 
-        self._memoires.extend([mem_login, mem_pwd])
+        slots = {
+            **self._slots,
+            LOGIN_SLOT: login_data,
+            PASSWORD_SLOT: password_data,
+            **(extras or {}),
+        }
+        payload = encode_slots(slots)
+        if not (
+            self._memoires
+            and self.shared_memory_service.reecrire_memoire_partagee(
+                self._memoires[0], payload
+            )
+        ):
+            for mem in self._memoires:
+                with suppress(Exception):  # nosec B110
+                    self.remove_shared_memory(mem)
+            self._memoires[:] = [
+                self._creer_segment_si_besoin(self.memory_config.arena_name, payload)
+            ]
+        self._slots = slots
 
     def __exit__(
         self,
@@ -227,47 +296,48 @@ class EncryptionService:
             with suppress(Exception):  # nosec B110
                 self.remove_shared_memory(mem)
         self._memoires.clear()
+        self._slots = {}
         self.cle_aes = None
 
     def retrieve_credentials(self) -> Credentials:
-        """Retrieve encrypted credentials from shared memory.
+        """Retrieve encrypted credentials from the arena in a single attach.
 
-        The caller is responsible for releasing the returned segments,
+        The caller is responsible for releasing the returned segment,
         e.g. via :meth:`close_credentials`.
         """
-        mem_key, aes_key = self.shared_memory_service.recuperer_de_memoire_partagee(
-            self.memory_config.cle_name,
-            self.memory_config.key_size,
-        )
-        self.logger.info("Clé AES récupérée depuis la mémoire partagée")
-
+        msg = "identifiants non trouvés : lancez d'abord psatime-launcher"
         try:
-            mem_login, login = self._lire_segment(self.memory_config.login_name)
-            mem_pwd, password = self._lire_segment(self.memory_config.password_name)
-        except FileNotFoundError as exc:
-            msg = "identifiants non trouvés : lancez d'abord psatime-launcher"
+            mem, slots = self._lire_arene()
+        except SegmentFormatError as exc:
             self.logger.error(msg)
-            with suppress(Exception):  # nosec B110
-                self.remove_shared_memory(mem_key)
-                for mem in list(self._memoires):
-                    if mem.name == self.memory_config.cle_name:
-                        self.remove_shared_memory(mem)
-                        self._memoires.remove(mem)
-                        break
             raise AutomationExitError(msg) from exc
 
+        aes_key = slots.pop(KEY_SLOT, None)
+        login = slots.pop(LOGIN_SLOT, None)
+        password = slots.pop(PASSWORD_SLOT, None)
+        if aes_key is None or login is None or password is None:
+            self.logger.error(msg)
+            with suppress(Exception):  # nosec B110
+                self.remove_shared_memory(mem)
+                for own in self._memoires:
+                    own.close()
+                self._memoires.clear()
+            raise AutomationExitError(msg)
+        self.logger.info("Identifiants récupérés depuis la mémoire partagée")
+
         return Credentials(
             aes_key=aes_key,
-            mem_key=mem_key,
+            mem_key=mem,
             login=login,
-            mem_login=mem_login,
+            mem_login=mem,
             password=password,
-            mem_password=mem_pwd,
+            mem_password=mem,
+            extras=slots,
         )
 
     def close_credentials(self, creds: Credentials) -> None:
         """Release shared memory segments obtained via ``retrieve_credentials``."""
 
-        for mem in (creds.mem_key, creds.mem_login, creds.mem_password):
+        for mem in creds.memories():
             with suppress(Exception):  # nosec B110
                 self.remove_shared_memory(mem)
@@ -19,3 +19,7 @@ class AutomationExitError(Exception):
 
 class ResourceManagerInitError(RuntimeError):
     """Raised when :class:`ResourceManager` initialization fails."""
+
+
+class SegmentFormatError(ValueError):
+    """Raised when a shared memory segment has no valid header or checksum."""
@@ -186,24 +186,12 @@ def _collect_filled_days(
         if not day.element:
             continue
 
-        write_log(
-            messages.DAY_CHECK.format(jour=day.name, id=day.input_id),
-            log_file,
-            "DEBUG",
-        )
+        write_log(messages.DAY_CHECK, log_file, "DEBUG", day.name, day.input_id)
         if verifier_champ_jour_rempli(day.element, day.name):
             filled_days.append(day.name)
-            write_log(
-                messages.DAY_ALREADY_FILLED.format(jour=day.name),
-                log_file,
-                "DEBUG",
-            )
+            write_log(messages.DAY_ALREADY_FILLED, log_file, "DEBUG", day.name)
         else:
-            write_log(
-                messages.DAY_EMPTY.format(jour=day.name),
-                log_file,
-                "DEBUG",
-            )
+            write_log(messages.DAY_EMPTY, log_file, "DEBUG", day.name)
     return filled_days
 
 
@@ -224,25 +212,31 @@ def _fill_days(params: FillDaysParams) -> None:
 
         if day.name in params.filled_days:
             write_log(
-                messages.DAY_ALREADY_FILLED_NO_CHANGE.format(jour=day.name),
+                messages.DAY_ALREADY_FILLED_NO_CHANGE,
                 params.log_file,
                 "DEBUG",
+                day.name,
             )
             continue
 
         value = params.day_values.get(day.name)
         if not value:
             write_log(
-                f"⚠️ {messages.AUCUNE_VALEUR} définie pour le jour '{day.name}' dans 'valeurs_a_remplir'.",
+                "⚠️ %s définie pour le jour '%s' dans 'valeurs_a_remplir'.",
                 params.log_file,
                 "DEBUG",
+                messages.AUCUNE_VALEUR,
+                day.name,
             )
             continue
 
         write_log(
-            f"✏️ {messages.REMPLISSAGE} de '{day.name}' avec la valeur '{value}'.",
+            "✏️ %s de '%s' avec la valeur '%s'.",
             params.log_file,
             "DEBUG",
+            messages.REMPLISSAGE,
+            day.name,
+            value,
         )
         _apply_value(
             day.element,
@@ -1,6 +1,7 @@
 # src\sele_saisie_auto\interfaces\protocols.py
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
 from selenium.webdriver.remote.webdriver import WebDriver
@@ -44,8 +45,24 @@ class WaiterProtocol(Protocol):
         self, driver: WebDriver, timeout: int | None = None
     ) -> bool: ...
 
+    def wait_until_dom_is_quiet(
+        self,
+        driver: WebDriver,
+        quiet_window_ms: int | None = None,
+        timeout: int | None = None,
+    ) -> bool | None: ...
+
+    def wait_until_network_idle(
+        self,
+        driver: WebDriver,
+        quiet_window_ms: int | None = None,
+        timeout: int | None = None,
+    ) -> bool | None: ...
+
     def wait_for_element(self, driver: WebDriver, *args: Any, **kwargs: Any) -> Any: ...
 
+    def wait_for_any(self, driver: WebDriver, *args: Any, **kwargs: Any) -> Any: ...
+
     def find_clickable(self, driver: WebDriver, *args: Any, **kwargs: Any) -> Any: ...
 
     def find_visible(self, driver: WebDriver, *args: Any, **kwargs: Any) -> Any: ...
@@ -72,6 +89,7 @@ class BrowserSessionProtocol(Protocol):
     def go_to_default_content(self) -> None: ...
     def click(self, element_id: str) -> bool: ...
     def fill_input(self, element_id: str, value: str) -> bool: ...
+    def fill_inputs(self, values: Mapping[str, str]) -> list[str] | None: ...
 
 
 @runtime_checkable
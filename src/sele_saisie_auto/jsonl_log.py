@@ -0,0 +1,380 @@
+# src\sele_saisie_auto\jsonl_log.py
+"""JSON Lines log files with a sidecar index of byte offsets.
+
+Each record is one line ``{"ts", "level", "run", "phase", "msg"}``. The
+sidecar ``<log>.idx`` maps every run to the byte ranges it wrote and every
+level to the offsets of its records, so :func:`query` seeks straight to the
+matching lines. Records appended after the index was last saved are indexed
+on the next read; lines that are not JSON records, such as one cut short by
+an interrupted write, are skipped.
+"""
+
+from __future__ import annotations
+
+import argparse
+import html
+import json
+import os
+import sys
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import IO, Any
+
+INDEX_SUFFIX = ".idx"
+INDEX_VERSION = 1
+# Seconds between two saves of the index of an open sink.
+INDEX_SAVE_INTERVAL = 5.0
+
+LogRecord = dict[str, Any]
+
+
+@dataclass
+class LogIndex:
+    """Byte offsets of the records of a JSONL log file.
+
+    ``size`` is the length of the indexed prefix of the file.
+    """
+
+    size: int = 0
+    runs: dict[str, list[list[int]]] = field(default_factory=dict)
+    levels: dict[str, list[int]] = field(default_factory=dict)
+
+    def add(self, offset: int, length: int, record: LogRecord) -> None:
+        """Index the record stored at ``offset``."""
+        level = str(record.get("level", ""))
+        run = str(record.get("run", ""))
+        self.levels.setdefault(level, []).append(offset)
+        ranges = self.runs.setdefault(run, [])
+        if ranges and ranges[-1][1] == offset:
+            ranges[-1][1] = offset + length
+        else:
+            ranges.append([offset, offset + length])
+        self.size = offset + length
+
+    @classmethod
+    def load(cls, path: str) -> LogIndex:
+        """Read the index at ``path``; an empty index when absent or unreadable."""
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return cls()
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return cls()
+        return cls(
+            size=int(data.get("size", 0)),
+            runs=data.get("runs", {}),
+            levels=data.get("levels", {}),
+        )
+
+    def save(self, path: str) -> None:
+        """Write the index atomically next to the log file."""
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "version": INDEX_VERSION,
+                    "size": self.size,
+                    "runs": self.runs,
+                    "levels": self.levels,
+                },
+                f,
+                separators=(",", ":"),
+            )
+        os.replace(tmp, path)
+
+
+def index_path(log_file: str) -> str:
+    """Return the path of the sidecar index of ``log_file``."""
+    return log_file + INDEX_SUFFIX
+
+
+def _parse(line: bytes) -> LogRecord | None:
+    try:
+        record = json.loads(line)
+    except ValueError:
+        return None
+    return record if isinstance(record, dict) else None
+
+
+def _lines(
+    handle: IO[bytes], start: int, end: int | None = None
+) -> Iterator[tuple[int, bytes]]:
+    """Yield ``(offset, line)`` for the complete lines after ``start``."""
+    handle.seek(start)
+    offset = start
+    while end is None or offset < end:
+        line = handle.readline()
+        if not line.endswith(b"\n"):
+            break
+        yield offset, line
+        offset += len(line)
+
+
+def _scan(
+    handle: IO[bytes], start: int, end: int | None = None
+) -> Iterator[tuple[int, int, LogRecord]]:
+    """Yield ``(offset, length, record)`` for the complete lines after ``start``."""
+    for offset, line in _lines(handle, start, end):
+        record = _parse(line)
+        if record is not None:
+            yield offset, len(line), record
+
+
+def update_index(log_file: str, index: LogIndex | None = None) -> LogIndex:
+    """Index the records appended to ``log_file`` since ``index`` was saved."""
+    index = index or LogIndex.load(index_path(log_file))
+    size = os.path.getsize(log_file)
+    if index.size > size:
+        index = LogIndex()
+    if index.size < size:
+        with open(log_file, "rb") as f:
+            for offset, line in _lines(f, index.size):
+                record = _parse(line)
+                if record is not None:
+                    index.add(offset, len(line), record)
+                index.size = offset + len(line)
+        try:
+            index.save(index_path(log_file))
+        except OSError:
+            pass
+    return index
+
+
+class JsonlLogSink:
+    """Append-only writer for a JSONL log keeping its index in memory.
+
+    The index is saved next to the file every :data:`INDEX_SAVE_INTERVAL`
+    seconds while records are written, and by :meth:`close`.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.index = LogIndex()
+        self._handle: IO[bytes] | None = None
+        self._saved_at = 0.0
+
+    @property
+    def is_open(self) -> bool:
+        """Return ``True`` while the underlying handle is open."""
+        return self._handle is not None
+
+    def open(self) -> None:
+        """Bring the index up to date and keep an append handle on the file."""
+        if self._handle is not None:
+            return
+        self.index = (
+            update_index(self.path) if os.path.exists(self.path) else LogIndex()
+        )
+        self._handle = open(self.path, "ab")
+        self._saved_at = time.monotonic()
+        end = self._handle.seek(0, os.SEEK_END)
+        if end > self.index.size:
+            # End the partial line left by an interrupted write: it is kept
+            # for inspection and skipped by readers.
+            self._handle.write(b"\n")
+            self._handle.flush()
+            self.index.size = end + 1
+
+    def write(self, text: str, records: list[LogRecord] | None = None) -> None:
+        """Append the JSON lines in ``text`` and index them.
+
+        ``records`` are the objects serialized in ``text``, one per line; when
+        given, they are indexed as is instead of parsing the lines again.
+        """
+        self.open()
+        assert self._handle is not None  # nosec B101
+        offset = self._handle.seek(0, os.SEEK_END)
+        if offset != self.index.size:
+            # Another writer appended to the file since our last write.
+            self.index = update_index(self.path, self.index)
+        lines = text.splitlines(keepends=True)
+        if records is None or len(records) != len(lines):
+            records = [json.loads(line) for line in lines]
+        for line, record in zip(lines, records, strict=True):
+            data = line.encode("utf-8")
+            self._handle.write(data)
+            self.index.add(offset, len(data), record)
+            offset += len(data)
+        self._handle.flush()
+        if time.monotonic() - self._saved_at >= INDEX_SAVE_INTERVAL:
+            self._save_index()
+
+    def close(self) -> None:
+        """Save the index and release the handle."""
+        handle, self._handle = self._handle, None
+        if handle is None:
+            return
+        try:
+            handle.close()
+        finally:
+            self.index.save(index_path(self.path))
+
+    def _save_index(self) -> None:
+        self._saved_at = time.monotonic()
+        try:
+            self.index.save(index_path(self.path))
+        except OSError:
+            # Readers rebuild the missing part of the index from the file.
+            pass
+
+
+# ----------------------------------------------------------------------------- #
+# --------------------------------- REQUÊTES ---------------------------------- #
+# ----------------------------------------------------------------------------- #
+
+
+def _in_ranges(offset: int, ranges: list[list[int]]) -> bool:
+    return any(start <= offset < end for start, end in ranges)
+
+
+def _read_at(handle: IO[bytes], offsets: Iterable[int]) -> Iterator[LogRecord]:
+    for offset in offsets:
+        handle.seek(offset)
+        record = _parse(handle.readline())
+        if record is not None:
+            yield record
+
+
+def _candidates(
+    handle: IO[bytes],
+    index: LogIndex,
+    levels: list[str] | None,
+    run: str | None,
+) -> Iterator[LogRecord]:
+    ranges = index.runs.get(run, []) if run is not None else None
+    if levels:
+        offsets = sorted(o for lvl in levels for o in index.levels.get(lvl, []))
+        if ranges is not None:
+            offsets = [o for o in offsets if _in_ranges(o, ranges)]
+        yield from _read_at(handle, offsets)
+    elif ranges is not None:
+        for start, end in ranges:
+            yield from (rec for _, _, rec in _scan(handle, start, end))
+    else:
+        yield from (rec for _, _, rec in _scan(handle, 0))
+
+
+def query(
+    log_file: str,
+    *,
+    levels: list[str] | None = None,
+    run: str | None = None,
+    phase: str | None = None,
+    contains: str | None = None,
+    limit: int | None = None,
+) -> Iterator[LogRecord]:
+    """Stream the records of ``log_file`` matching every given filter.
+
+    ``levels`` and ``run`` are resolved through the index; ``phase`` and
+    ``contains`` (a substring of the message) are checked on the records
+    read.
+    """
+    index = update_index(log_file)
+    count = 0
+    with open(log_file, "rb") as f:
+        for record in _candidates(f, index, levels, run):
+            if phase is not None and record.get("phase") != phase:
+                continue
+            if contains is not None and contains not in str(record.get("msg", "")):
+                continue
+            yield record
+            count += 1
+            if limit is not None and count >= limit:
+                return
+
+
+def list_runs(log_file: str) -> dict[str, int]:
+    """Return the number of bytes written by each run of ``log_file``."""
+    index = update_index(log_file)
+    return {
+        run: sum(end - start for start, end in ranges)
+        for run, ranges in index.runs.items()
+    }
+
+
+def render_html(records: Iterable[LogRecord]) -> str:
+    """Render ``records`` as an HTML log table."""
+    from sele_saisie_auto.logger_utils import HTML_CLOSING_TAGS, get_html_style
+
+    rows = []
+    for rec in records:
+        phase = f"[{rec['phase']}] " if rec.get("phase") else ""
+        rows.append(
+            f"<tr><td>{html.escape(str(rec.get('ts', '')))}</td>"
+            f"<td>{html.escape(str(rec.get('level', '')))}</td>"
+            f"<td>{html.escape(phase + str(rec.get('msg', '')))}</td></tr>\n"
+        )
+    return get_html_style() + "".join(rows) + HTML_CLOSING_TAGS
+
+
+# ----------------------------------------------------------------------------- #
+# ----------------------------------- CLI ------------------------------------- #
+# ----------------------------------------------------------------------------- #
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse the ``psatime-auto logs`` arguments."""
+    from sele_saisie_auto.logger_utils import LOG_LEVEL_CHOICES
+
+    parser = argparse.ArgumentParser(
+        prog="psatime-auto logs",
+        description="Query a JSONL log file through its offset index",
+    )
+    parser.add_argument("log_file", help="JSONL log file")
+    parser.add_argument(
+        "-l",
+        "--level",
+        action="append",
+        choices=LOG_LEVEL_CHOICES,
+        help="Keep records of this level (repeatable)",
+    )
+    parser.add_argument("--run", help="Keep records of this run id")
+    parser.add_argument("--phase", help="Keep records of this phase")
+    parser.add_argument("--contains", help="Keep messages containing this text")
+    parser.add_argument("--limit", type=int, help="Stop after N records")
+    parser.add_argument("--html", metavar="PATH", help="Write an HTML report")
+    parser.add_argument(
+        "--runs", action="store_true", help="List the runs of the file and exit"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Print the matching records as JSON lines, or write them as HTML."""
+    args = parse_args(argv)
+    if not os.path.exists(args.log_file):
+        print(f"Fichier de log introuvable : {args.log_file}", file=sys.stderr)
+        return 1
+    if args.runs:
+        for run, size in list_runs(args.log_file).items():
+            print(f"{run}\t{size}")
+        return 0
+    records = query(
+        args.log_file,
+        levels=args.level,
+        run=args.run,
+        phase=args.phase,
+        contains=args.contains,
+        limit=args.limit,
+    )
+    if args.html:
+        with open(args.html, "w", encoding="utf-8") as f:
+            f.write(render_html(records))
+        return 0
+    for record in records:
+        print(json.dumps(record, ensure_ascii=False))
+    return 0
+
+
+__all__ = [
+    "JsonlLogSink",
+    "LogIndex",
+    "index_path",
+    "list_runs",
+    "main",
+    "query",
+    "render_html",
+    "update_index",
+]
@@ -7,7 +7,6 @@ import multiprocessing
 import tkinter as tk
 from collections.abc import Callable, Iterable
 from functools import partial
-from multiprocessing import shared_memory
 from tkinter import messagebox, ttk
 from typing import cast
 
@@ -36,13 +35,16 @@ from sele_saisie_auto.gui_builder import (
 from sele_saisie_auto.interfaces import LoggerProtocol
 from sele_saisie_auto.logger_utils import LOG_LEVEL_CHOICES
 from sele_saisie_auto.logging_service import Logger, LoggingConfigurator, get_logger
-from sele_saisie_auto.memory_config import MemoryConfig
 from sele_saisie_auto.orchestration import AutomationOrchestrator
 from sele_saisie_auto.read_or_write_file_config_ini_utils import (
     read_config_ini,
     write_config_ini,
 )
 from sele_saisie_auto.resources.resource_manager import ResourceManager  # noqa: F401
+from sele_saisie_auto.shared_memory_service import (
+    cleanup_memory_segments,
+    collect_leaked_segments,
+)
 from sele_saisie_auto.shared_utils import get_log_file
 from sele_saisie_auto.styles import COLORS, setup_modern_style
 
@@ -67,39 +69,6 @@ BILLING_LABELS = [o.label for o in cgi_options_billing_action]
 WORK_LOCATION_LABELS = [o.label for o in work_location_options]
 
 
-def _remove_shared_memory(name: str) -> None:
-    try:
-        mem = shared_memory.SharedMemory(name=name)
-    except FileNotFoundError:
-        return
-    try:
-        mem.close()
-    finally:
-        try:
-            mem.unlink()
-        except FileNotFoundError:
-            pass
-
-
-def cleanup_memory_segments(memory_config: MemoryConfig | None = None) -> None:
-    """Remove leftover shared memory segments.
-
-    Parameters
-    ----------
-    memory_config:
-        Names of the segments to remove. Defaults to :class:`MemoryConfig`.
-    """
-
-    cfg = memory_config or MemoryConfig()
-    for name in (
-        cfg.cle_name,
-        cfg.data_name,
-        cfg.login_name,
-        cfg.password_name,
-    ):
-        _remove_shared_memory(name)
-
-
 def run_psatime(
     log_file: str,
     menu: tk.Tk,
@@ -689,6 +658,7 @@ def main(argv: list[str] | None = None) -> None:
 
         multiprocessing.freeze_support()
         cleanup_memory_segments()
+        collect_leaked_segments(logger)
         with EncryptionService(log_file) as encryption_service:
             cle_aes = cast(bytes, encryption_service.cle_aes)
             from sele_saisie_auto.main_menu import main_menu
@@ -0,0 +1,250 @@
+# src\sele_saisie_auto\log_segments.py
+"""Rotation of the daily log file into numbered, compressed segments.
+
+The daily file (``log_AAAA-MM-JJ.html``) is always the active segment.
+Rotating it renames it to ``log_AAAA-MM-JJ.<n>.html``, records the segment
+in ``log_AAAA-MM-JJ.manifest.json`` and gzips it on a background thread.
+Segments older than the retention period are deleted at each rotation.
+"""
+
+from __future__ import annotations
+
+import atexit
+import gzip
+import json
+import os
+import shutil
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+MANIFEST_SUFFIX = ".manifest.json"
+INDEX_SUFFIX = ".idx"
+BYTES_PER_MB = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class SegmentPolicy:
+    """When to rotate the active log and what to do with closed segments.
+
+    ``max_bytes`` rotates once the active file grows past that size,
+    ``per_run`` gives each run its own segment, ``retention_days`` deletes
+    older segments (``None`` keeps them all).
+    """
+
+    max_bytes: int | None = None
+    per_run: bool = False
+    compress: bool = True
+    retention_days: int | None = None
+
+
+def manifest_path(log_file: str) -> str:
+    """Return the manifest path of the day of ``log_file``."""
+    return os.path.splitext(log_file)[0] + MANIFEST_SUFFIX
+
+
+def load_manifest(log_file: str) -> dict[str, Any]:
+    """Return the manifest of ``log_file``; an empty one when absent."""
+    try:
+        with open(manifest_path(log_file), encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        data = None
+    if not isinstance(data, dict):
+        data = {}
+    data.setdefault("active", os.path.basename(log_file))
+    data.setdefault("segments", [])
+    return data
+
+
+_MANIFEST_LOCK = threading.Lock()
+
+
+def _save_manifest(log_file: str, manifest: dict[str, Any]) -> None:
+    path = manifest_path(log_file)
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+def _segment_name(log_file: str, number: int) -> str:
+    stem, ext = os.path.splitext(log_file)
+    return f"{stem}.{number:03d}{ext}"
+
+
+def _next_segment(log_file: str, manifest: dict[str, Any]) -> str:
+    number = len(manifest["segments"]) + 1
+    while True:
+        path = _segment_name(log_file, number)
+        if not os.path.exists(path) and not os.path.exists(f"{path}.gz"):
+            return path
+        number += 1
+
+
+def _remove_index(path: str) -> None:
+    try:
+        os.remove(path + INDEX_SUFFIX)
+    except FileNotFoundError:
+        pass
+
+
+def rotate_segment(
+    log_file: str,
+    *,
+    reason: str,
+    policy: SegmentPolicy,
+    keep_from: int | None = None,
+    header: str = "",
+    footer: str = "",
+) -> str | None:
+    """Move the active ``log_file`` to a new numbered segment.
+
+    The caller closes its handles first. With ``keep_from``, the bytes after
+    that offset stay in the active file (after ``header``) and ``footer`` is
+    appended to the segment instead. Returns the segment path, ``None`` when
+    there is nothing to rotate.
+    """
+    if not os.path.exists(log_file) or os.path.getsize(log_file) == 0:
+        return None
+    tail = b""
+    if keep_from is not None:
+        with open(log_file, "rb") as f:
+            f.seek(keep_from)
+            tail = f.read()
+    with _MANIFEST_LOCK:
+        manifest = load_manifest(log_file)
+        segment = _next_segment(log_file, manifest)
+        os.replace(log_file, segment)
+        _remove_index(log_file)
+        with open(segment, "rb+") as f:
+            if keep_from is not None:
+                f.truncate(keep_from)
+            f.seek(0, os.SEEK_END)
+            f.write(footer.encode("utf-8"))
+        if keep_from is not None:
+            with open(log_file, "wb") as f:
+                f.write(header.encode("utf-8") + tail)
+        manifest["segments"].append(
+            {
+                "file": os.path.basename(segment),
+                "bytes": os.path.getsize(segment),
+                "closed": datetime.now().isoformat(timespec="seconds"),
+                "reason": reason,
+                "compressed": False,
+            }
+        )
+        _save_manifest(log_file, manifest)
+    if policy.compress:
+        _schedule_compression(log_file, segment)
+    if policy.retention_days is not None:
+        apply_retention(os.path.dirname(log_file) or ".", policy.retention_days)
+    return segment
+
+
+# ----------------------------------------------------------------------------- #
+# ------------------------------- COMPRESSION --------------------------------- #
+# ----------------------------------------------------------------------------- #
+
+_COMPRESSOR: ThreadPoolExecutor | None = None
+_PENDING: list[Future[None]] = []
+
+
+def compress_segment(log_file: str, segment: str) -> None:
+    """Gzip ``segment`` and mark it compressed in the manifest."""
+    if not os.path.exists(segment):
+        return
+    target = f"{segment}.gz"
+    with open(segment, "rb") as src, gzip.open(f"{target}.tmp", "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    os.replace(f"{target}.tmp", target)
+    os.remove(segment)
+    _remove_index(segment)
+    name = os.path.basename(segment)
+    with _MANIFEST_LOCK:
+        manifest = load_manifest(log_file)
+        for entry in manifest["segments"]:
+            if entry["file"] == name:
+                entry["file"] = os.path.basename(target)
+                entry["compressed"] = True
+        _save_manifest(log_file, manifest)
+
+
+def _schedule_compression(log_file: str, segment: str) -> None:
+    global _COMPRESSOR
+    if _COMPRESSOR is None:
+        _COMPRESSOR = ThreadPoolExecutor(1, thread_name_prefix="log-compress")
+    _PENDING.append(_COMPRESSOR.submit(compress_segment, log_file, segment))
+
+
+@atexit.register
+def wait_for_compression() -> None:
+    """Wait until every scheduled segment has been compressed."""
+    while _PENDING:
+        future = _PENDING.pop(0)
+        try:
+            future.result()
+        except Exception as e:  # noqa: BLE001 - appelé à la sortie du processus
+            # Same stderr fallback as logger_utils, which imports this module.
+            print(
+                f"Erreur lors de la compression d'un segment de log : {e}",
+                file=sys.stderr,
+            )
+
+
+# ----------------------------------------------------------------------------- #
+# -------------------------------- RÉTENTION ---------------------------------- #
+# ----------------------------------------------------------------------------- #
+
+
+def apply_retention(
+    log_dir: str, retention_days: int, now: float | None = None
+) -> list[str]:
+    """Delete the segments closed more than ``retention_days`` days ago.
+
+    Returns the deleted paths. Manifests left without segments are removed
+    once their active file is gone as well.
+    """
+    limit = (now if now is not None else time.time()) - retention_days * 86400
+    removed: list[str] = []
+    with _MANIFEST_LOCK:
+        for name in sorted(os.listdir(log_dir)):
+            if not name.endswith(MANIFEST_SUFFIX):
+                continue
+            path = os.path.join(log_dir, name)
+            log_file = path[: -len(MANIFEST_SUFFIX)]
+            manifest = load_manifest(log_file)
+            kept = []
+            for entry in manifest["segments"]:
+                closed = datetime.fromisoformat(entry["closed"]).timestamp()
+                if closed >= limit:
+                    kept.append(entry)
+                    continue
+                segment = os.path.join(log_dir, entry["file"])
+                if os.path.exists(segment):
+                    os.remove(segment)
+                    removed.append(segment)
+            if len(kept) == len(manifest["segments"]):
+                continue
+            manifest["segments"] = kept
+            active = os.path.join(log_dir, manifest["active"])
+            if kept or os.path.exists(active):
+                _save_manifest(active, manifest)
+            else:
+                os.remove(path)
+    return removed
+
+
+__all__ = [
+    "SegmentPolicy",
+    "apply_retention",
+    "compress_segment",
+    "load_manifest",
+    "manifest_path",
+    "rotate_segment",
+    "wait_for_compression",
+]
@@ -1,14 +1,28 @@
 from __future__ import annotations
 
+import atexit
+import json
 import os
-from collections.abc import Callable, Mapping
+import queue
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterator, Mapping
 from configparser import ConfigParser
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Literal
+from typing import Literal, TextIO, get_args
 
 from sele_saisie_auto import messages
 from sele_saisie_auto.enums import AlertMessage, LogLevel
 from sele_saisie_auto.exceptions import InvalidConfigError
+from sele_saisie_auto.jsonl_log import JsonlLogSink, LogRecord
+from sele_saisie_auto.log_segments import (
+    BYTES_PER_MB,
+    SegmentPolicy,
+    apply_retention,
+    rotate_segment,
+)
 
 # ----------------------------------------------------------------------------- #
 # ------------------------------- CONSTANTE ----------------------------------- #
@@ -16,11 +30,13 @@ from sele_saisie_auto.exceptions import InvalidConfigError
 DEFAULT_LOG_DIR: str = "logs"
 HTML_FORMAT: Literal["html"] = "html"
 TXT_FORMAT: Literal["txt"] = "txt"
+JSONL_FORMAT: Literal["jsonl"] = "jsonl"
 COLUMN_WIDTHS: dict[str, str] = {"timestamp": "10%", "level": "6%", "message": "84%"}
 ROW_HEIGHT: str = "20px"
 FONT_SIZE: str = "12px"
 PADDING: str = "2px"
 LOG_ENTRY_FORMAT: str = "{timestamp} [{level}] {message}"
+HTML_CLOSING_TAGS: str = "</table></body></html>"
 LOG_STYLE_ALLOWED_KEYS: set[str] = {"column_widths", "row_height", "font_size"}
 LOG_LEVELS: dict[LogLevel, int] = {
     LogLevel.INFO: 10,
@@ -31,6 +47,18 @@ LOG_LEVELS: dict[LogLevel, int] = {
     LogLevel.OFF: 0,
 }
 LOG_LEVEL_CHOICES: list[str] = [lvl.value for lvl in LogLevel]
+LOG_FORMAT_CHOICES: list[str] = [HTML_FORMAT, TXT_FORMAT, JSONL_FORMAT]
+_LEVEL_LOOKUP: dict[LogLevel | str, LogLevel] = {
+    **{lvl: lvl for lvl in LogLevel},
+    **{lvl.value: lvl for lvl in LogLevel},
+}
+# Un message peut être une chaîne ou une fonction qui la construit à la demande.
+LogMessage = str | Callable[[], str]
+# Écriture asynchrone : taille de la file, taille et délai maximal d'un lot.
+QueueFullPolicy = Literal["block", "drop", "sync"]
+ASYNC_QUEUE_SIZE: int = 10_000
+ASYNC_BATCH_SIZE: int = 256
+ASYNC_FLUSH_INTERVAL: float = 0.005  # secondes
 
 # Par défaut, on commence avec un niveau de log minimal (par ex., "INFO")
 DEFAULT_LOG_LEVEL: LogLevel = LogLevel.INFO
@@ -57,6 +85,9 @@ MESSAGE_TEMPLATES: dict[str, str] = {
 
 
 def _to_level(level: LogLevel | str) -> LogLevel | None:
+    lvl = _LEVEL_LOOKUP.get(level)
+    if lvl is not None:
+        return lvl
     try:
         return level if isinstance(level, LogLevel) else LogLevel(level)
     except ValueError:
@@ -67,6 +98,21 @@ def _level_allowed(lvl: LogLevel) -> bool:
     return LOG_LEVELS[lvl] <= LOG_LEVELS[LOG_LEVEL_FILTER]
 
 
+def is_level_enabled(level: LogLevel | str) -> bool:
+    """Return ``True`` when a message at ``level`` would be written.
+
+    Call sites use it to skip building messages that would be filtered out.
+    """
+    lvl = _to_level(level)
+    return lvl is not None and _level_allowed(lvl)
+
+
+def render_message(message: LogMessage, args: tuple[object, ...] = ()) -> str:
+    """Build the text of a lazy message: call it, then apply ``%`` ``args``."""
+    text = message() if callable(message) else message
+    return text % args if args else text
+
+
 def _timestamp() -> str:
     return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
@@ -76,31 +122,505 @@ def _append(path: str, text: str) -> None:
         f.write(text)
 
 
-def _read_all(path: str) -> str:
-    with open(path, encoding="utf-8") as f:
-        return f.read()
+def _resolve_format(log_file: str, log_format: str) -> str:
+    """Return ``jsonl`` for ``.jsonl`` files, ``log_format`` otherwise."""
+    if log_file.endswith(f".{JSONL_FORMAT}"):
+        return JSONL_FORMAT
+    return log_format.lower()
 
 
-def _write_txt_line(path: str, ts: str, lvl: LogLevel, msg: str) -> None:
-    formatted = LOG_ENTRY_FORMAT.format(timestamp=ts, level=lvl.value, message=msg)
-    _append(path, formatted + "\n")
+def _write_now(
+    path: str, fmt: str, text: str, records: list[LogRecord] | None = None
+) -> None:
+    with _IO_LOCK:
+        key = _sink_key(path)
+        if key not in _RUN_OFFSETS:
+            _RUN_OFFSETS[key] = _content_size(path, fmt)
+        if fmt == HTML_FORMAT:
+            _get_html_sink(path).write(text)
+        elif fmt == JSONL_FORMAT:
+            _get_jsonl_sink(path).write(text, records)
+        else:
+            _append(path, text)
+        policy = _SEGMENT_POLICY
+        if policy is not None and policy.max_bytes:
+            _track_segment_size(path, fmt, key, text, policy.max_bytes)
+
+
+def _emit(path: str, fmt: str, text: str, record: LogRecord | None = None) -> None:
+    writer = _ASYNC_WRITER
+    if writer is None:
+        _write_now(path, fmt, text, None if record is None else [record])
+    else:
+        writer.submit(path, fmt, text, record)
 
 
-def _ensure_html_open(path: str) -> None:
-    initialize_html_log_file(path)
+def _write_txt_line(path: str, ts: str, lvl: LogLevel, msg: str) -> None:
+    formatted = LOG_ENTRY_FORMAT.format(timestamp=ts, level=lvl.value, message=msg)
+    _emit(path, TXT_FORMAT, formatted + "\n")
 
 
 def _write_html_row(path: str, ts: str, lvl: LogLevel, msg: str) -> None:
-    _ensure_html_open(path)
     row = f"<tr><td>{ts}</td><td>{lvl.value}</td><td>{msg}</td></tr>\n"
-    _append(path, row)
+    _emit(path, HTML_FORMAT, row)
+
+
+def _write_jsonl_record(path: str, ts: str, lvl: LogLevel, msg: str) -> None:
+    record = {
+        "ts": ts,
+        "level": lvl.value,
+        "run": _LOG_CONTEXT["run"],
+        "phase": _LOG_CONTEXT["phase"],
+        "msg": msg,
+    }
+    _emit(path, JSONL_FORMAT, json.dumps(record, ensure_ascii=False) + "\n", record)
 
 
 _WRITERS: Mapping[str, Callable[[str, str, LogLevel, str], None]] = {
     HTML_FORMAT: _write_html_row,
     TXT_FORMAT: _write_txt_line,
+    JSONL_FORMAT: _write_jsonl_record,
 }
 
+
+def _new_run_id() -> str:
+    return f"{datetime.now():%Y%m%dT%H%M%S}-{os.getpid()}"
+
+
+# Identifiant d'exécution et phase courante, enregistrés dans les logs JSONL.
+_LOG_CONTEXT: dict[str, str | None] = {"run": _new_run_id(), "phase": None}
+
+
+def begin_log_run(run_id: str | None = None) -> str:
+    """Start a new run: the following JSONL records carry its identifier."""
+    run = run_id or _new_run_id()
+    _LOG_CONTEXT["run"] = run
+    _LOG_CONTEXT["phase"] = None
+    return run
+
+
+@contextmanager
+def log_phase(name: str) -> Iterator[None]:
+    """Tag the JSONL records written inside the block with phase ``name``."""
+    previous, _LOG_CONTEXT["phase"] = _LOG_CONTEXT["phase"], name
+    try:
+        yield
+    finally:
+        _LOG_CONTEXT["phase"] = previous
+
+
+class HtmlLogSink:
+    """Append-only writer keeping the HTML log file open between rows.
+
+    The header is written once when the file is created, each row is
+    appended to the open handle and the closing tags are only written by
+    :meth:`close`. A file closed by a previous run is reopened by
+    truncating its trailing tags instead of rewriting its whole content.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._handle: TextIO | None = None
+
+    @property
+    def is_open(self) -> bool:
+        """Return ``True`` while the underlying handle is open."""
+        return self._handle is not None
+
+    def open(self) -> None:
+        """Prepare the file and keep an append handle on it."""
+        if self._handle is not None:
+            return
+        initialize_html_log_file(self.path)
+        self._handle = open(self.path, "a", encoding="utf-8")
+
+    def write(self, row: str) -> None:
+        """Append ``row`` to the log file and flush it."""
+        self.open()
+        assert self._handle is not None  # nosec B101
+        self._handle.write(row)
+        self._handle.flush()
+
+    def close(self) -> None:
+        """Write the closing tags and release the handle."""
+        if self._handle is None:
+            return
+        try:
+            self._handle.write(HTML_CLOSING_TAGS)
+        finally:
+            self.release()
+
+    def release(self) -> None:
+        """Close the handle without writing the closing tags."""
+        handle, self._handle = self._handle, None
+        if handle is not None:
+            handle.close()
+
+
+_HTML_SINKS: dict[str, HtmlLogSink] = {}
+
+
+def _sink_key(path: str) -> str:
+    return os.path.normcase(os.path.abspath(path))
+
+
+def _get_html_sink(path: str) -> HtmlLogSink:
+    key = _sink_key(path)
+    sink = _HTML_SINKS.get(key)
+    if sink is None:
+        sink = _HTML_SINKS[key] = HtmlLogSink(path)
+    return sink
+
+
+def _pop_html_sink(path: str) -> HtmlLogSink | None:
+    return _HTML_SINKS.pop(_sink_key(path), None)
+
+
+_JSONL_SINKS: dict[str, JsonlLogSink] = {}
+
+
+def _get_jsonl_sink(path: str) -> JsonlLogSink:
+    key = _sink_key(path)
+    sink = _JSONL_SINKS.get(key)
+    if sink is None:
+        sink = _JSONL_SINKS[key] = JsonlLogSink(path)
+    return sink
+
+
+@atexit.register
+def _release_html_sinks() -> None:
+    """Close every open handle at interpreter exit."""
+    while _HTML_SINKS:
+        _, sink = _HTML_SINKS.popitem()
+        sink.release()
+    while _JSONL_SINKS:
+        _, jsonl_sink = _JSONL_SINKS.popitem()
+        jsonl_sink.close()
+
+
+_QueueItem = tuple[str, str, str, LogRecord | None]
+
+
+def _report_log_error(context: str, detail: object) -> None:
+    """Report a failure of the log machinery itself on ``stderr``."""
+    print(f"{context} : {detail}", file=sys.stderr)
+
+
+class AsyncLogWriter:
+    """Background thread writing the log records queued by the producers.
+
+    Producers only enqueue ``(path, format, text, record)`` tuples, where
+    ``record`` is the JSONL object serialized in ``text``. The thread
+    groups them per file and writes each group at once, either when
+    ``batch_size`` records are waiting or ``flush_interval`` seconds after
+    the first one. ``policy`` decides what happens when the queue is full:
+    ``drop`` (the default) discards and counts the record, and the thread
+    reports the count on ``stderr`` after its next write; ``block`` waits
+    for room, so producers wait on the disk again; ``sync`` writes the
+    record from the calling thread, ahead of the records still queued, so
+    the file is no longer in emission order.
+    """
+
+    def __init__(
+        self,
+        *,
+        queue_size: int = ASYNC_QUEUE_SIZE,
+        batch_size: int = ASYNC_BATCH_SIZE,
+        flush_interval: float = ASYNC_FLUSH_INTERVAL,
+        policy: QueueFullPolicy = "drop",
+    ) -> None:
+        if policy not in get_args(QueueFullPolicy):
+            raise InvalidConfigError(f"Politique de file de log inconnue : {policy}")
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.policy = policy
+        self.dropped = 0
+        self.errors = 0
+        self._reported_dropped = 0
+        self._queue: queue.Queue[_QueueItem | None] = queue.Queue(queue_size)
+        self._thread = threading.Thread(
+            target=self._run, name="log-writer", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def is_alive(self) -> bool:
+        """Return ``True`` while the writer thread runs."""
+        return self._thread.is_alive()
+
+    def submit(
+        self, path: str, fmt: str, text: str, record: LogRecord | None = None
+    ) -> None:
+        """Queue a record, applying :attr:`policy` when the queue is full."""
+        item = (path, fmt, text, record)
+        if not self.is_alive:
+            _write_now(path, fmt, text, None if record is None else [record])
+            return
+        if self.policy == "block":
+            self._queue.put(item)
+            return
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            if self.policy == "drop":
+                self.dropped += 1
+            else:
+                _write_now(path, fmt, text, None if record is None else [record])
+
+    def flush(self) -> None:
+        """Wait until every queued record has been written."""
+        if self.is_alive:
+            self._queue.join()
+
+    def close(self) -> None:
+        """Write the pending records and stop the thread."""
+        if not self.is_alive:
+            return
+        self._queue.put(None)
+        self._thread.join()
+
+    # ------------------------------------------------------------------
+    # Writer thread
+    # ------------------------------------------------------------------
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            batch = [] if first is None else [first]
+            stop = first is None
+            deadline = time.monotonic() + self.flush_interval
+            while not stop and len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    record = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if record is None:
+                    stop = True
+                else:
+                    batch.append(record)
+            try:
+                self._write_batch(batch)
+                self._report_dropped()
+            finally:
+                for _ in range(len(batch) + int(stop)):
+                    self._queue.task_done()
+            if stop:
+                return
+
+    def _report_dropped(self) -> None:
+        dropped = self.dropped
+        if dropped > self._reported_dropped:
+            _report_log_error(
+                "File de log pleine",
+                f"{dropped - self._reported_dropped} message(s) ignoré(s)",
+            )
+            self._reported_dropped = dropped
+
+    def _write_batch(self, batch: list[_QueueItem]) -> None:
+        groups: dict[tuple[str, str], tuple[list[str], list[LogRecord | None]]] = {}
+        for path, fmt, text, record in batch:
+            texts, records = groups.setdefault((path, fmt), ([], []))
+            texts.append(text)
+            records.append(record)
+        for (path, fmt), (texts, records) in groups.items():
+            known = [r for r in records if r is not None]
+            try:
+                _write_now(
+                    path,
+                    fmt,
+                    "".join(texts),
+                    known if len(known) == len(records) else None,
+                )
+            except Exception as e:  # noqa: BLE001 - le thread doit survivre
+                self.errors += 1
+                _report_log_error("Erreur lors de l'écriture des logs", e)
+
+
+_IO_LOCK = threading.RLock()
+_ASYNC_WRITER: AsyncLogWriter | None = None
+
+# Segmentation : politique active, taille du segment actif et position où
+# l'exécution courante a commencé à écrire dans chaque fichier.
+_SEGMENT_POLICY: SegmentPolicy | None = None
+_SEGMENT_SIZES: dict[str, int] = {}
+_RUN_OFFSETS: dict[str, int] = {}
+
+
+def _content_size(path: str, fmt: str) -> int:
+    """Return the offset where the next record of ``path`` will be written."""
+    if not os.path.exists(path):
+        return 0
+    if fmt == HTML_FORMAT:
+        offset = _closing_tags_offset(path)
+        if offset is not None:
+            return offset
+    return os.path.getsize(path)
+
+
+def _track_segment_size(
+    path: str, fmt: str, key: str, text: str, max_bytes: int
+) -> None:
+    size = _SEGMENT_SIZES.get(key)
+    size = os.path.getsize(path) if size is None else size + len(text.encode())
+    _SEGMENT_SIZES[key] = size
+    if size >= max_bytes:
+        _rotate_active(path, fmt, "size")
+
+
+def _rotate_active(path: str, fmt: str, reason: str, *, split: bool = False) -> None:
+    """Close the handles on ``path`` and move it to a new segment.
+
+    With ``split``, the records written by the current run stay in the
+    active file and only the earlier ones are moved.
+    """
+    assert _SEGMENT_POLICY is not None  # nosec B101
+    key = _sink_key(path)
+    html_sink = _HTML_SINKS.pop(key, None)
+    jsonl_sink = _JSONL_SINKS.pop(key, None)
+    if jsonl_sink is not None:
+        jsonl_sink.close()
+    keep_from: int | None = None
+    header = footer = ""
+    if split:
+        keep_from = _RUN_OFFSETS.get(key, _content_size(path, fmt))
+        if html_sink is not None:
+            html_sink.release()
+        if fmt == HTML_FORMAT:
+            header, footer = get_html_style(), HTML_CLOSING_TAGS
+    elif html_sink is not None and html_sink.is_open:
+        html_sink.close()
+    elif (
+        fmt == HTML_FORMAT
+        and os.path.exists(path)
+        and _closing_tags_offset(path) is None
+    ):
+        footer = HTML_CLOSING_TAGS
+    rotate_segment(
+        path,
+        reason=reason,
+        policy=_SEGMENT_POLICY,
+        keep_from=keep_from,
+        header=header,
+        footer=footer,
+    )
+    _SEGMENT_SIZES.pop(key, None)
+    _RUN_OFFSETS[key] = len(header.encode()) if split else 0
+
+
+def set_segment_policy(policy: SegmentPolicy | None) -> None:
+    """Rotate the log files according to ``policy`` (``None`` disables it)."""
+    global _SEGMENT_POLICY
+    _SEGMENT_POLICY = policy
+    _SEGMENT_SIZES.clear()
+
+
+def start_run_segment(log_file: str, log_format: str | None = None) -> None:
+    """Move what earlier runs wrote to ``log_file`` into its own segment.
+
+    The format defaults to the one of the file extension.
+    """
+    if _SEGMENT_POLICY is None:
+        return
+    flush_logs()
+    if log_format is None:
+        extension = os.path.splitext(log_file)[1].lstrip(".").lower()
+        log_format = extension if extension in LOG_FORMAT_CHOICES else HTML_FORMAT
+    fmt = _resolve_format(log_file, log_format)
+    with _IO_LOCK:
+        offset = _RUN_OFFSETS.get(_sink_key(log_file), _content_size(log_file, fmt))
+        if offset > 0:
+            _rotate_active(log_file, fmt, "run", split=True)
+
+
+def configure_log_segments(
+    config: ConfigParser, log_file: str | None = None
+) -> SegmentPolicy | None:
+    """Apply the ``log_segment_*`` and ``log_retention_days`` settings."""
+    max_mb = config.getfloat("settings", "log_segment_mb", fallback=0.0)
+    per_run = config.getboolean("settings", "log_segment_per_run", fallback=False)
+    retention = config.getint("settings", "log_retention_days", fallback=0)
+    if not (max_mb or per_run or retention):
+        set_segment_policy(None)
+        return None
+    policy = SegmentPolicy(
+        max_bytes=int(max_mb * BYTES_PER_MB) or None,
+        per_run=per_run,
+        compress=config.getboolean("settings", "log_compress_segments", fallback=True),
+        retention_days=retention or None,
+    )
+    set_segment_policy(policy)
+    if log_file and per_run:
+        start_run_segment(log_file)
+    elif log_file and policy.retention_days:
+        apply_retention(os.path.dirname(log_file) or ".", policy.retention_days)
+    return policy
+
+
+def enable_async_logging(
+    *,
+    queue_size: int = ASYNC_QUEUE_SIZE,
+    batch_size: int = ASYNC_BATCH_SIZE,
+    flush_interval: float = ASYNC_FLUSH_INTERVAL,
+    policy: QueueFullPolicy = "drop",
+) -> AsyncLogWriter:
+    """Route every log record through a background :class:`AsyncLogWriter`."""
+    global _ASYNC_WRITER
+    disable_async_logging()
+    _ASYNC_WRITER = AsyncLogWriter(
+        queue_size=queue_size,
+        batch_size=batch_size,
+        flush_interval=flush_interval,
+        policy=policy,
+    )
+    return _ASYNC_WRITER
+
+
+@atexit.register
+def disable_async_logging() -> None:
+    """Write the pending records and return to synchronous writes."""
+    global _ASYNC_WRITER
+    writer, _ASYNC_WRITER = _ASYNC_WRITER, None
+    if writer is not None:
+        writer.close()
+
+
+def flush_logs() -> None:
+    """Wait until the background writer has written every queued record."""
+    writer = _ASYNC_WRITER
+    if writer is not None:
+        writer.flush()
+
+
+def configure_async_logging(config: ConfigParser) -> AsyncLogWriter | None:
+    """Enable the background writer when ``[settings] async_logging`` is set."""
+    if not config.getboolean("settings", "async_logging", fallback=False):
+        return None
+    policy = config.get("settings", "log_queue_policy", fallback="drop").strip()
+    return enable_async_logging(
+        queue_size=config.getint(
+            "settings", "log_queue_size", fallback=ASYNC_QUEUE_SIZE
+        ),
+        policy=policy.lower(),  # type: ignore[arg-type]
+    )
+
+
+def _closing_tags_offset(log_file: str) -> int | None:
+    """Return the offset of the trailing closing tags, ``None`` if absent."""
+    tail_size = len(HTML_CLOSING_TAGS.encode("utf-8")) + 64
+    with open(log_file, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        start = max(0, size - tail_size)
+        f.seek(start)
+        tail = f.read()
+    idx = tail.rfind(HTML_CLOSING_TAGS.encode("utf-8"))
+    if idx == -1 or tail[idx + len(HTML_CLOSING_TAGS) :].strip():
+        return None
+    return start + idx
+
+
 # ------------------------------------------------------------------------------------------- #
 # ----------------------------------- FONCTIONS --------------------------------------------- #
 # ------------------------------------------------------------------------------------------- #
@@ -320,61 +840,78 @@ def afficher_message_insertion(
 def initialize_html_log_file(log_file: str) -> None:
     """
     Initialise un fichier de log HTML avec le style requis si le fichier n'existe pas.
-    Si le fichier existe déjà, vérifie si une table est ouverte.
+    Si le fichier existe déjà et se termine par les balises fermantes, celles-ci
+    sont tronquées pour poursuivre l'écriture sans relire tout le fichier.
     """
     if not os.path.exists(log_file):
         # Crée un nouveau fichier HTML avec la structure complète
         with open(log_file, "w", encoding="utf-8") as f:
             f.write(get_html_style())
-    else:
-        # Vérifie si la balise </table> est présente
-        content = _read_all(log_file)
-        if "</table>" in content:
-            # Supprime les balises fermantes pour continuer l'écriture
-            content = content.replace("</table></body></html>", "")
-            with open(log_file, "w", encoding="utf-8") as f:
-                f.write(content)
+        return
+    offset = _closing_tags_offset(log_file)
+    if offset is not None:
+        with open(log_file, "rb+") as f:
+            f.truncate(offset)
 
 
 def _write_log_entry(
-    message: str,
+    message: LogMessage,
     log_file: str,
     level: LogLevel | str,
-    log_format: Literal["html", "txt"],
+    log_format: Literal["html", "txt", "jsonl"],
     auto_close: bool,
+    args: tuple[object, ...] = (),
 ) -> None:
     lvl = _to_level(level)
     if lvl is None or not _level_allowed(lvl):
         return
 
     ts = _timestamp()
-    fmt = log_format.lower()
+    fmt = _resolve_format(log_file, log_format)
     writer = _WRITERS.get(fmt, _write_txt_line)
-    writer(log_file, ts, lvl, message)
+    writer(log_file, ts, lvl, render_message(message, args))
 
     if auto_close and fmt == HTML_FORMAT:
-        _append(log_file, "</table></body></html>")
+        _close_logs_impl(log_file, fmt)
 
 
 def _close_logs_impl(log_file: str, log_format: str) -> None:
-    if log_format.lower() != HTML_FORMAT or not os.path.exists(log_file):
+    flush_logs()
+    fmt = _resolve_format(log_file, log_format)
+    if fmt == JSONL_FORMAT:
+        with _IO_LOCK:
+            jsonl_sink = _JSONL_SINKS.pop(_sink_key(log_file), None)
+            if jsonl_sink is not None:
+                jsonl_sink.close()
         return
-    content = _read_all(log_file)
-    if "</table>" in content:
+    if fmt != HTML_FORMAT:
         return
-    _append(log_file, "</table></body></html>")
+    with _IO_LOCK:
+        sink = _pop_html_sink(log_file)
+        if sink is not None and sink.is_open:
+            sink.close()
+            return
+        if not os.path.exists(log_file) or _closing_tags_offset(log_file) is not None:
+            return
+        _append(log_file, HTML_CLOSING_TAGS)
 
 
 def write_log(
-    message: str,
+    message: LogMessage,
     log_file: str,
     level: LogLevel | str = LogLevel.INFO,
-    log_format: Literal["html", "txt"] = HTML_FORMAT,
+    *args: object,
+    log_format: Literal["html", "txt", "jsonl"] = HTML_FORMAT,
     auto_close: bool = False,
 ) -> None:
-    """Écrit un message dans le fichier de log."""
+    """Écrit un message dans le fichier de log.
+
+    Comme pour :class:`Logger`, ``message`` est formaté avec ``%`` et
+    ``args``, ou peut être une fonction sans argument ; le formatage et
+    l'appel n'ont lieu que si ``level`` passe le filtre de niveau.
+    """
     try:
-        _write_log_entry(message, log_file, level, log_format, auto_close)
+        _write_log_entry(message, log_file, level, log_format, auto_close, args)
     except OSError:
         raise
     except Exception as e:
@@ -383,9 +920,24 @@ def write_log(
         ) from e
 
 
+def write_html_section(
+    content: str,
+    log_file: str,
+    log_format: Literal["html", "txt", "jsonl"] = HTML_FORMAT,
+) -> None:
+    """Ajoute un bloc HTML sur toute la largeur du tableau de log.
+
+    Le bloc est écrit quel que soit le niveau de log ; il est ignoré pour
+    les journaux texte.
+    """
+    if _resolve_format(log_file, log_format) != HTML_FORMAT:
+        return
+    _emit(log_file, HTML_FORMAT, f"<tr><td colspan='3'>{content}</td></tr>\n")
+
+
 def close_logs(
     log_file: str,
-    log_format: Literal["html", "txt"] = HTML_FORMAT,
+    log_format: Literal["html", "txt", "jsonl"] = HTML_FORMAT,
 ) -> None:
     """Ajoute la fermeture du tableau HTML si nécessaire."""
     try:
@@ -398,6 +950,17 @@ def close_logs(
         ) from e
 
 
+def open_html_log(log_file: str) -> None:
+    """Ouvre le fichier de log HTML et garde son descripteur pour les écritures."""
+    if _resolve_format(log_file, HTML_FORMAT) != HTML_FORMAT:
+        return
+    with _IO_LOCK:
+        _RUN_OFFSETS.setdefault(
+            _sink_key(log_file), _content_size(log_file, HTML_FORMAT)
+        )
+        _get_html_sink(log_file).open()
+
+
 def show_log_separator(log_file: str, level: LogLevel | str = LogLevel.INFO) -> None:
     """Write a visual separator to ``log_file``."""
 
@@ -3,7 +3,7 @@ from __future__ import annotations
 from configparser import ConfigParser
 from typing import Literal, Protocol
 
-LogFormat = Literal["html", "txt"]
+LogFormat = Literal["html", "txt", "jsonl"]
 
 
 # Signature minimale acceptée pour la fonction d'écriture
@@ -41,36 +41,64 @@ class Logger:
         """Chemin du fichier de log."""
         self.log_format: LogFormat = log_format
         self.writer: _Writer = writer or default_write_log
+        self._filtered = writer is None
 
-    def _log(self, level: str, message: str, *, auto_close: bool = False) -> None:
-        """Écrit un message au niveau spécifié."""
+    def is_enabled(self, level: str) -> bool:
+        """Indique si un message de niveau ``level`` serait écrit.
+
+        Un ``writer`` personnalisé applique son propre filtre et reçoit
+        donc tous les messages.
+        """
+        return not self._filtered or is_level_enabled(level)
+
+    def _log(
+        self,
+        level: str,
+        message: LogMessage,
+        args: tuple[object, ...] = (),
+        *,
+        auto_close: bool = False,
+    ) -> None:
+        """Écrit un message au niveau spécifié.
+
+        Le message n'est construit (appel de ``message``, formatage ``%``
+        avec ``args``) que si le niveau est actif.
+        """
+        if not self.is_enabled(level):
+            return
         self.writer(
-            message,
+            render_message(message, args),
             self.log_file,
             level=level,
             log_format=self.log_format,
             auto_close=auto_close,
         )
 
-    def info(self, message: str) -> None:
+    def info(self, message: LogMessage, *args: object) -> None:
         """Journalise au niveau ``INFO``."""
-        self._log("INFO", message)
+        self._log("INFO", message, args)
 
-    def debug(self, message: str) -> None:
+    def debug(self, message: LogMessage, *args: object) -> None:
         """Journalise au niveau ``DEBUG``."""
-        self._log("DEBUG", message)
+        self._log("DEBUG", message, args)
 
-    def warning(self, message: str) -> None:
+    def warning(self, message: LogMessage, *args: object) -> None:
         """Journalise au niveau ``WARNING``."""
-        self._log("WARNING", message)
+        self._log("WARNING", message, args)
 
-    def error(self, message: str) -> None:
+    def error(self, message: LogMessage, *args: object) -> None:
         """Journalise au niveau ``ERROR``."""
-        self._log("ERROR", message)
+        self._log("ERROR", message, args)
 
-    def critical(self, message: str) -> None:
+    def critical(self, message: LogMessage, *args: object) -> None:
         """Journalise au niveau ``CRITICAL``."""
-        self._log("CRITICAL", message)
+        self._log("CRITICAL", message, args)
+
+    def flush(self) -> None:
+        """Attend l'écriture des messages encore en file."""
+        from sele_saisie_auto.logger_utils import flush_logs
+
+        flush_logs()
 
     # ------------------------------------------------------------------
     # Context manager protocol
@@ -78,10 +106,10 @@ class Logger:
 
     def __enter__(self) -> Logger:
         """Prepare the log file when used as a context manager."""
-        from sele_saisie_auto.logger_utils import initialize_html_log_file
+        from sele_saisie_auto.logger_utils import open_html_log
 
-        if self.log_file:
-            initialize_html_log_file(self.log_file)
+        if self.log_file and self.log_format == "html":
+            open_html_log(self.log_file)
         return self
 
     def __exit__(
@@ -99,7 +127,13 @@ class Logger:
 
 _LOGGERS: dict[str, Logger] = {}
 
-from sele_saisie_auto.logger_utils import DEFAULT_LOG_LEVEL, write_log  # noqa: E402
+from sele_saisie_auto.logger_utils import (  # noqa: E402
+    DEFAULT_LOG_LEVEL,
+    LogMessage,
+    is_level_enabled,
+    render_message,
+    write_log,
+)
 from sele_saisie_auto.shared_utils import get_log_file  # noqa: E402
 
 
@@ -129,7 +163,11 @@ class LoggingConfigurator:
     def setup(log_file: str, debug_mode: str | None, config: ConfigParser) -> None:
         """Configure logging for Selenium helpers and the logger utils."""
 
-        from sele_saisie_auto.logger_utils import initialize_logger
+        from sele_saisie_auto.logger_utils import (
+            configure_async_logging,
+            configure_log_segments,
+            initialize_logger,
+        )
         from sele_saisie_auto.selenium_utils import (
             set_log_file as set_log_file_selenium,
         )
@@ -137,6 +175,8 @@ class LoggingConfigurator:
         set_log_file_selenium(log_file)
 
         if isinstance(config, ConfigParser):
+            configure_async_logging(config)
+            configure_log_segments(config, log_file)
             initialize_logger(
                 config,
                 log_level_override=debug_mode,
@@ -9,17 +9,25 @@ from uuid import uuid4
 class MemoryConfig:
     """Shared memory configuration constants."""
 
+    arena_name: str = "memoire_partagee_arene"
     cle_name: str = "memoire_partagee_cle"
     data_name: str = "memoire_partagee_donnees"
     login_name: str = "memoire_nom"
     password_name: str = "memoire_mdp"
     key_size: int = 32  # AES-256
     block_size: int = 128  # padding block
+    arena_size: int = 4096  # one page: key, credentials and extras
     suffix: str | None = None
 
     def __post_init__(self) -> None:
         if self.suffix:
-            for field in ("cle_name", "data_name", "login_name", "password_name"):
+            for field in (
+                "arena_name",
+                "cle_name",
+                "data_name",
+                "login_name",
+                "password_name",
+            ):
                 value = getattr(self, field)
                 setattr(self, field, f"{value}_{self.suffix}")
 
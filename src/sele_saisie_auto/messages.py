@@ -17,11 +17,11 @@ CONFIRMED_VALUE = "⚠️ Valeur '{valeur}' confirmée pour le jour '{jour}'"
 
 # Messages divers
 CHECK_FILLED_DAYS = "🔍 Vérification des jours déjà remplis..."
-DAY_CHECK = "👉 Vérification du jour : {jour} (ID: {id})"
-DAY_ALREADY_FILLED = "✅ Jour '{jour}' déjà rempli."
-DAY_EMPTY = "❌ Jour '{jour}' vide."
+DAY_CHECK = "👉 Vérification du jour : %s (ID: %s)"
+DAY_ALREADY_FILLED = "✅ Jour '%s' déjà rempli."
+DAY_EMPTY = "❌ Jour '%s' vide."
 ELEMENT_NOT_FOUND_ID = "❌ Élément non trouvé pour l'ID : {id}"
-DAY_ALREADY_FILLED_NO_CHANGE = "🔄 Jour '{jour}' déjà rempli, aucun changement."
+DAY_ALREADY_FILLED_NO_CHANGE = "🔄 Jour '%s' déjà rempli, aucun changement."
 DESCRIPTION_PROCESS_START = (
     "🔍 Début du traitement pour la description : '{description}'"
 )
@@ -13,6 +13,7 @@ from sele_saisie_auto.interfaces import (
     TimeSheetHelperProtocol,
 )
 from sele_saisie_auto.selenium_utils import detecter_doublons_jours
+from sele_saisie_auto.selenium_utils.command_metrics import command_phase
 
 AuthTuple: TypeAlias = tuple[bytes, bytes, bytes]
 
@@ -116,10 +117,15 @@ class PageNavigator:
         if self.credentials is None or self.date_cible is None:
             raise RuntimeError("PageNavigator not prepared")
 
-        self.login(driver, self.credentials)
-        self.navigate_to_date_entry(driver, self.date_cible)
-        self.fill_timesheet(driver)
-        self.finalize_timesheet(driver)
+        metrics = getattr(self.browser_session, "command_metrics", None)
+        with command_phase(metrics, "login"):
+            self.login(driver, self.credentials)
+        with command_phase(metrics, "date_entry"):
+            self.navigate_to_date_entry(driver, self.date_cible)
+        with command_phase(metrics, "grid_fill"):
+            self.fill_timesheet(driver)
+        with command_phase(metrics, "save"):
+            self.finalize_timesheet(driver)
 
     # ------------------------------------------------------------------
     # Low level delegations used by legacy APIs
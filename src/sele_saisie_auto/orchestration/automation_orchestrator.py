@@ -1,6 +1,7 @@
 # src\sele_saisie_auto\orchestration\automation_orchestrator.py
 from __future__ import annotations
 
+import os
 import types
 from collections.abc import Callable
 from dataclasses import dataclass
@@ -23,6 +24,7 @@ from sele_saisie_auto.interfaces import (
     LoginHandlerProtocol,
 )
 from sele_saisie_auto.locators import Locators
+from sele_saisie_auto.logger_utils import begin_log_run, write_html_section
 from sele_saisie_auto.navigation import PageNavigator
 from sele_saisie_auto.remplir_jours_feuille_de_temps import (
     TimeSheetHelper,
@@ -34,7 +36,9 @@ from sele_saisie_auto.selenium_utils import (  # noqa: F401  # re-export
     detecter_doublons_jours,
     wait_for_dom_after,
 )
+from sele_saisie_auto.selenium_utils.command_metrics import CommandMetrics
 from sele_saisie_auto.timeouts import DEFAULT_TIMEOUT
+from sele_saisie_auto.utils.misc import WAIT_STATS
 
 AuthTuple: TypeAlias = tuple[bytes, bytes, bytes]
 
@@ -98,6 +102,7 @@ class AutomationOrchestrator:
         timesheet_helper_cls: type[TimesheetHelperProtocol] = TimeSheetHelper,
         cleanup_resources: Callable[[object, object, object], None] | None = None,
         resource_manager: ResourceManager | None = None,
+        command_metrics: CommandMetrics | None = None,
     ) -> None:
         if not isinstance(browser_session, BrowserSession):
             raise TypeError("browser_session must be an instance of BrowserSession")
@@ -116,6 +121,7 @@ class AutomationOrchestrator:
             cast(str, logger.log_file)  # logger.log_file peut être None
         )
         self.page_navigator: PageNavigator | None = None
+        self.command_metrics: CommandMetrics | None = command_metrics
         self.service_configurator: ServiceConfigurator | None = None
         self.log_file: str | None = logger.log_file
         self.waiter = getattr(browser_session, "waiter", None)
@@ -147,6 +153,7 @@ class AutomationOrchestrator:
         alert_handler: AlertHandler | None = None,
         timesheet_helper_cls: type[TimesheetHelperProtocol] = TimeSheetHelper,
         cleanup_resources: Callable[[object, object, object], None] | None = None,
+        command_metrics: CommandMetrics | None = None,
     ) -> AutomationOrchestrator:
         """Create an orchestrator from high level components."""
 
@@ -162,6 +169,7 @@ class AutomationOrchestrator:
             timesheet_helper_cls=timesheet_helper_cls,
             cleanup_resources=cleanup_resources,
             resource_manager=resource_manager,
+            command_metrics=command_metrics,
         )
         inst.resource_manager = resource_manager
         inst.page_navigator = page_navigator
@@ -255,9 +263,12 @@ class AutomationOrchestrator:
         """Save the current timesheet as draft."""
         return bool(self.additional_info_page.save_draft_and_validate(driver))
 
-    @handle_errors()
-    def _fill_and_save_timesheet(self, driver: Any) -> None:
-        """Delegate the complete timesheet workflow to :class:`PageNavigator`."""
+    @handle_errors(default_return=False)
+    def _fill_and_save_timesheet(self, driver: Any) -> bool:
+        """Delegate the complete timesheet workflow to :class:`PageNavigator`.
+
+        Returns ``False`` when an error was logged instead of raised.
+        """
         assert self.page_navigator is not None  # nosec B101
         # Initialize the timesheet helper with the context and logger
         helper: TimesheetHelperProtocol = self.timesheet_helper_cls(  # type: ignore[call-arg]
@@ -273,13 +284,15 @@ class AutomationOrchestrator:
         assert self.page_navigator is not None  # nosec B101
         self.page_navigator.timesheet_helper = helper
         self.page_navigator.submit_full_timesheet(driver)
+        return True
 
     # ----------------------------
     # Run helpers (réduction CC)
     # ----------------------------
     def _date_cible_str(self) -> str:
         """Return the target date as a non-empty string or '' if absent.
-        Une date vide ou 'None' déclenche la sélection automatique du prochain samedi."""
+        Une date vide ou 'None' déclenche la sélection automatique du prochain samedi.
+        """
         dc = getattr(self.config, "date_cible", None)
         if dc is None:
             return ""  # aucune date => mode auto
@@ -314,22 +327,49 @@ class AutomationOrchestrator:
         fn = getattr(self.logger, "debug", None)
         (fn or self.logger.info)(msg)
 
-    def _run_prepared_flow(self, driver: Any, creds: CredsProtocol) -> None:
+    def _run_prepared_flow(self, driver: Any, creds: CredsProtocol) -> bool:
         self._debug("Flow=prepared")
         assert self.page_navigator is not None  # nosec B101
         # Le navigator peut typer 'Credentials' : on évite le couplage runtime
         self.page_navigator.prepare(creds, self._date_cible_str())
         self.page_navigator.run(driver)
+        return True
 
-    def _run_legacy_flow(self, driver: Any, creds: CredsProtocol) -> None:
+    def _run_legacy_flow(self, driver: Any, creds: CredsProtocol) -> bool:
         self._debug("Flow=legacy")
         assert self.page_navigator is not None  # nosec B101
         self.page_navigator.login(driver, creds)
         result = self.page_navigator.navigate_to_date_entry(
             driver, self._date_cible_str()
         )
-        if result is not False:
-            self._fill_and_save_timesheet(driver)
+        if result is False:
+            return False
+        return self._fill_and_save_timesheet(driver) is not False
+
+    def _start_command_metrics(self, driver: Any) -> None:
+        metrics = self.command_metrics
+        if metrics is None or not metrics.attach(driver):
+            return
+        cast(BrowserSession, self.browser_session).command_metrics = metrics
+
+    def _report_command_metrics(self) -> None:
+        metrics = self.command_metrics
+        if metrics is None or not metrics.records:
+            return
+        metrics.detach()
+        cast(BrowserSession, self.browser_session).command_metrics = None
+        frames = getattr(self.browser_session, "frames", None)
+        if frames is not None:
+            metrics.counters.update(frames.counters())
+        if not self.log_file:
+            return
+        json_file = f"{os.path.splitext(self.log_file)[0]}.commands.json"
+        with open(json_file, "w", encoding="utf-8") as f:
+            f.write(metrics.to_json())
+        write_html_section(metrics.to_html(), self.log_file)
+        self._debug(
+            f"Commandes WebDriver : {len(metrics.records)}, rapport : {json_file}"
+        )
 
     def _cleanup_creds(self, creds: CredsProtocol) -> None:
         self.cleanup_resources(creds.mem_key, creds.mem_login, creds.mem_password)
@@ -345,23 +385,45 @@ class AutomationOrchestrator:
 
         This method only coordinates calls to the injected services.
         All domain specific logic is delegated outside this class.
+        Errors are logged; use :meth:`execute` to propagate them.
         """
 
+        self.execute(headless=headless, no_sandbox=no_sandbox)
+
+    def execute(self, *, headless: bool = False, no_sandbox: bool = False) -> None:
+        """Same as :meth:`run` but let exceptions reach the caller."""
+
         self._ensure_config()
         assert (
             self.page_navigator is not None
         ), "page_navigator non initialisé"  # nosec B101
+        WAIT_STATS.reset()
+        begin_log_run()
         with self.resource_manager as rm:
             creds: CredsProtocol = rm.initialize_shared_memory(None)
             driver = self._get_driver_or_raise(
                 rm, headless=headless, no_sandbox=no_sandbox
             )
+            self._start_command_metrics(driver)
             try:
-                flow: Callable[[Any, CredsProtocol], None]
+                flow: Callable[[Any, CredsProtocol], bool]
                 if self._supports_prepare_run():
                     flow = self._run_prepared_flow
                 else:
                     flow = self._run_legacy_flow
-                flow(driver, creds)
+                if flow(driver, creds) is False:
+                    rm.mark_failed()
             finally:
                 self._cleanup_creds(creds)
+                self._debug(
+                    f"Attentes : {WAIT_STATS.waits}, "
+                    f"temps de pause cumulé : {WAIT_STATS.slept:.2f} s, "
+                    f"attente dans la page : {WAIT_STATS.observed:.2f} s"
+                )
+                frames = getattr(self.browser_session, "frames", None)
+                if frames is not None:
+                    self._debug(
+                        f"Changements de frame : {frames.switches}, "
+                        f"évités : {frames.avoided}"
+                    )
+                self._report_command_metrics()
@@ -7,13 +7,17 @@ import shutil
 import sys
 import threading
 from pathlib import Path
-from tkinter import messagebox
 from typing import Protocol, runtime_checkable
 
 from sele_saisie_auto import messages
 from sele_saisie_auto.logger_utils import write_log
 from sele_saisie_auto.logging_service import log_info
 from sele_saisie_auto.shared_utils import get_log_file
+from sele_saisie_auto.utils.lazy import lazy_attributes
+
+# Tk is only loaded when a notification is actually shown, so reading the
+# configuration on a server without display never imports it.
+__getattr__, __dir__ = lazy_attributes(globals(), {"messagebox": "tkinter.messagebox"})
 
 # Cache des configurations lues, indexé par chemin du fichier
 _CACHE: dict[str, tuple[int, configparser.ConfigParser]] = {}
@@ -160,6 +164,8 @@ class Notifier(Protocol):
 
 class _MessageboxNotifier:
     def info(self, title: str, message: str) -> None:  # pragma: no cover
+        from tkinter import messagebox
+
         messagebox.showinfo(title, message)
 
 
@@ -16,8 +16,6 @@ Résumé interne (rôles & règles) :
 
 from __future__ import annotations
 
-from configparser import ConfigParser
-from dataclasses import dataclass
 from typing import Protocol, cast, runtime_checkable
 
 from selenium.common.exceptions import (
@@ -29,7 +27,8 @@ from selenium.common.exceptions import (
 from selenium.webdriver.remote.webdriver import WebDriver
 
 from sele_saisie_auto import messages
-from sele_saisie_auto.app_config import AppConfig, AppConfigRaw, get_default_timeout
+from sele_saisie_auto.app_config import AppConfig
+from sele_saisie_auto.compiled_config import resolve_compiled
 from sele_saisie_auto.constants import JOURS_SEMAINE
 from sele_saisie_auto.day_filler import (
     DayFiller,
@@ -42,9 +41,6 @@ from sele_saisie_auto.day_filler import (
     traiter_champs_mission,
     traiter_jour,
 )
-from sele_saisie_auto.dropdown_options import (
-    cgi_options_billing_action as default_cgi_options_billing_action,
-)
 from sele_saisie_auto.error_handler import log_error
 from sele_saisie_auto.interfaces import (
     AdditionalInfoPageProtocol,
@@ -55,6 +51,7 @@ from sele_saisie_auto.interfaces import (
 from sele_saisie_auto.logger_utils import afficher_message_insertion, write_log
 from sele_saisie_auto.logging_service import Logger
 from sele_saisie_auto.read_or_write_file_config_ini_utils import read_config_ini
+from sele_saisie_auto.saisie_context import TimeSheetContext
 from sele_saisie_auto.selenium_utils import (
     controle_insertion,
     detecter_et_verifier_contenu,
@@ -68,10 +65,10 @@ from sele_saisie_auto.selenium_utils import (
     wait_for_element,
     wait_until_dom_is_stable,
 )
+from sele_saisie_auto.selenium_utils.command_metrics import command_phase
 from sele_saisie_auto.selenium_utils.wait_helpers import Waiter
 from sele_saisie_auto.selenium_utils.waiter_factory import create_waiter
 from sele_saisie_auto.timeouts import DEFAULT_TIMEOUT, LONG_TIMEOUT
-from sele_saisie_auto.utils.misc import program_break_time
 
 __all__ = [
     "TimeSheetContext",
@@ -91,17 +88,6 @@ __all__ = [
 ]
 
 
-@dataclass
-class TimeSheetContext:
-    """Context loaded during :func:`initialize`."""
-
-    log_file: str
-    item_descriptions: list[str]
-    work_days: dict[str, tuple[str, str]]
-    project_mission_info: dict[str, str]
-    config: ConfigParser | None = None
-
-
 @runtime_checkable
 class TimesheetHelperProtocol(Protocol):
     """Minimal interface for :class:`TimeSheetHelper`."""
@@ -112,21 +98,7 @@ class TimesheetHelperProtocol(Protocol):
 def context_from_app_config(app_config: AppConfig, log_file: str) -> TimeSheetContext:
     """Create a :class:`TimeSheetContext` from :class:`AppConfig`."""
 
-    billing_map = {
-        opt.label.lower(): opt.code for opt in app_config.cgi_options_billing_action
-    }
-    informations: dict[str, str] = {
-        item: billing_map.get(str(value).lower(), str(value))
-        for item, value in app_config.project_information.items()
-    }
-
-    return TimeSheetContext(
-        log_file=log_file,
-        item_descriptions=app_config.liste_items_planning,
-        work_days=cast(dict[str, tuple[str, str]], app_config.work_schedule),
-        project_mission_info=informations,
-        config=app_config.raw,
-    )
+    return app_config.compiled.timesheet_context(log_file)
 
 
 # ------------------------------------------------------------------------------------------- #
@@ -145,51 +117,12 @@ SELENIUM_ERROR_MESSAGES: dict[type[Exception], str] = {
 }
 
 
-# ------------------------------- Helpers "initialize" ------------------------------- #
-def _parse_item_descriptions(config: ConfigParser) -> list[str]:
-    return [
-        item.strip().strip('"')
-        for item in config.get("settings", "liste_items_planning").split(",")
-        if item.strip()
-    ]
-
-
-def _parse_work_days(config: ConfigParser) -> dict[str, tuple[str, str]]:
-    return {
-        day: (value.partition(",")[0].strip(), value.partition(",")[2].strip())
-        for day, value in config.items("work_schedule")
-    }
-
-
-def _load_billing_map(config: ConfigParser) -> dict[str, str]:
-    if config.has_section("cgi_options_billing_action"):
-        return {k.lower(): v for k, v in config.items("cgi_options_billing_action")}
-    # fallback par défaut
-    return {opt.label.lower(): opt.code for opt in default_cgi_options_billing_action}
-
-
-def _build_project_mission_info(
-    config: ConfigParser, billing_map: dict[str, str]
-) -> dict[str, str]:
-    return {
-        item_projet: billing_map.get(value.lower(), value)
-        for item_projet, value in config.items("project_information")
-    }
-
-
 def initialize(log_file: str) -> TimeSheetContext:
     """Load configuration and return a :class:`TimeSheetContext` (responsabilité unique)."""
 
     set_log_file_selenium(log_file)
     config = read_config_ini(log_file)
-    billing_map = _load_billing_map(config)
-    return TimeSheetContext(
-        log_file=log_file,
-        item_descriptions=_parse_item_descriptions(config),
-        work_days=_parse_work_days(config),
-        project_mission_info=_build_project_mission_info(config, billing_map),
-        config=config,
-    )
+    return AppConfig.from_parser(config).compiled.timesheet_context(log_file)
 
 
 # ----------------------------------------------------------------------------- #
@@ -231,15 +164,13 @@ class TimeSheetHelper:
         self.log_file: str = logger.log_file or ""
         self.waiter: WaiterProtocol
         if waiter is None:
-            cfg = context.config
-            app_cfg = None
-            timeout = DEFAULT_TIMEOUT
-            if isinstance(cfg, ConfigParser):
-                app_cfg = AppConfig.from_raw(AppConfigRaw(cfg))
-                timeout = get_default_timeout(app_cfg)
+            compiled = getattr(context, "compiled", None) or resolve_compiled(
+                getattr(context, "config", None)
+            )
+            timeout = compiled.default_timeout if compiled else DEFAULT_TIMEOUT
             w: Waiter = create_waiter(timeout)
-            if app_cfg is not None:
-                w.wrapper.long_timeout = app_cfg.long_timeout
+            if compiled is not None:
+                w.wrapper.long_timeout = compiled.long_timeout
             self.waiter = w
         else:
             self.waiter = waiter
@@ -310,10 +241,14 @@ class TimeSheetHelper:
 
         self.handle_additional_fields(driver)
         if self.additional_info_page is not None:
-            self.additional_info_page.navigate_from_work_schedule_to_additional_information_page(
-                driver
-            )
-            self.additional_info_page.submit_and_validate_additional_information(driver)
+            metrics = getattr(self.browser_session, "command_metrics", None)
+            with command_phase(metrics, "additional_info"):
+                self.additional_info_page.navigate_from_work_schedule_to_additional_information_page(
+                    driver
+                )
+                self.additional_info_page.submit_and_validate_additional_information(
+                    driver
+                )
         if self.browser_session is not None:
             self.browser_session.go_to_default_content()
         self.logger.debug("Tous les jours et missions ont été traités avec succès.")
@@ -0,0 +1,209 @@
+# src\sele_saisie_auto\resources\driver_pool.py
+"""Pool of started browsers reused across runs of the same process."""
+
+from __future__ import annotations
+
+import threading
+import time
+import weakref
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any, cast
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from sele_saisie_auto.app_config import AppConfig
+from sele_saisie_auto.automation.browser_session import SeleniumDriverManager
+from sele_saisie_auto.logging_service import Logger, get_logger
+
+__all__ = ["DriverPool", "edge_driver_factory", "is_driver_alive", "is_pooled_driver"]
+
+DEFAULT_POOL_SIZE = 1
+DEFAULT_MAX_USES = 20
+DEFAULT_MAX_IDLE = 15 * 60  # seconds
+
+DriverFactory = Callable[[], WebDriver | None]
+
+# Browsers currently owned by a pool, whatever the pool instance.
+_POOLED: weakref.WeakSet[WebDriver] = weakref.WeakSet()
+
+
+def is_driver_alive(driver: WebDriver) -> bool:
+    """Return ``True`` when ``driver`` still answers WebDriver commands."""
+    execute_script = cast(Callable[..., Any], driver.execute_script)
+    try:
+        execute_script("return document.readyState;")
+    except (WebDriverException, OSError):
+        return False
+    return True
+
+
+def is_pooled_driver(driver: WebDriver) -> bool:
+    """Return ``True`` when ``driver`` was lent by a :class:`DriverPool`."""
+    return driver in _POOLED
+
+
+def edge_driver_factory(
+    app_config: AppConfig,
+    log_file: str,
+    *,
+    headless: bool = False,
+    no_sandbox: bool = False,
+) -> DriverFactory:
+    """Return a factory opening Edge on ``app_config.url``."""
+
+    def factory() -> WebDriver | None:
+        manager = SeleniumDriverManager(log_file, app_config)
+        return cast(
+            WebDriver | None,
+            manager.open(app_config.url, headless=headless, no_sandbox=no_sandbox),
+        )
+
+    return factory
+
+
+@dataclass
+class _Entry:
+    driver: WebDriver
+    uses: int = 0
+    idle_since: float = field(default=0.0)
+
+
+class DriverPool:
+    """Keep up to ``size`` browsers open between leases.
+
+    A released browser keeps its cookies, so the next lease starts on an
+    authenticated session. Browsers are quit after ``max_uses`` leases, after
+    a failed run, when they stay idle longer than ``max_idle`` seconds or
+    when the health check fails.
+    """
+
+    def __init__(
+        self,
+        factory: DriverFactory,
+        *,
+        size: int = DEFAULT_POOL_SIZE,
+        max_uses: int = DEFAULT_MAX_USES,
+        max_idle: float = DEFAULT_MAX_IDLE,
+        health_check: Callable[[WebDriver], bool] = is_driver_alive,
+        clock: Callable[[], float] = time.monotonic,
+        logger: Logger | None = None,
+    ) -> None:
+        self.factory = factory
+        self.size = size
+        self.max_uses = max_uses
+        self.max_idle = max_idle
+        self.health_check = health_check
+        self.logger = logger or get_logger(None)
+        self._clock = clock
+        self._idle: list[_Entry] = []
+        self._leased: dict[int, _Entry] = {}
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Introspection
+    # ------------------------------------------------------------------
+    @property
+    def idle_count(self) -> int:
+        return len(self._idle)
+
+    @property
+    def leased_count(self) -> int:
+        return len(self._leased)
+
+    # ------------------------------------------------------------------
+    # Leasing
+    # ------------------------------------------------------------------
+    def prewarm(self) -> int:
+        """Start browsers until ``size`` are idle; return how many started."""
+        started = 0
+        while self.idle_count + self.leased_count < self.size:
+            driver = self.factory()
+            if driver is None:
+                break
+            with self._lock:
+                self._idle.append(_Entry(driver, idle_since=self._clock()))
+            started += 1
+        return started
+
+    def lease(self, url: str | None = None) -> WebDriver | None:
+        """Return a healthy idle browser, or a new one from the factory.
+
+        A reused browser is sent back to ``url`` when given.
+        """
+        self.reap()
+        while True:
+            with self._lock:
+                entry = self._idle.pop() if self._idle else None
+            if entry is None:
+                break
+            if not self.health_check(entry.driver):
+                self.logger.debug("Navigateur du pool hors service, remplacé.")
+                self._quit(entry)
+                continue
+            if url and not self._navigate(entry, url):
+                continue
+            self.logger.debug(f"Navigateur réutilisé ({entry.uses} utilisation(s)).")
+            return self._lend(entry)
+        driver = self.factory()
+        return None if driver is None else self._lend(_Entry(driver))
+
+    def release(self, driver: WebDriver, *, failed: bool = False) -> None:
+        """Give ``driver`` back; it is quit when it should not be reused."""
+        with self._lock:
+            entry = self._leased.pop(id(driver), None)
+        if entry is None:
+            return
+        if failed or entry.uses >= self.max_uses or self.idle_count >= self.size:
+            self._quit(entry)
+            return
+        entry.idle_since = self._clock()
+        with self._lock:
+            self._idle.append(entry)
+
+    def reap(self) -> int:
+        """Quit the browsers idle for more than ``max_idle`` seconds."""
+        now = self._clock()
+        with self._lock:
+            expired = [e for e in self._idle if now - e.idle_since > self.max_idle]
+            self._idle = [e for e in self._idle if e not in expired]
+        for entry in expired:
+            self._quit(entry)
+        return len(expired)
+
+    def close(self) -> None:
+        """Quit every browser, leased or idle."""
+        with self._lock:
+            entries = [*self._idle, *self._leased.values()]
+            self._idle.clear()
+            self._leased.clear()
+        for entry in entries:
+            self._quit(entry)
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _lend(self, entry: _Entry) -> WebDriver:
+        entry.uses += 1
+        with self._lock:
+            self._leased[id(entry.driver)] = entry
+        _POOLED.add(entry.driver)
+        return entry.driver
+
+    def _navigate(self, entry: _Entry, url: str) -> bool:
+        """Send ``entry`` back to ``url``; quit it when the browser fails."""
+        try:
+            entry.driver.get(url)
+        except (WebDriverException, OSError) as exc:
+            self.logger.debug(f"Navigateur du pool inutilisable, remplacé : {exc}")
+            self._quit(entry)
+            return False
+        return True
+
+    def _quit(self, entry: _Entry) -> None:
+        _POOLED.discard(entry.driver)
+        try:
+            entry.driver.quit()
+        except (WebDriverException, OSError) as exc:
+            self.logger.debug(f"Fermeture du navigateur impossible : {exc}")
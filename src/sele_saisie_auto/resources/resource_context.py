@@ -40,16 +40,11 @@ class ResourceContext:
         if hasattr(self.encryption_service, "__exit__"):
             self.encryption_service.__exit__(exc_type, exc, tb)
         if self._credentials is not None:
-            for mem in (
-                self._credentials.mem_key,
-                self._credentials.mem_login,
-                self._credentials.mem_password,
-            ):
-                if mem is not None:
-                    try:
-                        self.encryption_service.remove_shared_memory(mem)
-                    except Exception:  # nosec B110 - cleanup best effort
-                        pass
+            for mem in self._credentials.memories():
+                try:
+                    self.encryption_service.remove_shared_memory(mem)
+                except Exception:  # nosec B110 - cleanup best effort
+                    pass
         self._credentials = None
 
     def get_credentials(self) -> Credentials:
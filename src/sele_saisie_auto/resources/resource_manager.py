@@ -4,18 +4,19 @@
 from __future__ import annotations
 
 from multiprocessing import shared_memory
-from typing import Any
+from typing import Any, cast
 
 from selenium.webdriver.remote.webdriver import WebDriver
 
 from sele_saisie_auto.app_config import AppConfig
-from sele_saisie_auto.automation.browser_session import create_session
+from sele_saisie_auto.automation.browser_session import BrowserSession, create_session
 from sele_saisie_auto.config_manager import ConfigManager
 from sele_saisie_auto.encryption_utils import Credentials, EncryptionService
 from sele_saisie_auto.exceptions import AutomationExitError, ResourceManagerInitError
 from sele_saisie_auto.interfaces import BrowserSessionProtocol
 from sele_saisie_auto.logging_service import Logger
 from sele_saisie_auto.memory_config import MemoryConfig
+from sele_saisie_auto.resources.driver_pool import DriverPool
 from sele_saisie_auto.resources.resource_context import ResourceContext
 
 __all__ = ["ResourceManager"]
@@ -30,11 +31,14 @@ class ResourceManager:
         encryption_service: EncryptionService | None = None,
         *,
         memory_config: MemoryConfig | None = None,
+        driver_pool: DriverPool | None = None,
     ) -> None:
         """Initialise le gestionnaire.
 
         Args:
             log_file: Chemin du fichier de log.
+            driver_pool: Pool optionnel dans lequel le navigateur est emprunté
+                puis rendu au lieu d'être démarré et fermé à chaque exécution.
         """
 
         self.log_file = log_file
@@ -50,6 +54,8 @@ class ResourceManager:
         self._driver: WebDriver | None = None
         self._app_config: AppConfig | None = None
         self._res_ctx: ResourceContext | None = None
+        self.driver_pool = driver_pool
+        self._failed = False
 
     # ------------------------------------------------------------------
     # Context manager protocol
@@ -83,8 +89,12 @@ class ResourceManager:
         """Nettoie toutes les ressources ouvertes."""
 
         session = self._session
-        if session is not None:
-            if self._driver is not None:
+        if session is not None and self._driver is not None:
+            if self.driver_pool is not None:
+                failed = exc is not None or self._failed
+                self.driver_pool.release(self._driver, failed=failed)
+                cast(BrowserSession, session).driver = None
+            else:
                 session.close()
 
         exit_ctx = getattr(self._resource_context, "__exit__", None)
@@ -102,6 +112,12 @@ class ResourceManager:
         self._credentials = None
         self._driver = None
         self._session = None
+        self._failed = False
+
+    def mark_failed(self) -> None:
+        """Signale un échec intercepté : le navigateur ne sera pas réutilisé."""
+
+        self._failed = True
 
     def _cleanup_shared_memory(
         self, memories: list[shared_memory.SharedMemory | None]
@@ -189,9 +205,13 @@ class ResourceManager:
         if self._driver is None:
             if self._app_config is None:
                 raise RuntimeError("Configuration application manquante")
-            self._driver = self._session.open(
-                self._app_config.url,
-                headless=headless,
-                no_sandbox=no_sandbox,
-            )
+            if self.driver_pool is not None:
+                self._driver = self.driver_pool.lease(self._app_config.url)
+                cast(BrowserSession, self._session).driver = self._driver
+            else:
+                self._driver = self._session.open(
+                    self._app_config.url,
+                    headless=headless,
+                    no_sandbox=no_sandbox,
+                )
         return self._driver
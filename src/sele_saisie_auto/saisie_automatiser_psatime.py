@@ -57,7 +57,6 @@ from sele_saisie_auto.selenium_utils import (  # noqa: F401  # re-export  # noqa
 from sele_saisie_auto.shared_memory_service import SharedMemoryService
 from sele_saisie_auto.timeouts import DEFAULT_TIMEOUT
 from sele_saisie_auto.utils.date_utils import get_next_saturday_if_not_saturday
-from sele_saisie_auto.utils.misc import program_break_time
 from sele_saisie_auto.utils.mission import est_en_mission
 
 # ----------------------------------------------------------------------------- #
@@ -136,6 +135,7 @@ class PSATimeAutomation:
         self.browser_session = self.services.browser_session
         self.encryption_service = self.services.encryption_service
         self._login_handler = getattr(self.services, "login_handler", None)
+        self.compiled_config = app_config.compiled
         self.context = self._build_context(app_config)
 
         self._date_entry_page: DateEntryPage | None = None
@@ -190,20 +190,8 @@ class PSATimeAutomation:
         return ctx
 
     def _build_project_mission_info(self, app_config: AppConfig) -> dict[str, str]:
-        """
-        Construit le mapping projet -> code (robuste aux variations de casse).
-        Séparé pour réduire la complexité de __init__ et clarifier l'intention.
-        """
-        label_to_code = {
-            opt.label.lower(): opt.code for opt in app_config.cgi_options_billing_action
-        }
-        result: dict[str, str] = {}
-        for item_projet, value in app_config.project_information.items():
-            key = str(item_projet)
-            lookup = str(value).lower()
-            result[key] = label_to_code.get(lookup, str(value))
-
-        return result
+        """Retourne le mapping projet -> code précalculé par :class:`CompiledConfig`."""
+        return dict(self.compiled_config.project_mission_info)
 
     # ------------------------------------------------------------------
     # Context manager protocol
@@ -302,10 +290,7 @@ class PSATimeAutomation:
     def _create_page_navigator(self) -> PageNavigator:
         """Instantiate a :class:`PageNavigator` with helper dependencies."""
 
-        timesheet_ctx = remplir_jours_feuille_de_temps.context_from_app_config(
-            self.context.config,
-            self.log_file,
-        )
+        timesheet_ctx = self.compiled_config.timesheet_context(self.log_file)
         helper = remplir_jours_feuille_de_temps.TimeSheetHelper(
             timesheet_ctx,
             cast(LoggerProtocol, self.logger),
@@ -470,17 +455,12 @@ class PSATimeAutomation:
         memoire_mdp: shared_memory.SharedMemory | None,
     ) -> None:
         """Ferme le navigateur et libère les mémoires partagées."""
-        if memoire_cle:
-            self.context.shared_memory_service.supprimer_memoire_partagee_securisee(
-                memoire_cle
-            )
-        if memoire_nom:
-            self.context.shared_memory_service.supprimer_memoire_partagee_securisee(
-                memoire_nom
-            )
-        if memoire_mdp:
+        # La clé et les identifiants partagent le même segment (arène).
+        for memoire in dict.fromkeys(
+            m for m in (memoire_cle, memoire_nom, memoire_mdp) if m
+        ):
             self.context.shared_memory_service.supprimer_memoire_partagee_securisee(
-                memoire_mdp
+                memoire
             )
         if session is not None:
             session.close()
@@ -505,16 +485,9 @@ class PSATimeAutomation:
         """Remplit la feuille de temps puis la sauvegarde."""
         self.wait_for_dom(driver)
         self.switch_to_iframe_main_target_win0(driver)
-        program_break_time(
-            1,
-            messages.WAIT_STABILISATION,
-        )
-        write_log(messages.DOM_STABLE, self.log_file, "DEBUG")
         self._click_action_button(driver)
         self.wait_for_dom(driver)
-        ctx = remplir_jours_feuille_de_temps.context_from_app_config(
-            self.context.config, self.log_file
-        )
+        ctx = self.compiled_config.timesheet_context(self.log_file)
         helper = remplir_jours_feuille_de_temps.TimeSheetHelper(
             ctx,
             cast(LoggerProtocol, self.logger),
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+from configparser import ConfigParser
 from dataclasses import dataclass
 from multiprocessing import shared_memory
+from typing import TYPE_CHECKING
 
 from sele_saisie_auto.app_config import AppConfig
 from sele_saisie_auto.encryption_utils import EncryptionService
 from sele_saisie_auto.shared_memory_service import SharedMemoryService
 
+if TYPE_CHECKING:
+    from sele_saisie_auto.compiled_config import CompiledConfig
+
 
 @dataclass
 class SaisieContext:
@@ -24,4 +29,16 @@ class SaisieContext:
         self.shared_memory_service.supprimer_memoire_partagee_securisee(mem)
 
 
-__all__ = ["SaisieContext"]
+@dataclass
+class TimeSheetContext:
+    """Context loaded during :func:`~sele_saisie_auto.remplir_jours_feuille_de_temps.initialize`."""
+
+    log_file: str
+    item_descriptions: list[str]
+    work_days: dict[str, tuple[str, str]]
+    project_mission_info: dict[str, str]
+    config: ConfigParser | None = None
+    compiled: CompiledConfig | None = None
+
+
+__all__ = ["SaisieContext", "TimeSheetContext"]
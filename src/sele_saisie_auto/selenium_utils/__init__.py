@@ -3,21 +3,13 @@
 # ruff: noqa: E402
 # flake8: noqa: E402
 import time
-
-import requests
-from selenium import webdriver
-from selenium.common.exceptions import (
-    NoSuchElementException,
-    StaleElementReferenceException,
-    WebDriverException,
-)
-from selenium.webdriver.support import expected_conditions as ec
-from selenium.webdriver.support.ui import Select, WebDriverWait
+from typing import TYPE_CHECKING
 
 from sele_saisie_auto.logger_utils import write_log
 from sele_saisie_auto.logging_service import Logger, get_logger
 from sele_saisie_auto.shared_utils import get_log_file
 from sele_saisie_auto.timeouts import DEFAULT_TIMEOUT, LONG_TIMEOUT
+from sele_saisie_auto.utils.lazy import lazy_attributes
 
 LOG_FILE: str | None = None
 _DEFAULT_LOGGER = get_logger(get_log_file())
@@ -35,41 +27,136 @@ def get_default_logger() -> Logger:
     return _DEFAULT_LOGGER
 
 
-from .duplicate_day_detector import DuplicateDayDetector
-from .element_actions import (
-    click_element_without_wait,
-    controle_insertion,
-    detecter_doublons_jours,
-    detecter_et_verifier_contenu,
-    effacer_et_entrer_valeur,
-    modifier_date_input,
-    remplir_champ_texte,
-    select_by_text,
-    selectionner_option_menu_deroulant_type_select,
-    send_keys_to_element,
-    switch_to_default_content,
-    switch_to_iframe_by_id_or_name,
-    trouver_ligne_par_description,
-    verifier_champ_jour_rempli,
-)
-from .navigation import (
-    definir_taille_navigateur,
-    ouvrir_navigateur_sur_ecran_principal,
-    switch_to_frame_by_id,
-    verifier_accessibilite_url,
+# Selenium, ``requests`` and the helper submodules are imported on first use
+# so that importing a single helper does not load the whole WebDriver stack.
+_SUBMODULE_EXPORTS: dict[str, tuple[str, ...]] = {
+    "command_metrics": ("CommandMetrics", "CommandRecord", "command_phase"),
+    "duplicate_day_detector": ("DuplicateDayDetector",),
+    "element_actions": (
+        "click_element_without_wait",
+        "controle_insertion",
+        "detecter_doublons_jours",
+        "detecter_et_verifier_contenu",
+        "effacer_et_entrer_valeur",
+        "modifier_date_input",
+        "remplir_champ_texte",
+        "select_by_text",
+        "selectionner_option_menu_deroulant_type_select",
+        "send_keys_to_element",
+        "switch_to_default_content",
+        "switch_to_iframe_by_id_or_name",
+        "trouver_ligne_par_description",
+        "verifier_champ_jour_rempli",
+    ),
+    "grid_snapshot": ("GridRow", "GridSnapshot"),
+    "navigation": (
+        "definir_taille_navigateur",
+        "ouvrir_navigateur_sur_ecran_principal",
+        "switch_to_frame_by_id",
+        "verifier_accessibilite_url",
+    ),
+    "row_index": ("RowIndex",),
+    "wait_helpers": (
+        "Waiter",
+        "find_clickable",
+        "find_present",
+        "find_visible",
+        "wait_for_dom_after",
+        "wait_for_dom_ready",
+        "wait_for_element",
+        "wait_until_dom_is_stable",
+    ),
+    "waiter_factory": ("create_waiter",),
+    "wrapper": (
+        "ElementCondition",
+        "Outcome",
+        "RaceResult",
+        "Wrapper",
+        "is_document_complete",
+        "is_document_ready",
+        "text_contains",
+        "value_equals",
+    ),
+}
+_LAZY_EXPORTS: dict[str, str] = {
+    "requests": "requests",
+    "webdriver": "selenium.webdriver",
+    "ec": "selenium.webdriver.support.expected_conditions",
+    "Select": "selenium.webdriver.support.ui:Select",
+    "WebDriverWait": "selenium.webdriver.support.ui:WebDriverWait",
+    "NoSuchElementException": "selenium.common.exceptions:NoSuchElementException",
+    "StaleElementReferenceException": (
+        "selenium.common.exceptions:StaleElementReferenceException"
+    ),
+    "WebDriverException": "selenium.common.exceptions:WebDriverException",
+}
+_LAZY_EXPORTS.update(
+    {
+        name: f"{__name__}.{module}:{name}"
+        for module, names in _SUBMODULE_EXPORTS.items()
+        for name in names
+    }
 )
-from .wait_helpers import (
-    Waiter,
-    find_clickable,
-    find_present,
-    find_visible,
-    wait_for_dom_after,
-    wait_for_dom_ready,
-    wait_for_element,
-    wait_until_dom_is_stable,
-)
-from .waiter_factory import create_waiter
-from .wrapper import Wrapper, is_document_complete
+__getattr__, __dir__ = lazy_attributes(globals(), _LAZY_EXPORTS)
+
+if TYPE_CHECKING:  # pragma: no cover
+    import requests
+    from selenium import webdriver
+    from selenium.common.exceptions import (
+        NoSuchElementException,
+        StaleElementReferenceException,
+        WebDriverException,
+    )
+    from selenium.webdriver.support import expected_conditions as ec
+    from selenium.webdriver.support.ui import Select, WebDriverWait
+
+    from .command_metrics import CommandMetrics, CommandRecord, command_phase
+    from .duplicate_day_detector import DuplicateDayDetector
+    from .element_actions import (
+        click_element_without_wait,
+        controle_insertion,
+        detecter_doublons_jours,
+        detecter_et_verifier_contenu,
+        effacer_et_entrer_valeur,
+        modifier_date_input,
+        remplir_champ_texte,
+        select_by_text,
+        selectionner_option_menu_deroulant_type_select,
+        send_keys_to_element,
+        switch_to_default_content,
+        switch_to_iframe_by_id_or_name,
+        trouver_ligne_par_description,
+        verifier_champ_jour_rempli,
+    )
+    from .grid_snapshot import GridRow, GridSnapshot
+    from .navigation import (
+        definir_taille_navigateur,
+        ouvrir_navigateur_sur_ecran_principal,
+        switch_to_frame_by_id,
+        verifier_accessibilite_url,
+    )
+    from .row_index import RowIndex
+    from .wait_helpers import (
+        Waiter,
+        find_clickable,
+        find_present,
+        find_visible,
+        wait_for_dom_after,
+        wait_for_dom_ready,
+        wait_for_element,
+        wait_until_dom_is_stable,
+    )
+    from .waiter_factory import create_waiter
+    from .wrapper import (
+        ElementCondition,
+        Outcome,
+        RaceResult,
+        Wrapper,
+        is_document_complete,
+        is_document_ready,
+        text_contains,
+        value_equals,
+    )
 
 __all__ = [
     "set_log_file",
@@ -78,6 +165,7 @@ __all__ = [
     "DEFAULT_TIMEOUT",
     "LONG_TIMEOUT",
     "is_document_complete",
+    "is_document_ready",
     "wait_for_dom_ready",
     "wait_until_dom_is_stable",
     "wait_for_dom_after",
@@ -87,6 +175,11 @@ __all__ = [
     "find_present",
     "Wrapper",
     "Waiter",
+    "Outcome",
+    "RaceResult",
+    "ElementCondition",
+    "value_equals",
+    "text_contains",
     "create_waiter",
     "modifier_date_input",
     "switch_to_frame_by_id",
@@ -104,6 +197,12 @@ __all__ = [
     "trouver_ligne_par_description",
     "detecter_doublons_jours",
     "DuplicateDayDetector",
+    "GridRow",
+    "GridSnapshot",
+    "RowIndex",
+    "CommandMetrics",
+    "CommandRecord",
+    "command_phase",
     "verifier_accessibilite_url",
     "ouvrir_navigateur_sur_ecran_principal",
     "definir_taille_navigateur",
@@ -0,0 +1,134 @@
+# src\sele_saisie_auto\selenium_utils\batch_fill.py
+"""Fill several inputs with one script and verify them with one read."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any, cast
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from sele_saisie_auto.logging_service import Logger
+
+from . import get_default_logger
+
+# Sets each ``{id: value}`` pair and fires the events PeopleSoft listens to.
+# Returns ``{id: "missing" | "unchanged" | "set"}``.
+FILL_INPUTS_SCRIPT = """
+var values = arguments[0];
+var status = {};
+function fire(el, type) {
+    el.dispatchEvent(new Event(type, {bubbles: true}));
+}
+for (var id in values) {
+    if (!Object.prototype.hasOwnProperty.call(values, id)) { continue; }
+    var el = document.getElementById(id);
+    if (!el) { status[id] = 'missing'; continue; }
+    if ((el.value || '').trim() === values[id]) { status[id] = 'unchanged'; continue; }
+    if (el.focus) { el.focus(); }
+    el.value = values[id];
+    fire(el, 'input');
+    fire(el, 'change');
+    if (el.blur) { el.blur(); }
+    fire(el, 'blur');
+    status[id] = 'set';
+}
+return status;
+"""
+
+# Returns ``{id: value}`` with ``null`` for inputs absent from the page.
+READ_INPUTS_SCRIPT = """
+var ids = arguments[0];
+var values = {};
+for (var i = 0; i < ids.length; i++) {
+    var el = document.getElementById(ids[i]);
+    values[ids[i]] = el ? (el.value || '') : null;
+}
+return values;
+"""
+
+
+def supports_batch_fill(driver: WebDriver | None) -> bool:
+    """Return ``True`` when ``driver`` can run the batch scripts."""
+    return driver is not None and hasattr(driver, "execute_script")
+
+
+def _execute(
+    driver: WebDriver | None, script: str, argument: Any, logger: Logger
+) -> dict[str, Any] | None:
+    if driver is None or not supports_batch_fill(driver):
+        return None
+    execute_script = cast(Callable[..., Any], driver.execute_script)
+    try:
+        result = execute_script(script, argument)
+    except WebDriverException as exc:
+        logger.debug(f"Saisie groupée indisponible : {exc}")
+        return None
+    return result if isinstance(result, dict) else None
+
+
+def fill_inputs(
+    driver: WebDriver | None,
+    values: Mapping[str, str],
+    logger: Logger | None = None,
+) -> dict[str, str] | None:
+    """Write ``values`` in a single ``execute_script`` call.
+
+    Returns the status of each id, or ``None`` when the driver cannot run
+    the script.
+    """
+    logger = logger or get_default_logger()
+    status = _execute(driver, FILL_INPUTS_SCRIPT, dict(values), logger)
+    if status is not None:
+        logger.debug(f"Saisie groupée de {len(values)} champ(s) : {status}")
+    return status
+
+
+def read_input_values(
+    driver: WebDriver | None, ids: Iterable[str], logger: Logger | None = None
+) -> dict[str, str | None] | None:
+    """Return the current value of every input in ``ids`` with one call."""
+    logger = logger or get_default_logger()
+    return _execute(driver, READ_INPUTS_SCRIPT, list(ids), logger)
+
+
+def fill_and_verify(
+    driver: WebDriver | None,
+    values: Mapping[str, str],
+    logger: Logger | None = None,
+    settle: Callable[[], None] | None = None,
+) -> list[str] | None:
+    """Fill ``values`` then return the ids whose value did not persist.
+
+    ``settle`` is called between the write and the verification read, for
+    instance to wait for the DOM. Returns ``None`` when batch filling is not
+    available so callers can fall back to per-cell insertion.
+    """
+    logger = logger or get_default_logger()
+    if not values:
+        return []
+    status = fill_inputs(driver, values, logger)
+    if status is None:
+        return None
+    if settle is not None and "set" in status.values():
+        settle()
+    current = read_input_values(driver, values.keys(), logger)
+    if current is None:
+        return None
+    failed = [
+        field_id
+        for field_id, expected in values.items()
+        if (current.get(field_id) or "").strip() != expected
+    ]
+    if failed:
+        logger.debug(f"Valeurs non confirmées après saisie groupée : {failed}")
+    return failed
+
+
+__all__ = [
+    "fill_and_verify",
+    "fill_inputs",
+    "read_input_values",
+    "supports_batch_fill",
+]
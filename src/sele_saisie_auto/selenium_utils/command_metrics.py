@@ -0,0 +1,237 @@
+# src\sele_saisie_auto\selenium_utils\command_metrics.py
+"""Record every WebDriver command sent during a run, grouped by page phase."""
+
+from __future__ import annotations
+
+import functools
+import html
+import json
+import time
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from sele_saisie_auto.logger_utils import log_phase
+
+# Key used by the W3C protocol to serialise element references.
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+DEFAULT_PHASE = "setup"
+# Upper bounds (ms) of the histogram buckets; the last bucket is unbounded.
+BUCKET_BOUNDS_MS: tuple[int, ...] = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+SCRIPT_LABEL_LENGTH = 60
+SCRIPT_COMMANDS = {"executeScript", "executeAsyncScript"}
+FIND_COMMANDS = {
+    "findElement",
+    "findElements",
+    "findChildElement",
+    "findChildElements",
+}
+
+
+@dataclass(frozen=True)
+class CommandRecord:
+    """One WebDriver command and the phase it was sent in."""
+
+    name: str
+    locator: str | None
+    duration: float
+    phase: str
+
+
+def _script_label(script: Any) -> str | None:
+    if not isinstance(script, str):
+        return None
+    line = next((ln.strip() for ln in script.splitlines() if ln.strip()), "")
+    return f"script:{line[:SCRIPT_LABEL_LENGTH]}" if line else None
+
+
+def _element_ids(value: Any) -> list[str]:
+    items = value if isinstance(value, list) else [value]
+    return [
+        item[ELEMENT_KEY]
+        for item in items
+        if isinstance(item, dict) and isinstance(item.get(ELEMENT_KEY), str)
+    ]
+
+
+def _bucket_label(bound: int | None) -> str:
+    return "inf" if bound is None else str(bound)
+
+
+class CommandMetrics:
+    """Wrap a driver's command executor and time each command.
+
+    Commands are attributed to :attr:`phase`, set with :meth:`phase_scope`.
+    Element commands inherit the locator used to find the element so the
+    slowest commands can be traced back to the page they waited on.
+    :attr:`counters` holds the run totals reported alongside, such as the
+    frame switches avoided by :class:`BrowserSession`.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        self.phase = DEFAULT_PHASE
+        self.records: list[CommandRecord] = []
+        self.counters: dict[str, int] = {}
+        self._clock = clock
+        self._locators: dict[str, str] = {}
+        self._executor: Any = None
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    def attach(self, driver: WebDriver | None) -> bool:
+        """Start recording the commands of ``driver``.
+
+        Returns ``False`` when the driver has no command executor.
+        """
+        executor: Any = getattr(driver, "command_executor", None)
+        execute = getattr(executor, "execute", None)
+        if execute is None or not callable(execute):
+            return False
+        self.detach()
+
+        @functools.wraps(execute)
+        def timed_execute(command: str, params: Any) -> Any:
+            start = self._clock()
+            response = None
+            try:
+                response = execute(command, params)
+                return response
+            finally:
+                self.record(command, params, response, self._clock() - start)
+
+        executor.execute = timed_execute
+        self._executor = executor
+        return True
+
+    def detach(self) -> None:
+        """Restore the original command executor."""
+        executor, self._executor = self._executor, None
+        if executor is not None and "execute" in vars(executor):
+            del executor.execute
+
+    @contextmanager
+    def phase_scope(self, name: str) -> Iterator[None]:
+        """Attribute the commands sent inside the block to ``name``."""
+        previous, self.phase = self.phase, name
+        try:
+            yield
+        finally:
+            self.phase = previous
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+    def record(self, command: str, params: Any, response: Any, duration: float) -> None:
+        """Store ``command`` and remember the elements it returned."""
+        params = params if isinstance(params, dict) else {}
+        locator = self._locator(command, params)
+        self.records.append(CommandRecord(command, locator, duration, self.phase))
+        if command in FIND_COMMANDS and locator and isinstance(response, dict):
+            for element_id in _element_ids(response.get("value")):
+                self._locators[element_id] = locator
+
+    def _locator(self, command: str, params: dict[str, Any]) -> str | None:
+        if command in FIND_COMMANDS:
+            return f"{params.get('using')}={params.get('value')}"
+        if command in SCRIPT_COMMANDS:
+            return _script_label(params.get("script"))
+        ref = params.get("id")
+        if isinstance(ref, dict):
+            ref = ref.get(ELEMENT_KEY)
+        return self._locators.get(ref) if isinstance(ref, str) else None
+
+    # ------------------------------------------------------------------
+    # Reports
+    # ------------------------------------------------------------------
+    def histograms(self) -> dict[str, dict[str, Any]]:
+        """Return the count, total time and latency buckets of each phase."""
+        bounds: list[int | None] = [*BUCKET_BOUNDS_MS, None]
+        phases: dict[str, dict[str, Any]] = defaultdict(
+            lambda: {
+                "count": 0,
+                "total_s": 0.0,
+                "buckets": {_bucket_label(b): 0 for b in bounds},
+            }
+        )
+        for rec in self.records:
+            entry = phases[rec.phase]
+            entry["count"] += 1
+            entry["total_s"] += rec.duration
+            ms = rec.duration * 1000
+            bound = next((b for b in bounds if b is None or ms <= b), None)
+            entry["buckets"][_bucket_label(bound)] += 1
+        return dict(phases)
+
+    def slowest(self, limit: int = 10) -> list[CommandRecord]:
+        """Return the ``limit`` slowest commands, slowest first."""
+        return sorted(self.records, key=lambda rec: rec.duration, reverse=True)[:limit]
+
+    def to_dict(self, limit: int = 10) -> dict[str, Any]:
+        """Return the report as plain data."""
+        return {
+            "commands": len(self.records),
+            "total_s": sum(rec.duration for rec in self.records),
+            "bucket_bounds_ms": list(BUCKET_BOUNDS_MS),
+            "phases": self.histograms(),
+            "slowest": [asdict(rec) for rec in self.slowest(limit)],
+            "counters": dict(self.counters),
+        }
+
+    def to_json(self, limit: int = 10) -> str:
+        """Return the report serialised as JSON."""
+        return json.dumps(self.to_dict(limit), indent=2, ensure_ascii=False)
+
+    def to_html(self, limit: int = 10) -> str:
+        """Return the report as an HTML fragment for the log file."""
+        bounds = [_bucket_label(b) for b in (*BUCKET_BOUNDS_MS, None)]
+        head = "".join(f"<th>≤{b} ms</th>" for b in bounds[:-1])
+        rows = []
+        for phase, entry in self.histograms().items():
+            cells = "".join(f"<td>{entry['buckets'][b]}</td>" for b in bounds)
+            rows.append(
+                f"<tr><td>{html.escape(phase)}</td><td>{entry['count']}</td>"
+                f"<td>{entry['total_s']:.3f}</td>{cells}</tr>"
+            )
+        slow_rows = [
+            f"<tr><td>{rec.duration * 1000:.1f}</td><td>{html.escape(rec.phase)}</td>"
+            f"<td>{html.escape(rec.name)}</td>"
+            f"<td>{html.escape(rec.locator or '')}</td></tr>"
+            for rec in self.slowest(limit)
+        ]
+        counter_rows = "".join(
+            f"<tr><td>{html.escape(name)}</td><td>{value}</td></tr>"
+            for name, value in self.counters.items()
+        )
+        counters = (
+            f"<h3>Compteurs</h3><table>{counter_rows}</table>" if counter_rows else ""
+        )
+        return (
+            "<h3>Commandes WebDriver par phase</h3><table>"
+            f"<tr><th>Phase</th><th>Commandes</th><th>Temps (s)</th>{head}"
+            "<th>&gt;5000 ms</th></tr>" + "".join(rows) + "</table>"
+            f"<h3>{limit} commandes les plus lentes</h3><table>"
+            "<tr><th>ms</th><th>Phase</th><th>Commande</th><th>Localisateur</th></tr>"
+            + "".join(slow_rows)
+            + "</table>"
+            + counters
+        )
+
+
+@contextmanager
+def command_phase(metrics: object, name: str) -> Iterator[None]:
+    """Tag the block with phase ``name`` in ``metrics`` and the JSONL logs."""
+    scope = (
+        metrics.phase_scope(name)
+        if isinstance(metrics, CommandMetrics)
+        else nullcontext()
+    )
+    with scope, log_phase(name):
+        yield
+
+
+__all__ = ["CommandMetrics", "CommandRecord", "command_phase"]
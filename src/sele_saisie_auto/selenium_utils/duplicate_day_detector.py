@@ -14,6 +14,7 @@ from sele_saisie_auto.elements.element_id_builder import ElementIdBuilder
 from sele_saisie_auto.logging_service import Logger
 
 from . import get_default_logger
+from .grid_snapshot import GridSnapshot
 
 
 class DuplicateDayDetector:
@@ -59,7 +60,7 @@ class DuplicateDayDetector:
     ) -> Iterator[tuple[int, str]]:
         """Yield (row_index, description) for each visible description row."""
         row_elements = self._get_row_elements(driver, max_rows)
-        self.logger.debug(f"{len(row_elements)} ligne(s) de description détectée(s).")
+        self.logger.debug("%s ligne(s) de description détectée(s).", len(row_elements))
 
         for fallback_idx, el in enumerate(row_elements):
             el_id = el.get_attribute("id") or ""
@@ -95,15 +96,49 @@ class DuplicateDayDetector:
                     f"{', '.join(lines)}"
                 )
             else:
-                self.logger.debug(f"Aucun doublon détecté pour le jour '{day_name}'")
+                self.logger.debug("Aucun doublon détecté pour le jour '%s'", day_name)
 
-    def detect(self, driver: WebDriver, max_rows: int | None = None) -> None:
-        """Log duplicate days across description lines."""
+    def _collect_from_snapshot(
+        self, snapshot: GridSnapshot, max_rows: int | None
+    ) -> dict[str, list[str]]:
+        """Build the day tracker from an in-memory grid snapshot."""
         filled_days: dict[str, list[str]] = {}
+        rows = snapshot.limited(max_rows)
+        self.logger.debug("%s ligne(s) de description détectée(s).", len(rows))
+        for row in rows:
+            self.logger.debug(
+                "Analyse de la ligne '%s' à l'index %s", row.label, row.index
+            )
+            for day_counter in range(1, 8):
+                if row.value(day_counter) is None:
+                    self.logger.warning(
+                        f"{messages.IMPOSSIBLE_DE_TROUVER} l'élément pour le jour "
+                        f"'{JOURS_SEMAINE[day_counter]}' sur la ligne {row.index}"
+                    )
+                elif row.is_filled(day_counter):
+                    self._update_tracker(filled_days, day_counter, row.label)
+        return filled_days
+
+    def detect(
+        self,
+        driver: WebDriver,
+        max_rows: int | None = None,
+        snapshot: GridSnapshot | None = None,
+    ) -> None:
+        """Log duplicate days across description lines.
+
+        The grid is read with a single :class:`GridSnapshot` when the driver
+        supports it, element by element otherwise.
+        """
+        snapshot = snapshot or GridSnapshot.capture(driver, self.logger)
+        if snapshot is not None:
+            self._report_duplicates(self._collect_from_snapshot(snapshot, max_rows))
+            return
 
+        filled_days: dict[str, list[str]] = {}
         for row_index, description in self._iter_row_descriptions(driver, max_rows):
             self.logger.debug(
-                f"Analyse de la ligne '{description}' à l'index {row_index}"
+                "Analyse de la ligne '%s' à l'index %s", description, row_index
             )
             for day_counter in range(1, 8):
                 if self._is_day_filled(driver, row_index, day_counter):
@@ -19,6 +19,10 @@ from selenium.webdriver.support.ui import Select
 from sele_saisie_auto import messages
 from sele_saisie_auto.logging_service import Logger
 from sele_saisie_auto.selenium_utils.duplicate_day_detector import DuplicateDayDetector
+from sele_saisie_auto.selenium_utils.grid_snapshot import (
+    GridSnapshot,
+    normalize_description,
+)
 
 from . import get_default_logger
 from .navigation import switch_to_frame_by_id
@@ -28,7 +32,7 @@ CompareFn = Callable[[str, str], bool]  # (target, cleaned) -> bool
 
 def _normalize_text(text: str) -> str:
     """Supprime tous les espaces (y compris insécables) du texte."""
-    return "".join((text or "").split())
+    return normalize_description(text)
 
 
 def _text_contains(target: str, text: str) -> bool:
@@ -101,7 +105,7 @@ def _find_row(
     for idx, element in _iter_rows(driver, row_prefix, max_rows):
         cleaned = _normalize_text(element.text)
         if compare(target, cleaned):
-            logger.debug(f"{log_msg} pour '{raw_target}' à l'index {idx}")
+            logger.debug("%s pour '%s' à l'index %s", log_msg, raw_target, idx)
             return idx
     return None
 
@@ -136,7 +140,7 @@ def modifier_date_input(
     logger = logger or get_default_logger()
     date_field.clear()
     date_field.send_keys(new_date)
-    logger.debug(f"{update_message} : {new_date}")
+    logger.debug("%s : %s", update_message, new_date)
 
 
 def switch_to_iframe_by_id_or_name(
@@ -161,7 +165,7 @@ def click_element_without_wait(
     logger = logger or get_default_logger()
     target_element = driver.find_element(by, locator_value)
     target_element.click()
-    logger.debug(f"Élément {by}='{locator_value}' cliqué avec succès.")
+    logger.debug("Élément %s='%s' cliqué avec succès.", by, locator_value)
 
 
 def send_keys_to_element(
@@ -184,9 +188,9 @@ def verifier_champ_jour_rempli(
     logger = logger or get_default_logger()
     field_content = (day_field.get_attribute("value") or "").strip()
     if field_content:
-        logger.debug(f"Jour '{day_label}' contient une valeur : {field_content}")
+        logger.debug("Jour '%s' contient une valeur : %s", day_label, field_content)
         return day_label
-    logger.debug(f"Jour '{day_label}' est vide")
+    logger.debug("Jour '%s' est vide", day_label)
     return None
 
 
@@ -201,12 +205,14 @@ def remplir_champ_texte(
     current_content = (day_input_field.get_attribute("value") or "").strip()
     if current_content:
         logger.debug(
-            f"Le jour '{day_label}' contient déjà une valeur : {current_content}, rien à changer."
+            "Le jour '%s' contient déjà une valeur : %s, rien à changer.",
+            day_label,
+            current_content,
         )
         return
     day_input_field.clear()
     day_input_field.send_keys(input_value)
-    logger.debug(f"Valeur '{input_value}' insérée dans le jour '{day_label}'")
+    logger.debug("Valeur '%s' insérée dans le jour '%s'", input_value, day_label)
 
 
 def detecter_et_verifier_contenu(
@@ -220,7 +226,7 @@ def detecter_et_verifier_contenu(
         current_content = (raw_content or "").strip()
         is_correct_value = current_content == input_value
         logger.debug(
-            f"id trouvé : {element_id} / is_correct_value : {is_correct_value}"
+            "id trouvé : %s / is_correct_value : %s", element_id, is_correct_value
         )
         return day_input_field, is_correct_value
     except Exception as e:  # noqa: BLE001
@@ -234,7 +240,7 @@ def effacer_et_entrer_valeur(
     logger = logger or get_default_logger()
     day_input_field.clear()
     day_input_field.send_keys(input_value)
-    logger.debug(f"Valeur '{input_value}' insérée dans le champ avec succès.")
+    logger.debug("Valeur '%s' insérée dans le champ avec succès.", input_value)
 
 
 def controle_insertion(day_input_field: WebElement, input_value: str) -> bool:
@@ -251,7 +257,7 @@ def select_by_text(
     try:
         selector = Select(element)
         selector.select_by_visible_text(text)
-        logger.debug(f"Valeur '{text}' sélectionnée.")
+        logger.debug("Valeur '%s' sélectionnée.", text)
     except Exception as e:  # noqa: BLE001
         logger.error(f"❌ Erreur lors de la sélection de la valeur '{text}' : {str(e)}")
 
@@ -270,8 +276,13 @@ def trouver_ligne_par_description(
     partial_match: bool = False,
     logger: Logger | None = None,
     max_rows: int | None = None,
+    snapshot: GridSnapshot | None = None,
 ) -> int | None:
-    """Retourne l'index de la ligne correspondant à la description, ou ``None``."""
+    """Retourne l'index de la ligne correspondant à la description, ou ``None``.
+
+    Si ``snapshot`` est fourni, la recherche se fait dans cet instantané de la
+    grille sans interroger le WebDriver.
+    """
     logger = logger or get_default_logger()
     target = _normalize_text(target_description)
 
@@ -282,29 +293,39 @@ def trouver_ligne_par_description(
         compare = _text_equals
         log_msg = "Ligne trouvée"
 
-    idx = _find_row(
-        driver,
-        row_prefix,
-        max_rows,
-        compare,
-        target,
-        log_msg,
-        target_description,
-        logger,
-    )
+    if snapshot is not None:
+        idx = snapshot.find_row(target_description, partial_match, max_rows)
+        if idx is not None:
+            logger.debug("%s pour '%s' à l'index %s", log_msg, target_description, idx)
+    else:
+        idx = _find_row(
+            driver,
+            row_prefix,
+            max_rows,
+            compare,
+            target,
+            log_msg,
+            target_description,
+            logger,
+        )
     if idx is None:
         if max_rows is None:
             logger.warning(f"Aucune ligne trouvée pour '{target_description}'.")
         else:
             logger.debug(
-                f"Aucune ligne trouvée pour '{target_description}' parmi {max_rows} lignes."
+                "Aucune ligne trouvée pour '%s' parmi %s lignes.",
+                target_description,
+                max_rows,
             )
     return idx
 
 
 def detecter_doublons_jours(
-    driver: WebDriver, logger: Logger | None = None, max_rows: int | None = None
+    driver: WebDriver,
+    logger: Logger | None = None,
+    max_rows: int | None = None,
+    snapshot: GridSnapshot | None = None,
 ) -> None:
     """Check if any day appears more than once across lines."""
     detector = DuplicateDayDetector(logger=logger)
-    detector.detect(driver, max_rows=max_rows)
+    detector.detect(driver, max_rows=max_rows, snapshot=snapshot)
@@ -0,0 +1,188 @@
+# src\sele_saisie_auto\selenium_utils\grid_snapshot.py
+"""Read the whole time sheet grid in a single WebDriver round-trip."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass
+from typing import Any, cast
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from sele_saisie_auto.logging_service import Logger
+
+from . import get_default_logger
+
+DESCRIPTION_PREFIX = "POL_DESCR$"
+DAY_VALUE_PREFIX = "POL_TIME"
+DAYS_PER_ROW = 7
+
+# Returns ``[{index, text, values}]`` where ``values[d - 1]`` holds the value
+# of ``<value_prefix><d>$<index>`` or ``null`` when the input is missing.
+GRID_SNAPSHOT_SCRIPT = """
+var descPrefix = arguments[0], valuePrefix = arguments[1], days = arguments[2];
+var rows = [];
+var elements = document.querySelectorAll("[id^='" + descPrefix + "']");
+for (var i = 0; i < elements.length; i++) {
+    var el = elements[i];
+    var suffix = el.id.slice(descPrefix.length);
+    if (!/^\\d+$/.test(suffix)) { continue; }
+    var values = [];
+    for (var d = 1; d <= days; d++) {
+        var input = document.getElementById(valuePrefix + d + '$' + suffix);
+        values.push(input ? (input.value || '') : null);
+    }
+    rows.push({
+        index: parseInt(suffix, 10),
+        text: el.innerText || el.textContent || '',
+        values: values
+    });
+}
+return rows;
+"""
+
+
+def normalize_description(text: str) -> str:
+    """Supprime tous les espaces (y compris insécables) du texte."""
+    return "".join((text or "").split())
+
+
+@dataclass(frozen=True)
+class GridRow:
+    """One description line of the time sheet with its day values."""
+
+    index: int
+    label: str
+    description: str
+    values: tuple[str | None, ...]
+
+    def value(self, day_index: int) -> str | None:
+        """Return the stripped value of ``day_index`` (1-7) or ``None``."""
+        raw = self.values[day_index - 1] if 0 < day_index <= len(self.values) else None
+        return None if raw is None else raw.strip()
+
+    def is_filled(self, day_index: int) -> bool:
+        """Return ``True`` when the input of ``day_index`` holds a value."""
+        return bool(self.value(day_index))
+
+
+@dataclass(frozen=True)
+class GridSnapshot:
+    """In-memory copy of the ``POL_DESCR``/``POL_TIME`` grid."""
+
+    rows: tuple[GridRow, ...]
+
+    def __iter__(self) -> Iterator[GridRow]:
+        return iter(self.rows)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    @classmethod
+    def from_rows(cls, raw_rows: list[Mapping[str, Any]]) -> GridSnapshot:
+        """Build a snapshot from the structure returned by the script."""
+        rows: list[GridRow] = []
+        for raw in raw_rows:
+            label = str(raw.get("text") or "").strip()
+            values = tuple(
+                None if value is None else str(value)
+                for value in raw.get("values") or ()
+            )
+            rows.append(
+                GridRow(
+                    index=int(raw["index"]),
+                    label=label,
+                    description=normalize_description(label),
+                    values=values,
+                )
+            )
+        return cls(tuple(rows))
+
+    @classmethod
+    def capture(
+        cls,
+        driver: WebDriver | None,
+        logger: Logger | None = None,
+        *,
+        row_prefix: str = DESCRIPTION_PREFIX,
+        value_prefix: str = DAY_VALUE_PREFIX,
+    ) -> GridSnapshot | None:
+        """Read every row in one ``execute_script`` call.
+
+        Returns ``None`` when the driver cannot run the script so callers can
+        fall back to element-by-element lookups.
+        """
+        logger = logger or get_default_logger()
+        if driver is None or not hasattr(driver, "execute_script"):
+            return None
+        execute_script = cast(Callable[..., Any], driver.execute_script)
+        try:
+            raw_rows = execute_script(
+                GRID_SNAPSHOT_SCRIPT, row_prefix, value_prefix, DAYS_PER_ROW
+            )
+        except WebDriverException as exc:
+            logger.debug(f"Instantané de la grille indisponible : {exc}")
+            return None
+        if not isinstance(raw_rows, list):
+            return None
+        try:
+            snapshot = cls.from_rows(raw_rows)
+        except (AttributeError, KeyError, TypeError, ValueError) as exc:
+            logger.debug(f"Instantané de la grille invalide : {exc}")
+            return None
+        logger.debug(f"Instantané de la grille : {len(snapshot)} ligne(s).")
+        return snapshot
+
+    def limited(self, max_rows: int | None) -> GridSnapshot:
+        """Return the first ``max_rows`` rows, or ``self`` when ``None``."""
+        if max_rows is None:
+            return self
+        return GridSnapshot(self.rows[:max_rows])
+
+    def row(self, row_index: int) -> GridRow | None:
+        """Return the row whose id suffix is ``row_index``."""
+        for grid_row in self.rows:
+            if grid_row.index == row_index:
+                return grid_row
+        return None
+
+    def find_row(
+        self,
+        description: str,
+        partial_match: bool = False,
+        max_rows: int | None = None,
+    ) -> int | None:
+        """Return the index of the row matching ``description`` or ``None``.
+
+        ``max_rows`` restricts the search to indices ``0`` to ``max_rows - 1``.
+        """
+        target = normalize_description(description)
+        for grid_row in self.rows:
+            if max_rows is not None and grid_row.index >= max_rows:
+                continue
+            if partial_match:
+                if target in grid_row.description:
+                    return grid_row.index
+            elif grid_row.description == target:
+                return grid_row.index
+        return None
+
+    def filled_days(self, row_index: int, week_days: Mapping[int, str]) -> list[str]:
+        """Return the names of ``week_days`` already filled on ``row_index``."""
+        grid_row = self.row(row_index)
+        if grid_row is None:
+            return []
+        return [
+            day_name
+            for day_index, day_name in week_days.items()
+            if grid_row.is_filled(day_index)
+        ]
+
+
+__all__ = [
+    "GRID_SNAPSHOT_SCRIPT",
+    "GridRow",
+    "GridSnapshot",
+    "normalize_description",
+]
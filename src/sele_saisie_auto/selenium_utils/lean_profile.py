@@ -0,0 +1,113 @@
+# src\sele_saisie_auto\selenium_utils\lean_profile.py
+"""Lean browser profile: skip the resources the automation never reads.
+
+Enabled by ``[settings] lean_browser = true``. Images are disabled through the
+Chromium content settings preference, every URL matching
+``blocked_url_patterns`` (images, fonts and analytics by default) is blocked
+with the DevTools ``Network.setBlockedURLs`` command, and pages are loaded with
+the ``eager`` strategy unless ``eager_page_load = false``: navigation returns
+at ``DOMContentLoaded`` and :func:`~sele_saisie_auto.selenium_utils.wrapper.is_document_ready`
+accepts an ``interactive`` document.
+"""
+
+from __future__ import annotations
+
+from configparser import ConfigParser
+from dataclasses import dataclass
+from typing import Any
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.edge.options import Options as EdgeOptions
+
+from sele_saisie_auto.app_config import parse_list
+from sele_saisie_auto.logging_service import Logger
+
+from . import get_default_logger
+
+DEFAULT_BLOCKED_URL_PATTERNS: tuple[str, ...] = (
+    "*.png",
+    "*.jpg",
+    "*.jpeg",
+    "*.gif",
+    "*.svg",
+    "*.ico",
+    "*.webp",
+    "*.bmp",
+    "*.woff",
+    "*.woff2",
+    "*.ttf",
+    "*.otf",
+    "*.eot",
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*/analytics.js*",
+)
+
+# Chromium content setting value meaning "block".
+_BLOCK = 2
+
+
+@dataclass(frozen=True)
+class LeanProfile:
+    """Resources to block and page load strategy of a lean browser."""
+
+    blocked_url_patterns: tuple[str, ...] = DEFAULT_BLOCKED_URL_PATTERNS
+    block_images: bool = True
+    eager: bool = True
+
+    @classmethod
+    def from_config(cls, parser: ConfigParser | None) -> LeanProfile | None:
+        """Return the profile described by ``[settings]``, ``None`` if disabled."""
+        if parser is None or not parser.getboolean(
+            "settings", "lean_browser", fallback=False
+        ):
+            return None
+        patterns = DEFAULT_BLOCKED_URL_PATTERNS
+        if parser.has_option("settings", "blocked_url_patterns"):
+            patterns = tuple(
+                parse_list(parser, "settings", "blocked_url_patterns", [], str)
+            )
+        return cls(
+            blocked_url_patterns=patterns,
+            block_images=parser.getboolean(
+                "settings", "lean_block_images", fallback=True
+            ),
+            eager=parser.getboolean("settings", "eager_page_load", fallback=True),
+        )
+
+    def apply_to_options(self, options: EdgeOptions) -> EdgeOptions:
+        """Set the preferences and load strategy on ``options``."""
+        if self.block_images:
+            options.add_experimental_option(
+                "prefs", {"profile.managed_default_content_settings.images": _BLOCK}
+            )
+        if self.eager:
+            options.page_load_strategy = "eager"
+        return options
+
+    def apply_to_driver(self, driver: Any, logger: Logger | None = None) -> bool:
+        """Block :attr:`blocked_url_patterns` in ``driver`` before it navigates.
+
+        Returns ``False`` when the driver does not expose the DevTools
+        protocol; the preferences set by :meth:`apply_to_options` still apply.
+        """
+        logger = logger or get_default_logger()
+        execute_cdp_cmd = getattr(driver, "execute_cdp_cmd", None)
+        if not self.blocked_url_patterns or execute_cdp_cmd is None:
+            return False
+        try:
+            execute_cdp_cmd("Network.enable", {})
+            execute_cdp_cmd(
+                "Network.setBlockedURLs", {"urls": list(self.blocked_url_patterns)}
+            )
+        except WebDriverException as exc:
+            logger.warning(f"⚠️ Blocage des ressources indisponible : {exc}")
+            return False
+        logger.debug(
+            f"Profil allégé : {len(self.blocked_url_patterns)} motifs d'URL bloqués."
+        )
+        return True
+
+
+__all__ = ["DEFAULT_BLOCKED_URL_PATTERNS", "LeanProfile"]
@@ -11,6 +11,8 @@ from selenium.webdriver.edge.options import Options as EdgeOptions
 from sele_saisie_auto.logging_service import Logger
 
 from . import get_default_logger
+from .lean_profile import LeanProfile
+from .wrapper import install_network_tracker
 
 # Constantes pour éviter les "magic numbers"
 _DEFAULT_TIMEOUT = 10
@@ -68,13 +70,17 @@ def switch_to_frame_by_id(
     return True
 
 
-def _build_edge_options(*, headless: bool, no_sandbox: bool) -> EdgeOptions:
+def _build_edge_options(
+    *, headless: bool, no_sandbox: bool, lean: LeanProfile | None = None
+) -> EdgeOptions:
     """Construit les options Edge de manière déclarative (réduit la complexité de la fonction appelante)."""
     opts = EdgeOptions()
     if headless:
         opts.add_argument("--headless")
     if no_sandbox:
         opts.add_argument("--no-sandbox")
+    if lean is not None:
+        lean.apply_to_options(opts)
     return opts
 
 
@@ -93,16 +99,30 @@ def ouvrir_navigateur_sur_ecran_principal(
     headless: bool = False,
     no_sandbox: bool = False,
     logger: Logger | None = None,
+    lean: LeanProfile | None = None,
+    track_network: bool = False,
 ) -> webdriver.Edge | None:
-    """Open the Edge browser and navigate to the URL."""
+    """Open the Edge browser and navigate to the URL.
+
+    ``lean`` blocks images, fonts and analytics (see :class:`LeanProfile`).
+    ``track_network`` installs the request counter of the ``network_idle``
+    readiness mode before the first page loads.
+    """
     logger = logger or get_default_logger()
-    options = _build_edge_options(headless=headless, no_sandbox=no_sandbox)
+    options = _build_edge_options(headless=headless, no_sandbox=no_sandbox, lean=lean)
 
     if not verifier_accessibilite_url(url, logger=logger):
         return None
 
     try:
-        return _start_browser(options, url, plein_ecran)
+        return _start_browser(
+            options,
+            url,
+            plein_ecran,
+            lean=lean,
+            track_network=track_network,
+            logger=logger,
+        )
     except WebDriverException as e:
         _log_webdriver_exception(e, logger)
         return None
@@ -118,9 +138,21 @@ def definir_taille_navigateur(
     return navigateur
 
 
-def _start_browser(options: EdgeOptions, url: str, plein_ecran: bool) -> webdriver.Edge:
+def _start_browser(
+    options: EdgeOptions,
+    url: str,
+    plein_ecran: bool,
+    *,
+    lean: LeanProfile | None = None,
+    track_network: bool = False,
+    logger: Logger | None = None,
+) -> webdriver.Edge:
     """Lance le navigateur avec les options fournies."""
     browser_instance = webdriver.Edge(options=options)
+    if lean is not None:
+        lean.apply_to_driver(browser_instance, logger)
+    if track_network:
+        install_network_tracker(browser_instance)
     browser_instance.get(url)
     if plein_ecran:
         browser_instance.maximize_window()
@@ -0,0 +1,170 @@
+# src\sele_saisie_auto\selenium_utils\row_index.py
+"""Index mapping time sheet descriptions to their row number."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any, cast
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from sele_saisie_auto.logging_service import Logger
+
+from . import get_default_logger
+from .grid_snapshot import DESCRIPTION_PREFIX, GridSnapshot, normalize_description
+
+# Flags ``window.__seleRowIndex.dirty`` as soon as a description cell is
+# added, removed or edited. Returns ``false`` without MutationObserver.
+WATCH_ROWS_SCRIPT = """
+var prefix = arguments[0];
+var selector = "[id^='" + prefix + "']";
+var state = window.__seleRowIndex;
+if (state && state.observer) { state.observer.disconnect(); }
+state = window.__seleRowIndex = {dirty: false, observer: null};
+if (typeof MutationObserver === 'undefined') { return false; }
+function isRow(node) {
+    if (!node || node.nodeType !== 1) { return false; }
+    if (node.id && node.id.indexOf(prefix) === 0) { return true; }
+    return !!node.querySelector(selector);
+}
+function inRow(node) {
+    var el = node && node.nodeType === 1 ? node : node && node.parentNode;
+    return !!(el && el.closest && el.closest(selector));
+}
+function touches(mutation) {
+    if (mutation.type === 'characterData') { return inRow(mutation.target); }
+    if (inRow(mutation.target)) { return true; }
+    var lists = [mutation.addedNodes, mutation.removedNodes];
+    for (var l = 0; l < lists.length; l++) {
+        for (var n = 0; n < lists[l].length; n++) {
+            if (isRow(lists[l][n])) { return true; }
+        }
+    }
+    return false;
+}
+state.observer = new MutationObserver(function (mutations) {
+    for (var i = 0; i < mutations.length; i++) {
+        if (touches(mutations[i])) {
+            state.dirty = true;
+            state.observer.disconnect();
+            return;
+        }
+    }
+});
+state.observer.observe(document.documentElement || document, {
+    childList: true, subtree: true, characterData: true
+});
+return true;
+"""
+
+ROWS_CHANGED_SCRIPT = """
+var state = window.__seleRowIndex;
+return !state || state.dirty !== false;
+"""
+
+
+class RowIndex:
+    """Serve exact and partial description lookups from memory.
+
+    The index is built once from a :class:`GridSnapshot` and rebuilt when
+    :meth:`invalidate` bumps the generation counter or when the browser
+    reports that a description cell changed. The browser is asked at most
+    once per fill pass (see :meth:`begin_pass`), so lookups inside a pass
+    make no WebDriver call.
+    """
+
+    def __init__(
+        self, row_prefix: str = DESCRIPTION_PREFIX, logger: Logger | None = None
+    ) -> None:
+        self.row_prefix = row_prefix
+        self.logger = logger or get_default_logger()
+        self.generation = 0
+        self._built_generation: int | None = None
+        self._observed = False
+        self._verified = False
+        self._exact: dict[str, int] = {}
+        self._ordered: list[tuple[str, int]] = []
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    def invalidate(self) -> None:
+        """Mark the index as outdated; the next lookup rebuilds it."""
+        self.generation += 1
+
+    def begin_pass(self) -> None:
+        """Start a fill pass: the next lookup checks the page for changes."""
+        self._verified = False
+
+    def load(self, driver: WebDriver | None, snapshot: GridSnapshot) -> None:
+        """Index ``snapshot`` and watch the description cells of ``driver``."""
+        self._exact = {}
+        self._ordered = []
+        for row in snapshot:
+            self._exact.setdefault(row.description, row.index)
+            self._ordered.append((row.description, row.index))
+        self._built_generation = self.generation
+        self._observed = self._watch(driver)
+        self._verified = True
+        self.logger.debug(
+            f"Index des lignes construit : {len(self._ordered)} ligne(s)."
+        )
+
+    def ensure(self, driver: WebDriver | None) -> bool:
+        """Return ``True`` when the index is usable, rebuilding it if needed."""
+        if self._is_current(driver):
+            return True
+        snapshot = GridSnapshot.capture(driver, self.logger, row_prefix=self.row_prefix)
+        if snapshot is None:
+            self._built_generation = None
+            return False
+        self.load(driver, snapshot)
+        return True
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+    def find(self, description: str, partial_match: bool = False) -> int | None:
+        """Return the row index of ``description`` or ``None``."""
+        target = normalize_description(description)
+        if partial_match:
+            idx = next((index for text, index in self._ordered if target in text), None)
+            log_msg = "Ligne trouvée (correspondance partielle)"
+        else:
+            idx = self._exact.get(target)
+            log_msg = "Ligne trouvée"
+        if idx is None:
+            self.logger.warning(f"Aucune ligne trouvée pour '{description}'.")
+        else:
+            self.logger.debug("%s pour '%s' à l'index %s", log_msg, description, idx)
+        return idx
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _is_current(self, driver: WebDriver | None) -> bool:
+        if self._built_generation != self.generation or not self._observed:
+            return False
+        if not self._verified:
+            self._verified = not self._rows_changed(driver)
+        return self._verified
+
+    def _run_script(self, driver: WebDriver | None, script: str, *args: Any) -> Any:
+        if driver is None or not hasattr(driver, "execute_script"):
+            return None
+        execute_script = cast(Callable[..., Any], driver.execute_script)
+        try:
+            return execute_script(script, *args)
+        except WebDriverException as exc:
+            self.logger.debug(f"Surveillance des lignes indisponible : {exc}")
+            return None
+
+    def _watch(self, driver: WebDriver | None) -> bool:
+        return self._run_script(driver, WATCH_ROWS_SCRIPT, self.row_prefix) is True
+
+    def _rows_changed(self, driver: WebDriver | None) -> bool:
+        return self._run_script(driver, ROWS_CHANGED_SCRIPT) is not False
+
+
+__all__ = ["RowIndex"]
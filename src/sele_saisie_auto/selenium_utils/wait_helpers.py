@@ -5,7 +5,7 @@ from __future__ import annotations
 
 import inspect
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from functools import wraps
 from typing import Any
 
@@ -16,13 +16,24 @@ from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as ec
 
 from sele_saisie_auto.logging_service import Logger
-from sele_saisie_auto.timeouts import DEFAULT_TIMEOUT, LONG_TIMEOUT
+from sele_saisie_auto.timeouts import (
+    DEFAULT_TIMEOUT,
+    DOM_QUIET_WINDOW_MS,
+    LONG_TIMEOUT,
+)
 
 from . import get_default_logger
 from . import wrapper as _wrapper
 
 Wrapper = _wrapper.Wrapper
+Outcome = _wrapper.Outcome
+RaceResult = _wrapper.RaceResult
+ElementCondition = _wrapper.ElementCondition
+value_equals = _wrapper.value_equals
+text_contains = _wrapper.text_contains
 is_document_complete = _wrapper.is_document_complete
+is_document_ready = _wrapper.is_document_ready
+install_network_tracker = _wrapper.install_network_tracker
 # expose WebDriverWait for monkeypatching in tests
 
 # ------------------------------------------------------------------
@@ -42,13 +53,28 @@ class Waiter:
         long_timeout: int = LONG_TIMEOUT,
         wrapper: Wrapper | None = None,
         logger: Logger | None = None,
+        *,
+        dom_stability: _wrapper.DomStabilityMode = "mutation",
+        quiet_window_ms: int = DOM_QUIET_WINDOW_MS,
+        wait_engine: _wrapper.WaitEngine = "webdriver",
+        readiness: _wrapper.ReadinessMode = "ready_state",
     ) -> None:
-        """Configure les délais d'attente par défaut."""
+        """Configure les délais d'attente par défaut.
+
+        ``wait_engine="script"`` évalue les conditions d'attente des éléments
+        dans la page (voir :meth:`Wrapper.wait_for_element`) et
+        ``readiness="network_idle"`` attend en plus que plus aucune requête
+        XHR ou fetch ne soit en cours (voir :meth:`Wrapper.wait_for_dom_ready`).
+        """
         self.logger = logger or get_default_logger()
         self.wrapper: Wrapper = wrapper or Wrapper(
             default_timeout,
             long_timeout,
             logger=self.logger,
+            dom_stability=dom_stability,
+            quiet_window_ms=quiet_window_ms,
+            wait_engine=wait_engine,
+            readiness=readiness,
         )
 
     def wait_for_dom_ready(self, driver: WebDriver, timeout: int | None = None) -> None:
@@ -61,6 +87,29 @@ class Waiter:
         """Return True when the DOM remains unchanged for ``timeout`` seconds."""
         return self.wrapper.wait_until_dom_is_stable(driver, timeout)
 
+    @property
+    def readiness(self) -> _wrapper.ReadinessMode:
+        """Page readiness signal used by :meth:`wait_for_dom_ready`."""
+        return self.wrapper.readiness
+
+    def wait_until_network_idle(
+        self,
+        driver: WebDriver,
+        quiet_window_ms: int | None = None,
+        timeout: int | None = None,
+    ) -> bool | None:
+        """Return True once no XHR or fetch request is in flight."""
+        return self.wrapper.wait_until_network_idle(driver, quiet_window_ms, timeout)
+
+    def wait_until_dom_is_quiet(
+        self,
+        driver: WebDriver,
+        quiet_window_ms: int | None = None,
+        timeout: int | None = None,
+    ) -> bool | None:
+        """Return True once no DOM mutation occurs for ``quiet_window_ms``."""
+        return self.wrapper.wait_until_dom_is_quiet(driver, quiet_window_ms, timeout)
+
     def wait_for_element(
         self,
         driver: WebDriver,
@@ -84,6 +133,15 @@ class Waiter:
             )
             raise
 
+    def wait_for_any(
+        self,
+        driver: WebDriver,
+        outcomes: Sequence[_wrapper.Outcome],
+        timeout: float | None = None,
+    ) -> _wrapper.RaceResult | None:
+        """Return the first of ``outcomes`` to hold, or ``None`` after ``timeout``."""
+        return self.wrapper.wait_for_any(driver, outcomes, timeout)
+
     # Convenience wrappers -------------------------------------------------
     def find_clickable(
         self,
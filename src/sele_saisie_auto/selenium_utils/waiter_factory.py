@@ -2,24 +2,58 @@
 
 from __future__ import annotations
 
+from typing import cast
+
 from sele_saisie_auto.app_config import AppConfig
 from sele_saisie_auto.selenium_utils.wait_helpers import Waiter
+from sele_saisie_auto.selenium_utils.wrapper import ReadinessMode, WaitEngine
 from sele_saisie_auto.timeouts import DEFAULT_TIMEOUT
 
+READINESS_MODES: tuple[ReadinessMode, ...] = ("ready_state", "network_idle")
+
+
+def readiness_mode(app_config: AppConfig | None) -> ReadinessMode:
+    """Return ``[settings] readiness`` of ``app_config`` (``ready_state`` by default)."""
+    raw = getattr(app_config, "raw", None)
+    if raw is None:
+        return "ready_state"
+    value = raw.get("settings", "readiness", fallback="ready_state").strip().lower()
+    if value not in READINESS_MODES:
+        raise ValueError(
+            f"readiness inconnu : {value!r} (attendu : {', '.join(READINESS_MODES)})"
+        )
+    return cast(ReadinessMode, value)
+
 
-def create_waiter(timeout: int) -> Waiter:
+def create_waiter(
+    timeout: int,
+    wait_engine: WaitEngine = "webdriver",
+    readiness: ReadinessMode = "ready_state",
+) -> Waiter:
     """Return a :class:`Waiter` using ``timeout`` for its delays."""
-    return Waiter(default_timeout=timeout, long_timeout=timeout * 2)
+    return Waiter(
+        default_timeout=timeout,
+        long_timeout=timeout * 2,
+        wait_engine=wait_engine,
+        readiness=readiness,
+    )
 
 
-def get_waiter(app_config: AppConfig | None) -> Waiter:
+def get_waiter(
+    app_config: AppConfig | None, wait_engine: WaitEngine = "webdriver"
+) -> Waiter:
     """Return a :class:`Waiter` configured from ``app_config``."""
     timeout = DEFAULT_TIMEOUT
     long_timeout = DEFAULT_TIMEOUT * 2
     if app_config is not None:
         timeout = getattr(app_config, "default_timeout", DEFAULT_TIMEOUT)
         long_timeout = getattr(app_config, "long_timeout", timeout * 2)
-    return Waiter(default_timeout=timeout, long_timeout=long_timeout)
+    return Waiter(
+        default_timeout=timeout,
+        long_timeout=long_timeout,
+        wait_engine=wait_engine,
+        readiness=readiness_mode(app_config),
+    )
 
 
-__all__ = ["create_waiter", "get_waiter"]
+__all__ = ["READINESS_MODES", "create_waiter", "get_waiter", "readiness_mode"]
@@ -4,9 +4,16 @@
 from __future__ import annotations
 
 import time
-from collections.abc import Callable
-from typing import Any, cast
+from collections.abc import Callable, Sequence
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import Any, Literal, cast
 
+from selenium.common.exceptions import (
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
@@ -15,10 +22,340 @@ from selenium.webdriver.support.ui import WebDriverWait
 
 from sele_saisie_auto import messages
 from sele_saisie_auto.logging_service import Logger
-from sele_saisie_auto.timeouts import DEFAULT_TIMEOUT, LONG_TIMEOUT
+from sele_saisie_auto.timeouts import (
+    DEFAULT_TIMEOUT,
+    DOM_QUIET_WINDOW_MS,
+    INITIAL_POLL_DELAY,
+    LONG_TIMEOUT,
+    MAX_POLL_DELAY,
+)
+from sele_saisie_auto.utils.misc import WAIT_STATS
 
 from . import get_default_logger
 
+DomStabilityMode = Literal["mutation", "snapshot"]
+WaitEngine = Literal["webdriver", "script"]
+ReadinessMode = Literal["ready_state", "network_idle"]
+ConditionState = Literal["present", "visible", "clickable", "value", "text"]
+OutcomeState = Literal["present", "visible", "clickable", "absent"]
+
+_EC_FACTORIES: dict[str, Callable[[tuple[str, str]], Any]] = {
+    "present": ec.presence_of_element_located,
+    "visible": ec.visibility_of_element_located,
+    "clickable": ec.element_to_be_clickable,
+}
+
+
+@dataclass(frozen=True)
+class ElementCondition:
+    """Element condition understood by both wait engines.
+
+    Like the ``expected_conditions`` factories it is called with a locator
+    and returns a :class:`WebDriverWait` predicate; the ``script`` engine
+    evaluates ``state`` and ``expected`` in the page instead.
+    """
+
+    state: ConditionState
+    expected: str | None = None
+
+    def __call__(self, locator: tuple[str, str]) -> Callable[[WebDriver], Any]:
+        if self.state in _EC_FACTORIES:
+            return cast(Callable[[WebDriver], Any], _EC_FACTORIES[self.state](locator))
+
+        def matches(driver: WebDriver) -> WebElement | Literal[False]:
+            try:
+                element = driver.find_element(*locator)
+                if self.state == "value":
+                    ok = element.get_attribute("value") == self.expected
+                else:
+                    ok = (self.expected or "") in element.text
+            except StaleElementReferenceException:
+                return False
+            return element if ok else False
+
+        return matches
+
+
+def value_equals(expected: str) -> ElementCondition:
+    """Condition met once the ``value`` of the element equals ``expected``."""
+    return ElementCondition("value", expected)
+
+
+def text_contains(expected: str) -> ElementCondition:
+    """Condition met once the text of the element contains ``expected``."""
+    return ElementCondition("text", expected)
+
+
+def _script_condition(condition: Callable[..., Any]) -> ElementCondition | None:
+    """Return the in-page form of ``condition``, ``None`` if it has none."""
+    if isinstance(condition, ElementCondition):
+        return condition
+    for state, factory in _EC_FACTORIES.items():
+        if condition is factory:
+            return ElementCondition(cast(ConditionState, state))
+    return None
+
+
+@dataclass(frozen=True)
+class Outcome:
+    """One of the results awaited together by :meth:`Wrapper.wait_for_any`.
+
+    ``frame`` (id or name of an iframe) searches the document of that frame
+    when it exists, the current document otherwise; the element of such an
+    outcome is not returned.
+    """
+
+    name: str
+    locator_value: str
+    by: str = By.ID
+    state: OutcomeState = "present"
+    frame: str | None = None
+
+
+@dataclass(frozen=True)
+class RaceResult:
+    """Outcome that fired first and its element when one is available."""
+
+    outcome: Outcome
+    element: WebElement | None = None
+
+    @property
+    def name(self) -> str:
+        return self.outcome.name
+
+
+# Resolves ``true`` once no mutation happened during ``quiet`` ms, ``false``
+# when ``timeout`` ms elapse first and ``null`` without MutationObserver.
+DOM_QUIET_SCRIPT = """
+var quiet = arguments[0], timeout = arguments[1];
+var done = arguments[arguments.length - 1];
+if (typeof MutationObserver === 'undefined') { done(null); return; }
+var quietTimer = null, deadline = null;
+var observer = new MutationObserver(function () { arm(); });
+function finish(result) {
+    observer.disconnect();
+    clearTimeout(quietTimer);
+    clearTimeout(deadline);
+    done(result);
+}
+function arm() {
+    clearTimeout(quietTimer);
+    quietTimer = setTimeout(function () { finish(true); }, quiet);
+}
+observer.observe(document.documentElement || document, {
+    childList: true, subtree: true, attributes: true, characterData: true
+});
+deadline = setTimeout(function () { finish(false); }, timeout);
+arm();
+"""
+
+# Counts the XHR and fetch requests in flight in ``window.__saaNetwork``.
+# Installed at document creation through CDP when available, otherwise by
+# NETWORK_IDLE_SCRIPT itself (requests already running are then missed).
+NETWORK_TRACKER_SCRIPT = """
+(function () {
+    if (window.__saaNetwork) { return; }
+    var state = window.__saaNetwork = {inflight: 0, last: Date.now()};
+    function start() {
+        var finished = false;
+        state.inflight++;
+        state.last = Date.now();
+        return function () {
+            if (finished) { return; }
+            finished = true;
+            state.inflight = Math.max(0, state.inflight - 1);
+            state.last = Date.now();
+        };
+    }
+    var send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        var end = start();
+        this.addEventListener('loadend', end);
+        try { return send.apply(this, arguments); } catch (e) { end(); throw e; }
+    };
+    if (window.fetch) {
+        var fetch = window.fetch;
+        window.fetch = function () {
+            var end = start();
+            try {
+                return fetch.apply(this, arguments).then(
+                    function (r) { end(); return r; },
+                    function (e) { end(); throw e; });
+            } catch (e) { end(); throw e; }
+        };
+    }
+})();
+"""
+
+# Resolves ``true`` once the document reached ``arguments[2]`` (``complete``
+# or ``interactive``) and no request was in flight for ``arguments[0]`` ms,
+# ``false`` when ``arguments[1]`` ms elapse first. The counters of every
+# same-origin frame of the tab are summed: PeopleSoft issues its saves from
+# the ``TargetContent`` iframe while waits often run from default content.
+NETWORK_IDLE_SCRIPT = (
+    NETWORK_TRACKER_SCRIPT
+    + """
+var quiet = arguments[0], timeout = arguments[1], minState = arguments[2];
+var done = arguments[arguments.length - 1];
+var started = Date.now();
+function traffic() {
+    var top = window, total = {inflight: 0, last: 0};
+    try { if (window.top.document) { top = window.top; } } catch (e) {}
+    (function visit(win) {
+        try {
+            var state = win.__saaNetwork;
+            if (state) {
+                total.inflight += state.inflight;
+                total.last = Math.max(total.last, state.last);
+            }
+            for (var i = 0; i < win.frames.length; i++) { visit(win.frames[i]); }
+        } catch (e) {}
+    })(top);
+    return total;
+}
+function loaded() {
+    var rs = document.readyState;
+    return location.href !== 'about:blank'
+        && (rs === 'complete' || (minState === 'interactive' && rs === 'interactive'));
+}
+(function poll() {
+    var now = Date.now(), net = traffic();
+    if (loaded() && net.inflight === 0 && now - net.last >= quiet) {
+        done(true);
+    } else if (now - started >= timeout) {
+        done(false);
+    } else {
+        setTimeout(poll, Math.min(quiet, 25));
+    }
+})();
+"""
+)
+
+# Element lookup and condition checks shared by the in-page waits below.
+_ELEMENT_JS = """
+function root(frame) {
+    if (!frame) { return document; }
+    var el = document.getElementById(frame) || document.getElementsByName(frame)[0];
+    try { return (el && el.contentDocument) || document; } catch (e) { return document; }
+}
+function locate(doc, by, value) {
+    switch (by) {
+    case 'id': return doc.getElementById(value);
+    case 'name': return doc.getElementsByName(value)[0] || null;
+    case 'css selector': return doc.querySelector(value);
+    case 'class name': return doc.getElementsByClassName(value)[0] || null;
+    case 'tag name': return doc.getElementsByTagName(value)[0] || null;
+    case 'xpath': return doc.evaluate(value, doc, null,
+        XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    }
+    return null;
+}
+function visible(el) {
+    var style = el.ownerDocument.defaultView.getComputedStyle(el);
+    return style.display !== 'none' && style.visibility !== 'hidden'
+        && el.getClientRects().length > 0;
+}
+function holds(o, el) {
+    if (o.state === 'absent') { return !el; }
+    if (!el) { return false; }
+    if (o.state === 'visible') { return visible(el); }
+    if (o.state === 'clickable') { return visible(el) && !el.disabled; }
+    if (o.state === 'value') { return el.value === o.expected; }
+    if (o.state === 'text') {
+        var text = el.innerText === undefined ? el.textContent : el.innerText;
+        return (text || '').indexOf(o.expected) >= 0;
+    }
+    return true;
+}
+"""
+
+# Resolves ``[index, element]`` for the first outcome of ``arguments[0]`` that
+# holds (checked in order on every DOM mutation and every 50 ms) or ``null``
+# once ``timeout`` ms elapse.
+RACE_SCRIPT = (
+    _ELEMENT_JS
+    + """
+var outcomes = arguments[0], timeout = arguments[1];
+var done = arguments[arguments.length - 1];
+var finished = false, timer = null, deadline = null, observer = null;
+function finish(result) {
+    finished = true;
+    if (observer) { observer.disconnect(); }
+    clearTimeout(timer);
+    clearTimeout(deadline);
+    done(result);
+}
+function check() {
+    if (finished) { return true; }
+    for (var i = 0; i < outcomes.length; i++) {
+        var o = outcomes[i], el = locate(root(o.frame), o.by, o.value);
+        if (holds(o, el)) {
+            finish([i, o.frame || o.state === 'absent' ? null : el]);
+            return true;
+        }
+    }
+    return false;
+}
+if (check()) { return; }
+deadline = setTimeout(function () { finish(null); }, timeout);
+if (typeof MutationObserver !== 'undefined') {
+    observer = new MutationObserver(check);
+    observer.observe(document.documentElement || document,
+        {childList: true, subtree: true, attributes: true});
+}
+(function poll() { if (!check()) { timer = setTimeout(poll, 50); } })();
+"""
+)
+
+# Resolves ``["ok", element]`` once the element described by ``arguments[0]``
+# meets its condition, checked on every DOM mutation and animation frame (every
+# 50 ms in a hidden tab). Like the ``find_elements`` check of the ``webdriver``
+# engine, an element missing from the page resolves ``["absent", null]`` at
+# once; ``["unmet", null]`` is resolved after ``timeout`` ms.
+ELEMENT_WAIT_SCRIPT = (
+    _ELEMENT_JS
+    + """
+var spec = arguments[0], timeout = arguments[1];
+var done = arguments[arguments.length - 1];
+var finished = false, seen = false, frame = null, timer = null;
+var deadline = null, observer = null;
+function finish(result) {
+    finished = true;
+    if (observer) { observer.disconnect(); }
+    if (frame !== null) { cancelAnimationFrame(frame); }
+    clearTimeout(timer);
+    clearTimeout(deadline);
+    done(result);
+}
+function check() {
+    if (finished) { return true; }
+    var el = locate(document, spec.by, spec.value);
+    seen = seen || !!el;
+    if (holds(spec, el)) { finish(['ok', el]); return true; }
+    return false;
+}
+function tick() {
+    frame = null;
+    if (check()) { return; }
+    if (typeof requestAnimationFrame !== 'undefined'
+            && document.visibilityState !== 'hidden') {
+        frame = requestAnimationFrame(tick);
+    } else {
+        timer = setTimeout(tick, 50);
+    }
+}
+if (check()) { return; }
+if (!seen) { finish(['absent', null]); return; }
+deadline = setTimeout(function () { finish(['unmet', null]); }, timeout);
+if (typeof MutationObserver !== 'undefined') {
+    observer = new MutationObserver(check);
+    observer.observe(document.documentElement || document,
+        {childList: true, subtree: true, attributes: true, characterData: true});
+}
+tick();
+"""
+)
+
 
 def is_document_complete(driver: WebDriver) -> bool:
     """Return ``True`` when the DOM is fully loaded."""
@@ -27,6 +364,44 @@ def is_document_complete(driver: WebDriver) -> bool:
     return ready_state == "complete"
 
 
+def is_document_ready(driver: WebDriver) -> bool:
+    """Return ``True`` when the page is loaded as far as its load strategy waits.
+
+    Drivers using the ``eager`` page load strategy (lean profile) do not wait
+    for images and stylesheets, so an ``interactive`` document is accepted
+    there, except the ``about:blank`` placeholder of an iframe whose page has
+    not started loading.
+    """
+    capabilities = getattr(driver, "capabilities", None) or {}
+    if capabilities.get("pageLoadStrategy") != "eager":
+        return is_document_complete(driver)
+    execute_script = cast(Callable[[str], Any], driver.execute_script)
+    ready_state, href = cast(
+        list[str], execute_script("return [document.readyState, location.href];")
+    )
+    return ready_state != "loading" and href != "about:blank"
+
+
+def install_network_tracker(driver: WebDriver) -> bool:
+    """Inject :data:`NETWORK_TRACKER_SCRIPT` in every document ``driver`` opens.
+
+    Called when the browser starts, before its first navigation, so the
+    tracker survives every page of the driver, pool leases included.
+    Returns ``False`` when the driver does not expose the DevTools protocol;
+    the tracker is then injected on the first network idle wait of a page.
+    """
+    execute_cdp_cmd = getattr(driver, "execute_cdp_cmd", None)
+    if execute_cdp_cmd is None:
+        return False
+    try:
+        execute_cdp_cmd(
+            "Page.addScriptToEvaluateOnNewDocument", {"source": NETWORK_TRACKER_SCRIPT}
+        )
+    except WebDriverException:
+        return False
+    return True
+
+
 class Wrapper:
     """Utility object exposing common waiting helpers."""
 
@@ -35,43 +410,155 @@ class Wrapper:
         default_timeout: int = DEFAULT_TIMEOUT,
         long_timeout: int = LONG_TIMEOUT,
         logger: Logger | None = None,
+        *,
+        dom_stability: DomStabilityMode = "mutation",
+        quiet_window_ms: int = DOM_QUIET_WINDOW_MS,
+        wait_engine: WaitEngine = "webdriver",
+        readiness: ReadinessMode = "ready_state",
     ) -> None:
         self.default_timeout = default_timeout
         self.long_timeout = long_timeout
         self.logger = logger or get_default_logger()
+        self.dom_stability: DomStabilityMode = dom_stability
+        self.quiet_window_ms = quiet_window_ms
+        self.wait_engine: WaitEngine = wait_engine
+        self.readiness: ReadinessMode = readiness
 
     # ------------------------------------------------------------------
     # DOM helpers
     # ------------------------------------------------------------------
     def wait_for_dom_ready(self, driver: WebDriver, timeout: int | None = None) -> None:
-        """Wait until the DOM is fully loaded."""
+        """Wait until the DOM is loaded (see :func:`is_document_ready`).
+
+        In ``network_idle`` readiness the page must also have no XHR or
+        fetch request in flight for :attr:`quiet_window_ms`; the
+        ``readyState`` check remains the fallback when that wait is not
+        possible or times out, within what is left of ``timeout``.
+        """
         timeout = timeout or self.long_timeout
-        WebDriverWait(driver, timeout).until(is_document_complete)
+        remaining: float = timeout
+        if self.readiness == "network_idle":
+            start = time.monotonic()
+            if self.wait_until_network_idle(driver, timeout=timeout):
+                self.logger.debug("DOM chargé et réseau inactif.")
+                return
+            remaining = max(0.0, timeout - (time.monotonic() - start))
+        WebDriverWait(driver, remaining).until(is_document_ready)
         self.logger.debug("DOM chargé avec succès.")
 
+    def wait_until_network_idle(
+        self,
+        driver: WebDriver,
+        quiet_window_ms: int | None = None,
+        timeout: int | None = None,
+    ) -> bool | None:
+        """Return True once no request has been in flight for ``quiet_window_ms``.
+
+        Returns ``False`` on timeout and ``None`` when the page cannot run
+        :data:`NETWORK_IDLE_SCRIPT`.
+        """
+        quiet_window_ms = quiet_window_ms or self.quiet_window_ms
+        timeout = timeout or self.long_timeout
+        if not hasattr(driver, "execute_async_script"):
+            return None
+        capabilities = getattr(driver, "capabilities", None) or {}
+        min_state = (
+            "interactive"
+            if capabilities.get("pageLoadStrategy") == "eager"
+            else "complete"
+        )
+        execute_async_script = cast(Callable[..., Any], driver.execute_async_script)
+        try:
+            with WAIT_STATS.observing():
+                result = execute_async_script(
+                    NETWORK_IDLE_SCRIPT, quiet_window_ms, timeout * 1000, min_state
+                )
+        except TimeoutException:
+            result = False
+        except WebDriverException as exc:
+            self.logger.debug(f"Suivi des requêtes indisponible : {exc}")
+            return None
+        if result is False:
+            self.logger.warning(f"Requêtes réseau toujours en cours après {timeout}s.")
+        return bool(result)
+
     def wait_until_dom_is_stable(
         self, driver: WebDriver, timeout: int | None = None
     ) -> bool:
-        """Return ``True`` if the DOM remains unchanged for ``timeout`` seconds."""
-        previous_dom_snapshot = ""
-        unchanged_count = 0
-        required_stability_count = 3
+        """Return ``True`` once the DOM stops changing within ``timeout`` seconds.
 
+        The ``mutation`` mode relies on a ``MutationObserver`` and falls back
+        to page source snapshots when the browser cannot run it.
+        """
         timeout = timeout or self.default_timeout
-        for _ in range(timeout):
-            current_dom_snapshot = driver.page_source
+        if self.dom_stability == "mutation":
+            quiet = self.wait_until_dom_is_quiet(driver, timeout=timeout)
+            if quiet is not None:
+                return quiet
+        return self._wait_for_identical_snapshots(driver, timeout)
+
+    def wait_until_dom_is_quiet(
+        self,
+        driver: WebDriver,
+        quiet_window_ms: int | None = None,
+        timeout: int | None = None,
+    ) -> bool | None:
+        """Wait until no DOM mutation occurs for ``quiet_window_ms``.
+
+        Returns ``None`` when the observer cannot be used with ``driver``.
+        """
+        if not hasattr(driver, "execute_async_script"):
+            return None
+        quiet_window_ms = quiet_window_ms or self.quiet_window_ms
+        timeout = timeout or self.default_timeout
+        execute_async_script = cast(Callable[..., Any], driver.execute_async_script)
+        try:
+            with WAIT_STATS.observing():
+                result = execute_async_script(
+                    DOM_QUIET_SCRIPT, quiet_window_ms, timeout * 1000
+                )
+        except TimeoutException:
+            result = False
+        except WebDriverException as exc:
+            self.logger.debug(f"MutationObserver indisponible : {exc}")
+            return None
+        if not isinstance(result, bool):
+            return None
+        if result:
+            self.logger.debug(messages.DOM_STABLE)
+        else:
+            self.logger.warning(messages.DOM_NOT_STABLE)
+        return result
+
+    def _wait_for_identical_snapshots(self, driver: WebDriver, timeout: int) -> bool:
+        """Poll ``page_source`` until it stays unchanged for the quiet window.
 
-            if current_dom_snapshot == previous_dom_snapshot:
-                unchanged_count += 1
-            else:
-                unchanged_count = 0
+        The polling delay starts at :data:`INITIAL_POLL_DELAY` and doubles up
+        to :data:`MAX_POLL_DELAY`, so a page that is already stable is
+        detected after roughly ``quiet_window_ms``.
+        """
+        quiet_window = self.quiet_window_ms / 1000
+        WAIT_STATS.waits += 1
+        deadline = time.monotonic() + timeout
+        delay = INITIAL_POLL_DELAY
+        previous_dom_snapshot = driver.page_source
+        unchanged_since = time.monotonic()
 
-            if unchanged_count >= required_stability_count:
+        while True:
+            now = time.monotonic()
+            if now - unchanged_since >= quiet_window:
                 self.logger.debug(messages.DOM_STABLE)
                 return True
-
-            previous_dom_snapshot = current_dom_snapshot
-            time.sleep(1)
+            if now >= deadline:
+                break
+            pause = min(delay, deadline - now)
+            time.sleep(pause)
+            WAIT_STATS.record(pause)
+            delay = min(delay * 2, MAX_POLL_DELAY)
+            current_dom_snapshot = driver.page_source
+            if current_dom_snapshot != previous_dom_snapshot:
+                previous_dom_snapshot = current_dom_snapshot
+                unchanged_since = time.monotonic()
 
         self.logger.warning(messages.DOM_NOT_STABLE)
         return False
@@ -87,27 +574,208 @@ class Wrapper:
         condition: Callable[[tuple[str, str]], Any] = ec.presence_of_element_located,
         timeout: int | None = None,
     ) -> WebElement | None:
-        """Wait for an element to satisfy ``condition`` or return ``None``."""
+        """Wait for an element to satisfy ``condition`` or return ``None``.
+
+        With the ``script`` engine, conditions known to :class:`ElementCondition`
+        are evaluated by a single in-page script; other conditions, and
+        drivers that cannot run asynchronous scripts, use
+        :class:`WebDriverWait`. Both engines return ``None`` at once when the
+        element is missing and raise :class:`TimeoutException` when it stays
+        present without meeting ``condition``.
+        """
         if locator_value is None:
             self.logger.error(messages.LOCATOR_VALUE_REQUIRED)
             return None
 
         timeout = timeout or self.default_timeout
+        if self.wait_engine == "script":
+            spec = _script_condition(condition)
+            if spec is not None:
+                in_page = self._wait_in_page(driver, by, locator_value, spec, timeout)
+                if in_page is not False:
+                    return in_page
+
         found_elements = driver.find_elements(by, locator_value)
         if found_elements:
             matched_element: WebElement = cast(
                 WebElement,
                 WebDriverWait(driver, timeout).until(condition((by, locator_value))),
             )
-            self.logger.debug(
-                f"Élément avec {by}='{locator_value}' trouvé et condition '{condition.__name__}' validée."
-            )
+            self._log_matched(by, locator_value, condition)
             return matched_element
 
+        self._log_not_found(by, locator_value, timeout)
+        return None
+
+    def _wait_in_page(
+        self,
+        driver: WebDriver,
+        by: str,
+        locator_value: str,
+        spec: ElementCondition,
+        timeout: int,
+    ) -> WebElement | None | Literal[False]:
+        """Run :data:`ELEMENT_WAIT_SCRIPT`; ``False`` when the page cannot run it."""
+        if not hasattr(driver, "execute_async_script"):
+            return False
+        execute_async_script = cast(Callable[..., Any], driver.execute_async_script)
+        payload = {
+            "by": by,
+            "value": locator_value,
+            "state": spec.state,
+            "expected": spec.expected,
+        }
+        try:
+            with WAIT_STATS.observing():
+                raw = execute_async_script(ELEMENT_WAIT_SCRIPT, payload, timeout * 1000)
+        except TimeoutException:
+            # The driver gave up first: tell a vanished element from an unmet one.
+            found = driver.find_elements(by, locator_value)
+            raw = ["unmet" if found else "absent", None]
+        except WebDriverException as exc:
+            self.logger.debug(f"Attente dans la page indisponible : {exc}")
+            return False
+        status, element = raw
+        if status == "ok":
+            self._log_matched(by, locator_value, spec)
+            return cast(WebElement, element)
+        if status == "absent":
+            self._log_not_found(by, locator_value, timeout)
+            return None
+        raise TimeoutException(
+            f"Condition '{spec.state}' non remplie pour {by}='{locator_value}'."
+        )
+
+    def _log_matched(
+        self, by: str, locator_value: str, condition: Callable[..., Any]
+    ) -> None:
+        self.logger.debug(
+            "Élément avec %s='%s' trouvé et condition '%s' validée.",
+            by,
+            locator_value,
+            getattr(condition, "__name__", repr(condition)),
+        )
+
+    def _log_not_found(self, by: str, locator_value: str, timeout: int) -> None:
         self.logger.warning(
             f"Élément avec {by}='{locator_value}' non trouvé dans le délai imparti ({timeout}s)."
         )
-        return None
+
+    def wait_for_any(
+        self,
+        driver: WebDriver,
+        outcomes: Sequence[Outcome],
+        timeout: float | None = None,
+    ) -> RaceResult | None:
+        """Wait for the first of ``outcomes`` to hold, within one ``timeout``.
+
+        All outcomes are evaluated together by a single in-page script; when
+        several hold at once the earliest in ``outcomes`` wins. Returns
+        ``None`` if none holds before ``timeout`` seconds. When the script
+        fails midway, the polling fallback only gets what is left of
+        ``timeout``.
+        """
+        timeout = timeout or self.default_timeout
+        start = time.monotonic()
+        result = self._race_in_page(driver, outcomes, timeout)
+        if result is False:
+            remaining = max(0.0, timeout - (time.monotonic() - start))
+            result = self._race_by_polling(driver, outcomes, remaining)
+        elapsed_ms = (time.monotonic() - start) * 1000
+        if result is None:
+            self.logger.debug(
+                "Aucun des résultats %s après %.0f ms.",
+                [o.name for o in outcomes],
+                elapsed_ms,
+            )
+        else:
+            self.logger.debug(
+                "Résultat '%s' obtenu après %.0f ms.", result.name, elapsed_ms
+            )
+        return result
+
+    def _race_in_page(
+        self, driver: WebDriver, outcomes: Sequence[Outcome], timeout: float
+    ) -> RaceResult | None | Literal[False]:
+        """Run :data:`RACE_SCRIPT`; ``False`` when the page cannot run it."""
+        if not hasattr(driver, "execute_async_script"):
+            return False
+        execute_async_script = cast(Callable[..., Any], driver.execute_async_script)
+        specs = [
+            {"by": o.by, "value": o.locator_value, "state": o.state, "frame": o.frame}
+            for o in outcomes
+        ]
+        try:
+            with WAIT_STATS.observing():
+                raw = execute_async_script(RACE_SCRIPT, specs, int(timeout * 1000))
+        except TimeoutException:
+            return None
+        except WebDriverException as exc:
+            self.logger.debug(f"Attente groupée dans la page indisponible : {exc}")
+            return False
+        if not raw:
+            return None
+        index, element = raw
+        return RaceResult(outcomes[int(index)], element)
+
+    def _race_by_polling(
+        self, driver: WebDriver, outcomes: Sequence[Outcome], timeout: float
+    ) -> RaceResult | None:
+        """Evaluate ``outcomes`` from Python with an exponential backoff.
+
+        As in :data:`RACE_SCRIPT`, an outcome with a ``frame`` is looked up
+        inside that iframe, or in the current document when the iframe is
+        missing; the driver returns to the current document afterwards.
+        """
+        WAIT_STATS.waits += 1
+        deadline = time.monotonic() + timeout
+        delay = INITIAL_POLL_DELAY
+        while True:
+            for outcome in outcomes:
+                found, element = self._outcome_holds_in_frame(driver, outcome)
+                if found:
+                    return RaceResult(outcome, element)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            pause = min(delay, remaining)
+            time.sleep(pause)
+            WAIT_STATS.record(pause)
+            delay = min(delay * 2, MAX_POLL_DELAY)
+
+    def _outcome_holds_in_frame(
+        self, driver: WebDriver, outcome: Outcome
+    ) -> tuple[bool, WebElement | None]:
+        if not outcome.frame:
+            return self._outcome_holds(driver, outcome)
+        try:
+            driver.switch_to.frame(outcome.frame)
+        except WebDriverException:
+            return self._outcome_holds(driver, outcome)
+        try:
+            return self._outcome_holds(driver, outcome)
+        finally:
+            with suppress(WebDriverException):
+                driver.switch_to.parent_frame()
+
+    @staticmethod
+    def _outcome_holds(
+        driver: WebDriver, outcome: Outcome
+    ) -> tuple[bool, WebElement | None]:
+        try:
+            elements = driver.find_elements(outcome.by, outcome.locator_value)
+            if outcome.state == "absent":
+                return not elements, None
+            if not elements:
+                return False, None
+            element = elements[0]
+            if outcome.state == "visible":
+                return bool(element.is_displayed()), element
+            if outcome.state == "clickable":
+                return bool(element.is_displayed() and element.is_enabled()), element
+        except WebDriverException:
+            return False, None
+        return True, element
 
     def find_clickable(
         self,
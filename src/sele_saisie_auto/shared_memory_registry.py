@@ -0,0 +1,166 @@
+# src\sele_saisie_auto\shared_memory_registry.py
+"""Registry of the shared memory segments created by this package.
+
+Each segment created through :class:`SharedMemoryService` is recorded with
+the PID of its owner and its creation time in a small JSON file guarded by
+an exclusive file lock. Segment names carry random or PID suffixes
+(:meth:`MemoryConfig.with_uuid`), so after a crash only this registry knows
+which segments to reclaim; see
+:func:`sele_saisie_auto.shared_memory_service.collect_leaked_segments`.
+
+The file lives in ``/dev/shm`` when available, so it disappears with the
+segments at reboot, and in the temporary directory otherwise.
+``SAA_SHM_REGISTRY`` overrides its path.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+REGISTRY_ENV = "SAA_SHM_REGISTRY"
+REGISTRY_NAME = "sele_saisie_auto.shm-registry.json"
+
+_SHM_DIR = "/dev/shm"  # nosec B108
+_THREAD_LOCK = threading.Lock()
+
+
+def registry_path() -> str:
+    """Return the path of the registry file."""
+
+    override = os.environ.get(REGISTRY_ENV)
+    if override:
+        return override
+    directory = _SHM_DIR if os.path.isdir(_SHM_DIR) else tempfile.gettempdir()
+    return os.path.join(directory, REGISTRY_NAME)
+
+
+@contextmanager
+def _file_lock(path: str) -> Iterator[None]:
+    with _THREAD_LOCK, open(f"{path}.lock", "a+b") as handle:
+        if sys.platform == "win32":  # pragma: no cover - Windows only
+            import msvcrt
+
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+def _load(path: str) -> dict[str, dict[str, Any]]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _save(path: str, entries: dict[str, dict[str, Any]]) -> None:
+    if not entries:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        return
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(entries, f, indent=2)
+    os.replace(tmp, path)
+
+
+@contextmanager
+def edit_registry() -> Iterator[dict[str, dict[str, Any]]]:
+    """Yield the registry entries by segment name and save them on exit.
+
+    The registry stays locked for the whole block, across threads and
+    processes.
+    """
+
+    path = registry_path()
+    with _file_lock(path):
+        entries = _load(path)
+        before = dict(entries)
+        yield entries
+        if entries != before:
+            _save(path, entries)
+
+
+def register_segments(names: Iterable[str], pid: int | None = None) -> None:
+    """Record ``names`` as owned by ``pid`` (the current process by default)."""
+
+    record = {"pid": pid or os.getpid(), "created": time.time()}
+    with edit_registry() as entries:
+        for name in names:
+            entries[name] = dict(record)
+
+
+def unregister_segments(names: Iterable[str]) -> None:
+    """Forget ``names``; unknown names are ignored."""
+
+    with edit_registry() as entries:
+        for name in names:
+            entries.pop(name, None)
+
+
+def live_segments() -> dict[str, dict[str, Any]]:
+    """Return a snapshot of the registry entries."""
+
+    with edit_registry() as entries:
+        return {name: dict(record) for name, record in entries.items()}
+
+
+def pid_alive(pid: int) -> bool:
+    """Return whether a process with ``pid`` is running."""
+
+    if pid <= 0:
+        return False
+    if sys.platform == "win32":  # pragma: no cover - Windows only
+        import ctypes
+
+        kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
+        handle = kernel32.OpenProcess(0x1000, False, pid)
+        if not handle:
+            return False
+        code = ctypes.c_ulong()
+        try:
+            kernel32.GetExitCodeProcess(handle, ctypes.byref(code))
+        finally:
+            kernel32.CloseHandle(handle)
+        return code.value == 259  # STILL_ACTIVE
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+__all__ = [
+    "REGISTRY_ENV",
+    "edit_registry",
+    "live_segments",
+    "pid_alive",
+    "register_segments",
+    "registry_path",
+    "unregister_segments",
+]
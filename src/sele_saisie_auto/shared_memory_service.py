@@ -1,9 +1,86 @@
-"""Utilities to manage data in shared memory."""
+"""Utilities to manage data in shared memory.
+
+Every segment written by :class:`SharedMemoryService` starts with a fixed
+header followed by the payload::
+
+    magic (4) | version (1) | reserved (3) | payload length (4) | CRC-32 (4)
+
+so readers know the exact payload length (segments may be larger than
+requested, and ciphertext may end with ``\x00``) and can check it through
+``memoryview`` slices of the mapping without copying the whole segment.
+"""
 
 import os
+import struct
+import zlib
+from contextlib import suppress
 from multiprocessing import shared_memory
 
+from sele_saisie_auto.exceptions import SegmentFormatError
 from sele_saisie_auto.logging_service import Logger
+from sele_saisie_auto.memory_config import MemoryConfig
+from sele_saisie_auto.shared_memory_registry import (
+    edit_registry,
+    pid_alive,
+    register_segments,
+    unregister_segments,
+)
+
+SEGMENT_MAGIC = b"SAAS"
+SEGMENT_VERSION = 1
+SEGMENT_HEADER = struct.Struct("<4sB3xII")
+
+
+def framed_size(length: int) -> int:
+    """Return the segment size needed to store ``length`` payload bytes."""
+
+    return SEGMENT_HEADER.size + length
+
+
+def write_framed(buf: memoryview, payload: bytes) -> None:
+    """Write the header and ``payload`` at the start of ``buf``."""
+
+    SEGMENT_HEADER.pack_into(
+        buf, 0, SEGMENT_MAGIC, SEGMENT_VERSION, len(payload), zlib.crc32(payload)
+    )
+    start = SEGMENT_HEADER.size
+    buf[start : start + len(payload)] = payload
+
+
+def payload_view(buf: memoryview) -> memoryview:
+    """Return the payload of a framed segment as a slice of ``buf``.
+
+    Nothing is copied; release the returned view (``with`` block) before
+    closing the segment. Raises :class:`SegmentFormatError` when the header
+    or the checksum does not match.
+    """
+
+    if len(buf) < SEGMENT_HEADER.size:
+        raise SegmentFormatError("segment trop court pour contenir un en-tête")
+    magic, version, length, checksum = SEGMENT_HEADER.unpack_from(buf)
+    if magic != SEGMENT_MAGIC or version != SEGMENT_VERSION:
+        raise SegmentFormatError("en-tête de segment inconnu")
+    start = SEGMENT_HEADER.size
+    if start + length > len(buf):
+        raise SegmentFormatError("longueur de segment incohérente")
+    view = memoryview(buf)[start : start + length]
+    if zlib.crc32(view) != checksum:
+        view.release()
+        raise SegmentFormatError("somme de contrôle du segment invalide")
+    return view
+
+
+def read_framed(buf: memoryview, limit: int | None = None) -> bytes:
+    """Return a copy of the payload of ``buf`` (at most ``limit`` bytes)."""
+
+    with payload_view(buf) as view:
+        return bytes(view if limit is None else view[:limit])
+
+
+def wipe_segment(buf: memoryview) -> None:
+    """Overwrite ``buf`` with zeros in a single slice assignment."""
+
+    buf[:] = bytes(len(buf))
 
 
 def ensure_clean_segment(name: str, size: int) -> shared_memory.SharedMemory:
@@ -44,10 +121,76 @@ def ensure_clean_segment(name: str, size: int) -> shared_memory.SharedMemory:
             finally:
                 existing.close()
             return shared_memory.SharedMemory(name=name, create=True, size=size)
-        existing.buf[: existing.size] = b"\x00" * existing.size
+        wipe_segment(existing.buf)
         return existing
 
 
+def _remove_shared_memory(name: str) -> None:
+    try:
+        mem = shared_memory.SharedMemory(name=name)
+    except FileNotFoundError:
+        return
+    try:
+        mem.close()
+    finally:
+        try:
+            mem.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def cleanup_memory_segments(memory_config: MemoryConfig | None = None) -> None:
+    """Remove leftover shared memory segments.
+
+    Parameters
+    ----------
+    memory_config:
+        Names of the segments to remove. Defaults to :class:`MemoryConfig`.
+    """
+
+    cfg = memory_config or MemoryConfig()
+    names = (
+        cfg.arena_name,
+        cfg.cle_name,
+        cfg.data_name,
+        cfg.login_name,
+        cfg.password_name,
+    )
+    for name in names:
+        _remove_shared_memory(name)
+    try:
+        unregister_segments(names)
+    except OSError:
+        pass
+
+
+def collect_leaked_segments(logger: Logger | None = None) -> list[str]:
+    """Remove the registered segments whose owner process is gone.
+
+    Returns the names of the reclaimed segments. Segments of running
+    processes are left untouched; an unreadable registry reclaims nothing.
+    """
+
+    reclaimed: list[str] = []
+    try:
+        with edit_registry() as entries:
+            for name, record in list(entries.items()):
+                if pid_alive(int(record.get("pid", 0))):
+                    continue
+                _remove_shared_memory(name)
+                del entries[name]
+                reclaimed.append(name)
+    except OSError as e:
+        if logger is not None:
+            logger.warning(f"⚠️ Registre de mémoire partagée inaccessible : {e}")
+    if reclaimed and logger is not None:
+        logger.info(
+            f"🧹 {len(reclaimed)} segment(s) de mémoire partagée orphelin(s) "
+            f"supprimé(s) : {', '.join(reclaimed)}"
+        )
+    return reclaimed
+
+
 class SharedMemoryService:
     """Service to store and retrieve bytes in shared memory."""
 
@@ -74,12 +217,19 @@ class SharedMemoryService:
                 pass
 
     def stocker_en_memoire_partagee(
-        self, nom: str, donnees: bytes
+        self, nom: str, donnees: bytes, taille_min: int = 0
     ) -> shared_memory.SharedMemory:
-        """Create a shared memory segment and write ``donnees`` into it."""
+        """Create a shared memory segment and write ``donnees`` into it.
+
+        ``taille_min`` reserves room so the segment can later be rewritten in
+        place by :meth:`reecrire_memoire_partagee`.
+        """
         try:
-            memoire = ensure_clean_segment(nom, len(donnees))
-            memoire.buf[: len(donnees)] = donnees
+            memoire = ensure_clean_segment(
+                nom, max(framed_size(len(donnees)), taille_min)
+            )
+            write_framed(memoire.buf, donnees)
+            self._enregistrer(nom)
             self.logger.critical(
                 f"💀 Données stockées en mémoire partagée avec le nom '{nom}'."
             )
@@ -88,15 +238,38 @@ class SharedMemoryService:
             self.logger.error(f"❌ Erreur lors du stockage en mémoire partagée : {e}")
             raise
 
+    def _enregistrer(self, nom: str) -> None:
+        try:
+            register_segments([nom])
+        except OSError as e:
+            self.logger.warning(
+                f"⚠️ Segment '{nom}' non inscrit au registre de mémoire partagée : {e}"
+            )
+
+    def reecrire_memoire_partagee(
+        self, memoire: shared_memory.SharedMemory, donnees: bytes
+    ) -> bool:
+        """Replace the payload of ``memoire`` in place.
+
+        Returns ``False`` without writing when ``donnees`` does not fit.
+        """
+        fin = framed_size(len(donnees))
+        if fin > memoire.size:
+            return False
+        wipe_segment(memoire.buf[fin:])
+        write_framed(memoire.buf, donnees)
+        return True
+
     def supprimer_memoire_partagee_securisee(
         self, memoire: shared_memory.SharedMemory
     ) -> None:
         """Erase and remove a shared memory segment."""
         try:
-            for i in range(len(memoire.buf)):
-                memoire.buf[i] = 0
+            wipe_segment(memoire.buf)
             memoire.close()
             memoire.unlink()
+            with suppress(OSError):
+                unregister_segments([memoire.name])
             self.logger.critical("💀 Mémoire partagée supprimée de manière sécurisée.")
         except Exception as e:
             self.logger.error(
@@ -107,7 +280,7 @@ class SharedMemoryService:
     def recuperer_de_memoire_partagee(
         self, nom: str, taille: int
     ) -> tuple[shared_memory.SharedMemory, bytes]:
-        """Read bytes from an existing shared memory segment."""
+        """Read at most ``taille`` payload bytes from an existing segment."""
         if os.name == "posix":
             path = f"/dev/shm/{nom}"  # nosec B108
             if not os.path.exists(path):
@@ -115,7 +288,11 @@ class SharedMemoryService:
                 raise FileNotFoundError(nom)
         try:
             memoire = shared_memory.SharedMemory(name=nom)
-            donnees = bytes(memoire.buf[:taille])
+            try:
+                donnees = read_framed(memoire.buf, taille)
+            except SegmentFormatError:
+                memoire.close()
+                raise
             self.logger.critical(
                 f"💀 Données récupérées depuis la mémoire partagée avec le nom '{nom}'."
             )
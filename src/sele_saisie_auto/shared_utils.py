@@ -14,25 +14,27 @@ _log_file: str | None = None
 DEFAULT_LOG_DIR: str = "logs"
 HTML_FORMAT: Literal["html"] = "html"
 TXT_FORMAT: Literal["txt"] = "txt"
+JSONL_FORMAT: Literal["jsonl"] = "jsonl"
 
 
 def setup_logs(
     log_dir: str = DEFAULT_LOG_DIR,
-    log_format: Literal["html", "txt"] = HTML_FORMAT,
+    log_format: Literal["html", "txt", "jsonl"] = HTML_FORMAT,
 ) -> str:
     """
     Prépare un fichier de log journalier.
 
     Args:
         log_dir (str): Nom du répertoire où seront stockés les logs.
-        log_format (str): Format du fichier de log ("html" ou "txt").
+        log_format (str): Format du fichier de log ("html", "txt" ou "jsonl").
 
     Returns:
         str: Chemin complet du fichier de log.
     """
     try:
         os.makedirs(log_dir, exist_ok=True)
-        extension = HTML_FORMAT if log_format.lower() == HTML_FORMAT else TXT_FORMAT
+        fmt = log_format.lower()
+        extension = fmt if fmt in (HTML_FORMAT, JSONL_FORMAT) else TXT_FORMAT
         log_file = os.path.join(
             log_dir, f"log_{datetime.now().strftime('%Y-%m-%d')}.{extension}"
         )
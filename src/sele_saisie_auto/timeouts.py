@@ -5,3 +5,15 @@ DEFAULT_TIMEOUT = 10
 
 LONG_TIMEOUT = 20
 """Longer wait time for slower pages."""
+
+SETTLE_TIMEOUT = 1
+"""Upper bound for a field or a page to settle after an input."""
+
+DOM_QUIET_WINDOW_MS = 250
+"""Delay without DOM mutation after which the page is considered stable."""
+
+INITIAL_POLL_DELAY = 0.005
+"""First delay, in seconds, between two evaluations of a polled condition."""
+
+MAX_POLL_DELAY = 0.5
+"""Upper bound of the exponential backoff used when polling a condition."""
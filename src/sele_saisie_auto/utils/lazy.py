@@ -0,0 +1,64 @@
+"""Module attributes imported on first access.
+
+A module lists the names it exposes lazily as ``{name: "module"}`` (the
+module object itself) or ``{name: "module:attribute"}`` and installs the
+hooks returned by :func:`lazy_attributes`::
+
+    _LAZY = {"webdriver": "selenium.webdriver"}
+    __getattr__, __dir__ = lazy_attributes(globals(), _LAZY)
+
+The first ``module.name`` (or ``from module import name``) imports the
+target and stores it in the module globals, so later lookups cost nothing
+and ``monkeypatch.setattr`` keeps working.
+"""
+
+from __future__ import annotations
+
+import importlib
+from collections.abc import Callable, Mapping
+from typing import Any
+
+
+def _import_target(target: str) -> Any:
+    module_name, _, attribute = target.partition(":")
+    module = importlib.import_module(module_name)
+    return getattr(module, attribute) if attribute else module
+
+
+def lazy_attributes(
+    namespace: dict[str, Any], targets: Mapping[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Return the ``__getattr__`` and ``__dir__`` hooks of a lazy module."""
+
+    module_name = namespace["__name__"]
+
+    def module_getattr(name: str) -> Any:
+        try:
+            target = targets[name]
+        except KeyError:
+            raise AttributeError(
+                f"module {module_name!r} has no attribute {name!r}"
+            ) from None
+        value = _import_target(target)
+        namespace[name] = value
+        return value
+
+    def module_dir() -> list[str]:
+        return sorted(set(namespace) | set(targets))
+
+    return module_getattr, module_dir
+
+
+def resolve_lazy(namespace: dict[str, Any], targets: Mapping[str, str]) -> None:
+    """Import every target of ``targets`` not yet present in ``namespace``.
+
+    Functions of a lazy module call this before using the names as plain
+    globals; values already set (e.g. patched in tests) are kept.
+    """
+
+    for name, target in targets.items():
+        if name not in namespace:
+            namespace[name] = _import_target(target)
+
+
+__all__ = ["lazy_attributes", "resolve_lazy"]
@@ -5,9 +5,54 @@ from __future__ import annotations
 import os
 import subprocess  # nosec B404
 import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
 
 from sele_saisie_auto import shared_utils
 from sele_saisie_auto.logger_utils import write_log
+from sele_saisie_auto.timeouts import INITIAL_POLL_DELAY, MAX_POLL_DELAY
+
+
+@dataclass
+class WaitStats:
+    """Total time spent waiting during a run.
+
+    ``slept`` adds up the sleeps of the polling loops, ``observed`` the time
+    blocked in in-page observer scripts.
+    """
+
+    slept: float = 0.0
+    observed: float = 0.0
+    waits: int = 0
+
+    def record(self, seconds: float) -> None:
+        """Add ``seconds`` to the cumulated sleep time."""
+        self.slept += seconds
+
+    @contextmanager
+    def observing(self) -> Iterator[None]:
+        """Count the block as one wait and add its duration to ``observed``."""
+        self.waits += 1
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.observed += time.monotonic() - start
+
+    def reset(self) -> None:
+        """Reset the counters, typically at the start of a run."""
+        self.slept = 0.0
+        self.observed = 0.0
+        self.waits = 0
+
+
+WAIT_STATS = WaitStats()
+
+
+def _sleep(seconds: float) -> None:
+    time.sleep(seconds)
+    WAIT_STATS.record(seconds)
 
 
 def program_break_time(
@@ -21,7 +66,41 @@ def program_break_time(
         log_file,
         "DEBUG",
     )
-    time.sleep(memorization_time)
+    WAIT_STATS.waits += 1
+    _sleep(memorization_time)
+
+
+def wait_until(
+    predicate: Callable[[], bool],
+    *,
+    timeout: float,
+    description: str,
+    log_file: str | None = None,
+) -> bool:
+    """Poll ``predicate`` with exponential backoff until it holds.
+
+    The first retry happens after :data:`INITIAL_POLL_DELAY`, the delay then
+    doubles up to :data:`MAX_POLL_DELAY`. Returns ``False`` once ``timeout``
+    seconds have elapsed without the condition being met.
+    """
+
+    log_file = log_file or shared_utils.get_log_file()
+    WAIT_STATS.waits += 1
+    deadline = time.monotonic() + timeout
+    delay = INITIAL_POLL_DELAY
+    while not predicate():
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            write_log(
+                f"{description} : condition non remplie après {timeout} secondes",
+                log_file,
+                "DEBUG",
+            )
+            return False
+        _sleep(min(delay, remaining))
+        delay = min(delay * 2, MAX_POLL_DELAY)
+    write_log(f"{description} : condition remplie", log_file, "DEBUG")
+    return True
 
 
 def clear_screen() -> None:
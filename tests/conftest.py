@@ -30,6 +30,12 @@ class DummyLogger:
         self.records["error"].append(msg)
 
 
+@pytest.fixture(autouse=True)
+def _isolated_shm_registry(tmp_path, monkeypatch):
+    """Keep the shared memory registry of each test in its own file."""
+    monkeypatch.setenv("SAA_SHM_REGISTRY", str(tmp_path / "shm-registry.json"))
+
+
 @pytest.fixture
 def dummy_logger():
     """Return a fresh DummyLogger instance."""
@@ -107,25 +113,20 @@ def assert_call_prefix(mock: Mock, *expected: call) -> None:
 
 def store_setup(mem_cfg: MemoryConfig, service_factory):
     expected_key = b"k" * mem_cfg.key_size
-    mem_key = object()
-    mem_login = object()
-    mem_pwd = object()
+    mem_arena = object()
+    mem_grown = object()
     login_blob = b"login-data"
     pwd_blob = b"pwd-data"
     mock_service = Mock(spec=SharedMemoryService)
-    mock_service.stocker_en_memoire_partagee.side_effect = [
-        mem_key,
-        mem_login,
-        mem_pwd,
-    ]
+    mock_service.stocker_en_memoire_partagee.side_effect = [mem_arena, mem_grown]
+    mock_service.reecrire_memoire_partagee.return_value = True
     service = service_factory(mock_service, mem_cfg, expected_key)
     return (
         service,
         mock_service,
         expected_key,
-        mem_key,
-        mem_login,
-        mem_pwd,
+        mem_arena,
+        mem_grown,
         login_blob,
         pwd_blob,
     )
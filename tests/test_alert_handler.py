@@ -7,6 +7,7 @@ from sele_saisie_auto.alerts.alert_handler import AlertHandler
 from sele_saisie_auto.enums import AlertType
 from sele_saisie_auto.exceptions import AutomationExitError
 from sele_saisie_auto.locators import Locators
+from sele_saisie_auto.selenium_utils.wrapper import Outcome, RaceResult
 
 
 class DummyAutomation:
@@ -26,8 +27,13 @@ class DummyAutomation:
 def test_handle_alerts_clicks_confirm_ok_and_logs(monkeypatch):
     dummy = DummyAutomation()
     handler = AlertHandler(dummy)
-    seq = iter([True, False, False])
-    monkeypatch.setattr(handler.waiter, "wait_for_element", lambda *a, **k: next(seq))
+    raced = []
+
+    def fake_wait_for_any(driver, outcomes, timeout=None):
+        raced.append([o.locator_value for o in outcomes])
+        return RaceResult(outcomes[1])
+
+    monkeypatch.setattr(handler.waiter, "wait_for_any", fake_wait_for_any)
 
     clicks = []
 
@@ -47,14 +53,33 @@ def test_handle_alerts_clicks_confirm_ok_and_logs(monkeypatch):
 
     handler.handle_alerts("drv")
 
-    assert (By.ID, Locators.CONFIRM_OK.value) in clicks
+    assert raced == [AlertHandler.alert_configs["save_alerts"]]
+    assert clicks == [(By.ID, Locators.CONFIRM_OK.value)]
     assert logs
 
 
+def test_handle_save_alerts_without_alert(monkeypatch):
+    handler = AlertHandler(DummyAutomation())
+    monkeypatch.setattr(handler.waiter, "wait_for_any", lambda *a, **k: None)
+    clicks = []
+    monkeypatch.setattr(
+        "sele_saisie_auto.alerts.alert_handler.click_element_without_wait",
+        lambda *a, **k: clicks.append(a),
+    )
+
+    handler.handle_alerts("drv")
+
+    assert clicks == []
+
+
 def test_handle_alerts_date(monkeypatch):
     dummy = DummyAutomation()
     handler = AlertHandler(dummy)
-    monkeypatch.setattr(handler.waiter, "wait_for_element", lambda *a, **k: True)
+    monkeypatch.setattr(
+        handler.waiter,
+        "wait_for_any",
+        lambda driver, outcomes, timeout=None: RaceResult(outcomes[0]),
+    )
     monkeypatch.setattr(
         "sele_saisie_auto.alerts.alert_handler.click_element_without_wait",
         lambda *a, **k: None,
@@ -67,6 +92,30 @@ def test_handle_alerts_date(monkeypatch):
         handler.handle_alerts("drv", alert_type=AlertType.DATE_ALERT)
 
 
+def test_handle_date_alert_returns_when_grid_appears(monkeypatch):
+    handler = AlertHandler(DummyAutomation())
+    raced = []
+
+    def fake_wait_for_any(driver, outcomes, timeout=None):
+        raced.append((outcomes, timeout))
+        return RaceResult(outcomes[-1])
+
+    monkeypatch.setattr(handler.waiter, "wait_for_any", fake_wait_for_any)
+    monkeypatch.setattr(
+        "sele_saisie_auto.alerts.alert_handler.click_element_without_wait",
+        lambda *a, **k: pytest.fail("no alert to close"),
+    )
+
+    handler.handle_alerts("drv", alert_type=AlertType.DATE_ALERT)
+
+    outcomes, timeout = raced[0]
+    assert outcomes == [
+        Outcome(Locators.ALERT_CONTENT_0.value, Locators.ALERT_CONTENT_0.value),
+        AlertHandler.grid_outcome,
+    ]
+    assert timeout == 1
+
+
 def test_handle_alerts_unknown(monkeypatch):
     handler = AlertHandler(DummyAutomation())
     with pytest.raises(ValueError):
@@ -351,3 +351,34 @@ def test_run_sequence_with_mocks(sample_config):
         "cleanup",
         "exit",
     ]
+
+
+def test_swallowed_timesheet_error_marks_the_run_failed(sample_config):
+    app_cfg = AppConfig.from_raw(AppConfigRaw(sample_config))
+    creds = Credentials(b"k" * 32, object(), b"u", object(), b"p", object())
+    rm = MagicMock()
+    rm.__enter__.return_value = rm
+    rm.initialize_shared_memory.return_value = creds
+    rm.get_driver.return_value = "drv"
+    pn = MagicMock()
+    pn.prepare = None
+    pn.browser_session = DummyBrowserSession()
+    pn.submit_full_timesheet.side_effect = RuntimeError("grid")
+
+    orch = AutomationOrchestrator.from_components(
+        rm,
+        pn,
+        types.SimpleNamespace(app_config=app_cfg),
+        SaisieContext(app_cfg, None, None, {}, []),
+        Logger("log.html"),
+        timesheet_helper_cls=lambda *a, **k: object(),
+    )
+    orch.cleanup_resources = lambda *a, **k: None
+
+    orch.execute()
+    rm.mark_failed.assert_called_once_with()
+
+    pn.submit_full_timesheet.side_effect = None
+    rm.mark_failed.reset_mock()
+    orch.execute()
+    rm.mark_failed.assert_not_called()
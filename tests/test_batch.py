@@ -0,0 +1,211 @@
+import os
+import types
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import shared_memory
+from pathlib import Path
+
+import pytest
+
+from sele_saisie_auto import batch, cli
+from sele_saisie_auto.encryption_utils import EncryptionService
+
+EXAMPLE_CONFIG = Path(__file__).resolve().parents[1] / "examples" / "config_minimal.ini"
+
+
+def segment_exists(name):
+    try:
+        mem = shared_memory.SharedMemory(name=name)
+    except FileNotFoundError:
+        return False
+    mem.close()
+    return True
+
+
+def read_credentials(memory_config, log_file):
+    service = EncryptionService(log_file, memory_config=memory_config).attach()
+    creds = service.retrieve_credentials()
+    try:
+        return (
+            service.dechiffrer_donnees(creds.login, service.cle_aes),
+            service.dechiffrer_donnees(creds.password, service.cle_aes),
+        )
+    finally:
+        for mem in (creds.mem_key, creds.mem_login, creds.mem_password):
+            mem.close()
+
+
+def crash_worker(job, memory_config, log_file, options):
+    os._exit(3)
+
+
+def test_expand_jobs_and_weekly_dates():
+    dates = batch.weekly_dates("03/07/2024", 3)
+
+    assert dates == ["06/07/2024", "13/07/2024", "20/07/2024"]
+    jobs = batch.expand_jobs(["a/alice.ini", "bob.ini"], dates[:2])
+    assert [job.name for job in jobs] == [
+        "alice_06-07-2024",
+        "alice_13-07-2024",
+        "bob_06-07-2024",
+        "bob_13-07-2024",
+    ]
+    assert batch.expand_jobs([], []) == [batch.BatchJob()]
+    assert batch.BatchJob().name == "config_auto"
+
+
+def test_load_job_config_applies_date(tmp_path):
+    job = batch.BatchJob(str(EXAMPLE_CONFIG), "13/07/2024")
+
+    cfg = batch.load_job_config(job, str(tmp_path / "log.html"))
+
+    assert cfg.date_cible == "13/07/2024"
+
+
+def test_run_batch_provisions_and_wipes_namespaces(tmp_path):
+    seen = {}
+    prompts = []
+
+    def worker(job, memory_config, log_file, options):
+        seen[job.name] = (memory_config, read_credentials(memory_config, log_file))
+        if job.date_cible == "13/07/2024":
+            raise RuntimeError("boom")
+        return batch.JobResult(job, log_file, 0.5)
+
+    def prompt(config_path):
+        prompts.append(config_path)
+        return f"user-{config_path}", "secret"
+
+    jobs = batch.expand_jobs(["alice.ini"], ["06/07/2024", "13/07/2024"])
+    options = batch.BatchOptions(log_dir=str(tmp_path), concurrency=2)
+
+    summary = batch.run_batch(
+        jobs,
+        options,
+        prompt=prompt,
+        worker=worker,
+        executor_factory=lambda opts: ThreadPoolExecutor(opts.concurrency),
+    )
+
+    assert prompts == ["alice.ini"]
+    assert [result.ok for result in summary.results] == [True, False]
+    assert "boom" in summary.results[1].error
+    assert summary.results[0].log_file.endswith("00_alice_06-07-2024.html")
+    assert "1/2 réussi(s)" in summary.format()
+    configs = [memory_config for memory_config, _ in seen.values()]
+    assert configs[0].cle_name != configs[1].cle_name
+    assert {creds for _, creds in seen.values()} == {("user-alice.ini", "secret")}
+    for cfg in configs:
+        for name in (cfg.cle_name, cfg.login_name, cfg.password_name):
+            assert not segment_exists(name)
+
+
+def test_crashed_worker_is_reported_without_leaking_segments(monkeypatch, tmp_path):
+    options = batch.BatchOptions(log_dir=str(tmp_path), concurrency=1)
+    created = []
+    original = batch.MemoryConfig.with_uuid
+
+    def with_uuid():
+        created.append(original())
+        return created[-1]
+
+    monkeypatch.setattr(batch.MemoryConfig, "with_uuid", staticmethod(with_uuid))
+
+    summary = batch.run_batch(
+        [batch.BatchJob(date_cible="06/07/2024")],
+        options,
+        prompt=lambda path: ("user", "secret"),
+        worker=crash_worker,
+    )
+
+    assert summary.failed and "Processus interrompu" in summary.failed[0].error
+    assert not segment_exists(created[0].cle_name)
+    assert not segment_exists(created[0].login_name)
+
+
+def test_run_job_reports_success_and_failure(monkeypatch, tmp_path):
+    calls = []
+
+    class DummyOrchestrator:
+        @classmethod
+        def from_components(cls, *args, **kwargs):
+            return cls()
+
+        def execute(self, headless=False, no_sandbox=False):
+            calls.append((headless, no_sandbox))
+
+    services = types.SimpleNamespace(
+        encryption_service=types.SimpleNamespace(attach=lambda: None)
+    )
+    monkeypatch.setattr(
+        batch,
+        "service_configurator_factory",
+        lambda cfg, memory_config: types.SimpleNamespace(
+            build_services=lambda log_file: services
+        ),
+    )
+    managers = []
+
+    def automation(*args, **kwargs):
+        managers.append(types.SimpleNamespace(driver_pool=None))
+        return types.SimpleNamespace(
+            resource_manager=managers[-1],
+            page_navigator=None,
+            context=None,
+            logger=None,
+        )
+
+    monkeypatch.setattr(batch, "PSATimeAutomation", automation)
+    monkeypatch.setattr(batch, "AutomationOrchestrator", DummyOrchestrator)
+    monkeypatch.setattr(batch, "_DRIVER_POOLS", {})
+    options = batch.BatchOptions(
+        log_dir=str(tmp_path), headless=True, reuse_browsers=True
+    )
+    log_file = str(tmp_path / "job.html")
+    job = batch.BatchJob(str(EXAMPLE_CONFIG))
+
+    ok = batch.run_job(job, batch.MemoryConfig(), log_file, options)
+    batch.run_job(job, batch.MemoryConfig(), log_file, options)
+    failed = batch.run_job(
+        batch.BatchJob(str(tmp_path / "absent.ini")),
+        batch.MemoryConfig(),
+        log_file,
+        options,
+    )
+
+    assert ok.ok and calls == [(True, False), (True, False)]
+    assert managers[0].driver_pool is managers[1].driver_pool is not None
+    assert failed.error.startswith("FileNotFoundError")
+
+
+def test_cli_dispatches_batch(monkeypatch, tmp_path):
+    captured = {}
+
+    def fake_run_batch(jobs, options):
+        captured["jobs"] = jobs
+        captured["options"] = options
+        job = jobs[0]
+        return batch.BatchSummary([batch.JobResult(job, "log.html", 1.0, "boom")])
+
+    monkeypatch.setattr(batch, "run_batch", fake_run_batch)
+
+    with pytest.raises(SystemExit) as exc:
+        cli.main(
+            [
+                "batch",
+                "--config",
+                "alice.ini",
+                "--from-date",
+                "06/07/2024",
+                "--weeks",
+                "2",
+                "-j",
+                "3",
+                "--log-dir",
+                str(tmp_path),
+            ]
+        )
+
+    assert exc.value.code == 1
+    assert len(captured["jobs"]) == 2
+    assert captured["options"].concurrency == 3
+    assert "boom" in (tmp_path / batch.SUMMARY_LOG_NAME).read_text(encoding="utf-8")
@@ -0,0 +1,115 @@
+from types import SimpleNamespace
+
+from selenium.common.exceptions import WebDriverException
+
+from sele_saisie_auto.automation.browser_session import BrowserSession
+from sele_saisie_auto.day_filler import DayFiller
+from sele_saisie_auto.logging_service import Logger
+from sele_saisie_auto.remplir_jours_feuille_de_temps import TimeSheetContext
+from sele_saisie_auto.selenium_utils import batch_fill
+from sele_saisie_auto.selenium_utils.grid_snapshot import GRID_SNAPSHOT_SCRIPT
+from sele_saisie_auto.selenium_utils.row_index import WATCH_ROWS_SCRIPT
+
+
+class FakeGridDriver:
+    """Driver simulating the POL_TIME/TIME inputs of the grid."""
+
+    def __init__(self, inputs, rows=(), rejected=()):
+        self.inputs = dict(inputs)
+        self.rows = list(rows)
+        self.rejected = set(rejected)
+        self.scripts = []
+
+    def execute_script(self, script, *args):
+        if script == batch_fill.FILL_INPUTS_SCRIPT:
+            self.scripts.append("fill")
+            status = {}
+            for field_id, value in args[0].items():
+                if field_id not in self.inputs:
+                    status[field_id] = "missing"
+                elif self.inputs[field_id].strip() == value:
+                    status[field_id] = "unchanged"
+                else:
+                    if field_id not in self.rejected:
+                        self.inputs[field_id] = value
+                    status[field_id] = "set"
+            return status
+        if script == batch_fill.READ_INPUTS_SCRIPT:
+            self.scripts.append("read")
+            return {field_id: self.inputs.get(field_id) for field_id in args[0]}
+        if script == GRID_SNAPSHOT_SCRIPT:
+            return self.rows
+        return script == WATCH_ROWS_SCRIPT
+
+
+def silent_logger():
+    return Logger(None, writer=lambda *a, **k: None)
+
+
+def test_fill_and_verify_reports_failures():
+    driver = FakeGridDriver({"A": "", "B": "8", "C": ""}, rejected={"C"})
+    settled = []
+    failed = batch_fill.fill_and_verify(
+        driver,
+        {"A": "7", "B": "8", "C": "3", "D": "1"},
+        logger=silent_logger(),
+        settle=lambda: settled.append(True),
+    )
+    assert failed == ["C", "D"]
+    assert driver.inputs["A"] == "7"
+    assert driver.scripts == ["fill", "read"]
+    assert settled == [True]
+
+
+def test_fill_and_verify_unavailable():
+    assert batch_fill.fill_and_verify(None, {"A": "1"}) is None
+    assert batch_fill.fill_and_verify(SimpleNamespace(), {"A": "1"}) is None
+    assert batch_fill.fill_and_verify(None, {}) == []
+
+    def boom(*a):
+        raise WebDriverException("boom")
+
+    driver = SimpleNamespace(execute_script=boom)
+    assert batch_fill.fill_and_verify(driver, {"A": "1"}, silent_logger()) is None
+
+
+def test_day_filler_fills_week_in_one_batch(monkeypatch):
+    rows = [{"index": 4, "text": "Formation", "values": [""] * 7}]
+    inputs = {f"POL_TIME{d}$4": "" for d in range(1, 8)}
+    inputs["TIME6$0"] = ""
+    driver = FakeGridDriver(inputs, rows, rejected={"POL_TIME3$4"})
+    retried = []
+    monkeypatch.setattr(DayFiller, "wait_for_dom", lambda *a, **k: None)
+    monkeypatch.setattr(
+        DayFiller,
+        "insert_with_retries",
+        lambda self, drv, field_id, value, waiter=None: retried.append(field_id)
+        or False,
+    )
+    monkeypatch.setattr(
+        "sele_saisie_auto.remplir_jours_feuille_de_temps.afficher_message_insertion",
+        lambda *a: None,
+    )
+    ctx = TimeSheetContext("log", [], {}, {})
+    work_days = {
+        "lundi": ("Formation", "8"),
+        "mardi": ("Formation", "8"),
+        "mercredi": ("Formation", "8"),
+        "jeudi": ("Inconnue", "8"),
+        "vendredi": ("En mission", "7"),
+        "samedi": ("", ""),
+    }
+    filled = DayFiller(ctx, logger=None).remplir_mission(driver, work_days, ["lundi"])
+    assert filled == ["lundi", "mercredi", "vendredi"]
+    assert driver.inputs["POL_TIME3$4"] == ""
+    assert driver.inputs["TIME6$0"] == "7"
+    assert retried == ["POL_TIME3$4"]
+    assert driver.scripts == ["fill", "read"]
+
+
+def test_browser_session_fill_inputs(monkeypatch):
+    session = BrowserSession("log.html", waiter=SimpleNamespace())
+    assert session.fill_inputs({"A": "1"}) is None
+    session.driver = FakeGridDriver({"A": ""})
+    monkeypatch.setattr(session, "wait_for_dom", lambda driver: None)
+    assert session.fill_inputs({"A": "1"}) == []
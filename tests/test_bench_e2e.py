@@ -0,0 +1,162 @@
+import os
+import shutil
+import sys
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))  # noqa: E402
+sys.path.append(str(Path(__file__).resolve().parents[1] / "scripts"))  # noqa: E402
+
+import bench_e2e  # noqa: E402
+import psatime_mock  # noqa: E402
+
+from sele_saisie_auto.locators import Locators  # noqa: E402
+
+PAGE_IDS = {
+    "": [Locators.USERNAME, Locators.PASSWORD],
+    "home": [Locators.NAV_TO_DATE_ENTRY],
+    "timesheet": [Locators.SIDE_MENU_BUTTON, Locators.MAIN_FRAME],
+    "date-entry": [Locators.DATE_INPUT, Locators.ADD_BUTTON],
+    "grid": [
+        Locators.ADDITIONAL_INFO_LINK,
+        Locators.SAVE_DRAFT_BUTTON,
+        Locators.MODAL_FRAME,
+        Locators.ALERT_CONTENT_1,
+        Locators.CONFIRM_OK,
+    ],
+    "additional-info": [Locators.SAVE_ICON],
+}
+
+
+@pytest.fixture(scope="module")
+def pages():
+    with psatime_mock.MockPsaTimeServer() as server:
+        bodies = {}
+        for path in PAGE_IDS:
+            with urllib.request.urlopen(server.url + path) as response:  # nosec B310
+                bodies[path] = response.read().decode()
+        yield bodies, server.bytes_sent, server.requests
+
+
+def test_mock_pages_expose_locator_ids(pages):
+    bodies, _, _ = pages
+    for path, locators in PAGE_IDS.items():
+        for locator in locators:
+            assert f"{locator.value}" in bodies[path], (path, locator)
+
+
+def test_mock_pages_cover_grid_and_additional_info(pages):
+    bodies, bytes_sent, requests = pages
+    assert "id='POL_DESCR$2'" in bodies["grid"]
+    assert "id='POL_TIME7$2'" in bodies["grid"]
+    assert "id='TIME1$0'" in bodies["grid"]
+    assert "id='PROJECT_CODE$0'" in bodies["grid"]
+    assert "id='DESCR100$2'" in bodies["additional-info"]
+    assert "id='UC_TIME_LIN_WRK_UC_DAILYREST17$0'" in bodies["additional-info"]
+    assert "id='UC_LOCATION_A7$1'" in bodies["additional-info"]
+    assert bytes_sent == sum(len(body.encode()) for body in bodies.values())
+    assert requests["/grid"] == 1
+
+
+def _run(total, wall=0.1, commands=10):
+    return {
+        "total_s": total,
+        "completed": True,
+        "phases": {
+            phase: {
+                "wall_s": wall,
+                "commands": commands,
+                "command_s": 0.01,
+                "webdriver_bytes": 100,
+                "by_command": {},
+            }
+            for phase in bench_e2e.PHASES
+        },
+        "http": {"bytes": 1000, "requests": {}},
+    }
+
+
+def test_summarize_takes_median():
+    summary = bench_e2e.summarize([_run(1.0), _run(3.0), _run(2.0)])
+
+    assert summary["total_s"] == 2.0
+    assert summary["phases"]["fill"]["commands"] == 10
+
+
+def test_compare_flags_regressions_above_threshold():
+    baseline = bench_e2e.summarize([_run(1.0)])
+
+    assert bench_e2e.compare(bench_e2e.summarize([_run(1.1)]), baseline, 0.2) == []
+    regressions = bench_e2e.compare(
+        bench_e2e.summarize([_run(1.0, commands=20)]), baseline, 0.2
+    )
+    assert len(regressions) == len(bench_e2e.PHASES)
+    assert regressions[0].startswith("startup.commands")
+
+
+def test_mock_pages_load_assets_blocked_by_lean_profile(pages):
+    from fnmatch import fnmatch
+
+    from sele_saisie_auto.selenium_utils.lean_profile import LeanProfile
+
+    bodies, _, _ = pages
+    patterns = LeanProfile().blocked_url_patterns
+    for path in psatime_mock.ASSETS:
+        assert path in bodies["grid"]
+        assert any(fnmatch(path, pattern) for pattern in patterns), path
+    with psatime_mock.MockPsaTimeServer() as server:
+        with urllib.request.urlopen(server.url + "static/psa-logo.png") as response:
+            assert response.headers["Content-Type"] == "image/png"  # nosec B310
+
+
+def test_bench_config_enables_lean_browser():
+    config = psatime_mock.build_app_config(lean_browser=True)
+
+    assert config.raw.getboolean("settings", "lean_browser") is True
+
+
+def test_page_loads_table(capsys):
+    loads = {path: 0.05 for path in bench_e2e.PAGE_LOAD_PATHS}
+    bench_e2e._print_page_loads(
+        {"standard": loads, "lean": {p: v / 2 for p, v in loads.items()}}
+    )
+
+    lines = capsys.readouterr().out.splitlines()
+    assert "lean (ms)" in lines[0]
+    assert lines[-1].split() == ["/grid", "50.0", "25.0"]
+
+
+def _edge_installed():
+    program_files = os.environ.get("ProgramFiles(x86)", "")
+    windows_edge = Path(program_files, "Microsoft/Edge/Application/msedge.exe")
+    return bool(
+        shutil.which("msedge")
+        or shutil.which("microsoft-edge")
+        or shutil.which("microsoft-edge-stable")
+        or (program_files and windows_edge.exists())
+    )
+
+
+@pytest.mark.skipif(not _edge_installed(), reason="Microsoft Edge absent")
+def test_lean_profile_page_loads(record_property, capsys):
+    options = bench_e2e.parse_args(["--page-load-repeat", "3", "--no-sandbox"])
+    page_loads = {}
+    asset_requests = {}
+    with psatime_mock.MockPsaTimeServer(latency_ms=20) as server:
+        for mode in bench_e2e.PAGE_LOAD_MODES:
+            server.reset_counters()
+            page_loads[mode] = bench_e2e.measure_page_loads(
+                server, options, lean=mode == "lean"
+            )
+            asset_requests[mode] = sum(
+                server.requests.get(path, 0) for path in psatime_mock.ASSETS
+            )
+
+    with capsys.disabled():
+        bench_e2e._print_page_loads(page_loads)
+    for mode, loads in page_loads.items():
+        record_property(f"page_loads_{mode}", loads)
+    assert asset_requests["standard"] > 0
+    assert asset_requests["lean"] == 0
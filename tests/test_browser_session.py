@@ -1,4 +1,5 @@
 import sys
+import types
 from pathlib import Path
 
 import pytest
@@ -237,3 +238,92 @@ def test_go_to_iframe_fail(monkeypatch):
     session.driver = DummyDriver()
 
     assert session.go_to_iframe("id") is False
+
+
+class FrameDriver:
+    def __init__(self, frames):
+        self.frames = frames
+        self.calls = []
+        self.switch_to = types.SimpleNamespace(
+            frame=lambda element: self.calls.append(("frame", element)),
+            default_content=lambda: self.calls.append(("default",)),
+        )
+
+    def find_element(self, by, value):
+        self.calls.append(("find", by, value))
+        if (by, value) not in self.frames:
+            raise Exception("not found")
+        return f"{by}:{value}"
+
+
+def test_redundant_frame_switches_are_skipped():
+    session = BrowserSession("log.html")
+    driver = session.driver = FrameDriver({("id", "main")})
+
+    session.go_to_default_content()
+    assert session.go_to_iframe("main") is True
+    assert session.go_to_iframe("main") is True
+    session.go_to_default_content()
+    session.go_to_default_content()
+
+    assert driver.calls == [
+        ("find", "id", "main"),
+        ("frame", "id:main"),
+        ("default",),
+    ]
+    assert session.frames.counters() == {
+        "frame_switches": 2,
+        "frame_switches_avoided": 3,
+    }
+
+
+def test_frame_found_by_name_is_looked_up_by_name_next_time():
+    session = BrowserSession("log.html")
+    driver = session.driver = FrameDriver({("name", "modal")})
+
+    assert session.go_to_iframe("modal") is True
+    session.go_to_default_content()
+    driver.calls.clear()
+    assert session.go_to_iframe("modal") is True
+
+    assert driver.calls == [("find", "name", "modal"), ("frame", "name:modal")]
+
+
+def test_actions_that_may_navigate_forget_the_current_frame(monkeypatch):
+    monkeypatch.setattr(
+        "sele_saisie_auto.automation.browser_session.click_element_without_wait",
+        lambda *a, **k: None,
+    )
+    session = BrowserSession("log.html")
+    driver = session.driver = FrameDriver({("id", "main")})
+    session.go_to_iframe("main")
+
+    session.click("save")
+    session.go_to_default_content()
+    assert session.go_to_iframe("main") is True
+
+    assert driver.calls.count(("frame", "id:main")) == 2
+    assert session.frames.avoided == 0
+
+    session.frames.strategies["other"] = "name"
+    session.close()
+    assert session.frames.path == ()
+    assert session.frames.strategies == {}
+
+
+def test_network_idle_readiness_keeps_dom_stability_check():
+    calls = []
+
+    class IdleWaiter:
+        readiness = "network_idle"
+
+        def wait_until_dom_is_stable(self, driver, timeout=None):
+            calls.append("stable")
+
+        def wait_for_dom_ready(self, driver, timeout=None):
+            calls.append("ready")
+
+    session = BrowserSession("log.html", waiter=IdleWaiter())
+    session.wait_for_dom("drv", max_attempts=2)
+
+    assert calls == ["stable", "ready"]
@@ -128,10 +128,10 @@ def test_main_cleanup_flag(monkeypatch):
     )
     monkeypatch.setattr(cli, "parse_args", lambda argv: dummy_args)
     called = {}
-    import sele_saisie_auto.launcher as launcher
+    import sele_saisie_auto.shared_memory_service as shm_service
 
     monkeypatch.setattr(
-        launcher,
+        shm_service,
         "cleanup_memory_segments",
         lambda: called.setdefault("clean", True),
     )
@@ -149,7 +149,7 @@ def test_cleanup_mem_flag_removes_segments_and_skips_automation(monkeypatch):
         cleanup_mem=True,
     )
     monkeypatch.setattr(cli, "parse_args", lambda argv: dummy_args)
-    import sele_saisie_auto.launcher as launcher
+    import sele_saisie_auto.shared_memory_service as shm_service
 
     mem_cfg = MemoryConfig.with_uuid()
     leftovers = []
@@ -164,9 +164,9 @@ def test_cleanup_mem_flag_removes_segments_and_skips_automation(monkeypatch):
         seg.close()
         leftovers.append(name)
 
-    orig_cleanup = launcher.cleanup_memory_segments
+    orig_cleanup = shm_service.cleanup_memory_segments
     monkeypatch.setattr(
-        launcher,
+        shm_service,
         "cleanup_memory_segments",
         lambda: orig_cleanup(mem_cfg),
     )
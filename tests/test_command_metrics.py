@@ -0,0 +1,152 @@
+import json
+import types
+from unittest.mock import MagicMock
+
+from sele_saisie_auto.app_config import AppConfig, AppConfigRaw
+from sele_saisie_auto.encryption_utils import Credentials
+from sele_saisie_auto.logger_utils import close_logs
+from sele_saisie_auto.logging_service import Logger
+from sele_saisie_auto.orchestration import AutomationOrchestrator
+from sele_saisie_auto.saisie_context import SaisieContext
+from sele_saisie_auto.selenium_utils import CommandMetrics, command_phase
+from sele_saisie_auto.selenium_utils.command_metrics import ELEMENT_KEY
+from tests.conftest import DummyBrowserSession
+
+DURATIONS = {
+    "findElement": 0.002,
+    "clickElement": 0.04,
+    "executeScript": 0.7,
+    "getTitle": 6.0,
+}
+
+
+class FakeExecutor:
+    def __init__(self, clock):
+        self.clock = clock
+        self.calls = []
+
+    def execute(self, command, params):
+        self.calls.append(command)
+        self.clock.now += DURATIONS.get(command, 0.0)
+        if command == "findElement":
+            return {"value": {ELEMENT_KEY: "el-1"}}
+        return {"value": None}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_driver():
+    clock = FakeClock()
+    driver = types.SimpleNamespace(command_executor=FakeExecutor(clock))
+    return driver, clock
+
+
+def send_commands(driver, metrics):
+    execute = driver.command_executor.execute
+    with command_phase(metrics, "login"):
+        execute("findElement", {"using": "css selector", "value": '[id="userid"]'})
+        execute("clickElement", {"id": "el-1"})
+    with command_phase(metrics, "grid_fill"):
+        execute("executeScript", {"script": "\n  return document.readyState;\n"})
+    execute("getTitle", {})
+
+
+def test_attach_records_phase_and_locator():
+    driver, clock = make_driver()
+    metrics = CommandMetrics(clock=clock)
+
+    assert metrics.attach(driver) is True
+    send_commands(driver, metrics)
+    metrics.detach()
+    driver.command_executor.execute("getTitle", {})
+
+    assert [(r.name, r.locator, r.phase) for r in metrics.records] == [
+        ("findElement", 'css selector=[id="userid"]', "login"),
+        ("clickElement", 'css selector=[id="userid"]', "login"),
+        ("executeScript", "script:return document.readyState;", "grid_fill"),
+        ("getTitle", None, "setup"),
+    ]
+    assert metrics.records[1].duration == DURATIONS["clickElement"]
+    assert len(driver.command_executor.calls) == 5
+
+
+def test_attach_without_executor_is_ignored():
+    assert CommandMetrics().attach(None) is False
+    with command_phase(None, "login"):
+        pass
+
+
+def test_histograms_and_slowest():
+    driver, clock = make_driver()
+    metrics = CommandMetrics(clock=clock)
+    metrics.attach(driver)
+    send_commands(driver, metrics)
+
+    histograms = metrics.histograms()
+    assert histograms["login"]["count"] == 2
+    assert histograms["login"]["buckets"]["5"] == 1
+    assert histograms["login"]["buckets"]["50"] == 1
+    assert histograms["grid_fill"]["buckets"]["1000"] == 1
+    assert histograms["setup"]["buckets"]["inf"] == 1
+    assert [r.name for r in metrics.slowest(2)] == ["getTitle", "executeScript"]
+
+    report = json.loads(metrics.to_json(limit=1))
+    assert report["commands"] == 4
+    assert report["slowest"][0]["name"] == "getTitle"
+    html = metrics.to_html(limit=1)
+    assert "<td>grid_fill</td>" in html
+    assert "<td>getTitle</td>" in html
+
+
+def test_run_writes_json_report_and_log_section(tmp_path, sample_config):
+    log_file = tmp_path / "run.html"
+    app_cfg = AppConfig.from_raw(AppConfigRaw(sample_config))
+    creds = Credentials(b"k" * 32, object(), b"u", object(), b"p", object())
+    driver, clock = make_driver()
+    session = DummyBrowserSession()
+
+    rm = MagicMock()
+    rm.__enter__.return_value = rm
+    rm.initialize_shared_memory.return_value = creds
+    rm.get_driver.return_value = driver
+
+    pn = MagicMock()
+    pn.browser_session = session
+    pn.run.side_effect = lambda drv: send_commands(drv, session.command_metrics)
+
+    metrics = CommandMetrics(clock=clock)
+    orch = AutomationOrchestrator.from_components(
+        rm,
+        pn,
+        types.SimpleNamespace(app_config=app_cfg),
+        SaisieContext(app_cfg, None, None, {}, []),
+        Logger(str(log_file)),
+        command_metrics=metrics,
+    )
+    orch.cleanup_resources = lambda *a, **k: None
+
+    orch.run()
+    close_logs(str(log_file))
+
+    report = json.loads((tmp_path / "run.commands.json").read_text(encoding="utf-8"))
+    assert report["phases"]["login"]["count"] == 2
+    content = log_file.read_text(encoding="utf-8")
+    assert "Commandes WebDriver par phase" in content
+    assert content.endswith("</table></body></html>")
+    assert session.command_metrics is None
+    assert "execute" not in vars(driver.command_executor)
+
+
+def test_counters_are_reported():
+    metrics = CommandMetrics()
+    metrics.counters.update({"frame_switches": 4, "frame_switches_avoided": 3})
+
+    assert metrics.to_dict()["counters"]["frame_switches_avoided"] == 3
+    assert "<td>frame_switches_avoided</td><td>3</td>" in metrics.to_html()
+    assert "Compteurs" not in CommandMetrics().to_html()
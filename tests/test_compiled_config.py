@@ -0,0 +1,99 @@
+import configparser
+import types
+
+import pytest
+
+from sele_saisie_auto.alerts.alert_handler import AlertHandler
+from sele_saisie_auto.app_config import AppConfig, AppConfigRaw
+from sele_saisie_auto.compiled_config import CompiledConfig, resolve_compiled
+from sele_saisie_auto.configuration import ServiceConfigurator
+from sele_saisie_auto.logging_service import Logger
+from sele_saisie_auto.remplir_jours_feuille_de_temps import (
+    TimeSheetHelper,
+    context_from_app_config,
+    initialize,
+)
+
+
+@pytest.fixture
+def app_cfg(sample_config):
+    sample_config["settings"]["default_timeout"] = "7"
+    sample_config["settings"]["long_timeout"] = "30"
+    sample_config["project_information"] = {
+        "project_code": "PROJ",
+        "billing_action": "facturable",
+    }
+    sample_config["cgi_options_billing_action"] = {"Facturable": "B"}
+    return AppConfig.from_raw(AppConfigRaw(sample_config))
+
+
+def forbid_recompile(monkeypatch):
+    def fail(*_a, **_k):
+        raise AssertionError("la configuration ne doit pas être recompilée")
+
+    monkeypatch.setattr(AppConfig, "from_parser", fail)
+    monkeypatch.setattr(CompiledConfig, "build", fail)
+
+
+def test_compiled_view_is_shared_and_read_only(app_cfg):
+    compiled = app_cfg.compiled
+
+    assert app_cfg.compiled is compiled
+    assert resolve_compiled(app_cfg) is compiled
+    assert resolve_compiled(compiled) is compiled
+    assert resolve_compiled(object()) is None
+    assert compiled.project_mission_info == {
+        "project_code": "PROJ",
+        "billing_action": "B",
+    }
+    assert compiled.code_for("billing_action", "FACTURABLE") == "B"
+    assert compiled.code_for("billing_action", "Inconnu") == "Inconnu"
+    assert (compiled.default_timeout, compiled.long_timeout) == (7, 30)
+    with pytest.raises(TypeError):
+        compiled.lookups["billing_action"]["x"] = "y"  # type: ignore[index]
+
+    ctx = context_from_app_config(app_cfg, "log.html")
+    ctx.project_mission_info["billing_action"] = "modifié"
+    descriptions = compiled.descriptions()
+    descriptions[0]["type_element"] = "input"
+    assert compiled.project_mission_info["billing_action"] == "B"
+    assert compiled.descriptions()[0]["type_element"] == "select"
+    assert ctx.compiled is compiled and ctx.config is app_cfg.raw
+
+
+def test_helpers_reuse_compiled_config(app_cfg, monkeypatch):
+    compiled = app_cfg.compiled
+    ctx = compiled.timesheet_context("log.html")
+    forbid_recompile(monkeypatch)
+
+    helper = TimeSheetHelper(ctx, Logger("log.html"))
+    automation = types.SimpleNamespace(
+        log_file="log.html",
+        compiled_config=compiled,
+        context=types.SimpleNamespace(config=app_cfg.raw),
+    )
+    handler = AlertHandler(automation)
+
+    for waiter in (helper.waiter, handler.waiter):
+        assert waiter.wrapper.default_timeout == 7
+        assert waiter.wrapper.long_timeout == 30
+
+
+def test_services_and_initialize_expose_compiled(app_cfg, monkeypatch):
+    services = ServiceConfigurator(app_cfg).build_services("log.html")
+    assert services.config is app_cfg.compiled
+
+    parser = configparser.ConfigParser()
+    parser["settings"] = {"liste_items_planning": '"d1"'}
+    parser["project_information"] = {"billing_action": "Non facturable"}
+    monkeypatch.setattr(
+        "sele_saisie_auto.remplir_jours_feuille_de_temps.read_config_ini",
+        lambda lf: parser,
+    )
+    monkeypatch.setattr(
+        "sele_saisie_auto.remplir_jours_feuille_de_temps.set_log_file_selenium",
+        lambda lf: None,
+    )
+    ctx = initialize("log.html")
+    assert ctx.project_mission_info == {"billing_action": "U"}
+    assert ctx.work_days == {} and ctx.compiled is not None
@@ -0,0 +1,117 @@
+import os
+
+import pytest
+
+from sele_saisie_auto import app_config, config_snapshot
+from sele_saisie_auto.app_config import AppConfig, load_config
+from sele_saisie_auto.read_or_write_file_config_ini_utils import clear_cache
+
+CONFIG = """[settings]
+url=http://t
+liste_items_planning="a", "b"
+[work_schedule]
+lundi = En mission,8
+[cgi_options_billing_action]
+Facturable = B
+"""
+
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+    path = tmp_path / "config.ini"
+    path.write_text(CONFIG, encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    for env_var in app_config.ENV_VAR_MAP.values():
+        monkeypatch.delenv(env_var, raising=False)
+    clear_cache()
+    yield path
+    clear_cache()
+
+
+def forbid_parsing(monkeypatch):
+    def fail(*_a, **_k):
+        raise AssertionError("config.ini ne doit pas être relu")
+
+    monkeypatch.setattr(app_config, "read_config_ini", fail)
+
+
+def test_warm_load_uses_snapshot(config_file, tmp_path, monkeypatch):
+    log_file = str(tmp_path / "log.html")
+    cold = load_config(log_file)
+    assert (tmp_path / ".config.ini.snapshot").exists()
+
+    forbid_parsing(monkeypatch)
+    warm = load_config(log_file)
+
+    assert warm == cold
+    assert warm.work_schedule["lundi"] == ("En mission", "8")
+    assert warm.lookup_maps == cold.lookup_maps
+    assert warm.lookup_maps["billing_action"] == {"facturable": "B"}
+    assert warm.raw.get("settings", "url") == "http://t"
+    assert not warm.raw.has_option("settings", "absent")
+    assert warm.raw["work_schedule"]["lundi"] == "En mission,8"
+    assert warm.raw is not cold.raw
+
+
+def test_same_mtime_and_size_still_invalidates(config_file, tmp_path, monkeypatch):
+    log_file = str(tmp_path / "log.html")
+    load_config(log_file)
+    stat = config_file.stat()
+    config_file.write_text(CONFIG.replace("http://t", "http://u"), encoding="utf-8")
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    clear_cache()
+
+    assert load_config(log_file).url == "http://u"
+    forbid_parsing(monkeypatch)
+    assert load_config(log_file).url == "http://u"
+
+
+def test_environment_overrides_bypass_snapshot(config_file, tmp_path, monkeypatch):
+    log_file = str(tmp_path / "log.html")
+    monkeypatch.setenv("PSATIME_LOGIN", "secret")
+
+    assert load_config(log_file).encrypted_login == "secret"
+    assert not (tmp_path / ".config.ini.snapshot").exists()
+
+
+def test_unreadable_snapshot_is_a_miss(config_file, tmp_path):
+    path = str(config_file)
+    key = config_snapshot.snapshot_key(path)
+    assert config_snapshot.write_snapshot(path, key, {"url": "x"})
+    assert config_snapshot.read_snapshot(path, key) == {"url": "x"}
+    assert config_snapshot.read_snapshot(path, key[:-1] + (("autre",),)) is None
+
+    with open(config_snapshot.snapshot_path(path), "r+b") as f:
+        f.truncate(10)
+    assert config_snapshot.read_snapshot(path, key) is None
+    config_snapshot.remove_snapshot(path)
+    config_snapshot.remove_snapshot(path)
+    assert isinstance(load_config(str(tmp_path / "log.html")), AppConfig)
+
+
+@pytest.mark.parametrize(
+    "attribute, value",
+    [
+        ("SNAPSHOT_FORMAT", 999),
+        ("__version__", "9.9.9"),
+        ("_parser_source_hash", lambda: "autre source"),
+    ],
+)
+def test_parser_changes_invalidate_snapshot(
+    config_file, tmp_path, monkeypatch, attribute, value
+):
+    log_file = str(tmp_path / "log.html")
+    load_config(log_file)
+    parsed = []
+    original = app_config.read_config_ini
+    monkeypatch.setattr(
+        app_config,
+        "read_config_ini",
+        lambda *a, **k: parsed.append(1) or original(*a, **k),
+    )
+    monkeypatch.setattr(app_config, attribute, value)
+    monkeypatch.setattr(app_config, "_SNAPSHOT_SALT", None)
+    clear_cache()
+
+    assert load_config(log_file).url == "http://t"
+    assert parsed
@@ -0,0 +1,32 @@
+import pytest
+
+from sele_saisie_auto.credential_arena import decode_slots, encode_slots
+from sele_saisie_auto.exceptions import SegmentFormatError
+
+
+def test_slots_roundtrip_in_order():
+    slots = {"key": b"k" * 32, "login": b"\x00u", "password": b"", "otp": b"1"}
+
+    decoded = decode_slots(memoryview(encode_slots(slots)))
+
+    assert decoded == slots
+    assert list(decoded) == list(slots)
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        b"",
+        encode_slots({"login": b"abc"})[:-1],
+        b"\x01\x00\x09\x03\x00\x00\x00\x00\x00\x00key",
+        b"\x01\x00\x01\x01\x00\x00\x00\x00\x00\x00\xff",
+    ],
+)
+def test_invalid_directory_is_rejected(payload):
+    with pytest.raises(SegmentFormatError):
+        decode_slots(memoryview(payload))
+
+
+def test_slot_name_length_is_bounded():
+    with pytest.raises(ValueError):
+        encode_slots({"x" * 256: b""})
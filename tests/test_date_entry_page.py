@@ -215,8 +215,7 @@ def test_process_date(monkeypatch):
         lambda driver: calls.append("alert"),
     )
     monkeypatch.setattr(
-        "sele_saisie_auto.automation.date_entry_page.program_break_time",
-        lambda *a, **k: calls.append("wait"),
+        page, "wait_for_date_accepted", lambda driver: calls.append("wait")
     )
 
     page.process_date("drv", "01/01/2024")
@@ -237,10 +236,48 @@ def test_process_date_no_submit(monkeypatch):
         page.alert_handler, "handle_date_alert", lambda d: calls.append("alert")
     )
     monkeypatch.setattr(
-        "sele_saisie_auto.automation.date_entry_page.program_break_time",
-        lambda *a, **k: calls.append("wait"),
+        page, "wait_for_date_accepted", lambda driver: calls.append("wait")
     )
 
     page.process_date("drv", None)
 
     assert calls == ["input", "wait", "submit"]
+
+
+@pytest.mark.parametrize(
+    "values, state, expected",
+    [
+        ([], "complete", False),
+        ([" "], "complete", False),
+        (["01/01/2024"], "loading", False),
+        (["01/01/2024"], "complete", True),
+    ],
+)
+def test_date_field_accepted(values, state, expected):
+    field = types.SimpleNamespace
+    driver = types.SimpleNamespace(
+        find_elements=lambda by, value: [
+            field(get_attribute=lambda name, v=v: v) for v in values
+        ],
+        execute_script=lambda script: state,
+    )
+
+    assert DateEntryPage._date_field_accepted(driver) is expected
+
+
+@pytest.mark.parametrize(
+    "settled, accepted, expected",
+    [(True, True, True), (False, True, False), (True, False, False)],
+)
+def test_wait_for_date_accepted_waits_for_dom_settle(settled, accepted, expected):
+    dummy = DummyAutomation()
+    page = DateEntryPage(dummy, page_navigator=DummyNavigator(dummy.browser_session))
+    calls = []
+    page.waiter = types.SimpleNamespace(
+        wait_until_dom_is_stable=lambda driver, timeout=None: calls.append(timeout)
+        or settled
+    )
+    page._date_field_accepted = lambda driver: accepted
+
+    assert page.wait_for_date_accepted("drv") is expected
+    assert calls == [1]
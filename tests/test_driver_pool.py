@@ -0,0 +1,159 @@
+from selenium.common.exceptions import WebDriverException
+
+from sele_saisie_auto.resources import resource_manager
+from sele_saisie_auto.resources.driver_pool import (
+    DriverPool,
+    is_driver_alive,
+    is_pooled_driver,
+)
+from tests.conftest import FakeEncryptionService
+from tests.test_resource_manager import (
+    DummyBrowserSession,
+    DummyConfigManager,
+    DummyResourceContext,
+)
+
+
+class FakeDriver:
+    def __init__(self, name):
+        self.name = name
+        self.alive = True
+        self.quit_called = False
+        self.urls = []
+        self.broken_navigation = False
+
+    def execute_script(self, script):
+        if not self.alive:
+            raise WebDriverException("gone")
+        return "complete"
+
+    def get(self, url):
+        if self.broken_navigation:
+            raise WebDriverException("tab crashed")
+        self.urls.append(url)
+
+    def quit(self):
+        self.quit_called = True
+
+
+class Factory:
+    def __init__(self):
+        self.created = []
+
+    def __call__(self):
+        self.created.append(FakeDriver(f"d{len(self.created)}"))
+        return self.created[-1]
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_released_driver_is_reused_until_max_uses():
+    factory = Factory()
+    pool = DriverPool(factory, max_uses=2)
+
+    first = pool.lease("http://psa")
+    pool.release(first)
+    second = pool.lease("http://psa")
+    pool.release(second)
+    third = pool.lease("http://psa")
+
+    assert first is second
+    assert first.urls == ["http://psa"]
+    assert first.quit_called and third is not first
+    assert len(factory.created) == 2
+    assert pool.leased_count == 1 and pool.idle_count == 0
+
+
+def test_failed_unhealthy_and_idle_drivers_are_recycled():
+    factory = Factory()
+    clock = Clock()
+    pool = DriverPool(factory, size=2, max_idle=60, clock=clock)
+
+    assert pool.prewarm() == 2
+    failed = pool.lease()
+    pool.release(failed, failed=True)
+    assert failed.quit_called
+
+    broken = pool.lease()
+    broken.alive = False
+    pool.release(broken)
+    replacement = pool.lease()
+    assert replacement is not broken and broken.quit_called
+
+    pool.release(replacement)
+    clock.now = 120
+    assert pool.reap() == 1 and replacement.quit_called
+    pool.release(FakeDriver("stranger"))
+    pool.close()
+    assert pool.idle_count == 0 and pool.leased_count == 0
+
+
+def test_driver_failing_navigation_is_quit_and_replaced():
+    factory = Factory()
+    pool = DriverPool(factory)
+
+    crashed = pool.lease("http://psa")
+    pool.release(crashed)
+    crashed.broken_navigation = True
+    fresh = pool.lease("http://psa")
+
+    assert fresh is not crashed and crashed.quit_called
+    assert pool.leased_count == 1 and pool.idle_count == 0
+
+
+def test_is_driver_alive():
+    driver = FakeDriver("d")
+    assert is_driver_alive(driver)
+    driver.alive = False
+    assert not is_driver_alive(driver)
+
+
+def test_resource_manager_leases_and_releases(monkeypatch):
+    monkeypatch.setattr(resource_manager, "ConfigManager", DummyConfigManager)
+    monkeypatch.setattr(
+        resource_manager,
+        "create_session",
+        lambda cfg: DummyBrowserSession("log.html", cfg),
+    )
+    monkeypatch.setattr(resource_manager, "ResourceContext", DummyResourceContext)
+    factory = Factory()
+    pool = DriverPool(factory)
+
+    for _ in range(2):
+        with resource_manager.ResourceManager(
+            "log.html", FakeEncryptionService("log.html"), driver_pool=pool
+        ) as rm:
+            driver = rm.get_driver()
+            session = rm.browser_session
+            assert session.driver is driver
+
+    assert len(factory.created) == 1
+    assert session.closed is False and session.driver is None
+    assert pool.idle_count == 1 and not driver.quit_called
+
+
+def test_resource_manager_recycles_a_driver_marked_failed(monkeypatch):
+    monkeypatch.setattr(resource_manager, "ConfigManager", DummyConfigManager)
+    monkeypatch.setattr(
+        resource_manager,
+        "create_session",
+        lambda cfg: DummyBrowserSession("log.html", cfg),
+    )
+    monkeypatch.setattr(resource_manager, "ResourceContext", DummyResourceContext)
+    pool = DriverPool(Factory())
+
+    with resource_manager.ResourceManager(
+        "log.html", FakeEncryptionService("log.html"), driver_pool=pool
+    ) as rm:
+        driver = rm.get_driver()
+        assert is_pooled_driver(driver)
+        rm.mark_failed()
+
+    assert driver.quit_called and not is_pooled_driver(driver)
+    assert pool.idle_count == 0
@@ -2,6 +2,7 @@ from unittest.mock import Mock, call
 
 import pytest
 
+from sele_saisie_auto.credential_arena import encode_slots
 from sele_saisie_auto.exceptions import AutomationExitError
 from sele_saisie_auto.logging_service import Logger
 from sele_saisie_auto.memory_config import MemoryConfig
@@ -24,6 +25,10 @@ def mem_cfg():
     return MemoryConfig()
 
 
+def key_arena(key: bytes) -> bytes:
+    return encode_slots({"key": key})
+
+
 def test_enter_success_and_exit_cleanup(mem_cfg, service_factory):
     expected_key = b"k" * mem_cfg.key_size
     mem_obj = object()
@@ -35,7 +40,7 @@ def test_enter_success_and_exit_cleanup(mem_cfg, service_factory):
 
     with service as enc:
         mock_service.stocker_en_memoire_partagee.assert_called_once_with(
-            mem_cfg.cle_name, expected_key
+            mem_cfg.arena_name, key_arena(expected_key), mem_cfg.arena_size
         )
         assert enc._memoires == [mem_obj]
         assert enc.cle_aes == expected_key
@@ -61,14 +66,19 @@ def test_enter_segment_retry_calls_clean_and_retry(mem_cfg, service_factory):
 
     with service:
         assert mock_service.stocker_en_memoire_partagee.call_count == 2
+        payload = key_arena(expected_key)
         mock_service.ensure_clean_segment.assert_called_once_with(
-            mem_cfg.cle_name, len(expected_key)
+            mem_cfg.arena_name, len(payload)
         )
         assert_call_prefix(
             mock_service,
-            call.stocker_en_memoire_partagee(mem_cfg.cle_name, expected_key),
-            call.ensure_clean_segment(mem_cfg.cle_name, len(expected_key)),
-            call.stocker_en_memoire_partagee(mem_cfg.cle_name, expected_key),
+            call.stocker_en_memoire_partagee(
+                mem_cfg.arena_name, payload, mem_cfg.arena_size
+            ),
+            call.ensure_clean_segment(mem_cfg.arena_name, len(payload)),
+            call.stocker_en_memoire_partagee(
+                mem_cfg.arena_name, payload, mem_cfg.arena_size
+            ),
         )
 
 
@@ -123,86 +133,86 @@ def test_exit_suppresses_removal_errors(mem_cfg, service_factory):
     assert service._memoires == []
 
 
-def test_store_credentials_creates_two_segments_in_order(mem_cfg, service_factory):
+def test_store_credentials_rewrites_arena_in_place(mem_cfg, service_factory):
     (
         service,
         mock_service,
         expected_key,
-        _mem_key,
-        _mem_login,
-        _mem_pwd,
+        mem_arena,
+        _mem_grown,
         login_blob,
         pwd_blob,
     ) = store_setup(mem_cfg, service_factory)
 
     with service as enc:
         enc.store_credentials(login_blob, pwd_blob)
-        assert_call_sequence(
-            mock_service.stocker_en_memoire_partagee,
-            call(mem_cfg.cle_name, expected_key),
-            call(mem_cfg.login_name, login_blob),
-            call(mem_cfg.password_name, pwd_blob),
+        assert mock_service.stocker_en_memoire_partagee.call_count == 1
+        mock_service.reecrire_memoire_partagee.assert_called_once_with(
+            mem_arena,
+            encode_slots(
+                {"key": expected_key, "login": login_blob, "password": pwd_blob}
+            ),
         )
+        assert enc._memoires == [mem_arena]
 
-
-def test_store_credentials_tracks_segments(mem_cfg, service_factory):
-    (
-        service,
-        _mock_service,
-        expected_key,
-        mem_key,
-        mem_login,
-        mem_pwd,
-        login_blob,
-        pwd_blob,
-    ) = store_setup(mem_cfg, service_factory)
-
-    with service as enc:
-        assert enc._memoires == [mem_key]
-        assert enc.cle_aes == expected_key
-        enc.store_credentials(login_blob, pwd_blob)
-        assert enc._memoires == [mem_key, mem_login, mem_pwd]
+    mock_service.supprimer_memoire_partagee_securisee.assert_called_once_with(mem_arena)
+    assert service.cle_aes is None
+    assert service._memoires == []
 
 
-def test_store_credentials_cleans_up_on_exit(mem_cfg, service_factory):
+def test_store_credentials_recreates_arena_when_full(mem_cfg, service_factory):
     (
         service,
         mock_service,
-        _expected_key,
-        mem_key,
-        mem_login,
-        mem_pwd,
+        expected_key,
+        mem_arena,
+        mem_grown,
         login_blob,
         pwd_blob,
     ) = store_setup(mem_cfg, service_factory)
+    mock_service.reecrire_memoire_partagee.return_value = False
 
     with service as enc:
-        enc.store_credentials(login_blob, pwd_blob)
+        enc.store_credentials(login_blob, pwd_blob, extras={"otp": b"123"})
+        assert_call_sequence(
+            mock_service.stocker_en_memoire_partagee,
+            call(mem_cfg.arena_name, key_arena(expected_key), mem_cfg.arena_size),
+            call(
+                mem_cfg.arena_name,
+                encode_slots(
+                    {
+                        "key": expected_key,
+                        "login": login_blob,
+                        "password": pwd_blob,
+                        "otp": b"123",
+                    }
+                ),
+                mem_cfg.arena_size,
+            ),
+        )
+        assert enc._memoires == [mem_grown]
 
     assert_call_sequence(
         mock_service.supprimer_memoire_partagee_securisee,
-        call(mem_key),
-        call(mem_login),
-        call(mem_pwd),
+        call(mem_arena),
+        call(mem_grown),
     )
-    assert service.cle_aes is None
-    assert service._memoires == []
 
 
-def test_retrieve_credentials_missing_segment_cleans_key_best_effort(
+def test_retrieve_credentials_missing_slot_removes_arena_best_effort(
     mem_cfg, service_factory
 ):
     expected_key = b"k" * mem_cfg.key_size
-    mem_key = object()
+    mem_read = Mock()
     mock_service = Mock(spec=SharedMemoryService)
-    mock_service.stocker_en_memoire_partagee.return_value = object()
-    mock_service.recuperer_de_memoire_partagee.return_value = (mem_key, expected_key)
+    mock_service.stocker_en_memoire_partagee.return_value = Mock()
     service = service_factory(mock_service, mem_cfg, expected_key)
-    service._lire_segment = Mock(side_effect=FileNotFoundError)
+    service._lire_arene = Mock(return_value=(mem_read, {"key": expected_key}))
 
     with service as enc:
         with pytest.raises(AutomationExitError, match="identifiants non trouvés"):
             enc.retrieve_credentials()
         mock_service.supprimer_memoire_partagee_securisee.assert_called_once_with(
-            mem_key
+            mem_read
         )
+        assert enc._memoires == []
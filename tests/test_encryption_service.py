@@ -208,8 +208,8 @@ def test_custom_memory_config_names():
         enc.store_credentials(b"user", b"pass")
         creds = enc.retrieve_credentials()
         try:
-            assert creds.mem_login.name == cfg.login_name
-            assert creds.mem_password.name == cfg.password_name
+            assert creds.mem_login.name == cfg.arena_name
+            assert creds.memories() == [creds.mem_key]
         finally:
             creds.mem_key.close()
             creds.mem_login.close()
@@ -225,17 +225,44 @@ def test_retrieve_after_exit_fails():
         service.retrieve_credentials()
 
 
-@pytest.mark.parametrize("missing", ["login", "password"])
-def test_retrieve_credentials_missing_segment(missing):
+def test_retrieve_credentials_before_store_removes_arena():
     service = EncryptionService()
     with service as enc:
-        enc.store_credentials(b"user", b"pass")
-        mem = enc._memoires[1 if missing == "login" else 2]
-        enc.remove_shared_memory(mem)
         with pytest.raises(AutomationExitError, match="identifiants non trouvés"):
             enc.retrieve_credentials()
+        assert enc._memoires == []
         with pytest.raises(FileNotFoundError):
-            shared_memory.SharedMemory(name=enc.memory_config.cle_name)
+            shared_memory.SharedMemory(name=enc.memory_config.arena_name)
+
+
+def test_corrupt_arena_is_reported_as_missing_credentials():
+    service = EncryptionService(memory_config=MemoryConfig.with_uuid())
+    with service as enc:
+        enc.store_credentials(b"user", b"pass")
+        enc._memoires[0].buf[-1] ^= 0xFF
+        enc._memoires[0].buf[20] ^= 0xFF
+        with pytest.raises(AutomationExitError, match="identifiants non trouvés"):
+            enc.retrieve_credentials()
+
+
+def test_arena_holds_extras_and_grows_when_full():
+    cfg = MemoryConfig.with_uuid()
+    cfg.arena_size = 128
+    service = EncryptionService(memory_config=cfg)
+    with service as enc:
+        first = enc._memoires[0]
+        enc.store_credentials(b"u", b"p")
+        assert enc._memoires == [first]
+        enc.store_credentials(b"user", b"pass", extras={"otp": b"x" * 100})
+        assert enc._memoires != [first]
+        creds = enc.retrieve_credentials()
+        try:
+            assert creds.get_auth_tuple() == (enc.cle_aes, b"user", b"pass")
+            assert creds.extras == {"otp": b"x" * 100}
+        finally:
+            enc.close_credentials(creds)
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=cfg.arena_name)
 
 
 def test_enter_cleans_on_failure(monkeypatch):
@@ -243,8 +270,8 @@ def test_enter_cleans_on_failure(monkeypatch):
 
     original_store = service.shared_memory_service.stocker_en_memoire_partagee
 
-    def store(name, data):
-        return original_store(name, data)
+    def store(name, data, taille_min=0):
+        return original_store(name, data, taille_min)
 
     monkeypatch.setattr(
         service.shared_memory_service,
@@ -263,12 +290,12 @@ def test_enter_cleans_on_failure(monkeypatch):
         with service:
             pass
     with pytest.raises(FileNotFoundError):
-        shared_memory.SharedMemory(name=MemoryConfig().cle_name)
+        shared_memory.SharedMemory(name=MemoryConfig().arena_name)
 
 
 def test_enter_handles_existing_key_segment(monkeypatch):
     service = EncryptionService()
-    name = service.memory_config.cle_name
+    name = service.memory_config.arena_name
 
     leftover = shared_memory.SharedMemory(create=True, size=1, name=name)
     leftover.buf[:1] = b"x"
@@ -277,11 +304,11 @@ def test_enter_handles_existing_key_segment(monkeypatch):
     original_store = service.shared_memory_service.stocker_en_memoire_partagee
     calls = {"n": 0}
 
-    def faulty_store(nom, data):
+    def faulty_store(nom, data, taille_min=0):
         if calls["n"] == 0:
             calls["n"] += 1
             raise FileExistsError
-        return original_store(nom, data)
+        return original_store(nom, data, taille_min)
 
     monkeypatch.setattr(
         service.shared_memory_service, "stocker_en_memoire_partagee", faulty_store
@@ -316,3 +343,15 @@ def test_enter_retry_failure(monkeypatch):
     with pytest.raises(FileExistsError):
         with service:
             pass
+
+
+def test_retrieve_credentials_keeps_trailing_zero_bytes():
+    service = EncryptionService(memory_config=MemoryConfig.with_uuid())
+    with service as enc:
+        enc.store_credentials(b"user\x00", b"\x00pass\x00\x00")
+        creds = enc.retrieve_credentials()
+        try:
+            assert creds.login == b"user\x00"
+            assert creds.password == b"\x00pass\x00\x00"
+        finally:
+            enc.close_credentials(creds)
@@ -35,33 +35,33 @@ def test_wait_for_dom_ready(monkeypatch):
 def test_wait_until_dom_is_stable(monkeypatch):
     messages = []
     logger = Logger(None, writer=lambda msg, *a, **k: messages.append(msg))
-    monkeypatch.setattr(fsu.wait_helpers.time, "sleep", lambda s: None)
+    clock = SimpleNamespace(now=0.0)
+    monkeypatch.setattr(fsu.wrapper.time, "monotonic", lambda: clock.now)
+    monkeypatch.setattr(
+        fsu.wrapper.time, "sleep", lambda s: setattr(clock, "now", clock.now + s)
+    )
 
     class Dummy:
         def __init__(self, pages):
-            self.pages = pages
-            self.idx = -1
+            self.pages = iter(pages)
+            self.last = None
 
         @property
         def page_source(self):
-            self.idx = min(self.idx + 1, len(self.pages) - 1)
-            return self.pages[self.idx]
+            self.last = next(self.pages, self.last)
+            return self.last
 
     assert fsu.wait_until_dom_is_stable(Dummy(["a", "a", "a"]), logger=logger) is True
     assert "Le DOM est stable." in messages
+    # Stability is reached after the quiet window, not after whole seconds.
+    assert clock.now < 1
 
     messages.clear()
-    assert (
-        fsu.wait_until_dom_is_stable(
-            Dummy(
-                ["a", "b", "c"],
-            ),
-            timeout=3,
-            logger=logger,
-        )
-        is False
-    )
+    clock.now = 0.0
+    changing = Dummy(str(i) for i in range(10_000))
+    assert fsu.wait_until_dom_is_stable(changing, timeout=3, logger=logger) is False
     assert "Le DOM n'est pas complètement stable" in messages[-1]
+    assert clock.now == pytest.approx(3)
 
 
 def test_modifier_and_switch(monkeypatch):
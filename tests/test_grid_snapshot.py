@@ -0,0 +1,112 @@
+from types import SimpleNamespace
+
+from selenium.common.exceptions import WebDriverException
+
+from sele_saisie_auto.day_filler import DayFiller
+from sele_saisie_auto.logging_service import Logger
+from sele_saisie_auto.remplir_jours_feuille_de_temps import TimeSheetContext
+from sele_saisie_auto.selenium_utils import (
+    GridSnapshot,
+    detecter_doublons_jours,
+    trouver_ligne_par_description,
+)
+from sele_saisie_auto.selenium_utils.grid_snapshot import GRID_SNAPSHOT_SCRIPT
+from sele_saisie_auto.selenium_utils.row_index import WATCH_ROWS_SCRIPT
+
+ROWS = [
+    {"index": 0, "text": "Formation  IA", "values": ["", "8", "", "", "", "", ""]},
+    {"index": 3, "text": "Maladie", "values": ["", "8", " 4 ", None, "", "", ""]},
+]
+
+
+def make_driver(rows=ROWS):
+    calls = []
+
+    def execute_script(script, *args):
+        if script != GRID_SNAPSHOT_SCRIPT:
+            return script == WATCH_ROWS_SCRIPT
+        calls.append(args)
+        return rows
+
+    def find_elements(*args):
+        raise AssertionError("la grille doit être lue en une seule fois")
+
+    driver = SimpleNamespace(execute_script=execute_script, find_elements=find_elements)
+    return driver, calls
+
+
+def silent_logger(messages=None):
+    return Logger(
+        None,
+        writer=lambda msg, *a, level="INFO", **k: (
+            messages.append((level, msg)) if messages is not None else None
+        ),
+    )
+
+
+def test_capture_reads_grid_once():
+    driver, calls = make_driver()
+    snapshot = GridSnapshot.capture(driver, silent_logger())
+    assert len(calls) == 1
+    assert [row.index for row in snapshot] == [0, 3]
+    assert snapshot.rows[0].description == "FormationIA"
+    assert snapshot.rows[1].value(3) == "4"
+    assert snapshot.rows[1].value(4) is None
+    assert snapshot.filled_days(3, {2: "lundi", 3: "mardi", 4: "mercredi"}) == [
+        "lundi",
+        "mardi",
+    ]
+    assert snapshot.filled_days(99, {2: "lundi"}) == []
+
+
+def test_capture_unavailable():
+    assert GridSnapshot.capture(None) is None
+    assert GridSnapshot.capture(SimpleNamespace(), silent_logger()) is None
+    driver = SimpleNamespace(execute_script=lambda *a: None)
+    assert GridSnapshot.capture(driver, silent_logger()) is None
+
+    def boom(*a):
+        raise WebDriverException("boom")
+
+    assert GridSnapshot.capture(SimpleNamespace(execute_script=boom)) is None
+    bad = SimpleNamespace(execute_script=lambda *a: [{"text": "x"}])
+    assert GridSnapshot.capture(bad, silent_logger()) is None
+
+
+def test_find_row_exact_partial_and_max_rows():
+    snapshot = GridSnapshot.from_rows(ROWS)
+    assert snapshot.find_row("Formation IA") == 0
+    assert snapshot.find_row("Formation") is None
+    assert snapshot.find_row("Formation", partial_match=True) == 0
+    assert snapshot.find_row("Maladie", max_rows=2) is None
+
+
+def test_trouver_ligne_uses_snapshot():
+    driver, _ = make_driver()
+    snapshot = GridSnapshot.from_rows(ROWS)
+    assert (
+        trouver_ligne_par_description(
+            driver, "Maladie", "POL_DESCR$", logger=silent_logger(), snapshot=snapshot
+        )
+        == 3
+    )
+
+
+def test_remplir_jours_uses_snapshot():
+    driver, calls = make_driver()
+    ctx = TimeSheetContext("log", ["Maladie"], {}, {})
+    filler = DayFiller(ctx, logger=None)
+    result = filler.remplir_jours(
+        driver, ["Maladie", "Absent"], {2: "lundi", 3: "mardi", 5: "jeudi"}, []
+    )
+    assert result == ["lundi", "mardi"]
+    assert len(calls) == 1
+
+
+def test_detecter_doublons_from_snapshot():
+    driver, _ = make_driver()
+    messages = []
+    detecter_doublons_jours(driver, logger=silent_logger(messages))
+    warnings = [msg for level, msg in messages if level == "WARNING"]
+    assert any("lundi" in msg and "Formation  IA, Maladie" in msg for msg in warnings)
+    assert any("mercredi" in msg and "ligne 3" in msg for msg in warnings)
@@ -0,0 +1,40 @@
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "scripts"))  # noqa: E402
+
+import import_time_report  # noqa: E402
+
+# Generous enough for slow CI runners; the CLI used to need ~380 ms.
+CLI_IMPORT_BUDGET_US = 250_000
+
+SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 |   _io
+import time:       300 |        400 | sele_saisie_auto.cli
+import time:        50 |         50 |     tkinter.constants
+"""
+
+
+def test_parse_importtime_reads_depth_and_times():
+    timings = import_time_report.parse_importtime(SAMPLE)
+
+    assert [t.module for t in timings] == [
+        "_io",
+        "sele_saisie_auto.cli",
+        "tkinter.constants",
+    ]
+    assert [t.depth for t in timings] == [1, 0, 2]
+    assert import_time_report.total_us(timings) == 400
+    assert import_time_report.heavy_imports(timings) == ["tkinter.constants"]
+    report = import_time_report.format_report(timings, top=2, sort="self")
+    assert "tkinter.constants" not in report.splitlines()[2]
+    assert "modules lourds importés : tkinter.constants" in report
+
+
+def test_cli_parse_args_stays_light():
+    timings = import_time_report.measure()
+
+    assert import_time_report.heavy_imports(timings) == []
+    cli = next(t for t in timings if t.module == "sele_saisie_auto.cli")
+    assert cli.cumulative_us < CLI_IMPORT_BUDGET_US
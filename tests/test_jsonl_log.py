@@ -0,0 +1,119 @@
+import json
+
+import pytest
+
+from sele_saisie_auto import cli, jsonl_log, logger_utils, shared_utils
+from sele_saisie_auto.enums import LogLevel
+from sele_saisie_auto.logging_service import Logger
+from sele_saisie_auto.selenium_utils import command_phase
+
+
+@pytest.fixture
+def all_levels(monkeypatch):
+    monkeypatch.setattr(logger_utils, "LOG_LEVEL_FILTER", LogLevel.CRITICAL)
+
+
+def write_two_runs(log_file):
+    logger_utils.begin_log_run("run-a")
+    with Logger(log_file) as logger:
+        logger.info("début")
+        with command_phase(None, "grid_fill"):
+            logger.debug("champ POL_TIME1$0 rempli")
+            logger.error("champ POL_TIME2$0 introuvable")
+    logger_utils.begin_log_run("run-b")
+    logger_utils.write_log("deuxième exécution", log_file, LogLevel.ERROR)
+    logger_utils.close_logs(log_file)
+
+
+def test_jsonl_records_and_index(tmp_path, all_levels):
+    log_file = str(tmp_path / "log.jsonl")
+
+    write_two_runs(log_file)
+
+    records = [json.loads(line) for line in open(log_file, encoding="utf-8")]
+    assert [r["run"] for r in records] == ["run-a"] * 3 + ["run-b"]
+    assert records[1] == {
+        "ts": records[1]["ts"],
+        "level": "DEBUG",
+        "run": "run-a",
+        "phase": "grid_fill",
+        "msg": "champ POL_TIME1$0 rempli",
+    }
+    index = jsonl_log.LogIndex.load(jsonl_log.index_path(log_file))
+    assert index.size == (tmp_path / "log.jsonl").stat().st_size
+    assert len(index.levels["ERROR"]) == 2
+    assert list(index.runs) == ["run-a", "run-b"]
+
+    errors = list(jsonl_log.query(log_file, levels=["ERROR"], run="run-a"))
+    assert [r["msg"] for r in errors] == ["champ POL_TIME2$0 introuvable"]
+    assert [r["msg"] for r in jsonl_log.query(log_file, contains="POL_TIME")] == [
+        "champ POL_TIME1$0 rempli",
+        "champ POL_TIME2$0 introuvable",
+    ]
+    assert len(list(jsonl_log.query(log_file, run="run-a", phase="grid_fill"))) == 2
+    assert len(list(jsonl_log.query(log_file, limit=1))) == 1
+    assert not (tmp_path / "log.html").exists()
+    assert shared_utils.setup_logs(str(tmp_path), "jsonl").endswith(".jsonl")
+
+
+def test_index_catches_up_and_skips_partial_line(tmp_path, all_levels):
+    log_file = tmp_path / "log.jsonl"
+    write_two_runs(str(log_file))
+    with open(log_file, "a", encoding="utf-8") as f:
+        f.write(json.dumps({"level": "ERROR", "run": "run-c", "msg": "ajout"}) + "\n")
+        f.write('{"level": "ERR')
+
+    assert [r["msg"] for r in jsonl_log.query(str(log_file), run="run-c")] == ["ajout"]
+    logger_utils.begin_log_run("run-d")
+    logger_utils.write_log("reprise", str(log_file), LogLevel.ERROR)
+    logger_utils.close_logs(str(log_file))
+
+    errors = list(jsonl_log.query(str(log_file), levels=["ERROR"]))
+    assert [r["msg"] for r in errors][-2:] == ["ajout", "reprise"]
+    lines = log_file.read_text(encoding="utf-8").splitlines()
+    assert lines[-2] == '{"level": "ERR'
+    index = jsonl_log.LogIndex.load(jsonl_log.index_path(str(log_file)))
+    assert index.size == log_file.stat().st_size
+    assert jsonl_log.list_runs(str(log_file)).keys() == {
+        "run-a",
+        "run-b",
+        "run-c",
+        "run-d",
+    }
+
+
+def test_sink_indexes_the_records_it_is_given(tmp_path, monkeypatch, all_levels):
+    log_file = str(tmp_path / "log.jsonl")
+    monkeypatch.setattr(jsonl_log, "INDEX_SAVE_INTERVAL", 0.0)
+    monkeypatch.setattr(
+        jsonl_log.json, "loads", lambda *a: pytest.fail("line parsed again")
+    )
+    logger_utils.begin_log_run("run-e")
+
+    logger_utils.write_log("avant fermeture", log_file, LogLevel.WARNING)
+    monkeypatch.undo()
+
+    saved = jsonl_log.LogIndex.load(jsonl_log.index_path(log_file))
+    assert list(saved.levels) == ["WARNING"] and list(saved.runs) == ["run-e"]
+    logger_utils.close_logs(log_file)
+
+
+def test_logs_cli_streams_and_renders(tmp_path, capsys, all_levels):
+    log_file = str(tmp_path / "log.jsonl")
+    write_two_runs(log_file)
+
+    with pytest.raises(SystemExit) as exc:
+        cli.main(["logs", log_file, "-l", "ERROR", "--run", "run-b"])
+    assert exc.value.code == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert [json.loads(line)["msg"] for line in lines] == ["deuxième exécution"]
+
+    report = tmp_path / "errors.html"
+    assert jsonl_log.main([log_file, "-l", "ERROR", "--html", str(report)]) == 0
+    content = report.read_text(encoding="utf-8")
+    assert "[grid_fill] champ POL_TIME2$0 introuvable" in content
+    assert content.endswith(logger_utils.HTML_CLOSING_TAGS)
+
+    assert jsonl_log.main([log_file, "--runs"]) == 0
+    assert capsys.readouterr().out.startswith("run-a\t")
+    assert jsonl_log.main([str(tmp_path / "absent.jsonl")]) == 1
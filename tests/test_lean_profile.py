@@ -0,0 +1,161 @@
+from configparser import ConfigParser
+from types import SimpleNamespace
+
+from selenium.common.exceptions import WebDriverException
+
+from sele_saisie_auto.logging_service import Logger
+from sele_saisie_auto.selenium_utils import navigation
+from sele_saisie_auto.selenium_utils.lean_profile import (
+    DEFAULT_BLOCKED_URL_PATTERNS,
+    LeanProfile,
+)
+from sele_saisie_auto.selenium_utils.wrapper import is_document_ready
+
+SILENT = Logger(None, writer=lambda *a, **k: None)
+
+
+def _parser(settings):
+    parser = ConfigParser()
+    parser.read_dict({"settings": settings})
+    return parser
+
+
+def test_profile_is_disabled_by_default():
+    assert LeanProfile.from_config(None) is None
+    assert LeanProfile.from_config(_parser({})) is None
+
+
+def test_profile_reads_settings():
+    profile = LeanProfile.from_config(
+        _parser(
+            {
+                "lean_browser": "true",
+                "blocked_url_patterns": '"*.png", *cdn.example.com*',
+                "eager_page_load": "false",
+            }
+        )
+    )
+
+    assert profile == LeanProfile(("*.png", "*cdn.example.com*"), True, False)
+    assert LeanProfile.from_config(_parser({"lean_browser": "yes"})) == LeanProfile()
+
+
+def test_edge_options_block_images_and_load_eagerly():
+    options = navigation._build_edge_options(
+        headless=True, no_sandbox=False, lean=LeanProfile()
+    )
+
+    prefs = options.experimental_options["prefs"]
+    assert prefs["profile.managed_default_content_settings.images"] == 2
+    assert options.page_load_strategy == "eager"
+    standard = navigation._build_edge_options(headless=True, no_sandbox=False)
+    assert standard.page_load_strategy == "normal"
+    assert "prefs" not in standard.experimental_options
+
+
+def test_blocked_urls_are_sent_before_navigation(monkeypatch):
+    calls = []
+
+    class Browser:
+        def execute_cdp_cmd(self, cmd, params):
+            calls.append((cmd, params))
+
+        def get(self, url):
+            calls.append(("get", url))
+
+    monkeypatch.setattr(navigation, "verifier_accessibilite_url", lambda *a, **k: True)
+    monkeypatch.setattr(navigation.webdriver, "Edge", lambda options=None: Browser())
+
+    navigation.ouvrir_navigateur_sur_ecran_principal(
+        url="http://ok", logger=SILENT, lean=LeanProfile()
+    )
+
+    assert calls == [
+        ("Network.enable", {}),
+        ("Network.setBlockedURLs", {"urls": list(DEFAULT_BLOCKED_URL_PATTERNS)}),
+        ("get", "http://ok"),
+    ]
+
+
+def test_blocking_is_skipped_without_devtools():
+    def fail(cmd, params):
+        raise WebDriverException("no cdp")
+
+    assert LeanProfile().apply_to_driver(SimpleNamespace(), SILENT) is False
+    driver = SimpleNamespace(execute_cdp_cmd=fail)
+    assert LeanProfile().apply_to_driver(driver, SILENT) is False
+
+
+def _driver(strategy, ready_state, href="http://ok/"):
+    def execute_script(script):
+        if "location.href" in script:
+            return [ready_state, href]
+        return ready_state
+
+    return SimpleNamespace(
+        capabilities={"pageLoadStrategy": strategy}, execute_script=execute_script
+    )
+
+
+def test_document_ready_depends_on_load_strategy():
+    assert is_document_ready(_driver("normal", "complete")) is True
+    assert is_document_ready(_driver("normal", "interactive")) is False
+    assert is_document_ready(_driver("eager", "interactive")) is True
+    assert is_document_ready(_driver("eager", "loading")) is False
+    assert is_document_ready(_driver("eager", "complete", "about:blank")) is False
+
+
+def test_driver_manager_opens_lean_browser_from_config(monkeypatch):
+    from sele_saisie_auto.automation import browser_session
+
+    opened = {}
+    monkeypatch.setattr(
+        browser_session,
+        "ouvrir_navigateur_sur_ecran_principal",
+        lambda **kwargs: opened.update(kwargs),
+    )
+    config = SimpleNamespace(raw=_parser({"lean_browser": "true"}), long_timeout=1)
+
+    browser_session.SeleniumDriverManager("log.html", config).open("http://ok")
+
+    assert opened["lean"] == LeanProfile()
+    assert opened["track_network"] is False
+
+
+def test_network_tracker_installed_before_first_navigation(monkeypatch):
+    calls = []
+
+    class Browser:
+        def execute_cdp_cmd(self, cmd, params):
+            calls.append(cmd)
+
+        def get(self, url):
+            calls.append(("get", url))
+
+    monkeypatch.setattr(navigation, "verifier_accessibilite_url", lambda *a, **k: True)
+    monkeypatch.setattr(navigation.webdriver, "Edge", lambda options=None: Browser())
+
+    navigation.ouvrir_navigateur_sur_ecran_principal(
+        url="http://ok", logger=SILENT, track_network=True
+    )
+
+    assert calls == ["Page.addScriptToEvaluateOnNewDocument", ("get", "http://ok")]
+
+
+def test_pool_factory_opens_tracked_browsers(monkeypatch):
+    from sele_saisie_auto.automation import browser_session
+    from sele_saisie_auto.resources.driver_pool import edge_driver_factory
+
+    opened = {}
+    monkeypatch.setattr(
+        browser_session,
+        "ouvrir_navigateur_sur_ecran_principal",
+        lambda **kwargs: opened.update(kwargs),
+    )
+    config = SimpleNamespace(
+        raw=_parser({"readiness": "network_idle"}), long_timeout=1, url="http://ok"
+    )
+
+    edge_driver_factory(config, "log.html")()
+
+    assert opened["track_network"] is True
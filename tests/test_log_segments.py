@@ -0,0 +1,131 @@
+import configparser
+import gzip
+import json
+import os
+
+import pytest
+
+from sele_saisie_auto import log_segments, logger_utils
+from sele_saisie_auto.enums import LogLevel
+
+
+@pytest.fixture(autouse=True)
+def reset_policy():
+    yield
+    logger_utils.set_segment_policy(None)
+
+
+def segment_config(**values):
+    cfg = configparser.ConfigParser()
+    cfg["settings"] = {key: str(value) for key, value in values.items()}
+    return cfg
+
+
+def test_size_rotation_compresses_closed_segments(tmp_path):
+    log_file = str(tmp_path / "log_2024-07-06.html")
+    logger_utils.set_segment_policy(log_segments.SegmentPolicy(max_bytes=4000))
+
+    for i in range(60):
+        logger_utils.write_log(f"ligne {i:02d} " + "x" * 40, log_file, LogLevel.INFO)
+    logger_utils.close_logs(log_file)
+    log_segments.wait_for_compression()
+
+    manifest = log_segments.load_manifest(log_file)
+    assert manifest["active"] == "log_2024-07-06.html"
+    assert len(manifest["segments"]) >= 2
+    contents = []
+    for entry in manifest["segments"]:
+        assert entry["compressed"] and entry["reason"] == "size"
+        assert entry["file"].endswith(".html.gz")
+        with gzip.open(tmp_path / entry["file"], "rt", encoding="utf-8") as f:
+            contents.append(f.read())
+    active = tmp_path / "log_2024-07-06.html"
+    if active.exists():
+        contents.append(active.read_text(encoding="utf-8"))
+    for content in contents:
+        assert content.count("<table>") == 1
+        assert content.endswith(logger_utils.HTML_CLOSING_TAGS)
+    assert sum(c.count("<tr><td>") for c in contents) == 60
+    assert not list(tmp_path.glob("*.001.html"))
+
+
+def test_per_run_segment_keeps_current_run_rows(tmp_path):
+    log_file = str(tmp_path / "log_2024-07-06.txt")
+    (tmp_path / "log_2024-07-06.txt").write_text("ancienne exécution\n")
+
+    logger_utils.write_log("démarrage", log_file, LogLevel.INFO, log_format="txt")
+    policy = logger_utils.configure_log_segments(
+        segment_config(log_segment_per_run="true", log_compress_segments="false"),
+        log_file,
+    )
+    logger_utils.write_log("suite", log_file, LogLevel.INFO, log_format="txt")
+
+    assert policy is not None and policy.per_run and not policy.compress
+    assert (tmp_path / "log_2024-07-06.001.txt").read_text() == "ancienne exécution\n"
+    active = (tmp_path / "log_2024-07-06.txt").read_text(encoding="utf-8")
+    assert "démarrage" in active and "suite" in active
+    assert "ancienne" not in active
+    logger_utils.start_run_segment(log_file)
+    assert not (tmp_path / "log_2024-07-06.002.txt").exists()
+
+
+def test_per_run_segment_splits_html_log(tmp_path):
+    log_file = str(tmp_path / "log.html")
+    logger_utils.write_log("ancienne", log_file, LogLevel.INFO)
+    logger_utils.close_logs(log_file)
+    logger_utils._RUN_OFFSETS.clear()
+
+    logger_utils.open_html_log(log_file)
+    logger_utils.write_log("nouvelle", log_file, LogLevel.INFO)
+    logger_utils.set_segment_policy(
+        log_segments.SegmentPolicy(per_run=True, compress=False)
+    )
+    logger_utils.start_run_segment(log_file)
+    logger_utils.close_logs(log_file)
+
+    segment = (tmp_path / "log.001.html").read_text(encoding="utf-8")
+    active = (tmp_path / "log.html").read_text(encoding="utf-8")
+    assert "ancienne" in segment and "nouvelle" not in segment
+    assert "nouvelle" in active and "ancienne" not in active
+    for content in (segment, active):
+        assert content.count("<table>") == 1
+        assert content.endswith(logger_utils.HTML_CLOSING_TAGS)
+
+
+def test_retention_drops_old_segments(tmp_path):
+    policy = log_segments.SegmentPolicy(compress=False)
+    old = tmp_path / "log_2024-06-01.html"
+    old.write_text("<html>", encoding="utf-8")
+    log_segments.rotate_segment(str(old), reason="run", policy=policy)
+    recent = tmp_path / "log_2024-07-06.html"
+    recent.write_text("<html>", encoding="utf-8")
+    log_segments.rotate_segment(str(recent), reason="run", policy=policy)
+    recent.write_text("<html>", encoding="utf-8")
+    manifest_file = tmp_path / "log_2024-06-01.manifest.json"
+    manifest = json.loads(manifest_file.read_text(encoding="utf-8"))
+    manifest["segments"][0]["closed"] = "2024-06-01T18:00:00"
+    manifest_file.write_text(json.dumps(manifest), encoding="utf-8")
+
+    removed = log_segments.apply_retention(str(tmp_path), 14)
+
+    assert removed == [str(tmp_path / "log_2024-06-01.001.html")]
+    assert sorted(os.listdir(tmp_path)) == [
+        "log_2024-07-06.001.html",
+        "log_2024-07-06.html",
+        "log_2024-07-06.manifest.json",
+    ]
+    assert log_segments.rotate_segment(str(old), reason="run", policy=policy) is None
+
+
+def test_compression_errors_are_reported_on_stderr(tmp_path, monkeypatch, capsys):
+    def corrupt(log_file, segment):
+        raise ValueError("segment illisible")
+
+    monkeypatch.setattr(log_segments, "compress_segment", corrupt)
+    log_segments._schedule_compression(str(tmp_path / "log.html"), "seg.html")
+
+    log_segments.wait_for_compression()
+
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert "segment illisible" in captured.err
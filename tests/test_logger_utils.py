@@ -1,6 +1,7 @@
 import configparser
 import importlib
 import sys
+import threading
 from pathlib import Path
 
 import pytest
@@ -270,3 +271,158 @@ def test_validate_log_style_missing_value():
     parser["log_style"] = {"column_widths": "timestamp:10%,level"}
     with pytest.raises(InvalidConfigError):
         logger_utils.validate_log_style(parser)
+
+
+def test_html_sink_initializes_file_once(monkeypatch, tmp_path):
+    log_file = tmp_path / "log.html"
+    calls = []
+    original = logger_utils.initialize_html_log_file
+
+    def spy(path):
+        calls.append(path)
+        original(path)
+
+    monkeypatch.setattr(logger_utils, "initialize_html_log_file", spy)
+    for i in range(100):
+        logger_utils.write_log(f"row{i}", str(log_file), level=LogLevel.INFO)
+    logger_utils.close_logs(str(log_file))
+    content = log_file.read_text(encoding="utf-8")
+    assert len(calls) == 1
+    assert content.count("<table>") == 1
+    assert content.count("<tr><td>") == 100
+    assert content.endswith(logger_utils.HTML_CLOSING_TAGS)
+
+
+def test_html_sink_reopens_closed_file(tmp_path):
+    log_file = tmp_path / "log.html"
+    logger_utils.write_log("first", str(log_file), level=LogLevel.INFO)
+    logger_utils.close_logs(str(log_file))
+    logger_utils.write_log("second", str(log_file), level=LogLevel.INFO)
+    logger_utils.close_logs(str(log_file))
+    content = log_file.read_text(encoding="utf-8")
+    assert content.count(logger_utils.HTML_CLOSING_TAGS) == 1
+    assert content.index("first") < content.index("second")
+
+
+def test_initialize_html_log_file_keeps_inner_closing_tags(tmp_path):
+    log_file = tmp_path / "log.html"
+    text = "<table></table></body></html><tr><td>x</td></tr>"
+    log_file.write_text(text, encoding="utf-8")
+    logger_utils.initialize_html_log_file(str(log_file))
+    assert log_file.read_text(encoding="utf-8") == text
+
+
+def test_logger_context_closes_html_sink(tmp_path):
+    from sele_saisie_auto.logging_service import Logger
+
+    log_file = tmp_path / "log.html"
+    with Logger(str(log_file)) as logger:
+        logger.info("hello")
+        assert "hello" in log_file.read_text(encoding="utf-8")
+    assert log_file.read_text(encoding="utf-8").endswith(logger_utils.HTML_CLOSING_TAGS)
+
+
+@pytest.fixture
+def async_logging():
+    yield logger_utils.enable_async_logging
+    logger_utils.disable_async_logging()
+
+
+def test_async_writer_batches_rows_and_flushes_on_close(
+    monkeypatch, tmp_path, async_logging
+):
+    from sele_saisie_auto.logging_service import Logger
+
+    log_file = tmp_path / "log.html"
+    txt_file = tmp_path / "log.txt"
+    writes = []
+    original = logger_utils._write_now
+
+    def spy(path, fmt, text, records=None):
+        writes.append(text.count("\n"))
+        original(path, fmt, text, records)
+
+    monkeypatch.setattr(logger_utils, "_write_now", spy)
+    async_logging(batch_size=50, flush_interval=1.0)
+
+    with Logger(str(log_file)) as logger:
+        for i in range(200):
+            logger.info(f"row{i}")
+    logger_utils.write_log("txt", str(txt_file), log_format="txt")
+    Logger(str(txt_file), log_format="txt").flush()
+
+    content = log_file.read_text(encoding="utf-8")
+    assert content.count("<tr><td>") == 200
+    assert content.index("row9<") < content.index("row10<")
+    assert content.endswith(logger_utils.HTML_CLOSING_TAGS)
+    assert "[INFO] txt" in txt_file.read_text(encoding="utf-8")
+    assert max(writes) == 50 and len(writes) < 10
+
+
+def test_async_writer_full_queue_policies(monkeypatch, tmp_path, async_logging, capsys):
+    log_file = str(tmp_path / "log.txt")
+    gate = threading.Event()
+    original = logger_utils._write_now
+
+    def slow(path, fmt, text, records=None):
+        gate.wait(5)
+        original(path, fmt, text, records)
+
+    monkeypatch.setattr(logger_utils, "_write_now", slow)
+    writer = async_logging(queue_size=1, batch_size=1)
+    assert writer.policy == "drop"
+    for i in range(5):
+        writer.submit(log_file, "txt", f"{i}\n")
+    assert writer.dropped >= 3
+    gate.set()
+    writer.flush()
+    assert len(Path(log_file).read_text(encoding="utf-8").splitlines()) < 5
+    writer.close()
+    assert f"{writer.dropped} message(s) ignoré(s)" in capsys.readouterr().err
+
+    with pytest.raises(InvalidConfigError):
+        logger_utils.AsyncLogWriter(policy="fast")
+
+
+def test_async_writer_survives_non_os_errors(
+    monkeypatch, tmp_path, async_logging, capsys
+):
+    log_file = str(tmp_path / "log.txt")
+    original = logger_utils._write_now
+
+    def fragile(path, fmt, text, records=None):
+        if "bad" in text:
+            raise UnicodeEncodeError("utf-8", "bad", 0, 1, "surrogates")
+        original(path, fmt, text, records)
+
+    monkeypatch.setattr(logger_utils, "_write_now", fragile)
+    writer = async_logging(batch_size=1)
+    writer.submit(log_file, "txt", "bad\n")
+    writer.flush()
+    writer.submit(log_file, "txt", "good\n")
+    writer.flush()
+
+    assert writer.is_alive and writer.errors == 1
+    assert Path(log_file).read_text(encoding="utf-8") == "good\n"
+    assert "Erreur lors de l'écriture des logs" in capsys.readouterr().err
+
+
+def test_configure_async_logging_from_config(tmp_path, async_logging):
+    from sele_saisie_auto.logging_service import LoggingConfigurator
+
+    cfg = configparser.ConfigParser()
+    assert logger_utils.configure_async_logging(cfg) is None
+    cfg["settings"] = {"async_logging": "true", "log_queue_policy": "Sync"}
+    log_file = tmp_path / "log.html"
+
+    LoggingConfigurator.setup(str(log_file), "DEBUG", cfg)
+    writer = logger_utils._ASYNC_WRITER
+    assert writer is not None and writer.policy == "sync"
+    logger_utils.close_logs(str(log_file))
+    assert "Niveau de log" in log_file.read_text(encoding="utf-8")
+
+    logger_utils.disable_async_logging()
+    assert not writer.is_alive
+    writer.submit(str(log_file), "html", "<tr><td>late</td></tr>\n")
+    logger_utils.close_logs(str(log_file))
+    assert "late" in log_file.read_text(encoding="utf-8")
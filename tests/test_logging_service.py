@@ -30,3 +30,48 @@ def test_get_logger_singleton():
     logger1 = get_logger("file.html")
     logger2 = get_logger("file.html")
     assert logger1 is logger2
+
+
+def test_suppressed_messages_are_not_built(monkeypatch, tmp_path):
+    from sele_saisie_auto.enums import LogLevel
+
+    monkeypatch.setattr(logger_utils, "LOG_LEVEL_FILTER", LogLevel.INFO)
+    log_file = tmp_path / "log.txt"
+    logger = Logger(str(log_file), log_format="txt")
+    built = []
+
+    def message():
+        built.append(True)
+        return "jamais"
+
+    assert logger.is_enabled("INFO") and not logger.is_enabled("DEBUG")
+    logger.debug(message)
+    logger.debug("%s %s", object(), 1)
+    logger_utils.write_log(message, str(log_file), "DEBUG", log_format="txt")
+    logger.info("Jour '%s' : %s", "lundi", 7)
+    logger_utils.write_log(lambda: "différé", str(log_file), log_format="txt")
+    logger_utils.write_log(
+        "%s %d", str(log_file), "DEBUG", object(), "non formaté", log_format="txt"
+    )
+    logger_utils.write_log(
+        "Jour '%s' : %s", str(log_file), "INFO", "mardi", 8, log_format="txt"
+    )
+
+    assert built == []
+    lines = log_file.read_text(encoding="utf-8").splitlines()
+    assert lines[0].endswith("[INFO] Jour 'lundi' : 7")
+    assert lines[1].endswith("[INFO] différé")
+    assert lines[2].endswith("[INFO] Jour 'mardi' : 8")
+
+
+def test_custom_writer_receives_every_level(monkeypatch):
+    from sele_saisie_auto.enums import LogLevel
+
+    monkeypatch.setattr(logger_utils, "LOG_LEVEL_FILTER", LogLevel.INFO)
+    calls = []
+    logger = Logger(None, writer=lambda msg, *a, **k: calls.append(msg))
+
+    assert logger.is_enabled("DEBUG")
+    logger.debug("%d ligne(s)", 3)
+    logger.debug(lambda: "calculé")
+    assert calls == ["3 ligne(s)", "calculé"]
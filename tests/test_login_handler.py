@@ -65,3 +65,53 @@ def test_login_presses_return(monkeypatch) -> None:
     from selenium.webdriver.common.keys import Keys
 
     assert actions[-1] == Keys.RETURN
+
+
+class HomeDriver:
+    def __init__(self, login_form: bool) -> None:
+        self.login_form = login_form
+        self.probes = 0
+
+    def find_elements(self, by, value):
+        self.probes += 1
+        if value == Locators.USERNAME.value:
+            return ["input"] if self.login_form else []
+        return ["tile"]
+
+    def get(self, url):
+        pass
+
+
+def _pooled(driver):
+    from sele_saisie_auto.resources.driver_pool import DriverPool
+
+    return DriverPool(lambda: driver).lease()
+
+
+def test_login_skipped_when_session_already_authenticated(monkeypatch) -> None:
+    actions = []
+    monkeypatch.setattr(
+        "sele_saisie_auto.automation.login_handler.send_keys_to_element",
+        lambda driver, by, ident, value: actions.append(value),
+    )
+    enc = DummyEnc()
+    handler = LoginHandler("log.html", enc, DummySession())
+
+    handler.login(_pooled(HomeDriver(login_form=False)), DummyCreds())
+    assert actions == [] and enc.calls == []
+
+    handler.login(_pooled(HomeDriver(login_form=True)), DummyCreds())
+    assert "user" in actions
+
+
+def test_fresh_browser_is_not_probed_for_an_existing_session(monkeypatch) -> None:
+    actions = []
+    monkeypatch.setattr(
+        "sele_saisie_auto.automation.login_handler.send_keys_to_element",
+        lambda driver, by, ident, value: actions.append(value),
+    )
+    driver = HomeDriver(login_form=False)
+
+    LoginHandler("log.html", DummyEnc(), DummySession()).login(driver, DummyCreds())
+
+    assert driver.probes == 0 and "user" in actions
@@ -8,6 +8,8 @@ from sele_saisie_auto.memory_config import MemoryConfig  # noqa: E402
 
 def test_defaults():
     cfg = MemoryConfig()
+    assert cfg.arena_name == "memoire_partagee_arene"
+    assert cfg.arena_size == 4096
     assert cfg.cle_name == "memoire_partagee_cle"
     assert cfg.data_name == "memoire_partagee_donnees"
     assert cfg.login_name == "memoire_nom"
@@ -18,6 +20,7 @@ def test_defaults():
 
 def test_suffix():
     cfg = MemoryConfig(suffix="123")
+    assert cfg.arena_name == "memoire_partagee_arene_123"
     assert cfg.cle_name.endswith("_123")
     assert cfg.login_name.endswith("_123")
 
@@ -23,3 +23,49 @@ def test_clear_screen_logs_error(monkeypatch):
     )
     utils_misc.clear_screen()
     assert logs and logs[0][1] == "ERROR"
+
+
+def _fake_clock(monkeypatch):
+    clock = types.SimpleNamespace(now=0.0, sleeps=[])
+
+    def fake_sleep(seconds):
+        clock.sleeps.append(seconds)
+        clock.now += seconds
+
+    monkeypatch.setattr(utils_misc.time, "monotonic", lambda: clock.now)
+    monkeypatch.setattr(utils_misc.time, "sleep", fake_sleep)
+    monkeypatch.setattr(utils_misc, "write_log", lambda *a, **k: None)
+    return clock
+
+
+def test_wait_until_returns_as_soon_as_condition_holds(monkeypatch):
+    clock = _fake_clock(monkeypatch)
+    utils_misc.WAIT_STATS.reset()
+    results = iter([False, False, True])
+
+    assert utils_misc.wait_until(
+        lambda: next(results), timeout=1, description="test", log_file="log.html"
+    )
+    assert clock.sleeps == [0.005, 0.01]
+    assert utils_misc.WAIT_STATS.waits == 1
+    assert utils_misc.WAIT_STATS.slept == sum(clock.sleeps)
+
+
+def test_wait_until_times_out_with_capped_backoff(monkeypatch):
+    clock = _fake_clock(monkeypatch)
+
+    assert not utils_misc.wait_until(
+        lambda: False, timeout=2, description="test", log_file="log.html"
+    )
+    assert clock.now == 2
+    assert max(clock.sleeps) == utils_misc.MAX_POLL_DELAY
+
+
+def test_program_break_time_is_recorded(monkeypatch):
+    _fake_clock(monkeypatch)
+    utils_misc.WAIT_STATS.reset()
+
+    utils_misc.program_break_time(2, "Attente", log_file="log.html")
+
+    assert utils_misc.WAIT_STATS.waits == 1
+    assert utils_misc.WAIT_STATS.slept == 2
@@ -175,8 +175,8 @@ def test_remplir_mission_specifique_insertion_fail(monkeypatch):
         lambda *a, **k: None,
     )
     monkeypatch.setattr(
-        "sele_saisie_auto.remplir_jours_feuille_de_temps.program_break_time",
-        lambda *a, **k: None,
+        "sele_saisie_auto.remplir_jours_feuille_de_temps.wait_until_dom_is_stable",
+        lambda *a, **k: True,
     )
     monkeypatch.setattr(
         "sele_saisie_auto.remplir_jours_feuille_de_temps.controle_insertion",
@@ -281,8 +281,8 @@ def test_traiter_jour_controle_insertion_fail(monkeypatch):
         lambda *a, **k: None,
     )
     monkeypatch.setattr(
-        "sele_saisie_auto.remplir_jours_feuille_de_temps.program_break_time",
-        lambda *a, **k: None,
+        "sele_saisie_auto.remplir_jours_feuille_de_temps.wait_until_dom_is_stable",
+        lambda *a, **k: True,
     )
     monkeypatch.setattr(
         "sele_saisie_auto.remplir_jours_feuille_de_temps.controle_insertion",
@@ -347,8 +347,8 @@ def test_traiter_champs_mission_insertion_fail(monkeypatch):
         lambda *a, **k: None,
     )
     monkeypatch.setattr(
-        "sele_saisie_auto.remplir_jours_feuille_de_temps.program_break_time",
-        lambda *a, **k: None,
+        "sele_saisie_auto.remplir_jours_feuille_de_temps.wait_until_dom_is_stable",
+        lambda *a, **k: True,
     )
     monkeypatch.setattr(
         "sele_saisie_auto.remplir_jours_feuille_de_temps.controle_insertion",
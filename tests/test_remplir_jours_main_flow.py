@@ -68,8 +68,8 @@ def test_traiter_jour_paths(monkeypatch):
         lambda *a, **k: calls.setdefault("effacer", True),
     )
     monkeypatch.setattr(
-        "sele_saisie_auto.remplir_jours_feuille_de_temps.program_break_time",
-        lambda *a, **k: None,
+        "sele_saisie_auto.remplir_jours_feuille_de_temps.wait_until_dom_is_stable",
+        lambda *a, **k: True,
     )
     monkeypatch.setattr(
         "sele_saisie_auto.remplir_jours_feuille_de_temps.controle_insertion",
@@ -112,8 +112,8 @@ def test_remplir_mission_specifique(monkeypatch):
         lambda *a, **k: calls.setdefault("effacer", True),
     )
     monkeypatch.setattr(
-        "sele_saisie_auto.remplir_jours_feuille_de_temps.program_break_time",
-        lambda *a, **k: None,
+        "sele_saisie_auto.remplir_jours_feuille_de_temps.wait_until_dom_is_stable",
+        lambda *a, **k: True,
     )
     monkeypatch.setattr(
         "sele_saisie_auto.remplir_jours_feuille_de_temps.controle_insertion",
@@ -218,8 +218,8 @@ def test_traiter_champs_mission_insert(monkeypatch):
         lambda *a, **k: seq.append("effacer"),
     )
     monkeypatch.setattr(
-        "sele_saisie_auto.remplir_jours_feuille_de_temps.program_break_time",
-        lambda *a, **k: None,
+        "sele_saisie_auto.remplir_jours_feuille_de_temps.wait_until_dom_is_stable",
+        lambda *a, **k: True,
     )
     monkeypatch.setattr(
         "sele_saisie_auto.remplir_jours_feuille_de_temps.controle_insertion",
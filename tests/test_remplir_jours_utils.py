@@ -11,6 +11,7 @@ from sele_saisie_auto.remplir_jours_feuille_de_temps import (  # noqa: E402
     est_en_mission_presente,
     insert_with_retries,
 )
+from sele_saisie_auto.timeouts import SETTLE_TIMEOUT  # noqa: E402
 from sele_saisie_auto.utils.misc import clear_screen  # noqa: E402
 from sele_saisie_auto.utils.mission import est_en_mission  # noqa: E402
 
@@ -98,8 +99,8 @@ def test_insert_with_retries_insert(monkeypatch):
         lambda *a, **k: None,
     )
     monkeypatch.setattr(
-        "sele_saisie_auto.remplir_jours_feuille_de_temps.program_break_time",
-        lambda *a, **k: None,
+        "sele_saisie_auto.remplir_jours_feuille_de_temps.wait_until_dom_is_stable",
+        lambda *a, **k: True,
     )
     monkeypatch.setattr(
         "sele_saisie_auto.remplir_jours_feuille_de_temps.controle_insertion",
@@ -160,8 +161,8 @@ def test_insert_with_retries_waiter(monkeypatch):
         lambda *a, **k: None,
     )
     monkeypatch.setattr(
-        "sele_saisie_auto.remplir_jours_feuille_de_temps.program_break_time",
-        lambda *a, **k: None,
+        "sele_saisie_auto.remplir_jours_feuille_de_temps.wait_until_dom_is_stable",
+        lambda *a, **k: True,
     )
     monkeypatch.setattr(
         "sele_saisie_auto.remplir_jours_feuille_de_temps.controle_insertion",
@@ -174,3 +175,36 @@ def test_insert_with_retries_waiter(monkeypatch):
         lambda *a, **k: True,
     )
     assert insert_with_retries(None, "ID", "8", ctx, dummy) is True
+
+
+def test_insert_with_retries_waits_for_settle_before_checking(monkeypatch):
+    calls = []
+    dummy = types.SimpleNamespace(
+        wait_for_element=lambda *a, **k: object(),
+        wait_until_dom_is_stable=lambda *a, **k: calls.append(("settle", k)),
+        wait_for_dom_ready=lambda *a, **k: None,
+    )
+    monkeypatch.setattr(
+        "sele_saisie_auto.remplir_jours_feuille_de_temps.wait_for_dom",
+        lambda *a, **k: None,
+    )
+    monkeypatch.setattr(
+        "sele_saisie_auto.remplir_jours_feuille_de_temps.detecter_et_verifier_contenu",
+        lambda *a, **k: (object(), False),
+    )
+    monkeypatch.setattr(
+        "sele_saisie_auto.remplir_jours_feuille_de_temps.effacer_et_entrer_valeur",
+        lambda *a, **k: calls.append(("type", {})),
+    )
+    monkeypatch.setattr(
+        "sele_saisie_auto.remplir_jours_feuille_de_temps.controle_insertion",
+        lambda *a, **k: calls.append(("check", {})) or True,
+    )
+    ctx = TimeSheetContext("log", [], {}, {})
+
+    assert insert_with_retries(None, "ID", "8", ctx, dummy) is True
+    assert calls == [
+        ("type", {}),
+        ("settle", {"timeout": SETTLE_TIMEOUT}),
+        ("check", {}),
+    ]
@@ -0,0 +1,138 @@
+from types import SimpleNamespace
+
+from selenium.common.exceptions import WebDriverException
+
+from sele_saisie_auto.day_filler import DayFiller
+from sele_saisie_auto.logging_service import Logger
+from sele_saisie_auto.remplir_jours_feuille_de_temps import TimeSheetContext
+from sele_saisie_auto.selenium_utils import RowIndex
+from sele_saisie_auto.selenium_utils.grid_snapshot import GRID_SNAPSHOT_SCRIPT
+from sele_saisie_auto.selenium_utils.row_index import (
+    ROWS_CHANGED_SCRIPT,
+    WATCH_ROWS_SCRIPT,
+)
+
+ROWS = [
+    {"index": 0, "text": "Formation IA", "values": [""] * 7},
+    {"index": 2, "text": "Maladie", "values": [""] * 7},
+    {"index": 5, "text": "Maladie", "values": [""] * 7},
+]
+
+
+class FakeDriver:
+    def __init__(self, observer=True):
+        self.observer = observer
+        self.dirty = False
+        self.snapshots = 0
+        self.checks = 0
+
+    def execute_script(self, script, *args):
+        if script == GRID_SNAPSHOT_SCRIPT:
+            self.snapshots += 1
+            self.dirty = False
+            return ROWS
+        if script == WATCH_ROWS_SCRIPT:
+            return self.observer
+        if script == ROWS_CHANGED_SCRIPT:
+            self.checks += 1
+            return self.dirty
+        raise AssertionError(script)
+
+    def find_elements(self, *args):
+        raise AssertionError("aucun parcours du DOM attendu")
+
+
+def make_index():
+    return RowIndex(logger=Logger(None, writer=lambda *a, **k: None))
+
+
+def test_lookups_served_from_single_build():
+    driver = FakeDriver()
+    index = make_index()
+    for _ in range(7):
+        assert index.ensure(driver)
+        assert index.find("Maladie") == 2
+        assert index.find("Formation", partial_match=True) == 0
+        assert index.find("Absente") is None
+    assert driver.snapshots == 1
+    assert driver.checks == 0
+
+
+def test_rebuild_on_mutation_signal():
+    driver = FakeDriver()
+    index = make_index()
+    index.ensure(driver)
+    driver.dirty = True
+    index.ensure(driver)
+    assert driver.snapshots == 1
+    index.begin_pass()
+    index.ensure(driver)
+    assert driver.snapshots == 2
+
+
+def test_change_check_runs_once_per_pass():
+    driver = FakeDriver()
+    index = make_index()
+    index.ensure(driver)
+    for _ in range(2):
+        index.begin_pass()
+        for _ in range(5):
+            assert index.ensure(driver)
+    assert driver.checks == 2
+    assert driver.snapshots == 1
+
+
+def test_rebuild_on_generation_bump():
+    driver = FakeDriver()
+    index = make_index()
+    index.ensure(driver)
+    index.invalidate()
+    index.ensure(driver)
+    index.ensure(driver)
+    assert driver.snapshots == 2
+
+
+def test_rebuild_each_time_without_observer():
+    driver = FakeDriver(observer=False)
+    index = make_index()
+    index.ensure(driver)
+    index.ensure(driver)
+    assert driver.snapshots == 2
+
+
+def test_unavailable_without_script_support():
+    index = make_index()
+    assert index.ensure(None) is False
+    assert index.ensure(SimpleNamespace()) is False
+
+    def boom(*a):
+        raise WebDriverException("boom")
+
+    assert index._watch(SimpleNamespace(execute_script=boom)) is False
+
+
+def test_day_filler_reuses_index_for_each_day(monkeypatch):
+    driver = FakeDriver()
+    ctx = TimeSheetContext("log", [], {}, {})
+    filler = DayFiller(ctx, logger=None, batch_fill=False)
+    inserted = []
+    monkeypatch.setattr(
+        "sele_saisie_auto.remplir_jours_feuille_de_temps.wait_for_element",
+        lambda *a, **k: object(),
+    )
+    monkeypatch.setattr(
+        filler,
+        "insert_with_retries",
+        lambda driver, field_id, value, waiter=None: inserted.append(field_id) or True,
+    )
+    monkeypatch.setattr(
+        "sele_saisie_auto.remplir_jours_feuille_de_temps.afficher_message_insertion",
+        lambda *a: None,
+    )
+    work_days = {jour: ("Maladie", "8") for jour in ("lundi", "mardi", "mercredi")}
+    filler.remplir_mission(driver, work_days, [])
+    assert inserted == ["POL_TIME2$2", "POL_TIME3$2", "POL_TIME4$2"]
+    assert driver.snapshots == 1
+    filler.remplir_mission(driver, work_days, [])
+    assert driver.snapshots == 1
+    assert driver.checks == 1
@@ -408,7 +408,6 @@ def test_main_flow(monkeypatch, sample_config):
         "wait_for_dom_ready",
         lambda *a, **k: None,
     )
-    monkeypatch.setattr(sap, "program_break_time", lambda *a, **k: None)
     monkeypatch.setattr(
         sap.remplir_jours_feuille_de_temps.TimeSheetHelper,
         "run",
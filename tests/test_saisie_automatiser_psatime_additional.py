@@ -269,6 +269,10 @@ def test_cleanup_resources(monkeypatch, sample_config):
     assert shm_service.removed == ["c", "n", "p"]
     assert "close" in called
 
+    shm_service.removed.clear()
+    sap._ORCHESTRATOR.cleanup_resources("arena", "arena", "arena")
+    assert shm_service.removed == ["arena"]
+
 
 EXCEPTIONS = [
     NoSuchElementException("boom"),
@@ -311,7 +315,6 @@ def test_main_exceptions(monkeypatch, sample_config):
         "wait_for_dom_ready",
         lambda *a, **k: None,
     )
-    monkeypatch.setattr(sap, "program_break_time", lambda *a, **k: None)
     monkeypatch.setattr(
         sap.remplir_jours_feuille_de_temps.TimeSheetHelper,
         "run",
@@ -192,9 +192,6 @@ def test_fill_and_save_timesheet(monkeypatch, sample_config):
     calls = []
     monkeypatch.setattr(auto, "wait_for_dom", lambda d: calls.append("wait"))
     monkeypatch.setattr(auto, "switch_to_iframe_main_target_win0", lambda d: True)
-    monkeypatch.setattr(
-        sap, "program_break_time", lambda *a, **k: calls.append("break")
-    )
     monkeypatch.setattr(auto, "_click_action_button", lambda d: calls.append("click"))
 
     class DummyHelper:
@@ -11,8 +11,8 @@ from sele_saisie_auto.automation.browser_session import (  # noqa: E402
 def test_open_calls_utils(monkeypatch):
     calls = {}
 
-    def fake_open(plein_ecran, url, headless, no_sandbox):
-        calls["args"] = (plein_ecran, url, headless, no_sandbox)
+    def fake_open(plein_ecran, url, headless, no_sandbox, lean, track_network):
+        calls["args"] = (plein_ecran, url, headless, no_sandbox, lean, track_network)
 
         class Dummy:
             def quit(self):
@@ -37,7 +37,14 @@ def test_open_calls_utils(monkeypatch):
     driver = manager.open("http://test", fullscreen=True, headless=True)
 
     assert driver is manager.driver  # nosec B101
-    assert calls["args"] == (True, "http://test", True, False)  # nosec B101
+    assert calls["args"] == (  # nosec B101
+        True,
+        "http://test",
+        True,
+        False,
+        None,
+        False,
+    )
 
 
 def test_close_quits_driver(monkeypatch):
@@ -0,0 +1,96 @@
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import shared_memory
+from uuid import uuid4
+
+import pytest
+
+from sele_saisie_auto import cli, shared_memory_service
+from sele_saisie_auto.logging_service import Logger
+from sele_saisie_auto.shared_memory_registry import (
+    live_segments,
+    pid_alive,
+    register_segments,
+    registry_path,
+)
+from sele_saisie_auto.shared_memory_service import (
+    SharedMemoryService,
+    collect_leaked_segments,
+)
+
+pytestmark = pytest.mark.skipif(
+    sys.platform.startswith("win"), reason="segments POSIX uniquement"
+)
+
+
+@pytest.fixture
+def dead_pid():
+    proc = subprocess.Popen([sys.executable, "-c", "pass"])  # nosec B603
+    proc.wait()
+    assert not pid_alive(proc.pid)
+    return proc.pid
+
+
+def leaked_segment() -> str:
+    name = f"leak_{uuid4().hex}"
+    seg = shared_memory.SharedMemory(create=True, size=8, name=name)
+    seg.close()
+    return name
+
+
+def test_service_registers_and_unregisters_segments():
+    service = SharedMemoryService(Logger(None))
+    name = f"reg_{uuid4().hex}"
+
+    mem = service.stocker_en_memoire_partagee(name, b"x")
+    assert live_segments()[name]["pid"] == os.getpid()
+
+    service.supprimer_memoire_partagee_securisee(mem)
+    assert name not in live_segments()
+    assert not os.path.exists(registry_path())
+
+
+def test_collector_reclaims_only_dead_owners(dead_pid):
+    dead, alive = leaked_segment(), leaked_segment()
+    register_segments([dead], pid=dead_pid)
+    register_segments([alive])
+    try:
+        assert collect_leaked_segments() == [dead]
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=dead)
+        assert list(live_segments()) == [alive]
+    finally:
+        shared_memory_service._remove_shared_memory(alive)
+
+
+def test_concurrent_registration_keeps_every_entry():
+    names = [f"conc_{i}" for i in range(16)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda n: register_segments([n]), names))
+
+    assert sorted(live_segments()) == sorted(names)
+
+
+def test_cleanup_mem_flag_collects_leaks(dead_pid, monkeypatch, capsys):
+    name = leaked_segment()
+    register_segments([name], pid=dead_pid)
+    monkeypatch.setattr(shared_memory_service, "cleanup_memory_segments", lambda: None)
+
+    cli.main(["--cleanup-mem"])
+
+    assert f"1 segment(s) orphelin(s) supprimé(s)\n  {name}" in capsys.readouterr().out
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=name)
+
+
+def test_unreadable_registry_reclaims_nothing(monkeypatch, tmp_path):
+    monkeypatch.setenv("SAA_SHM_REGISTRY", str(tmp_path / "absent" / "reg.json"))
+    warnings = []
+    logger = Logger(None)
+    monkeypatch.setattr(logger, "warning", warnings.append)
+
+    assert collect_leaked_segments(logger) == []
+    assert warnings and "inaccessible" in warnings[0]
@@ -7,8 +7,16 @@ import pytest
 
 sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))  # noqa: E402
 
+from sele_saisie_auto.exceptions import SegmentFormatError  # noqa: E402
 from sele_saisie_auto.logging_service import Logger  # noqa: E402
-from sele_saisie_auto.shared_memory_service import SharedMemoryService  # noqa: E402
+from sele_saisie_auto.shared_memory_service import (  # noqa: E402
+    SEGMENT_HEADER,
+    SharedMemoryService,
+    framed_size,
+    payload_view,
+    read_framed,
+    write_framed,
+)
 
 
 def test_stocker_removes_existing_segment():
@@ -21,7 +29,7 @@ def test_stocker_removes_existing_segment():
 
     mem = service.stocker_en_memoire_partagee(name, b"ab")
     try:
-        assert bytes(mem.buf[:2]) == b"ab"
+        assert read_framed(mem.buf) == b"ab"
     finally:
         service.supprimer_memoire_partagee_securisee(mem)
 
@@ -29,6 +37,59 @@ def test_stocker_removes_existing_segment():
         shared_memory.SharedMemory(name=name)
 
 
+def test_framed_payload_keeps_trailing_zeros_and_larger_segments():
+    payload = b"chiffre\x00\x00"
+    buf = memoryview(bytearray(framed_size(len(payload)) + 64))
+    write_framed(buf, payload)
+
+    with payload_view(buf) as view:
+        assert view.obj is buf.obj  # slice of the mapping, not a copy
+        assert view.tobytes() == payload
+    assert read_framed(buf, 7) == b"chiffre"
+
+
+@pytest.mark.parametrize(
+    "corrupt",
+    [
+        lambda buf: buf.__setitem__(0, 0),  # magic
+        lambda buf: buf.__setitem__(SEGMENT_HEADER.size, 0),  # checksum
+        lambda buf: buf.__setitem__(slice(8, 12), b"\xff\xff\x00\x00"),  # length
+    ],
+)
+def test_corrupt_segment_is_rejected(corrupt):
+    buf = memoryview(bytearray(framed_size(3)))
+    write_framed(buf, b"abc")
+    corrupt(buf)
+
+    with pytest.raises(SegmentFormatError):
+        read_framed(buf)
+    with pytest.raises(SegmentFormatError):
+        read_framed(buf[:4])
+
+
+def test_secure_delete_wipes_whole_segment(monkeypatch):
+    service = SharedMemoryService(Logger(None))
+    mem = service.stocker_en_memoire_partagee(f"seg_{uuid4().hex}", b"secret")
+    buf = bytearray(mem.buf)
+    wiped = []
+
+    class Spy:
+        name = mem.name
+
+        def __init__(self):
+            self.buf = buf
+
+        def close(self):
+            wiped.append(bytes(self.buf))
+            mem.close()
+
+        def unlink(self):
+            mem.unlink()
+
+    service.supprimer_memoire_partagee_securisee(Spy())
+    assert wiped == [bytes(len(buf))]
+
+
 def test_ensure_clean_segment_method():
     service = SharedMemoryService(Logger(None))
     name = f"seg_{uuid4().hex}"
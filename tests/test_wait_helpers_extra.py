@@ -5,6 +5,7 @@ from selenium.common.exceptions import TimeoutException
 
 from sele_saisie_auto.logging_service import Logger
 from sele_saisie_auto.selenium_utils import wait_helpers as wh
+from sele_saisie_auto.utils.misc import WAIT_STATS
 
 
 def test_wait_for_element_no_locator(monkeypatch):
@@ -34,3 +35,484 @@ def test_wait_for_element_warning_on_timeout(monkeypatch):
         wh.Waiter(logger=logger).wait_for_element(driver, locator_value="x")
 
     assert "WARNING" in logs
+
+
+def test_dom_stable_uses_mutation_observer():
+    calls = []
+
+    def execute_async_script(script, quiet, timeout):
+        calls.append((quiet, timeout))
+        return True
+
+    driver = SimpleNamespace(execute_async_script=execute_async_script)
+    waiter = wh.Waiter(logger=Logger(None, writer=lambda *a, **k: None))
+    assert waiter.wait_until_dom_is_stable(driver, timeout=2) is True
+    assert calls == [(250, 2000)]
+
+
+def test_dom_quiet_window_is_configurable():
+    calls = []
+    driver = SimpleNamespace(
+        execute_async_script=lambda script, quiet, timeout: calls.append(quiet) or False
+    )
+    waiter = wh.Waiter(
+        quiet_window_ms=100, logger=Logger(None, writer=lambda *a, **k: None)
+    )
+    assert waiter.wait_until_dom_is_quiet(driver) is False
+    assert waiter.wait_until_dom_is_quiet(driver, quiet_window_ms=50) is False
+    assert calls == [100, 50]
+
+
+def test_dom_stable_falls_back_to_snapshots(monkeypatch):
+    from selenium.common.exceptions import WebDriverException
+
+    monkeypatch.setattr(wh.time, "sleep", lambda s: None)
+
+    def execute_async_script(*args):
+        raise WebDriverException("unsupported")
+
+    driver = SimpleNamespace(
+        execute_async_script=execute_async_script, page_source="<html/>"
+    )
+    waiter = wh.Waiter(logger=Logger(None, writer=lambda *a, **k: None))
+    assert waiter.wait_until_dom_is_stable(driver, timeout=5) is True
+
+
+def test_dom_stable_snapshot_mode_skips_observer(monkeypatch):
+    monkeypatch.setattr(wh.time, "sleep", lambda s: None)
+
+    def execute_async_script(*args):
+        raise AssertionError("observer ne doit pas être utilisé")
+
+    driver = SimpleNamespace(
+        execute_async_script=execute_async_script, page_source="<html/>"
+    )
+    waiter = wh.Waiter(
+        dom_stability="snapshot", logger=Logger(None, writer=lambda *a, **k: None)
+    )
+    assert waiter.wait_until_dom_is_stable(driver, timeout=5) is True
+
+
+def test_wait_for_any_returns_outcome_fired_in_page():
+    calls = []
+    element = object()
+
+    def execute_async_script(script, specs, timeout):
+        calls.append((specs, timeout))
+        return [1, element]
+
+    driver = SimpleNamespace(execute_async_script=execute_async_script)
+    waiter = wh.Waiter(logger=Logger(None, writer=lambda *a, **k: None))
+    outcomes = [
+        wh.Outcome("alerte", "ptModContent_0"),
+        wh.Outcome("grille", "#grid", by="css selector", state="visible", frame="f"),
+    ]
+
+    result = waiter.wait_for_any(driver, outcomes, timeout=2)
+
+    assert result == wh.RaceResult(outcomes[1], element)
+    assert result.name == "grille"
+    assert calls == [
+        (
+            [
+                {
+                    "by": "id",
+                    "value": "ptModContent_0",
+                    "state": "present",
+                    "frame": None,
+                },
+                {
+                    "by": "css selector",
+                    "value": "#grid",
+                    "state": "visible",
+                    "frame": "f",
+                },
+            ],
+            2000,
+        )
+    ]
+
+
+@pytest.mark.parametrize("raw", [None, TimeoutException("timeout")])
+def test_wait_for_any_returns_none_on_timeout(raw):
+    def execute_async_script(*args):
+        if isinstance(raw, Exception):
+            raise raw
+        return raw
+
+    driver = SimpleNamespace(execute_async_script=execute_async_script)
+    waiter = wh.Waiter(logger=Logger(None, writer=lambda *a, **k: None))
+    assert waiter.wait_for_any(driver, [wh.Outcome("a", "a")], timeout=1) is None
+
+
+def test_wait_for_any_polls_when_page_script_unavailable(monkeypatch):
+    from selenium.common.exceptions import WebDriverException
+
+    sleeps = []
+    monkeypatch.setattr(wh._wrapper.time, "sleep", sleeps.append)
+    hidden = SimpleNamespace(is_displayed=lambda: False, is_enabled=lambda: True)
+    shown = SimpleNamespace(is_displayed=lambda: True, is_enabled=lambda: True)
+    pages = iter([{"a": [hidden]}, {"a": [hidden]}, {"a": [shown], "b": [shown]}])
+    page = {}
+
+    def execute_async_script(*args):
+        raise WebDriverException("unsupported")
+
+    def find_elements(by, value):
+        if value == "a":
+            page.update(next(pages))
+        return page.get(value, [])
+
+    driver = SimpleNamespace(
+        execute_async_script=execute_async_script, find_elements=find_elements
+    )
+    waiter = wh.Waiter(logger=Logger(None, writer=lambda *a, **k: None))
+    outcomes = [wh.Outcome("a", "a", state="clickable"), wh.Outcome("b", "b")]
+    WAIT_STATS.reset()
+
+    result = waiter.wait_for_any(driver, outcomes, timeout=5)
+
+    assert result == wh.RaceResult(outcomes[0], shown)
+    assert sleeps == [0.005, 0.01]
+    assert WAIT_STATS.slept == sum(sleeps)
+    assert WAIT_STATS.waits == 2  # script tenté, puis interrogation
+
+
+def test_wait_for_any_polling_handles_absent_outcome(monkeypatch):
+    monkeypatch.setattr(wh._wrapper.time, "sleep", lambda s: None)
+    driver = SimpleNamespace(find_elements=lambda by, value: [])
+    waiter = wh.Waiter(logger=Logger(None, writer=lambda *a, **k: None))
+    outcomes = [wh.Outcome("present", "x"), wh.Outcome("gone", "y", state="absent")]
+
+    assert waiter.wait_for_any(driver, outcomes, timeout=1).name == "gone"
+
+
+def _script_waiter():
+    return wh.Waiter(
+        wait_engine="script", logger=Logger(None, writer=lambda *a, **k: None)
+    )
+
+
+@pytest.mark.parametrize(
+    "condition, state, expected",
+    [
+        (wh.ec.presence_of_element_located, "present", None),
+        (wh.ec.element_to_be_clickable, "clickable", None),
+        (wh.value_equals("08:00"), "value", "08:00"),
+        (wh.text_contains("Total"), "text", "Total"),
+    ],
+)
+def test_script_engine_waits_in_one_round_trip(condition, state, expected):
+    calls = []
+    element = object()
+
+    def execute_async_script(script, spec, timeout):
+        calls.append((spec, timeout))
+        return ["ok", element]
+
+    driver = SimpleNamespace(
+        execute_async_script=execute_async_script,
+        find_elements=lambda *a: pytest.fail("no WebDriver polling"),
+    )
+
+    result = _script_waiter().wait_for_element(driver, "id", "x", condition, timeout=3)
+
+    assert result is element
+    assert calls == [
+        ({"by": "id", "value": "x", "state": state, "expected": expected}, 3000)
+    ]
+
+
+def test_script_engine_absent_element_returns_none():
+    driver = SimpleNamespace(execute_async_script=lambda *a: ["absent", None])
+    assert _script_waiter().wait_for_element(driver, "id", "x", timeout=1) is None
+
+
+@pytest.mark.parametrize("outcome", [["unmet", None], TimeoutException("script")])
+def test_script_engine_unmet_condition_raises_timeout(outcome):
+    def execute_async_script(*args):
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    driver = SimpleNamespace(
+        execute_async_script=execute_async_script, find_elements=lambda *a: ["el"]
+    )
+    with pytest.raises(TimeoutException):
+        _script_waiter().wait_for_element(driver, "id", "x", timeout=1)
+
+
+def test_script_engine_driver_timeout_on_vanished_element_returns_none():
+    def execute_async_script(*args):
+        raise TimeoutException("script")
+
+    driver = SimpleNamespace(
+        execute_async_script=execute_async_script, find_elements=lambda *a: []
+    )
+    assert _script_waiter().wait_for_element(driver, "id", "x", timeout=1) is None
+
+
+class _Page:
+    """Driver answering both engines from the same ``{id: value}`` fields."""
+
+    def __init__(self, fields):
+        self.fields = fields
+
+    def find_elements(self, by, value):
+        return [self.find_element(by, value)] if value in self.fields else []
+
+    def find_element(self, by, value):
+        if value not in self.fields:
+            from selenium.common.exceptions import NoSuchElementException
+
+            raise NoSuchElementException(value)
+        field_value = self.fields[value]
+        return SimpleNamespace(
+            id=value, get_attribute=lambda name: field_value, text=field_value
+        )
+
+    def execute_async_script(self, script, spec, timeout):
+        # Same outcome as ELEMENT_WAIT_SCRIPT once ``timeout`` elapsed.
+        if spec["value"] not in self.fields:
+            return ["absent", None]
+        if spec["state"] == "value" and self.fields[spec["value"]] != spec["expected"]:
+            return ["unmet", None]
+        return ["ok", self.find_element("id", spec["value"])]
+
+
+class _OneShotWait:
+    def __init__(self, driver, timeout):
+        self.driver = driver
+
+    def until(self, predicate):
+        result = predicate(self.driver)
+        if not result:
+            raise TimeoutException("unmet")
+        return result
+
+
+@pytest.mark.parametrize(
+    "locator, condition, expected",
+    [
+        ("missing", wh.ec.presence_of_element_located, None),
+        ("missing", wh.value_equals("08:00"), None),
+        ("hours", wh.ec.presence_of_element_located, "hours"),
+        ("hours", wh.value_equals("08:00"), "hours"),
+        ("hours", wh.value_equals("09:00"), TimeoutException),
+    ],
+)
+@pytest.mark.parametrize("engine", ["webdriver", "script"])
+def test_wait_engines_agree(monkeypatch, engine, locator, condition, expected):
+    monkeypatch.setattr(wh._wrapper, "WebDriverWait", _OneShotWait)
+    waiter = wh.Waiter(
+        wait_engine=engine, logger=Logger(None, writer=lambda *a, **k: None)
+    )
+    page = _Page({"hours": "08:00"})
+
+    if expected is TimeoutException:
+        with pytest.raises(TimeoutException):
+            waiter.wait_for_element(page, "id", locator, condition, timeout=1)
+        return
+    result = waiter.wait_for_element(page, "id", locator, condition, timeout=1)
+    assert getattr(result, "id", None) == expected
+
+
+def test_script_engine_falls_back_to_webdriver_wait(monkeypatch):
+    from selenium.common.exceptions import WebDriverException
+
+    element = object()
+
+    class DummyWait:
+        def __init__(self, driver, timeout):
+            self.driver = driver
+
+        def until(self, predicate):
+            return predicate(self.driver)
+
+    def execute_async_script(*args):
+        raise WebDriverException("unsupported")
+
+    monkeypatch.setattr(wh._wrapper, "WebDriverWait", DummyWait)
+    field = SimpleNamespace(get_attribute=lambda name: "b")
+    driver = SimpleNamespace(
+        execute_async_script=execute_async_script,
+        find_elements=lambda by, value: [element],
+        find_element=lambda by, value: field,
+    )
+    custom = lambda locator: lambda drv: element  # noqa: E731
+
+    waiter = _script_waiter()
+    assert waiter.wait_for_element(driver, "id", "x", custom) is element
+    assert waiter.wait_for_element(driver, "id", "x", wh.value_equals("a")) is False
+
+
+def test_element_condition_predicates_for_webdriver_engine():
+    field = SimpleNamespace(get_attribute=lambda name: "08:00", text="Total 40")
+    driver = SimpleNamespace(find_element=lambda by, value: field)
+
+    assert wh.value_equals("08:00")(("id", "x"))(driver) is field
+    assert wh.value_equals("09:00")(("id", "x"))(driver) is False
+    assert wh.text_contains("40")(("id", "x"))(driver) is field
+    assert wh.text_contains("41")(("id", "x"))(driver) is False
+
+
+def _idle_waiter():
+    return wh.Waiter(
+        readiness="network_idle",
+        quiet_window_ms=100,
+        logger=Logger(None, writer=lambda *a, **k: None),
+    )
+
+
+def test_network_idle_readiness_uses_one_in_page_wait(monkeypatch):
+    calls = []
+
+    def execute_async_script(script, quiet, timeout, min_state):
+        calls.append((quiet, timeout, min_state))
+        return True
+
+    monkeypatch.setattr(
+        wh._wrapper, "WebDriverWait", lambda *a: pytest.fail("no readyState poll")
+    )
+    driver = SimpleNamespace(
+        execute_async_script=execute_async_script,
+        capabilities={"pageLoadStrategy": "eager"},
+    )
+
+    _idle_waiter().wait_for_dom_ready(driver, timeout=3)
+
+    assert calls == [(100, 3000, "interactive")]
+
+
+@pytest.mark.parametrize("outcome", [False, TimeoutException("t"), "unsupported"])
+def test_network_idle_falls_back_to_ready_state(monkeypatch, outcome):
+    from selenium.common.exceptions import WebDriverException
+
+    polled = []
+    clock = iter([10.0, 10.75])
+
+    class DummyWait:
+        def __init__(self, driver, timeout):
+            self.timeout = timeout
+
+        def until(self, predicate):
+            polled.append((predicate, self.timeout))
+            return True
+
+    def execute_async_script(*args):
+        if outcome == "unsupported":
+            raise WebDriverException(outcome)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    monkeypatch.setattr(wh._wrapper, "WebDriverWait", DummyWait)
+    monkeypatch.setattr(
+        wh._wrapper, "time", SimpleNamespace(monotonic=lambda: next(clock))
+    )
+    driver = SimpleNamespace(execute_async_script=execute_async_script)
+
+    _idle_waiter().wait_for_dom_ready(driver, timeout=1)
+
+    assert polled == [(wh.is_document_ready, pytest.approx(0.25))]
+
+
+def test_network_idle_script_sums_same_origin_frames():
+    assert "win.frames" in wh._wrapper.NETWORK_IDLE_SCRIPT
+    assert "window.top" in wh._wrapper.NETWORK_IDLE_SCRIPT
+
+
+def test_network_idle_unavailable_without_async_scripts():
+    assert _idle_waiter().wait_until_network_idle(SimpleNamespace()) is None
+    assert _idle_waiter().readiness == "network_idle"
+
+
+def test_network_tracker_installed_for_new_documents():
+    from selenium.common.exceptions import WebDriverException
+
+    calls = []
+    driver = SimpleNamespace(execute_cdp_cmd=lambda cmd, params: calls.append(cmd))
+
+    assert wh.install_network_tracker(driver) is True
+    assert calls == ["Page.addScriptToEvaluateOnNewDocument"]
+    assert wh.install_network_tracker(SimpleNamespace()) is False
+
+    def fail(cmd, params):
+        raise WebDriverException("no cdp")
+
+    assert wh.install_network_tracker(SimpleNamespace(execute_cdp_cmd=fail)) is False
+
+
+def test_snapshot_sleeps_and_observer_waits_are_counted(monkeypatch):
+    monkeypatch.setattr(wh._wrapper.time, "sleep", lambda s: None)
+    driver = SimpleNamespace(
+        execute_async_script=lambda *a: True, page_source="<html/>"
+    )
+    waiter = wh.Waiter(
+        dom_stability="snapshot", logger=Logger(None, writer=lambda *a, **k: None)
+    )
+    WAIT_STATS.reset()
+
+    assert waiter.wait_until_dom_is_stable(driver, timeout=5) is True
+    assert waiter.wait_until_dom_is_quiet(driver) is True
+
+    assert WAIT_STATS.waits == 2
+    assert WAIT_STATS.slept > 0
+    assert WAIT_STATS.observed >= 0
+
+
+def test_wait_for_any_fallback_shares_the_deadline(monkeypatch):
+    from selenium.common.exceptions import WebDriverException
+
+    clock = SimpleNamespace(now=0.0)
+    monkeypatch.setattr(wh._wrapper.time, "monotonic", lambda: clock.now)
+    monkeypatch.setattr(
+        wh._wrapper.time, "sleep", lambda s: setattr(clock, "now", clock.now + s)
+    )
+
+    def execute_async_script(*args):
+        clock.now += 4  # la page navigue au milieu du script
+        raise WebDriverException("navigated")
+
+    driver = SimpleNamespace(
+        execute_async_script=execute_async_script, find_elements=lambda *a: []
+    )
+    waiter = wh.Waiter(logger=Logger(None, writer=lambda *a, **k: None))
+
+    assert waiter.wait_for_any(driver, [wh.Outcome("a", "a")], timeout=5) is None
+    assert clock.now == pytest.approx(5)
+
+
+def test_wait_for_any_polling_looks_inside_outcome_frames(monkeypatch):
+    from selenium.common.exceptions import NoSuchFrameException
+
+    monkeypatch.setattr(wh._wrapper.time, "sleep", lambda s: None)
+    button = SimpleNamespace(is_displayed=lambda: True, is_enabled=lambda: True)
+    documents = {"main": {"grid": [button]}, None: {}}
+    state = SimpleNamespace(current=None, switches=[])
+
+    def frame(name):
+        if name not in documents:
+            raise NoSuchFrameException(name)
+        state.switches.append(name)
+        state.current = name
+
+    def parent_frame():
+        state.switches.append("parent")
+        state.current = None
+
+    driver = SimpleNamespace(
+        switch_to=SimpleNamespace(frame=frame, parent_frame=parent_frame),
+        find_elements=lambda by, value: documents[state.current].get(value, []),
+    )
+    waiter = wh.Waiter(logger=Logger(None, writer=lambda *a, **k: None))
+    outcomes = [
+        wh.Outcome("alert", "alert", frame="missing"),
+        wh.Outcome("grid", "grid", frame="main"),
+    ]
+
+    result = waiter.wait_for_any(driver, outcomes, timeout=1)
+
+    assert result == wh.RaceResult(outcomes[1], button)
+    assert state.switches == ["main", "parent"]
+    assert state.current is None
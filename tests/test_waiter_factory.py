@@ -8,3 +8,30 @@ def test_create_waiter_returns_configured_waiter():
     assert isinstance(waiter, Waiter)
     assert waiter.wrapper.default_timeout == 5
     assert waiter.wrapper.long_timeout == 10
+
+
+def test_create_waiter_selects_wait_engine():
+    assert create_waiter(5).wrapper.wait_engine == "webdriver"
+    assert create_waiter(5, wait_engine="script").wrapper.wait_engine == "script"
+
+
+def test_readiness_mode_from_settings():
+    from configparser import ConfigParser
+    from types import SimpleNamespace
+
+    import pytest
+
+    from sele_saisie_auto.selenium_utils.waiter_factory import (
+        get_waiter,
+        readiness_mode,
+    )
+
+    parser = ConfigParser()
+    parser.read_dict({"settings": {"readiness": "Network_Idle"}})
+    config = SimpleNamespace(raw=parser, default_timeout=3, long_timeout=6)
+
+    assert readiness_mode(None) == "ready_state"
+    assert get_waiter(config).readiness == "network_idle"
+    parser.set("settings", "readiness", "load")
+    with pytest.raises(ValueError):
+        readiness_mode(config)